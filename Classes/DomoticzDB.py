@@ -325,6 +325,9 @@ class DomoticzDB_DeviceStatus:
                 value = self.dbCursor.fetchone()
                 self.logging(  "Debug", "--> Value: %s" %value)
                 if value is None:
+                    # No TimeOut for this device, don't query again
+                    self.AdjValue['TimeOutMotion'][ID]['Value'] = 0
+                    self.AdjValue['TimeOutMotion'][ID]['Stamp'] = int(time())
                     self.closeDB()
                     return 0
                 else:
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: DomoticzUnitIndex.py
+
+    Description: Index of the Domoticz Devices, to avoid scanning all Units
+
+    - DeviceID ( IEEE, GroupId ) -> list of Units
+    - Domoticz ID ( WidgetId ) -> Unit
+    - NwkId -> list of ( WidgetEp, WidgetId, WidgetType ) as returned by RetreiveWidgetTypeList
+    - NwkId -> ( Ep, ClusterId ) -> route compiled by domoMaj.compileWidgetRoute
+    - Unit -> WidgetType
+
+    The index is updated when the plugin creates or removes a widget, and when a device
+    reconnects with a new NwkId. As Devices can also be changed from Domoticz ( device
+    removed by the user ), the index is checked at each lookup: it is rebuilt when the
+    number of Units has changed or when an indexed Unit doesn't match anymore.
+
+"""
+
+
+class DomoticzUnitIndex(object):
+
+    def __init__(self):
+        self.deviceid2units = {}    # DeviceID -> [ Unit ]
+        self.id2unit = {}           # Domoticz ID -> Unit
+        self.widgets = {}           # NwkId -> [ ( WidgetEp, WidgetId, WidgetType ) ]
+        self.routes = {}            # NwkId -> { ( Ep, ClusterId ): ( ClusterType, [ ( Unit, WidgetEp, WidgetId, WidgetType, Handlers ) ], GroupCheck ) }
+        self.unit2widget = {}       # Unit -> ( Domoticz ID, WidgetType )
+        self.size = None            # len(Devices) when the index was built
+        self.rebuilds = 0
+
+    def rebuild(self, Devices):
+        self.deviceid2units = {}
+        self.id2unit = {}
+        self.routes = {}
+        self.unit2widget = {}
+        for unit in Devices:
+            self._add(Devices, unit)
+        self.size = len(Devices)
+        self.rebuilds += 1
+
+    def add(self, Devices, unit):
+        # A widget has been created
+        if self.size is None or unit not in Devices:
+            return
+        self._add(Devices, unit)
+        self.size = len(Devices)
+
+    def remove(self, Devices, unit):
+        # A widget is about to be removed, or has been removed from Devices
+        for deviceid in list(self.deviceid2units):
+            if unit in self.deviceid2units[deviceid]:
+                self.deviceid2units[deviceid].remove(unit)
+                if not self.deviceid2units[deviceid]:
+                    del self.deviceid2units[deviceid]
+        for domoid in [ domoid for domoid, x in self.id2unit.items() if x == unit ]:
+            del self.id2unit[domoid]
+        self.routes = {}
+        self.unit2widget.pop(unit, None)
+        if self.size is not None:
+            self.size = len(Devices) - 1 if unit in Devices else len(Devices)
+
+    def units(self, Devices, deviceid):
+        # Return the list of Units attached to the DeviceID ( IEEE or GroupId )
+        self._check(Devices)
+        units = self.deviceid2units.get(deviceid, ())
+        for unit in units:
+            if unit not in Devices or Devices[unit].DeviceID != deviceid:
+                self.rebuild(Devices)
+                return list(self.deviceid2units.get(deviceid, ()))
+        return list(units)
+
+    def unit(self, Devices, deviceid):
+        # Return the first Unit attached to the DeviceID, or None
+        units = self.units(Devices, deviceid)
+        return units[0] if units else None
+
+    def unit_for_id(self, Devices, domoid):
+        # Return the Unit of the Domoticz ID ( WidgetId ), or None
+        self._check(Devices)
+        domoid = int(domoid)
+        unit = self.id2unit.get(domoid)
+        if unit is not None and ( unit not in Devices or Devices[unit].ID != domoid ):
+            self.rebuild(Devices)
+            unit = self.id2unit.get(domoid)
+        return unit
+
+    def widget_list(self, nwkid):
+        return self.widgets.get(nwkid)
+
+    def set_widget_list(self, nwkid, widgets):
+        self.widgets[nwkid] = widgets
+
+    def route(self, Devices, nwkid, key):
+        # Return the route compiled for ( Ep, ClusterId ) of nwkid, or None
+        self._check(Devices)
+        routes = self.routes.get(nwkid)
+        if routes is None:
+            return None
+        return routes.get(key)
+
+    def set_route(self, nwkid, key, route):
+        if nwkid not in self.routes:
+            self.routes[nwkid] = {}
+        self.routes[nwkid][key] = route
+
+    def widget_type(self, Devices, unit):
+        # Return the WidgetType of unit, or None if not known yet
+        entry = self.unit2widget.get(unit)
+        if entry is None or unit not in Devices or Devices[unit].ID != entry[0]:
+            return None
+        return entry[1]
+
+    def set_widget_type(self, Devices, unit, widgettype):
+        self.unit2widget[unit] = ( Devices[unit].ID, widgettype )
+
+    def invalidate_widgets(self, nwkid=None):
+        # The ClusterType of nwkid has changed ( or of every devices if nwkid is None )
+        if nwkid is None:
+            self.widgets.clear()
+            self.routes.clear()
+        else:
+            self.widgets.pop(nwkid, None)
+            self.routes.pop(nwkid, None)
+        self.unit2widget.clear()
+
+    def _check(self, Devices):
+        if self.size != len(Devices):
+            self.rebuild(Devices)
+
+    def _add(self, Devices, unit):
+        deviceid = Devices[unit].DeviceID
+        if deviceid not in self.deviceid2units:
+            self.deviceid2units[deviceid] = []
+        if unit not in self.deviceid2units[deviceid]:
+            self.deviceid2units[deviceid].append(unit)
+        self.id2unit[Devices[unit].ID] = unit
@@ -76,7 +76,7 @@ class GroupsManagement( object):
     from Classes.GroupMgtv2.GrpWebServices import process_web_request, ScanAllDevicesForGroupMemberShip, ScanDevicesForGroupMemberShip
     from Classes.GroupMgtv2.GrpIkeaRemote import manageIkeaTradfriRemoteLeftRight
     
-    def __init__(self, PluginConf, ZigateComm, adminWidgets, HomeDirectory, hardwareID, Devices, ListOfDevices, IEEE2NWK , log):
+    def __init__(self, PluginConf, ZigateComm, adminWidgets, HomeDirectory, hardwareID, Devices, ListOfDevices, IEEE2NWK , log, UnitIndex):
 
         self.HB = 0
         self.pluginconf = PluginConf
@@ -84,6 +84,7 @@ class GroupsManagement( object):
         self.adminWidgets = adminWidgets
         self.homeDirectory = HomeDirectory
         self.Devices = Devices                               # Point to the List of Domoticz Devices
+        self.UnitIndex = UnitIndex                           # Point to the index of the Domoticz Devices
         self.ListOfDevices = ListOfDevices    # Point to the Global ListOfDevices
         self.IEEE2NWK = IEEE2NWK                        # Point to the List of IEEE to NWKID
         self.ListOfGroups = {}                            # Data structutre to store all groups
@@ -15,10 +15,7 @@ from Classes.AdminWidgets import AdminWidgets
 
 def unit_for_widget( self, GroupId):
     
-    for x in self.Devices:
-        if self.Devices[x].DeviceID == GroupId:
-            return x
-    return None
+    return self.UnitIndex.unit( self.Devices, GroupId )
 
 def create_domoticz_group_device(self, GroupName, GroupId):
     ' Create Device for just created group in Domoticz. '
@@ -32,10 +29,9 @@ def create_domoticz_group_device(self, GroupName, GroupId):
         Domoticz.Error("createDomoticzGroupDevice - Invalid Group Name: %s or GroupdID: %s" %(GroupName, GroupId))
         return
 
-    for x in self.Devices:
-        if self.Devices[x].DeviceID == GroupId:
-            #Domoticz.Error("createDomoticzGroupDevice - existing group %s" %(self.Devices[x].Name))
-            return
+    if unit_for_widget( self, GroupId ) is not None:
+        #Domoticz.Error("createDomoticzGroupDevice - existing group %s" %(self.Devices[x].Name))
+        return
 
     Type_, Subtype_, SwitchType_ = best_group_widget( self, GroupId)
 
@@ -47,6 +43,7 @@ def create_domoticz_group_device(self, GroupName, GroupId):
     if ID == -1:
         Domoticz.Error('createDomoticzGroupDevice - failed to create Group device.')
         return
+    self.UnitIndex.add( self.Devices, unit )
     
     self.ListOfGroups[GroupId]['WidgetType'] = unit
 
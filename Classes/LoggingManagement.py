@@ -13,10 +13,29 @@
 
 import Domoticz
 import json
-from datetime import datetime
+import os
+import queue
+from datetime import datetime, date
 import threading
 import time
 
+LOGGING_QUEUE_GET_TIMEOUT = 1   # seconds, also the period at which the Error history is checked
+LOGGING_BATCH_SIZE = 500        # max lines written between 2 flushes
+ERROR_HISTORY_DELAY = 5         # seconds an update of the Error history waits before being written, errors coming in burst
+LOGGING_STOP = 'STOP'
+
+# Values of the cached debug<Module> flags
+DEBUG_OFF = 0
+DEBUG_FILTERED = 1              # debug<Module> set, filtered by debugMatchId
+DEBUG_ALWAYS = 2                # no debug<Module> parameter
+
+def loggingRender( message, args ):
+    if callable( message ):
+        message = message()
+    if args is not None:
+        message = message % args
+    return message
+
 class LoggingManagement:
 
     def __init__(self, pluginconf, PluginHealth, HardwareID, ListOfDevices, permitTojoin):
@@ -30,9 +49,18 @@ class LoggingManagement:
         self.FirmwareVersion = None
         self.FirmwareMajorVersion = None
         self._startTime = int(time.time())
-        
-        
-        
+
+        # Log lines are formated and written by the ZiGateLogging thread, so the callers never wait on the disk
+        self.logging_queue = None
+        self.logging_thread = None
+        self.loggingFileDay = None
+        self.loggingDroppedLines = 0
+        self.errorHistoryUpdated = None     # time of the oldest Error history update not yet written
+
+        # Cache of the debug<Module> flags and of debugMatchId, cleared by loggingUpdatePluginConf()
+        self.debugFlags = {}
+        self.debugMatchId = None
+
     def loggingUpdateFirmware(self, FirmwareVersion, FirmwareMajorVersion):
         if self.FirmwareVersion and self.FirmwareMajorVersion:
             return
@@ -47,28 +75,36 @@ class LoggingManagement:
         
     def openLogFile( self ):
 
-        if not self.pluginconf.pluginConf['useDomoticzLog']:
-            #logfilename =  self.pluginconf.pluginConf['pluginLogs'] + "/" + "Zigate" + '_' + '%02d' %self.HardwareID + "_" + str(datetime.now().strftime('%Y-%m-%d_%H-%M-%S')) + ".log"
-            logfilename =  self.pluginconf.pluginConf['pluginLogs'] + "/" + "Zigate" + '_' + '%02d' %self.HardwareID + "_" + str(datetime.now().strftime('%Y-%m-%d')) + ".log"
-            self.loggingFileHandle = open( logfilename, "a+", encoding='utf-8')
-        
         jsonLogHistory =  self.pluginconf.pluginConf['pluginLogs'] + "/" + "Zigate_log_error_history.json"
         try:
             handle = open( jsonLogHistory, "r", encoding='utf-8')
         except Exception as e:
             Domoticz.Status("Log history not found, no error logged")
             #Domoticz.Error(repr(e))
-            return
-        try:
-            self.LogErrorHistory = json.load( handle, encoding=dict)
-        except json.decoder.JSONDecodeError as e:
-            res = "Failed"
-            Domoticz.Error("load Json LogErrorHistory poorly-formed %s, not JSON: %s" %(jsonLogHistory,e))
-        handle.close()
+            handle = None
+        if handle:
+            try:
+                self.LogErrorHistory = json.load( handle )
+            except json.decoder.JSONDecodeError as e:
+                res = "Failed"
+                Domoticz.Error("load Json LogErrorHistory poorly-formed %s, not JSON: %s" %(jsonLogHistory,e))
+            handle.close()
+
+        if self.logging_thread is None:
+            self.logging_queue = queue.Queue( maxsize = self.pluginconf.pluginConf['logQueueSize'] )
+            self.logging_thread = threading.Thread( name="ZiGateLogging", target=LoggingManagement.logging_thread_writer, args=(self,))
+            self.logging_thread.start()
 
 
     def closeLogFile( self ):
 
+        if self.logging_thread:
+            # Stop the writer once the pending lines are written
+            self.logging_queue.put( LOGGING_STOP )
+            self.logging_thread.join()
+            self.logging_thread = None
+            self.logging_queue = None
+
         if self.loggingFileHandle:
             self.loggingFileHandle.close()
             self.loggingFileHandle = None
@@ -77,16 +113,102 @@ class LoggingManagement:
     def logToFile( self, message ):
 
             Domoticz.Status( message )
-            message =  str(datetime.now().strftime('%b %d %H:%M:%S.%f')) + " [" + threading.current_thread().name + "] " + message + '\n'
-            self.loggingFileHandle.write( message )
-            self.loggingFileHandle.flush()
+            line = ( time.time(), threading.current_thread().name, message )
+            if self.logging_queue is None:
+                # Writer stopped ( onStop )
+                self.loggingWriteLines( [ line ] )
+                return
+            try:
+                self.logging_queue.put_nowait( line )
+            except queue.Full:
+                # The disk doesn't follow, don't slow down the caller
+                self.loggingDroppedLines += 1
+
+    def logging_thread_writer( self ):
+
+        Domoticz.Status("LoggingManagement: logging_thread_writer Thread start.")
+        running = True
+        while running:
+            batch = []
+            try:
+                line = self.logging_queue.get( timeout = LOGGING_QUEUE_GET_TIMEOUT )
+                while True:
+                    if line == LOGGING_STOP:
+                        running = False
+                        break
+                    batch.append( line )
+                    if len(batch) >= LOGGING_BATCH_SIZE:
+                        break
+                    line = self.logging_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            try:
+                if batch:
+                    self.loggingWriteLines( batch )
+                if self.errorHistoryUpdated and time.time() >= self.errorHistoryUpdated + ERROR_HISTORY_DELAY:
+                    self.loggingWriteErrorHistory()
+            except Exception as e:
+                Domoticz.Error("LoggingManagement: logging_thread_writer error %s" %e)
+
+        Domoticz.Status("LoggingManagement: logging_thread_writer Thread stop.")
+
+    def loggingWriteLines( self, lines ):
+
+        today = date.today()
+        if self.loggingFileHandle is None or today != self.loggingFileDay:
+            self.loggingOpenFile( today )
+
+        text = ''
+        if self.loggingDroppedLines:
+            text = str(datetime.now().strftime('%b %d %H:%M:%S.%f')) + " [ZiGateLogging] %s lines lost, logging queue full\n" %self.loggingDroppedLines
+            self.loggingDroppedLines = 0
+        text += ''.join( str(datetime.fromtimestamp( timestamp ).strftime('%b %d %H:%M:%S.%f')) + " [" + thread + "] " + message + '\n'
+                         for timestamp, thread, message in lines )
+        self.loggingFileHandle.write( text )
+        self.loggingFileHandle.flush()
+
+        maxSize = self.pluginconf.pluginConf['logMaxSize']
+        if maxSize and self.loggingFileHandle.tell() > maxSize * 1024 * 1024:
+            self.loggingRotateFile()
+
+    def loggingFileName( self, day ):
+        return self.pluginconf.pluginConf['pluginLogs'] + "/" + "Zigate" + '_' + '%02d' %self.HardwareID + "_" + str(day.strftime('%Y-%m-%d')) + ".log"
+
+    def loggingOpenFile( self, day ):
+        # A new file every day
+        if self.loggingFileHandle:
+            self.loggingFileHandle.close()
+        self.loggingFileHandle = open( self.loggingFileName( day ), "a+", encoding='utf-8')
+        self.loggingFileDay = day
+
+    def loggingRotateFile( self ):
+        # Size limit reached: file.log becomes file.log.1, file.log.1 becomes file.log.2, ... up to logMaxBackups
+        logfilename = self.loggingFileName( self.loggingFileDay )
+        self.loggingFileHandle.close()
+        self.loggingFileHandle = None
+
+        backups = self.pluginconf.pluginConf['logMaxBackups']
+        try:
+            if backups <= 0:
+                os.remove( logfilename )
+            else:
+                if os.path.exists( '%s.%s' %(logfilename, backups) ):
+                    os.remove( '%s.%s' %(logfilename, backups) )
+                for idx in range( backups - 1, 0, -1):
+                    if os.path.exists( '%s.%s' %(logfilename, idx) ):
+                        os.replace( '%s.%s' %(logfilename, idx), '%s.%s' %(logfilename, idx + 1) )
+                os.replace( logfilename, logfilename + '.1' )
+        except OSError as e:
+            Domoticz.Error("LoggingManagement: unable to rotate %s: %s" %(logfilename, e))
+        self.loggingOpenFile( self.loggingFileDay )
 
     def _loggingStatus( self, message):
 
         if self.pluginconf.pluginConf['useDomoticzLog']:
             Domoticz.Status( message )
         else:
-            if self.loggingFileHandle is None:
+            if self.logging_thread is None:
                 self.openLogFile()
             self.logToFile(message )
 
@@ -95,7 +217,7 @@ class LoggingManagement:
         if self.pluginconf.pluginConf['useDomoticzLog']:
             Domoticz.Log( message )
         else: 
-            if self.loggingFileHandle is None:
+            if self.logging_thread is None:
                 self.openLogFile()
             self.logToFile( message )
 
@@ -104,19 +226,37 @@ class LoggingManagement:
         if self.pluginconf.pluginConf['useDomoticzLog']:
             Domoticz.Log( message )
         else: 
-            if self.loggingFileHandle is None:
+            if self.logging_thread is None:
                 self.openLogFile()
             self.logToFile( message )
 
-    def _logginfilter( self, message, nwkid):
+    def _logginfilter( self, nwkid):
 
         if nwkid is None:
-            self._loggingDebug( message )
-        elif nwkid:
-            nwkid = nwkid.lower()
-            _debugMatchId =  self.pluginconf.pluginConf['debugMatchId'].lower().split(',')
-            if ('ffff' in _debugMatchId) or (nwkid in _debugMatchId) or (nwkid == 'ffff'):
-                self._loggingDebug(  message )
+            return True
+        if not nwkid:
+            return False
+        if self.debugMatchId is None:
+            self.debugMatchId = set( self.pluginconf.pluginConf['debugMatchId'].lower().split(',') )
+        nwkid = nwkid.lower()
+        return ('ffff' in self.debugMatchId) or (nwkid in self.debugMatchId) or (nwkid == 'ffff')
+
+    def loggingDebugFlag( self, module ):
+        pluginConfModule = "debug"+str(module)
+        if pluginConfModule not in self.pluginconf.pluginConf:
+            # Modules without debug flag are always logged
+            flag = DEBUG_ALWAYS
+        elif self.pluginconf.pluginConf[pluginConfModule]:
+            flag = DEBUG_FILTERED
+        else:
+            flag = DEBUG_OFF
+        self.debugFlags[ module ] = flag
+        return flag
+
+    def loggingUpdatePluginConf( self ):
+        # pluginConf has been updated, the debug flags must be read again
+        self.debugFlags = {}
+        self.debugMatchId = None
 
     def loggingDirector( self, logType, message):
         if  logType == 'Log':
@@ -124,25 +264,27 @@ class LoggingManagement:
         elif logType == 'Status':
             self._loggingStatus( message )
             
-    def logging( self, module, logType, message, nwkid=None, context=None):
-        if logType == 'Error':
-            self.loggingError(module, message, nwkid, context)
-        elif logType == 'Debug':
-            pluginConfModule = "debug"+str(module)
-            if pluginConfModule in self.pluginconf.pluginConf:
-                if self.pluginconf.pluginConf[pluginConfModule]:
-                    self._logginfilter(message, nwkid)
-            else:
-                self._loggingDebug(message)
-        else:
-            self.loggingDirector(logType, message )
+    def logging( self, module, logType, message, nwkid=None, context=None, args=None):
+        # message is either the text, a format string rendered with args, or a callable returning the text.
+        # For Debug, it is rendered only if the debug<module> flag is set and nwkid matches debugMatchId
+        if logType == 'Debug':
+            flag = self.debugFlags.get( module )
+            if flag is None:
+                flag = self.loggingDebugFlag( module )
+            if flag == DEBUG_OFF or ( flag == DEBUG_FILTERED and not self._logginfilter( nwkid ) ):
+                return
+            self._loggingDebug( loggingRender( message, args ) )
+        elif logType == 'Error':
+            self.loggingError(module, loggingRender( message, args ), nwkid, context)
+        elif logType in ( 'Log', 'Status' ):
+            self.loggingDirector(logType, loggingRender( message, args ) )
 
     def loggingError(self, module, message, nwkid, context):
         Domoticz.Error(message)
         
         #Log to file
         if not self.pluginconf.pluginConf['useDomoticzLog']:
-            if self.loggingFileHandle is None:
+            if self.logging_thread is None:
                 self.openLogFile()
             self.logToFile( message )
 
@@ -157,7 +299,7 @@ class LoggingManagement:
             }
 
             self.LogErrorHistory['0']['0'] = self.loggingBuildContext(module, message, nwkid, context)
-            self.loggingWriteErrorHistory()
+            self.loggingErrorHistoryUpdated()
             return # log created, leaving
 
         #check if existing log contains plugin launch time
@@ -189,7 +331,7 @@ class LoggingManagement:
                 idx = list(self.LogErrorHistory.keys())[1]
                 self.LogErrorHistory.pop(idx)
 
-        self.loggingWriteErrorHistory()
+        self.loggingErrorHistoryUpdated()
 
     def loggingBuildContext(self, module, message, nwkid, context):
         
@@ -217,14 +359,25 @@ class LoggingManagement:
                 _context['context'] = str(context)
         return _context
 
+    def loggingErrorHistoryUpdated( self ):
+        if self.logging_thread is None:
+            self.loggingWriteErrorHistory()
+        elif self.errorHistoryUpdated is None:
+            # Written by the ZiGateLogging thread within ERROR_HISTORY_DELAY
+            self.errorHistoryUpdated = time.time()
+
     def loggingWriteErrorHistory( self ):
         jsonLogHistory =  self.pluginconf.pluginConf['pluginLogs'] + "/" + "Zigate_log_error_history.json"
-        with open( jsonLogHistory, "w", encoding='utf-8') as json_file:
-            try:
-                json.dump( dict(self.LogErrorHistory), json_file)
-                json_file.write('\n')
-            except Exception as e:
-                Domoticz.Error("Hops ! Unable to write LogErrorHistory error: %s log: %s" %(e,self.LogErrorHistory ))
+        self.errorHistoryUpdated = None
+        try:
+            # json.dumps() is done in one go by the C encoder, the other threads can't modify the history in the middle
+            content = json.dumps( dict(self.LogErrorHistory) ) + '\n'
+        except Exception as e:
+            Domoticz.Error("Hops ! Unable to write LogErrorHistory error: %s log: %s" %(e,self.LogErrorHistory ))
+            return
+        with open( jsonLogHistory + '.tmp', "w", encoding='utf-8') as json_file:
+            json_file.write( content )
+        os.replace( jsonLogHistory + '.tmp', jsonLogHistory )
                 
     def loggingCleaningErrorHistory( self ):
         if len(self.LogErrorHistory) > 1:
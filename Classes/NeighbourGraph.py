@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: NeighbourGraph.py
+
+    Description: In-memory graph of the Zigbee mesh, maintained from the LQI scans and the live traffic
+
+    self.links[ router ][ neighbour ] is the entry of the router Neighbour table ( NetworkMap.LQIresp ),
+    with its LQI, relationship and the time it has been refreshed. self.seenBy[ neighbour ] are the routers
+    having it in their table, so the neighbours of a node are found in O(degree) both ways.
+    - LQIresp updates the links one by one, and drops the ones not reported anymore when a table is completed.
+    - updLQI ( every frame received, 0x8002 included ) refreshes the last LQI heard by ZiGate from the node, and
+      the link to ZiGate of its End Devices, as their frames are always received directly.
+    - The graph is seeded at start from the last scan kept in ListOfDevices ( 'Neighbours' ).
+
+"""
+
+import threading
+import time
+
+# Relationship of the router to the neighbour, seen from the neighbour
+REVERSE_RELATIONSHIP = { 'Parent': 'Child', 'Child': 'Parent' }
+
+
+class NeighbourLink(object):
+
+    __slots__ = ('lqi', 'relationship', 'devicetype', 'depth', 'ieee', 'stamp')
+
+    def __init__(self, lqi, relationship, devicetype, depth, ieee, stamp):
+        self.lqi = lqi
+        self.relationship = relationship    # Relationship of the neighbour to the router: 'Parent', 'Child', 'Sibling' ...
+        self.devicetype = devicetype        # Device type of the neighbour
+        self.depth = depth
+        self.ieee = ieee                    # IEEE of the neighbour
+        self.stamp = stamp
+
+
+class NeighbourGraph(object):
+
+    def __init__(self):
+        self.links = {}         # router -> { neighbour: NeighbourLink }
+        self.seenBy = {}        # neighbour -> set of routers having it in their table
+        self.heard = {}         # nwkid -> ( LQI, time ) of the last frame received by ZiGate
+        self.lock = threading.RLock()
+
+    def update_link(self, router, neighbour, lqi, relationship, devicetype, depth, ieee, stamp=None):
+        # Entry of a router Neighbour table
+        stamp = stamp or time.time()
+        with self.lock:
+            self.links.setdefault( router, {} )[ neighbour ] = NeighbourLink( lqi, relationship, devicetype, depth, ieee, stamp )
+            self.seenBy.setdefault( neighbour, set() ).add( router )
+
+    def prune(self, router, neighbours):
+        # The router table is complete, drop the links not in it
+        with self.lock:
+            for neighbour in [ x for x in self.links.get( router, {} ) if x not in neighbours ]:
+                self._drop_link( router, neighbour )
+
+    def remove(self, nwkid):
+        # Device gone, or with a new short address
+        with self.lock:
+            for neighbour in list( self.links.get( nwkid, {} ) ):
+                self._drop_link( nwkid, neighbour )
+            for router in list( self.seenBy.get( nwkid, () ) ):
+                self._drop_link( router, nwkid )
+            self.links.pop( nwkid, None )
+            self.heard.pop( nwkid, None )
+
+    def _drop_link(self, router, neighbour):
+        del self.links[ router ][ neighbour ]
+        routers = self.seenBy.get( neighbour )
+        if routers is not None:
+            routers.discard( router )
+            if not routers:
+                del self.seenBy[ neighbour ]
+
+    def frame_received(self, nwkid, lqi, stamp=None):
+        # LQI of a frame received by ZiGate from nwkid
+        stamp = stamp or time.time()
+        with self.lock:
+            self.heard[ nwkid ] = ( lqi, stamp )
+            link = self.links.get( '0000', {} ).get( nwkid )
+            if link is not None and link.relationship == 'Child' and link.devicetype == 'End Device':
+                link.lqi = lqi
+                link.stamp = stamp
+
+    def load_scans(self, ListOfDevices):
+        # Seed the graph with the last scan of each router kept in ListOfDevices
+        for router in list( ListOfDevices ):
+            scans = ListOfDevices[ router ].get( 'Neighbours' )
+            if not isinstance( scans, list ) or not scans or not isinstance( scans[-1], dict ):
+                continue
+            try:
+                stamp = time.mktime( time.strptime( scans[-1]['Time'], '%Y-%m-%d %H:%M:%S' ) )
+            except ( KeyError, TypeError, ValueError ):
+                continue
+            for element in scans[-1].get( 'Devices', [] ):
+                if not isinstance( element, dict ):
+                    continue
+                for neighbour, entry in element.items():
+                    self.update_link( router, neighbour, entry.get( '_lnkqty', 0 ), entry.get( '_relationshp' ),
+                        entry.get( '_devicetype' ), entry.get( '_depth', 0 ), entry.get( '_IEEE' ), stamp )
+
+    def neighbours(self, nwkid):
+        # { neighbour: ( LQI, age, relationship of the neighbour to nwkid ) }, from both tables
+        now = time.time()
+        result = {}
+        with self.lock:
+            for router in self.seenBy.get( nwkid, () ):
+                link = self.links[ router ][ nwkid ]
+                result[ router ] = ( link.lqi, int( now - link.stamp ), REVERSE_RELATIONSHIP.get( link.relationship, link.relationship ) )
+            # nwkid own table, when it is a router, prevails
+            for neighbour, link in self.links.get( nwkid, {} ).items():
+                result[ neighbour ] = ( link.lqi, int( now - link.stamp ), link.relationship )
+        return result
+
+    def ieee(self, nwkid):
+        # IEEE of nwkid as most recently reported by a router, None if unknown
+        ieee = None
+        stamp = 0
+        with self.lock:
+            for router in self.seenBy.get( nwkid, () ):
+                link = self.links[ router ][ nwkid ]
+                if link.ieee and link.stamp > stamp:
+                    ieee, stamp = link.ieee, link.stamp
+        return ieee
+
+    def parent(self, nwkid):
+        # Most recently reported parent of nwkid, None if unknown
+        parent = None
+        stamp = 0
+        with self.lock:
+            for router in self.seenBy.get( nwkid, () ):
+                link = self.links[ router ][ nwkid ]
+                if link.relationship == 'Child' and link.stamp > stamp:
+                    parent, stamp = router, link.stamp
+            for neighbour, link in self.links.get( nwkid, {} ).items():
+                if link.relationship == 'Parent' and link.stamp > stamp:
+                    parent, stamp = neighbour, link.stamp
+        return parent
+
+    def weakest_link(self, nwkid):
+        # ( neighbour, LQI ) of the lowest LQI link of nwkid, None if no link
+        links = self.neighbours( nwkid )
+        if not links:
+            return None
+        neighbour = min( links, key=lambda x: links[ x ][0] )
+        return neighbour, links[ neighbour ][0]
+
+    def weak_links(self, threshold, max_age=None):
+        # [ ( router, neighbour, LQI ) ] of the links below threshold
+        now = time.time()
+        with self.lock:
+            return [ ( router, neighbour, link.lqi ) for router in self.links for neighbour, link in self.links[ router ].items()
+                if link.lqi < threshold and ( max_age is None or now - link.stamp <= max_age ) ]
+
+    def route_hint(self, nwkid):
+        # ( router, LQI ) of the best router nwkid is linked to, a link counting for the weakest of its two directions
+        best = None
+        with self.lock:
+            candidates = set( self.seenBy.get( nwkid, () ) ) | { x for x in self.links.get( nwkid, {} ) if x in self.links }
+            for router in candidates:
+                lqis = [ self.links[ router ][ nwkid ].lqi ] if nwkid in self.links.get( router, {} ) else []
+                if router in self.links.get( nwkid, {} ):
+                    lqis.append( self.links[ nwkid ][ router ].lqi )
+                if best is None or min( lqis ) > best[1]:
+                    best = ( router, min( lqis ) )
+        return best
+
+    def report(self):
+        # Graph in the LQI report format ( NetworkMap.Neighbours ), as expected by topologyRelations()
+        with self.lock:
+            return { router: { 'Neighbours': { neighbour: {
+                        '_relationshp': link.relationship,
+                        '_lnkqty': '%02x' %link.lqi,
+                        '_devicetype': link.devicetype,
+                        '_depth': '%02x' %link.depth } for neighbour, link in self.links[ router ].items() } }
+                for router in self.links }
@@ -10,28 +10,36 @@
 
 """
 """
-    self.EnergyLevel[ nwkid ]
-                            ['Status'] ( 'Completed' /* table is completd (all entries collected */
-                                         'WaitResponse' /* Waiting for response */
-                                         'WaitResponse2' /* Waiting for response */
-                                         'ScanRequired' /* A scan is required to get more entries */
-                                         'ScanRequired2' /* A scan is required to get more entries */
-                            ['Channels'][ Num ] /* Energy Level by Channel for corresponding nwkid
+    Each ( root, target ) scan is a row:
+        self.Pairs[ row ]       ( root, target )
+        self.Status[ row ]      'ScanRequired' /* A scan is required */
+                                'WaitResponse' /* Waiting for response */
+                                'Completed'    /* Response received */
+                                'TimedOut'
+        self.Tx[ row ], self.Failure[ row ]
+        self.Levels[ row * WIDTH + channel index ]  /* Energy Level by Channel */
+    Tx, Failure and Levels are arrays, NO_LEVEL when not received. self.Pending are the rows to be scanned,
+    in order, so the next scan is found in O(1). The per channel statistics are computed on the Levels columns.
 """
 
 
 from datetime import datetime
 from time import time
+from array import array
+from collections import deque
 import os.path
-import json
 
 import Domoticz
 from Modules.basicOutputs import sendZigateCmd, maskChannel
 from Classes.AdminWidgets import AdminWidgets
 from Classes.LoggingManagement import LoggingManagement
+from Classes.ReportStore import openReportStore
 
 CHANNELS = [ '11', '12', '13','14','15','16','17','18','19','20','21','22','23','24','25','26']
+CHANNEL_INDEX = { int(c): idx for idx, c in enumerate( CHANNELS ) }
 DURATION = 0x03
+NO_LEVEL = -1
+WIDTH = len(CHANNELS)     # Levels per row
 
 class NetworkEnergy():
 
@@ -44,14 +52,25 @@ class NetworkEnergy():
         self.HardwareID = HardwareID
         self.log = log
 
-        self.EnergyLevel = None
         self.ScanInProgress = False
-        self.nwkidInQueue = []
         self.ticks = 0
+        self._resetNwkEnrgy( [] )
 
 
     def logging( self, logType, message):
         self.log.logging('NetworkEnergy', logType, message)
+
+    def _resetNwkEnrgy( self, channels ):
+
+        self.Channels = list( channels )    # Channels to be scanned
+        self.Roots = {}                     # root -> rows, in report order
+        self.Pairs = []
+        self.Status = []
+        self.Tx = array('l')
+        self.Failure = array('l')
+        self.Levels = array('h')
+        self.Pending = deque()
+        self.InFlight = None                # row waiting for its response
         
     def _initNwkEnrgy( self, root=None, target=None, channels=0):
 
@@ -73,10 +92,7 @@ class NetworkEnergy():
 
 
         self.logging( 'Debug', "_initNwkEnrgy - root: %s target: %s, channels: %s" %(root, target, channels))
-        if self.EnergyLevel:
-            del self.EnergyLevel
-
-        self.EnergyLevel = {}
+        self._resetNwkEnrgy( channels )
         
         if target == root == '0000':
             lstdev = list(self.ListOfDevices)
@@ -84,7 +100,7 @@ class NetworkEnergy():
                 lstdev.append( '0000' )
             for r in lstdev:
                 if isRouter( r ):
-                    self.EnergyLevel[ r ] = {}
+                    self.Roots[ r ] = []
                     for nwkid in self.ListOfDevices:
                         if nwkid == '0000': continue
                         if nwkid == r: continue
@@ -95,65 +111,73 @@ class NetworkEnergy():
                                 continue
                         if not isRouter( nwkid ):
                             continue
-                        self._initNwkEnrgyRecord( r, nwkid , channels)
+                        self._initNwkEnrgyRecord( r, nwkid )
         elif target == '0000':
             # We do a full scan but only for the Zigate controller
             root = '0000'
-            self.EnergyLevel[root] = {}
+            self.Roots[root] = []
             for nwkid in self.ListOfDevices:
                 if nwkid == '0000': continue
                 if not isRouter( nwkid ):
                     continue
-                self._initNwkEnrgyRecord( root, nwkid , channels)
+                self._initNwkEnrgyRecord( root, nwkid )
         elif target is not None and root is not None:
             # We target only this target
             if target in self.ListOfDevices:
                 if isRouter( target ):
-                    self._initNwkEnrgyRecord( root, target, channels )
+                    self.Roots[root] = []
+                    self._initNwkEnrgyRecord( root, target )
         return
 
 
-    def _initNwkEnrgyRecord( self, root, nwkid, channels):
+    def _initNwkEnrgyRecord( self, root, nwkid ):
 
         self.logging( 'Debug', "_initNwkEnrgyRecord %s <-> %s" %(root, nwkid))
 
-        if nwkid not in self.EnergyLevel[root]:
-            self.EnergyLevel[ root ][ nwkid ] = {}
-        self.EnergyLevel[ root ][ nwkid ][ 'Status' ]  = 'ScanRequired'
-        self.EnergyLevel[ root ][ nwkid ][ 'Tx' ]  =  None
-        self.EnergyLevel[ root ][ nwkid ][ 'Failure' ]  = None
-        self.EnergyLevel[ root ][ nwkid ][ 'Channels' ]  = {}
-        for i in channels:
-            self.EnergyLevel[ root ][ nwkid ][ 'Channels' ][ i ]  = None
+        row = len( self.Pairs )
+        self.Roots[ root ].append( row )
+        self.Pairs.append( ( root, nwkid ) )
+        self.Status.append( 'ScanRequired' )
+        self.Tx.append( NO_LEVEL )
+        self.Failure.append( NO_LEVEL )
+        self.Levels.extend( [ NO_LEVEL ] * WIDTH )
+        self.Pending.append( row )
+
+    def _levels( self, row ):
+        # { channel: Level } of a row, None for a channel requested and not received
+        levels = self.Levels[ row * WIDTH: ( row + 1 ) * WIDTH ]
+        return { c: ( levels[ idx ] if levels[ idx ] != NO_LEVEL else None ) for idx, c in enumerate( CHANNELS )
+            if c in self.Channels or levels[ idx ] != NO_LEVEL }
 
     def prettyPrintNwkEnrgy( self ):
 
-        for r in self.EnergyLevel:
-            for i in self.EnergyLevel[ r ]:
-                Domoticz.Log("%s <-> %s : %s" %(r, i, self.EnergyLevel[r][i]['Status']))
-                if self.EnergyLevel[i]['Status'] == 'Completed':
-                    Domoticz.Log("---> Tx: %s" %(self.EnergyLevel[r][i]['Tx']))
-                    Domoticz.Log("---> Failure: %s" %(self.EnergyLevel[r][i]['Failure']))
-                    for c in self.EnergyLevel[r][i]['Channels']:
-                        Domoticz.Log("---> %s: %s" %(c, self.EnergyLevel[r][i]['Channels'][c]))
+        for row, ( r, i ) in enumerate( self.Pairs ):
+            Domoticz.Log("%s <-> %s : %s" %(r, i, self.Status[ row ]))
+            if self.Status[ row ] == 'Completed':
+                Domoticz.Log("---> Tx: %s" %(self.Tx[ row ]))
+                Domoticz.Log("---> Failure: %s" %(self.Failure[ row ]))
+                for c, level in self._levels( row ).items():
+                    Domoticz.Log("---> %s: %s" %(c, level))
         self.logging( 'Debug', "")
 
-    def NwkScanReq(self, root, target, channels):
+    def NwkScanReq(self, row):
+
+        root, target = self.Pairs[ row ]
 
         # Scan Duration
         scanDuration = DURATION
         scanCount = 1
 
-        mask = maskChannel( channels )
+        mask = maskChannel( self.Channels )
         datas = target + "%08.x" %(mask) + "%02.x" %(scanDuration) + "%02.x" %(scanCount)  + "00" + root
     
-        if len(self.nwkidInQueue) == 0:
+        if self.InFlight is None:
             self.logging( 'Debug', "NwkScanReq - request a scan on channels %s for duration %s an count %s" \
-                %( channels, scanDuration, scanCount))
+                %( self.Channels, scanDuration, scanCount))
             self.logging( 'Debug', "NwkScan - %s %s" %("004A", datas))
-            self.nwkidInQueue.append( ( root, target) )
+            self.InFlight = row
             sendZigateCmd(self, "004A", datas )
-            self.EnergyLevel[ root ][ target ]['Status'] = 'WaitResponse'
+            self.Status[ row ] = 'WaitResponse'
             self.ticks = 0
 
 
@@ -186,47 +210,42 @@ class NetworkEnergy():
 
     def _next_scan( self ):
 
-        self.logging( 'Debug', "_next_scan")
+        self.logging( 'Debug', "_next_scan - In flight: %s Pending: %s" %(self.InFlight, len(self.Pending)))
         self.ticks += 1
-        allRootCompleted = True
-        self.logging( 'Debug', "_next_scan - To be scan: %s" %list(self.EnergyLevel))
-        for r in self.EnergyLevel:
-            waitResponse = False
-            breakfromabove = False
-            self.logging( 'Debug', "_next_scan - %s against %s" %(r, list(self.EnergyLevel[ r ])))
-            for i in self.EnergyLevel[ r ]:
-                self.logging( 'Debug', "--> _next_scan - %s <-> %s %s" %(r,i,self.EnergyLevel[ r ][ i ]['Status']))
-                if self.EnergyLevel[ r ][ i ]['Status'] == 'Completed':
-                    continue
-                elif self.EnergyLevel[ r ][ i ]['Status'] == 'TimedOut':
-                    continue
-                elif self.EnergyLevel[ r ][ i ]['Status'] == 'WaitResponse':
-                    waitResponse = True
-                    allRootCompleted = False
-                    if self.ticks > 2:
-                        self.logging( 'Debug', "--> _next_scan - %s <-> %s %s --> TimedOut" %(r,i,self.EnergyLevel[ r ][ i ]['Status']))
-                        self.EnergyLevel[ r ][ i ]['Status'] = 'TimedOut'
-                        if len(self.nwkidInQueue) > 0:
-                            root, entry = self.nwkidInQueue.pop()
-                            if r != root and i != entry:
-                                Domoticz.Error("Mismatch %s versus %s" %(i, entry))
-                    continue
-                elif self.EnergyLevel[ r ][ i ]['Status'] == 'ScanRequired':
-                    _channels = []
-                    for c in self.EnergyLevel[ r ][ i ]['Channels']:
-                        _channels.append( c )
-                    self.NwkScanReq( r, i, _channels)
-                    breakfromabove = True
-                    allRootCompleted = False
-                    break
-            else:
-                if not waitResponse:
-                    continue
-            if breakfromabove:
-                break
-        else:
-            if allRootCompleted:
-                self.finish_scan()
+        if self.InFlight is not None:
+            if self.ticks <= 2:
+                return
+            r, i = self.Pairs[ self.InFlight ]
+            self.logging( 'Debug', "--> _next_scan - %s <-> %s %s --> TimedOut" %(r,i,self.Status[ self.InFlight ]))
+            self.Status[ self.InFlight ] = 'TimedOut'
+            self.InFlight = None
+
+        while self.Pending:
+            row = self.Pending.popleft()
+            if self.Status[ row ] == 'ScanRequired':
+                self.NwkScanReq( row )
+                return
+
+        self.finish_scan()
+
+    def channel_statistics( self ):
+        # Per channel statistics of the last scan, across all ( root, target ) scans received
+        statistics = []
+        for idx, c in enumerate( CHANNELS ):
+            # Column of the channel, rows without a Level dropped
+            levels = sorted( filter( NO_LEVEL.__ne__, self.Levels[ idx::WIDTH ] ) )
+            if not levels:
+                continue
+            statistics.append( {
+                'Channel': c,
+                'Count': len(levels),
+                'Mean': round( sum( levels ) / len(levels), 1),
+                'Max': levels[-1],
+                'P50': levels[ ( len(levels) - 1 ) // 2 ],
+                'P90': levels[ ( 9 * ( len(levels) - 1 ) ) // 10 ],
+            } )
+        best = min( statistics, key=lambda x: ( x['P90'], x['Mean'] ) )['Channel'] if statistics else None
+        return { 'Channels': statistics, 'BestChannel': best }
 
 
     def finish_scan( self ):
@@ -237,14 +256,15 @@ class NetworkEnergy():
         stamp = int(time())
         storeEnergy = {}
         storeEnergy[stamp] = []
-        for r in self.EnergyLevel:
+        for r in self.Roots:
             Domoticz.Status("Network Energy Level Report: %s" %r)
             Domoticz.Status("-----------------------------------------------")
             Domoticz.Status("%6s <- %5s %6s %8s %4s %4s %4s %4s %4s %4s" %('router', 'nwkid', 'Tx', 'Failure', '11','15','19','20','25','26'))
             router = {}
             router['_NwkId'] = r
             router['MeshRouters'] = []
-            for nwkid in self.EnergyLevel[ r ]:
+            for row in self.Roots[ r ]:
+                nwkid = self.Pairs[ row ][1]
                 entry = {}
                 entry['_NwkId'] = nwkid
                 if nwkid not in self.ListOfDevices:
@@ -254,11 +274,13 @@ class NetworkEnergy():
                         entry['ZDeviceName'] = self.ListOfDevices[nwkid]['ZDeviceName']
                     else:
                         entry['ZDeviceName'] = nwkid
-                if self.EnergyLevel[ r ][nwkid]['Status'] != 'Completed':
+                tx = self.Tx[ row ] if self.Tx[ row ] != NO_LEVEL else None
+                failure = self.Failure[ row ] if self.Failure[ row ] != NO_LEVEL else None
+                if self.Status[ row ] != 'Completed':
                     entry['Tx'] = 0
                     entry['Failure'] = 0
                     entry['Channels'] = []
-                    toprint = "%6s <- %5s %6s %8s" %(r, nwkid, self.EnergyLevel[ r ][ nwkid ][ 'Tx' ], self.EnergyLevel[ r ][ nwkid ][ 'Failure' ])
+                    toprint = "%6s <- %5s %6s %8s" %(r, nwkid, tx, failure)
                     for c in CHANNELS:
                         channels = {}
                         channels['Channel'] = c
@@ -266,19 +288,17 @@ class NetworkEnergy():
                         entry['Channels'].append( channels )
                         toprint += " %4s" %0
                 else:
-                    entry['Tx'] = self.EnergyLevel[ r ][ nwkid ][ 'Tx' ]
-                    entry['Failure'] = self.EnergyLevel[ r ][ nwkid ][ 'Failure' ]
+                    entry['Tx'] = tx
+                    entry['Failure'] = failure
                     entry['Channels'] = []
     
-                    toprint = "%6s <- %5s %6s %8s" %(r, nwkid, self.EnergyLevel[ r ][ nwkid ][ 'Tx' ], self.EnergyLevel[ r ][ nwkid ][ 'Failure' ])
-                    for c in self.EnergyLevel[ r ][ nwkid ]['Channels']:
+                    toprint = "%6s <- %5s %6s %8s" %(r, nwkid, tx, failure)
+                    for c, level in self._levels( row ).items():
                         channels = {}
-                        if c not in CHANNELS:
-                            continue
                         channels['Channel'] = c
-                        channels['Level'] = self.EnergyLevel[ r ][ nwkid ]['Channels'][ c ]
+                        channels['Level'] = level
                         entry['Channels'].append( channels )
-                        toprint += " %4s" %self.EnergyLevel[ r ][ nwkid ]['Channels'][ c ]
+                        toprint += " %4s" %level
                 router['MeshRouters'].append ( entry )
                 Domoticz.Status(toprint)
             storeEnergy[stamp].append( router )
@@ -287,26 +307,9 @@ class NetworkEnergy():
 
         _filename = self.pluginconf.pluginConf['pluginReports'] + 'NetworkEnergy-v3-' + '%02d' %self.HardwareID + '.json'
         if os.path.isdir( self.pluginconf.pluginConf['pluginReports'] ):
-
-            nbentries = 0
-            if os.path.isfile( _filename ):
-                with open( _filename, 'r') as fin:
-                    data = fin.read().splitlines(True)
-                    nbentries = len(data)
-
-            with open( _filename, 'w') as fout:
-                # we need to short the list by todayNumReports - todayNumReports - 1
-                maxNumReports = self.pluginconf.pluginConf['numTopologyReports']
-                start = 0
-                if nbentries >= maxNumReports:
-                    start = (nbentries - maxNumReports)+ 1
-                self.logging( 'Debug', "Rpt max: %s , New Start: %s, Len:%s " %(maxNumReports, start, nbentries))
-
-                if nbentries != 0:
-                    fout.write('\n')
-                    fout.writelines(data[start:])
-                fout.write('\n')
-                json.dump( storeEnergy, fout)
+            maxNumReports = self.pluginconf.pluginConf['numEnergyReports']
+            self.logging( 'Debug', "Rpt max: %s , New report: %s" %(maxNumReports, stamp))
+            openReportStore( _filename ).append( stamp, storeEnergy[stamp], maxNumReports )
         else:
             Domoticz.Error("Unable to get access to directory %s, please check PluginConf.txt" %(self.pluginconf.pluginConf['pluginReports']))
 
@@ -342,27 +345,16 @@ class NetworkEnergy():
             Domoticz.Error("NwkScanResponse - Status: %s with Data: %s" %(MsgDataStatus, MsgData))
             return
 
-        if len(self.nwkidInQueue) == 0 and MsgSrc:
-            #self.logging( 'Log', "NwkScanResponse - Empty Queue, Receive infos from %s" %MsgSrc)
-            return
-
-        if len(self.nwkidInQueue) == 0:
-            #self.logging( 'Log', "NwkScanResponse - Empty Queue ")
+        if self.InFlight is None:
+            #self.logging( 'Log', "NwkScanResponse - Nothing expected, Receive infos from %s" %MsgSrc)
             return
 
-        if len(self.nwkidInQueue) > 0 and MsgSrc:
-            root, entry = self.nwkidInQueue.pop()
-            self.logging( 'Debug', "NwkScanResponse - Root: %s, Entry: %s, MsgSrc: %s" %(root, entry, MsgSrc))
-            if entry != MsgSrc:
-                Domoticz.Log("NwkScanResponse - Unexpected message >%s< from %s, expecting %s" %( MsgData, MsgSrc, entry))
-
-        elif  len(self.nwkidInQueue) > 0 :
-            root, entry = self.nwkidInQueue.pop()
-            self.logging( 'Debug', "NwkScanResponse - Root: %s, Entry: %s" %(root, entry))
-            
-        else:
-            self.logging( 'Log', "NwkScanResponse - Unexpected: len: %s, MsgSrc: %s" %(len(self.nwkidInQueue), MsgSrc))
-            return
+        row = self.InFlight
+        self.InFlight = None
+        root, entry = self.Pairs[ row ]
+        self.logging( 'Debug', "NwkScanResponse - Root: %s, Entry: %s, MsgSrc: %s" %(root, entry, MsgSrc))
+        if MsgSrc and entry != MsgSrc:
+            Domoticz.Log("NwkScanResponse - Unexpected message >%s< from %s, expecting %s" %( MsgData, MsgSrc, entry))
 
         channelList = []
         for channel in CHANNELS:
@@ -378,13 +370,13 @@ class NetworkEnergy():
         self.logging( 'Debug', "NwkScanResponse - SQN: %s, Tx: %s , Failures: %s , Status: %s) " \
                 %(MsgSequenceNumber, int(MsgTotalTransmission,16), int(MsgTransmissionFailures,16), MsgDataStatus) )
 
-        self.EnergyLevel[ root ][ entry ][ 'Tx' ]  =   int(MsgTotalTransmission,16)
-        self.EnergyLevel[ root ][ entry ][ 'Failure' ]  =  int(MsgTransmissionFailures,16)
+        self.Tx[ row ] = int(MsgTotalTransmission,16)
+        self.Failure[ row ] = int(MsgTransmissionFailures,16)
 
         for chan, inter in zip( channelList, channelListInterferences ):
-            if chan in CHANNELS:
-                self.EnergyLevel[ root ][ entry ]['Channels'][ str(chan) ] = int(inter,16)
+            if chan in CHANNEL_INDEX:
+                self.Levels[ row * WIDTH + CHANNEL_INDEX[ chan ] ] = int(inter,16)
                 self.logging( 'Debug', "     %s <- %s Channel: %s Interference: : %s " %(root, entry, chan, int(inter,16)))
 
-        self.EnergyLevel[ root ][ entry ]['Status'] = 'Completed'
+        self.Status[ row ] = 'Completed'
         return
@@ -21,18 +21,30 @@
                                 ['TableCurSize'] Number of actual entries
                                 ['Neighbours'][ nwkid ]
                                                        [attributes]
+
+    Scan
+        Up to 'TopologyParallelRequests' Mgmt_Lqi_req ( 0x004E ) are in flight ( self.LQIreqInProgress[ nwkid ] = time sent ),
+        less when the ZiGate send queue is loaded, none above MAX_LOAD_ZIGATE. Each request times out on its own after LQI_REQUEST_TIMEOUT.
+        A response frees its slot at once: next page of the same table, or next Router to be scanned.
+        Responses are matched on their source ( firmware 3.1a and above ), until such a response is received
+        only one request is in flight.
 """
 
 
 from datetime import datetime
 import time
 import os.path
-import json
 
 import Domoticz
 
+from Modules.zigateConsts import HEARTBEAT, MAX_LOAD_ZIGATE
+
 from Classes.AdminWidgets import AdminWidgets
 from Classes.LoggingManagement import LoggingManagement
+from Classes.ReportStore import openReportStore
+from Classes.NeighbourGraph import NeighbourGraph
+
+LQI_REQUEST_TIMEOUT = 3 * HEARTBEAT         # No response since then, the request is sent again once, then the Router is TimedOut
 
 class NetworkMap():
 
@@ -46,9 +58,11 @@ class NetworkMap():
         self.log = log
 
         self._NetworkMapPhase = 0
-        self.LQIreqInProgress = []
-        self.LQIticks = 0
+        self.LQIreqInProgress = {}              # nwkid -> time the request has been sent
+        self.LQIrespWithSource = False          # Responses provide their source, requests can be run in parallel
         self.Neighbours = {}                   # Table of Neighbours
+        self.graph = NeighbourGraph()           # Live graph of the mesh, kept up to date by the scans and the traffic
+        self.graph.load_scans( ListOfDevices )
 
 
     def logging( self, logType, message):
@@ -138,11 +152,17 @@ class NetworkMap():
             self.logging( 'Debug', "Skiping %s as it's not a Router nor Coordinator" %nwkid)
             return
 
+        if nwkid in self.ListOfDevices:
+            if 'Health' in self.ListOfDevices[nwkid]:
+                if self.ListOfDevices[nwkid]['Health'] == 'Not Reachable':
+                    self.logging( 'Log', "LQIreq - skiping device %s which is Not Reachable" %nwkid)
+                    self.Neighbours[ nwkid ]['Status'] = 'NotReachable'
+                    return
+
         # u8StartIndex is the Neighbour table index of the first entry to be included in the response to this request
         index = self.Neighbours[ nwkid ]['TableCurSize']
 
-        ############self.LQIreq
-        self.LQIreqInProgress.append ( nwkid )
+        self.LQIreqInProgress[ nwkid ] = time.time()
         datas = "%s%02X" %(nwkid, index)
 
         self.logging( 'Debug', "LQIreq - from: %s start at index: %s" %( nwkid, index ))
@@ -151,17 +171,30 @@ class NetworkMap():
         elif self.Neighbours[ nwkid ]['Status'] == 'ScanRequired2':
             self.Neighbours[ nwkid ]['Status'] = 'WaitResponse2'
 
-        if nwkid in self.ListOfDevices:
-            if 'Health' in self.ListOfDevices[nwkid]:
-                if self.ListOfDevices[nwkid]['Health'] == 'Not Reachable':
-                    self.logging( 'Log', "LQIreq - skiping device %s which is Not Reachable" %nwkid)
-                    self.Neighbours[ nwkid ]['Status'] = 'NotReachable'
-                    return
-
         self.ZigateComm.sendData( "004E",datas)  
 
         return
 
+    def scan_window( self ):
+        # Number of LQI requests which can be in flight
+        if self.ZigateComm.loadTransmit() > MAX_LOAD_ZIGATE:
+            # Same gate as the heartbeat applies before continue_scan, as LQIresp also fills the window
+            return 0
+        if not self.LQIrespWithSource:
+            # Responses cannot be matched to their request
+            return 1
+        return max( 1, self.pluginconf.pluginConf['TopologyParallelRequests'] - self.ZigateComm.loadTransmit() )
+
+    def fill_scan_window( self ):
+        # Send LQI requests to the Routers to be scanned, while there is room in the window
+        for entry in list(self.Neighbours):
+            if len(self.LQIreqInProgress) >= self.scan_window():
+                return
+            if entry in self.LQIreqInProgress:
+                continue
+            if self.Neighbours[entry]['Status'] in ( 'ScanRequired', 'ScanRequired2') :
+                self.LQIreq( entry )
+
     def start_scan(self):
 
         if len(self.Neighbours) != 0:
@@ -169,6 +202,7 @@ class NetworkMap():
             del self.Neighbours
             self.Neighbours = {}
 
+        self.LQIreqInProgress = {}
         self._initNeighbours( )
         # Start on Zigate Controler
         self.prettyPrintNeighbours()
@@ -180,14 +214,16 @@ class NetworkMap():
         self.logging( 'Debug', "continue_scan - %s" %( len(self.LQIreqInProgress) ))
 
         self.prettyPrintNeighbours()
-        if len(self.LQIreqInProgress) > 0 and self.LQIticks < 2:
-            self.logging( 'Debug', "continue_scan - Command pending")
-            self.LQIticks += 1
-            return
-
-        if len(self.LQIreqInProgress) > 0 and self.LQIticks >= 2:
-            entry = self.LQIreqInProgress.pop()
+        now = time.time()
+        for entry, sent in list( self.LQIreqInProgress.items() ):
+            if now < sent + LQI_REQUEST_TIMEOUT:
+                continue
+            # LQIresp runs on the frame processing thread, the response might have been received meanwhile
+            if self.LQIreqInProgress.pop( entry, None ) is None:
+                continue
             self.logging( 'Debug', "Commdand pending Timeout: %s" % entry)
+            if entry not in self.Neighbours:
+                continue
             if self.Neighbours[entry]['Status'] == 'WaitResponse':
                 self.Neighbours[entry]['Status'] = 'ScanRequired2'
                 self.logging( 'Debug', "LQI:continue_scan - Try one more for %s" %entry)
@@ -195,37 +231,26 @@ class NetworkMap():
                 self.Neighbours[entry]['Status'] = 'TimedOut'
                 self.logging( 'Debug', "LQI:continue_scan - TimedOut for %s" %entry)
 
-            self.LQIticks = 0
-            self.logging( 'Debug', "continue_scan - %s" %( len(self.LQIreqInProgress) ))
-
-        waitResponse = False
         for entry in list(self.Neighbours):
             if entry not in self.ListOfDevices:
                 self.logging( 'Log', "LQIreq - device %s not found removing from the device to be scaned" %entry)
                 # Most likely this device as been removed, or change it Short Id
                 del self.Neighbours[ entry ]
-                continue
+                self.LQIreqInProgress.pop( entry, None )
 
-            if self.Neighbours[entry]['Status'] == 'Completed':
-                continue
+        self.fill_scan_window()
 
-            elif self.Neighbours[entry]['Status'] in ( 'TimedOut', 'NotReachable'):
-                continue
+        if self.LQIreqInProgress:
+            self.logging( 'Debug', "continue_scan - %s Command(s) pending" %len(self.LQIreqInProgress))
+            return
 
-            elif self.Neighbours[entry]['Status'] in ( 'WaitResponse', 'WaitResponse2'):
-                waitResponse = True
-                continue
+        if any( self.Neighbours[entry]['Status'] in ( 'ScanRequired', 'ScanRequired2') for entry in self.Neighbours ):
+            return
 
-            elif self.Neighbours[entry]['Status'] in ( 'ScanRequired', 'ScanRequired2') :
-                self.LQIreq( entry )
-                return
-        else:
-            # We have been through all list of devices and not action triggered
-            if not waitResponse:
-                self.logging( 'Debug', "continue_scan - scan completed, all Neighbour tables received.")
-                self._NetworkMapPhase = 0
-                self.finish_scan()
-        return
+        # We have been through all list of devices and not action triggered
+        self.logging( 'Debug', "continue_scan - scan completed, all Neighbour tables received.")
+        self._NetworkMapPhase = 0
+        self.finish_scan()
 
     def finish_scan( self ):
 
@@ -301,31 +326,13 @@ class NetworkMap():
 
         self.prettyPrintNeighbours()
 
-        storeLQI = {}
-        storeLQI[int(time.time())] = dict(self.Neighbours)
+        stamp = int(time.time())
 
         _filename = self.pluginconf.pluginConf['pluginReports'] + 'NetworkTopology-v3-' + '%02d' %self.HardwareID + '.json'
         if os.path.isdir( self.pluginconf.pluginConf['pluginReports'] ):
-
-            nbentries = 0
-            if os.path.isfile( _filename ):
-                with open( _filename, 'r') as fin:
-                    data = fin.read().splitlines(True)
-                    nbentries = len(data)
-
-            with open( _filename, 'w') as fout:
-                # we need to short the list by todayNumReports - todayNumReports - 1
-                maxNumReports = self.pluginconf.pluginConf['numTopologyReports']
-                start = 0
-                if nbentries >= maxNumReports:
-                    start = (nbentries - maxNumReports)+ 1
-                self.logging( 'Debug', "Rpt max: %s , New Start: %s, Len:%s " %(maxNumReports, start, nbentries))
-
-                if nbentries != 0:
-                    fout.write('\n')
-                    fout.writelines(data[start:])
-                fout.write('\n')
-                json.dump( storeLQI, fout)
+            maxNumReports = self.pluginconf.pluginConf['numTopologyReports']
+            self.logging( 'Debug', "Rpt max: %s , New report: %s" %(maxNumReports, stamp))
+            openReportStore( _filename ).append( stamp, dict(self.Neighbours), maxNumReports )
             #self.adminWidgets.updateNotificationWidget( Devices, 'A new LQI report is available')
         else:
             Domoticz.Error("LQI:Unable to get access to directory %s, please check PluginConf.txt" %(self.pluginconf.pluginConf['pluginReports']))
@@ -358,10 +365,22 @@ class NetworkMap():
             Domoticz.Error("LQI:LQIresp - missmatch. Expecting %s entries and found %s" \
                     %(NeighbourTableListCount, len(ListOfEntries)//42))
 
-        NwkIdSource = self.LQIreqInProgress.pop()
+        # continue_scan runs on the heartbeat, and may time out a request at the same time
         if MsgSrc:
-            if MsgSrc != NwkIdSource:
-                Domoticz.Log("LQIresp - Receive %s but expect %s" %(MsgSrc, NwkIdSource))
+            self.LQIrespWithSource = True
+            NwkIdSource = MsgSrc
+        else:
+            # Oldest request
+            try:
+                NwkIdSource = min( self.LQIreqInProgress, key=lambda x: self.LQIreqInProgress.get( x, 0 ) )
+            except ValueError:
+                NwkIdSource = None
+        if NwkIdSource is None or self.LQIreqInProgress.pop( NwkIdSource, None ) is None:
+            self.logging( 'Debug', "LQI:LQIresp - Receive unexpected message from %s %s"  %(MsgSrc, MsgData))
+            return
+
+        if NwkIdSource not in self.Neighbours:
+            return
 
         self.logging( 'Debug', "self.LQIreqInProgress = %s" %len(self.LQIreqInProgress))
         self.logging( 'Debug', "LQIresp - %s Status: %s, NeighbourTableEntries: %s, StartIndex: %s, NeighbourTableListCount: %s" \
@@ -374,6 +393,7 @@ class NetworkMap():
             # No element in that list
             self.logging( 'Debug', "LQIresp -  No element in that list ")
             self.Neighbours[NwkIdSource]['Status'] = 'Completed'
+            self.fill_scan_window()
             return
 
         if (StartIndex + NeighbourTableListCount) == NeighbourTableEntries:
@@ -473,5 +493,11 @@ class NetworkMap():
             self.Neighbours[NwkIdSource]['Neighbours'][_nwkid]['_permitjnt'] = _permitjnt
             self.Neighbours[NwkIdSource]['Neighbours'][_nwkid]['_relationshp'] = _relationshp
             self.Neighbours[NwkIdSource]['Neighbours'][_nwkid]['_rxonwhenidl'] = _rxonwhenidl
+            self.graph.update_link( NwkIdSource, _nwkid, int(_lnkqty, 16) if _lnkqty else 0, _relationshp, _devicetype, int(_depth, 16) if _depth else 0, _ieee )
+
+        if self.Neighbours[NwkIdSource]['Status'] == 'Completed':
+            self.graph.prune( NwkIdSource, self.Neighbours[NwkIdSource]['Neighbours'] )
 
+        # Next page of this table, or next Router, without waiting for the heartbeat
+        self.fill_scan_window()
         return
@@ -17,13 +17,17 @@
 # 
 #     0x8503 <------------------
 # 
-#     'Upgraded Device':
-#         - Notified
-#         - Block Requested
-#         - Transfer Progress
-#         - Transfer Completed
-#         - Transfer Aborted
-#         - Timeout
+#     Each requested upgrade is a Transfer ( self.Transfers[ NwkId ] ), with its own state:
+#         - Queued   : waiting for a free slot ( otaMaxConcurrentUpdates ) and for ZiGate to have aPDU to spare
+#         - Notified : the image is loaded on ZiGate ( 0x0500 ) and the device notified ( 0x0505 )
+#         - Transfer : the device is requesting blocks ( 0x8501 ), served from its own mapped image
+#         - Resumed  : restored after a plugin restart, waiting for the device to request its next block
+# 
+#     ZiGate holds one image for the Query Next Image, so only devices upgraded with the same image are
+#     Notified together. Once a device is requesting blocks, the image loaded on ZiGate doesn't matter
+#     anymore and the next queued device can be started.
+#     When ZiGate is short of aPDU, only the oldest Transfer is served, the others are asked to wait ( 0x0506 ).
+#     The Transfers are saved in ListOfDevices ( 'OTA-Transfer' ) so they survive a plugin restart.
 # 
 # """
 
@@ -31,6 +35,7 @@ import Domoticz
 
 import binascii
 import struct
+import threading
 
 from os import listdir
 from os.path import isfile, join
@@ -41,9 +46,22 @@ from Modules.zigateConsts import ADDRESS_MODE, HEARTBEAT, MAX_LOAD_ZIGATE, ZIGAT
 
 from Classes.AdminWidgets import AdminWidgets
 from Classes.LoggingManagement import LoggingManagement
+from Classes.OtaImageCatalogue import OtaImageCatalogue
+from Classes.TransportScheduler import APDU_POOL_SIZE
 
 OTA_CLUSTER_ID = '0019'
 
+# 0x0502 BLOCK_SEND: Address mode, NwkId, Src Ep, Dst Ep, Sequence, Status, Offset, Image Version, Image Type, Manuf Code, Length
+OTA_BLOCK_HEADER = struct.Struct('>BHBBBBLLHHB')
+OTA_BLOCK_SQN_INDEX = 5
+
+OTA_TRANSFER_TIMEOUT = 300              # No Block request since then, the Transfer is dropped
+OTA_RESUME_TIMEOUT = 60                 # Restored Transfer without Block request since then, the device is notified again
+OTA_NOTIFY_RETRY = 10                   # Notifications ( one per heartbeat ) before giving up
+OTA_APDU_ADMISSION = APDU_POOL_SIZE // 2    # No new Transfer is started above this aPDU usage
+OTA_APDU_THROTTLE = APDU_POOL_SIZE - 2      # Only the oldest Transfer is served above this aPDU usage
+OTA_THROTTLE_DELAY = 1000               # ms, Block Request Delay given to the throttled devices
+
 OTA_CODES = {
     'Ikea':      { 'Folder': 'IKEA-TRADFRI',    'ManufCode': 0x117c, 'ManufName': 'IKEA of Sweden',     'Enabled': True},
     'Ledvance':  { 'Folder': 'LEDVANCE',        'ManufCode': 0x1189, 'ManufName': 'LEDVANCE',           'Enabled': True},
@@ -70,9 +88,11 @@ class OTAManagement(object):
         self.homeDirectory = HomeDirectory
         self.log = log
         self.PluginHealth = PluginHealth
+        self.hardwareID = hardwareID
 
 
-        self.ListOfImages = {}      # List of available firmware loaded at plugin startup
+        self.ListOfImages = {}      # List of available firmware found at plugin startup ( headers only )
+        self.ImageCatalogue = OtaImageCatalogue( self.pluginconf.pluginConf['pluginData'] + 'OTA-Headers-%02d.json' %hardwareID )
 
         self.ImageLoaded = {        # Indicates information of the current Firmware/Image loaded on ZiGate
             'ImageVersion': None,
@@ -83,36 +103,26 @@ class OTAManagement(object):
             'NotifiedTimeStamp': 0,
             }
 
-        self.ListInUpdate = {       # Tracking requested update information
-            'FileName': None,
-            'intImageType': None,
-            'intImageVersion': None,
-            'ImageVersion': None,
-            'Process': None,
-            'LastBlockSent': 0,
-            'NwkId': None,
-            'Ep': None,
-            'intManufCode': None,
-            'LastBlockSent': 0,
-            'AuthorizedForUpdate': [],
-            'Retry': 0
-        }
+        self.Transfers = {}         # NwkId -> Transfer, one per requested upgrade
+        self.UpgradeQueue = []      # NwkId of the Queued Transfers, in request order
+        self.lock = threading.RLock()   # 0x8501/0x8503 may be decoded out of the heartbeat thread
 
 
         self.once = True
         ota_scan_folder( self )
+        restore_transfers( self )
 
     def cancel_current_firmware_update( self ):
-        self.ListInUpdate['NwkId'] = None
-        self.ListInUpdate['LastBlockSent'] = 0
-        self.ListInUpdate['Retry'] = 0
-        self.ImageLoaded['NotifiedTimeStamp'] = 0
-        self.ImageLoaded['LoadedTimeStamp'] = 0
-        self.ListInUpdate['Process'] = None
+        with self.lock:
+            for NwkId in list( self.Transfers ):
+                end_transfer( self, NwkId )
+            self.ImageLoaded['NotifiedTimeStamp'] = 0
+            self.ImageLoaded['LoadedTimeStamp'] = 0
 
     def ota_request_firmware( self , MsgData):  # OK 13/10
         # ota_request_firmware(self, Devices, MsgData, MsgLQI):  # OTA image block request
         # BLOCK_REQUEST  0x8501  ZiGate will receive this command when device asks OTA firmware
+        _receivedTime = time()
         logging( self,  'Debug+', "ota_request_firmware - Request Firmware Block (%s) %s" %(len(MsgData), MsgData))
 
         MsgSQN =                 MsgData[0:2]
@@ -132,53 +142,59 @@ class OTAManagement(object):
         logging( self,  'Debug', "ota_request_firmware - Request Firmware %s/%s Offset: %s Version: 0x%08x Type: 0x%04X Manuf: 0x%04X Delay: %s MaxSize: %s Control: 0x%02X"
             %(MsgSrcAddr, MsgEP, int(MsgFileOffset,16), intMsgImageVersion, intMsgImageType, intMsgManufCode, int(MsgBlockRequestDelay,16), int(MsgMaxDataSize,16), intMsgFieldControl))
 
-        if self.ListInUpdate['NwkId'] is None:
-            logging( self,  'Debug', "ota_request_firmware - Async request from device: %s." %(MsgSrcAddr))
-            if not async_request( self, MsgSrcAddr, MsgEP, MsgIEEE, MsgFileOffset, intMsgImageVersion, intMsgImageType, intMsgManufCode, MsgBlockRequestDelay, MsgMaxDataSize, intMsgFieldControl):
-                logging( self,  'Debug', "ota_request_firmware %s/%s - Async request failed %s " %(MsgSrcAddr, MsgEP, self.ListInUpdate))
+        with self.lock:
+            transfer = self.Transfers.get( MsgSrcAddr )
+            if transfer is None:
+                # We need to prevent looping on serving if it is not expected!
+                logging( self,  'Error', "ota_request_firmware %s/%s - There is no upgrade plan for that device, drop request" %(MsgSrcAddr, MsgEP))
                 return
 
-        self.ListInUpdate['Retry'] = 0
+            # Get all block information, and patch if needed ( Legrand )
+            block_request = initialize_block_request( self, MsgSrcAddr, MsgEP, MsgFileOffset, intMsgImageVersion, intMsgImageType,
+                                                intMsgManufCode, MsgBlockRequestDelay, MsgMaxDataSize, intMsgFieldControl, MsgSQN)
+            block_request['ReceivedTime'] = _receivedTime
+            if intMsgImageType != block_request['ImageType']:
+                intMsgImageType = block_request['ImageType']
 
-        # Get all block information, and patch if needed ( Legrand )
-        block_request = initialize_block_request( self, MsgSrcAddr, MsgEP, MsgFileOffset, intMsgImageVersion, intMsgImageType, 
-                                            intMsgManufCode, MsgBlockRequestDelay, MsgMaxDataSize, intMsgFieldControl, MsgSQN) 
-        if intMsgImageType != block_request['ImageType']:
-            intMsgImageType = block_request['ImageType']
+            if intMsgImageType not in self.ListOfImages['ImageType']:
+                # Image Type unknown or not loaded
+                logging( self,  'Error', "ota_request_firmware %s/%s - 0x%04x image not found" %(MsgSrcAddr, MsgEP, intMsgImageType))
+                return
 
-        if intMsgImageType not in self.ListOfImages['ImageType']:
-            # Image Type unknown or not loaded
-            logging( self,  'Error', "ota_request_firmware %s/%s - 0x%04x image not found" %(MsgSrcAddr, MsgEP, intMsgImageType))
-            return                
+            if intMsgImageType != transfer['ImageType']:
+                # Request which do not belongs to the planned upgrade
+                logging( self,  'Error', "ota_request_firmware %s/%s - request 0x%04x while 0x%04x is planned" %(MsgSrcAddr, MsgEP, intMsgImageType, transfer['ImageType']))
+                return
 
-        if self.ListInUpdate['NwkId'] and intMsgImageType != self.ListInUpdate['intImageType'] and MsgSrcAddr != self.ListInUpdate['NwkId']:
-            # Request which do not belongs to the current upgrade
-            logging( self,  'Error', "ota_request_firmware %s/%s - request update while an other is in progress %s " %(MsgSrcAddr, MsgEP, self.ListInUpdate['NwkId']))
-            return
+            logging( self,  'Debug', "ota_request_firmware - [%3s] OTA image Block request - %s/%s Offset: %s version: 0x%08X Type: 0%04X Code: 0x%04X Delay: %s MaxSize: %s Control: 0x%02X"
+                %(int(MsgSQN,16), MsgSrcAddr, MsgEP, int(MsgFileOffset,16), intMsgImageVersion, intMsgImageType, intMsgManufCode, int(MsgBlockRequestDelay,16), int(MsgMaxDataSize,16), intMsgFieldControl))
 
-        logging( self,  'Debug', "ota_request_firmware - [%3s] OTA image Block request - %s/%s Offset: %s version: 0x%08X Type: 0%04X Code: 0x%04X Delay: %s MaxSize: %s Control: 0x%02X"
-            %(int(MsgSQN,16), MsgSrcAddr, MsgEP, int(MsgFileOffset,16), intMsgImageVersion, intMsgImageType, intMsgManufCode, int(MsgBlockRequestDelay,16), int(MsgMaxDataSize,16), intMsgFieldControl))
+            if transfer['Status'] == 'Queued' and len( active_transfers( self ) ) >= self.pluginconf.pluginConf['otaMaxConcurrentUpdates']:
+                # The device comes by itself, but there is no free slot yet
+                ota_management( self, MsgSrcAddr, MsgEP, OTA_THROTTLE_DELAY )
+                return
 
-        if self.ListInUpdate['Process'] is None:
-            start_upgrade_infos( self, MsgSrcAddr, intMsgImageType, intMsgManufCode, MsgFileOffset, MsgMaxDataSize)
-            self.ListInUpdate['Process'] = 'Started'
-        else:
-            self.ListInUpdate['Process'] = 'OnGoing'
+            if ota_throttled( self, transfer ):
+                logging( self,  'Debug', "ota_request_firmware - %s/%s asked to wait, aPDU: %s" %(MsgSrcAddr, MsgEP, self.ZigateComm.apdu))
+                transfer['LastBlockSent'] = time()
+                ota_management( self, MsgSrcAddr, MsgEP, OTA_THROTTLE_DELAY )
+                return
 
-        display_percentage_progress( self, MsgSrcAddr, MsgEP, intMsgImageType, MsgFileOffset )
+            if transfer['Status'] != 'Transfer':
+                start_upgrade_infos( self, transfer, MsgEP, intMsgManufCode, MsgMaxDataSize)
 
-        self.ListInUpdate['Status'] = 'Block requested'
-        self.ListInUpdate['intFileOffset'] = int(MsgFileOffset,16)
-        self.ListInUpdate['LastBlockSent'] = time()
+            display_percentage_progress( self, transfer, MsgFileOffset )
 
-        # self. ota_management( MsgSrcAddr, MsgEP )
+            transfer['Retry'] = 0
+            transfer['Offset'] = int(MsgFileOffset,16)
+            transfer['LastBlockSent'] = time()
 
-        logging( self,  'Debug', "ota_request_firmware - Block Request for %s/%s Image Type: 0x%04X Image Version: %08X Seq: %s Offset: %s Size: %s FieldCtrl: 0x%02X" \
-            %(MsgSrcAddr, block_request['ReqEp'], block_request['ImageType'], \
-                block_request['ImageVersion'], MsgSQN, (block_request['Offset'],16), 
-               int(block_request['MaxDataSize'],16), block_request['FieldControl']))
+            logging( self,  'Debug', "ota_request_firmware - Block Request for %s/%s Image Type: 0x%04X Image Version: %08X Seq: %s Offset: %s Size: %s FieldCtrl: 0x%02X" \
+                %(MsgSrcAddr, block_request['ReqEp'], block_request['ImageType'], \
+                    block_request['ImageVersion'], MsgSQN, (block_request['Offset'],16),
+                   int(block_request['MaxDataSize'],16), block_request['FieldControl']))
 
-        ota_send_block( self, MsgSrcAddr, MsgEP, intMsgImageType, intMsgImageVersion, block_request )           
+            ota_send_block( self, transfer, MsgEP, block_request )
 
 
     def ota_request_firmware_completed( self , MsgData):
@@ -194,7 +210,7 @@ class OTAManagement(object):
         #define OTA_UNSUP_CLUSTER_COMMAND                 (uint8)0x81
         #define OTA_REQUIRE_MORE_IMAGE                    (uint8)0x99
         logging( self,  'Debug2', "Decode8503 - Request Firmware Completed %s/%s" %(MsgData, len(MsgData)))
-        
+
         MsgSQN             = MsgData[0:2]
         MsgEP              = MsgData[2:4]
         MsgClusterId       = MsgData[4:8]
@@ -208,100 +224,85 @@ class OTAManagement(object):
         logging( self, 'Debug', "OTA upgrade completed - %s/%s %s Version: 0x%08x Type: 0x%04x Code: 0x%04x Status: %s"
             %(MsgSrcAddr, MsgEP, MsgClusterId, intMsgImageVersion, image_type, intMsgManufCode, MsgStatus))
 
-        if self.ListInUpdate['NwkId'] is None:
-            logging( self,  'Log', "ota_request_firmware_completed - Receive Firmware Completed from %s most likely a duplicated packet as there is nothing in Progress. " %(MsgSrcAddr))
-            return
-        
-        if self.ListInUpdate['NwkId'] and MsgSrcAddr != self.ListInUpdate['NwkId']:
-            logging( self, 'Error', "ota_request_firmware_completed - OTA upgrade completed - %s not in Upgraded devices" %MsgSrcAddr)
-            return
+        with self.lock:
+            transfer = self.Transfers.get( MsgSrcAddr )
+            if transfer is None:
+                logging( self,  'Log', "ota_request_firmware_completed - Receive Firmware Completed from %s most likely a duplicated packet as there is nothing in Progress. " %(MsgSrcAddr))
+                return
 
-        if 'StartTime' not in self.ListInUpdate:
-            logging( self, 'Error', "ota_request_firmware_completed - OTA upgrade completed - No Start Time for device: %s" %MsgSrcAddr)
-            return
+            if transfer['Status'] != 'Transfer' or transfer['StartTime'] is None:
+                logging( self, 'Error', "ota_request_firmware_completed - OTA upgrade completed - %s not in Transfer: %s" %(MsgSrcAddr, transfer['Status']))
+                return
 
-        if MsgStatus == '00': # OTA_STATUS_SUCCESS
-            logging( self, 'Status', "OTA upgrade completed with success - %s/%s %s Version: 0x%08x Type: 0x%04x Code: 0x%04x Status: %s"
-                %(MsgSrcAddr, MsgEP, MsgClusterId, intMsgImageVersion, image_type, intMsgManufCode, MsgStatus))
-            ota_upgrade_end_response( self, MsgSrcAddr, MsgEP,intMsgImageVersion, image_type, intMsgManufCode )
-            notify_upgrade_end( self, 'OK', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
-
-        elif MsgStatus == '95': # OTA_STATUS_ABORT The image download that is currently in progress should be cancelled
-            logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware aborted")
-            notify_upgrade_end( self, 'Aborted', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
-            
-        elif MsgStatus == '96': # OTA_STATUS_INVALID_IMAGE: The downloaded image failed the verification
-                                # checks and will be discarded
-            logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware image validation failed")
-            notify_upgrade_end( self, 'Failed', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
-
-        elif MsgStatus == '97': # OTA_STATUS_WAIT_FOR_DATA
-            logging( self,  'Log',"ota_request_firmware_completed - OTA Firmware image wait for data")
-            return 
-            
-        elif MsgStatus == '99': # OTA_REQUIRE_MORE_IMAGE: The downloaded image was successfully received 
-                                # and verified, but the client requires multiple images before performing an upgrade
-            logging( self,  'Status', "ota_request_firmware_completed - OTA Firmware  The downloaded image was successfully received, but there is a need for additional image")
-            notify_upgrade_end( self, 'More', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+            if MsgStatus == '00': # OTA_STATUS_SUCCESS
+                logging( self, 'Status', "OTA upgrade completed with success - %s/%s %s Version: 0x%08x Type: 0x%04x Code: 0x%04x Status: %s"
+                    %(MsgSrcAddr, MsgEP, MsgClusterId, intMsgImageVersion, image_type, intMsgManufCode, MsgStatus))
+                ota_upgrade_end_response( self, MsgSrcAddr, MsgEP,intMsgImageVersion, image_type, intMsgManufCode )
+                notify_upgrade_end( self, transfer, 'OK', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
 
-        else:
-            logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware unexpected error %s" %MsgStatus)
-            notify_upgrade_end( self, 'Aborted', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+            elif MsgStatus == '95': # OTA_STATUS_ABORT The image download that is currently in progress should be cancelled
+                logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware aborted")
+                notify_upgrade_end( self, transfer, 'Aborted', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+
+            elif MsgStatus == '96': # OTA_STATUS_INVALID_IMAGE: The downloaded image failed the verification
+                                    # checks and will be discarded
+                logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware image validation failed")
+                notify_upgrade_end( self, transfer, 'Failed', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+
+            elif MsgStatus == '97': # OTA_STATUS_WAIT_FOR_DATA
+                logging( self,  'Log',"ota_request_firmware_completed - OTA Firmware image wait for data")
+                return
 
-        cleanup_after_completed_upgrade( self, MsgSrcAddr, MsgStatus)
+            elif MsgStatus == '99': # OTA_REQUIRE_MORE_IMAGE: The downloaded image was successfully received
+                                    # and verified, but the client requires multiple images before performing an upgrade
+                logging( self,  'Status', "ota_request_firmware_completed - OTA Firmware  The downloaded image was successfully received, but there is a need for additional image")
+                notify_upgrade_end( self, transfer, 'More', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+
+            else:
+                logging( self,  'Error',"ota_request_firmware_completed - OTA Firmware unexpected error %s" %MsgStatus)
+                notify_upgrade_end( self, transfer, 'Aborted', MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion )
+
+            cleanup_after_completed_upgrade( self, MsgSrcAddr, MsgStatus)
+            schedule_transfers( self )
 
 
     def heartbeat( self ):
 
-        if self.ListInUpdate['NwkId'] is None:
-            # Nothing to do.
-            logging( self,  'Debug', "ota_heartbeat - nothing to do")
-            return
+        self.HB += 1
+        with self.lock:
+            if not self.Transfers:
+                # Nothing to do.
+                logging( self,  'Debug', "ota_heartbeat - nothing to do")
+                return
 
-        logging( self,  'Debug', "ota_heartbeat - NwkId: %s Process: %s Loaded: 0x%s Time: %s Notified: %s Retry: %s Authorized: %s" 
-            %(self.ListInUpdate['NwkId'],
-            self.ListInUpdate['Process'] ,
-            self.ImageLoaded['image_type'],
-            self.ImageLoaded['LoadedTimeStamp'], 
-            self.ImageLoaded['NotifiedTimeStamp'], 
-            self.ListInUpdate['Retry'],
-            self.ListInUpdate['AuthorizedForUpdate'] 
-            ))
-
-        # Do we have a TimeOut on Sending Blocks
-        if self.ListInUpdate['NwkId'] and self.ListInUpdate['LastBlockSent'] != 0 and (time() > self.ListInUpdate['LastBlockSent'] + 300):
-            logging( self,  'Error', "Ota detects Timeout while sending blocks for %s" %self.ListInUpdate['NwkId'])
-            if self.ListInUpdate['NwkId'] in self.ListInUpdate['AuthorizedForUpdate']:
-                self.ListInUpdate['AuthorizedForUpdate'].remove( self.ListInUpdate['NwkId'] )
-            self.ListInUpdate['NwkId'] = None
-            self.ListInUpdate['LastBlockSent'] = 0
-            self.ImageLoaded['NotifiedTimeStamp'] = 0
-            self.ImageLoaded['LoadedTimeStamp'] = 0
-            self.ListInUpdate['Process'] = None
-            return
+            now = time()
+            for NwkId, transfer in list( self.Transfers.items() ):
+                logging( self,  'Debug', "ota_heartbeat - NwkId: %s Status: %s Offset: %s Retry: %s Loaded: 0x%s"
+                    %( NwkId, transfer['Status'], transfer['Offset'], transfer['Retry'], self.ImageLoaded['image_type'] ))
 
-        # Is an image loaded and we need to re-enforce the Notification
-        if self.ListInUpdate['NwkId'] and self.ListInUpdate['LastBlockSent'] == 0 and self.ImageLoaded['LoadedTimeStamp'] != 0:
-            # Retry every 5s (heartbeat) after 10s after first notification
-            self.ListInUpdate['Retry'] += 1
-            logging( self,  'Log', "Ota retries notifying device %s" %self.ListInUpdate['NwkId'])
-            ota_image_advertize(self, 
-                    self.ListInUpdate['NwkId'], 
-                    self.ListInUpdate['Ep'], 
-                    int( self.ImageLoaded['ImageVersion'],16) , 
-                    int( self.ImageLoaded['image_type'],16) , 
-                    int( self.ImageLoaded['manufacturer_code'],16) )
-
-        if self.ListInUpdate['Retry'] == 10:
-            logging( self,  'Error', "Ota detects Timeout while notifying device %s" %self.ListInUpdate['NwkId'])
-            if self.ListInUpdate['NwkId'] in self.ListInUpdate['AuthorizedForUpdate']:
-                self.ListInUpdate['AuthorizedForUpdate'].remove( self.ListInUpdate['NwkId'] )
-            self.ListInUpdate['NwkId'] = None
-            self.ListInUpdate['LastBlockSent'] = 0
-            self.ListInUpdate['Retry'] = 0
-            self.ImageLoaded['LoadedTimeStamp'] = 0
-            self.ImageLoaded['NotifiedTimeStamp'] = 0
-            self.ListInUpdate['Process'] = None
+                if transfer['Status'] == 'Transfer' and now > transfer['LastBlockSent'] + OTA_TRANSFER_TIMEOUT:
+                    # Do we have a TimeOut on Sending Blocks
+                    logging( self,  'Error', "Ota detects Timeout while sending blocks for %s" %NwkId)
+                    end_transfer( self, NwkId )
+
+                elif transfer['Status'] == 'Resumed' and now > transfer['LastBlockSent'] + OTA_RESUME_TIMEOUT:
+                    # The device didn't come back after the restart, it has to be notified again
+                    logging( self,  'Log', "Ota - %s didn't resume its transfer at offset %s, back in queue" %(NwkId, transfer['Offset']))
+                    transfer['Status'] = 'Queued'
+                    self.UpgradeQueue.insert( 0, NwkId )
+
+                elif transfer['Status'] == 'Notified' and transfer['Retry'] >= OTA_NOTIFY_RETRY:
+                    logging( self,  'Error', "Ota detects Timeout while notifying device %s" %NwkId)
+                    end_transfer( self, NwkId )
+
+                elif transfer['Status'] == 'Notified':
+                    # The image is loaded and we need to re-enforce the Notification
+                    transfer['Retry'] += 1
+                    logging( self,  'Log', "Ota retries notifying device %s" %NwkId)
+                    ota_image_advertize(self, NwkId, transfer['Ep'], transfer['ImageVersion'], transfer['ImageType'], transfer['ManufCode'] )
+
+            schedule_transfers( self )
+            save_transfers( self )
 
 
     def restapi_list_of_firmware( self ): # OK 26/10
@@ -326,18 +327,51 @@ class OTAManagement(object):
         return available_firmware
 
 
-    def restapi_firmware_update( self, data): # 
-
-        if len(data) > 1:
-            logging( self,  'Error', "For now we support only Update of 1 device at a time!")
-            return
-        for x in data:
-            brand = x['Brand']
-            file_name = x['FileName']
-            target_nwkid = x['NwkId']
-            target_ep = x['Ep']
-            force_update = x['ForceUpdate']
-            firmware_update( self, brand, file_name, target_nwkid, target_ep, force_update )
+    def restapi_firmware_update( self, data): #
+
+        with self.lock:
+            for x in data:
+                brand = x['Brand']
+                file_name = x['FileName']
+                target_nwkid = x['NwkId']
+                target_ep = x['Ep']
+                force_update = x['ForceUpdate']
+                firmware_update( self, brand, file_name, target_nwkid, target_ep, force_update )
+            schedule_transfers( self )
+            save_transfers( self )
+
+
+    def restapi_list_of_transfers( self ):
+        # Return the Transfers, in progress first then in queue order
+        with self.lock:
+            transfers = []
+            for NwkId, transfer in self.Transfers.items():
+                transfers.append( {
+                    'NwkId':        NwkId,
+                    'Ep':           transfer['Ep'],
+                    'Brand':        transfer['Brand'],
+                    'FileName':     transfer['FileName'],
+                    'ImageType':    '%04x' % transfer['ImageType'],
+                    'Version':      '%08x' % transfer['ImageVersion'],
+                    'Status':       transfer['Status'],
+                    'Offset':       transfer['Offset'],
+                    'Size':         transfer['Size'],
+                    'Progress':     round( 100 * transfer['Offset'] / transfer['Size'], 1 ) if transfer['Size'] else 0,
+                    'StartTime':    int( transfer['StartTime'] ) if transfer['StartTime'] else None,
+                    'Queue':        self.UpgradeQueue.index( NwkId ) + 1 if NwkId in self.UpgradeQueue else 0,
+                } )
+            transfers.sort( key=lambda x: ( x['Queue'], x['NwkId'] ) )
+            return transfers
+
+
+    def restapi_cancel_transfer( self, NwkId ):
+        with self.lock:
+            if NwkId not in self.Transfers:
+                return False
+            logging( self,  'Status', "Firmware update cancelled for %s" %NwkId)
+            end_transfer( self, NwkId )
+            schedule_transfers( self )
+            return True
 
 
 # Routines sending Data
@@ -392,53 +426,61 @@ def ota_load_image_to_zigate( self, image_type, force_version=None): # OK 13/10
 
 
 
-def ota_send_block( self , dest_addr, dest_ep, image_type, msg_image_version, block_request): # OK 24/10
+def ota_send_block( self , transfer, dest_ep, block_request): # OK 24/10
     # 'BLOCK_SEND 	0x0502 	This is used to transfer firmware BLOCKS to device when it sends request 0x8501.'
     # 
     # Indicates whether a data block is included in the response:
     #     OTA_STATUS_SUCCESS: ( 0x00)  A data block is included
     #     OTA_STATUS_WAIT_FOR_DATA (0x97) : No data block is included - client should re-request a data block after a waiting time
 
+    dest_addr = transfer['NwkId']
+    image_type = block_request['ImageType']
     logging( self,  'Debug2', "ota_send_block - Addr: %s/%s Type: 0x%X" %(dest_addr, dest_ep, image_type))
     if image_type not in self.ListOfImages['ImageType']:
         Domoticz.Error("ota_send_block - unknown image_type %s" %image_type)
         return False
 
-    if image_type != int(self.ListInUpdate['ImageType'],16):
-        Domoticz.Error("ota_send_block - inconsistent ImageType Received: %s Expecting: %s" %(image_type, self.ListInUpdate['ImageType']))
+    if image_type != transfer['ImageType']:
+        Domoticz.Error("ota_send_block - inconsistent ImageType Received: %s Expecting: %s" %(image_type, transfer['ImageType']))
         return False       
     
 
-    _status = 0x00
-
     sequence          = int(    block_request['Sequence'],16)
     _offset           = int(    block_request['Offset'],16)
-    image_version     = '%08x' %self.ListInUpdate['ImageVersion']
-    image_type        = '%04x' %image_type
-    manufacturer_code = '%04x' %self.ListInUpdate['intManufCode']
-    
-    # Build the data block to be send based on the request
     _lenght           = int(block_request['MaxDataSize'],16)
-    _raw_ota_data     = self.ListInUpdate['OtaImage'][_offset:_offset+_lenght]
-
-    # Build the message and send
-    datas = '07' + dest_addr + ZIGATE_EP + dest_ep 
-    datas += "%02x" %sequence + "%02x" %_status 
-    datas += "%08x" %_offset 
-    datas += image_version + image_type + manufacturer_code
-    datas += "%02x" %_lenght
-    for i in _raw_ota_data:
-        datas += "%02x" %i
-
-    self.ListInUpdate['TimeStamps'] = time()
-    self.ListInUpdate['Status'] = 'Transfer Progress'
-    self.ListInUpdate['Received'] = _offset
-    self.ListInUpdate['Sent'] = _offset + _lenght
+
+    # Use the block prepared after the previous one, if this is the one requested
+    block_key = ( dest_addr, dest_ep, _offset, _lenght, transfer['ImageVersion'], image_type, transfer['intManufCode'] )
+    prefetched = transfer['NextBlock']
+    if prefetched and prefetched[0] == block_key:
+        datas = prefetched[1]
+    else:
+        prefetched = None
+        datas = ota_block_payload( transfer, block_key )
+    datas[ OTA_BLOCK_SQN_INDEX ] = sequence
 
     logging( self,  'Debug2', "ota_send_block - Block sent to %s/%s Received yet: %s Sent now: %s" 
             %( dest_addr, dest_ep, _offset, _lenght))
 
     self.ZigateComm.sendData( "0502", datas)
+    if 'ReceivedTime' in block_request:
+        self.ZigateComm.statistics.add_ota_block_latency( round( 1000 * ( time() - block_request['ReceivedTime'] ), 2), prefetched is not None )
+
+    # Prepare the next block, most likely the next request
+    transfer['NextBlock'] = None
+    if _offset + _lenght < len( transfer['OtaImage'] ):
+        next_key = ( dest_addr, dest_ep, _offset + _lenght ) + block_key[3:]
+        transfer['NextBlock'] = ( next_key, ota_block_payload( transfer, next_key ) )
+
+
+def ota_block_payload( transfer, block_key ):
+    # 0x0502 payload, the data block is sliced from the mapped image. The Sequence is set when requested
+    dest_addr, dest_ep, _offset, _lenght, image_version, image_type, manufacturer_code = block_key
+    datas = bytearray( OTA_BLOCK_HEADER.pack( 
+        0x07, int(dest_addr,16), int(ZIGATE_EP,16), int(dest_ep,16), 
+        0x00, 0x00, _offset, image_version, image_type, manufacturer_code, _lenght ) )
+    datas += transfer['OtaImage'][_offset:_offset+_lenght]
+    return datas
 
 
 def ota_image_advertize(self, dest_addr, dest_ep, image_version , image_type = 0xFFFF, manufacturer_code = 0xFFFF ): # OK 24/10
@@ -566,18 +608,15 @@ def ota_management( self, MsgSrcAddr, MsgEP , delay = 500):
 def cleanup_after_completed_upgrade( self, NwkId, Status):
         # Cleanup
         logging( self,  'Debug',"cleanup_after_completed_upgrade - Cleanup and house keeping %s %s" %( NwkId, Status))
-        self.ListInUpdate['NwkId'] = None
-        if NwkId in self.ListInUpdate['AuthorizedForUpdate'] and Status == '00':
-            self.ListInUpdate['AuthorizedForUpdate'].remove( NwkId )
-        logging( self,  'Debug',"cleanup_after_completed_upgrade - After cleanup self.ListInUpdate['Nwkid']: %s self.ListInUpdate['AuthorizedForUpdate']: %s" 
-            %( self.ListInUpdate['NwkId'], self.ListInUpdate['AuthorizedForUpdate']))
-        self.ListInUpdate['Process'] = None
+        end_transfer( self, NwkId )
+        logging( self,  'Debug',"cleanup_after_completed_upgrade - After cleanup Transfers: %s Queue: %s"
+            %( list( self.Transfers ), self.UpgradeQueue))
 
 def firmware_update( self, brand, file_name, target_nwkid, target_ep , force_update=False):
-    
-    if self.ListInUpdate['NwkId']:
-            logging( self,  'Error', "There is already an Image loaded %s for device: %s please come back later" 
-                %(self.ListInUpdate['FileName'], self.ListInUpdate['NwkId']))
+
+    if target_nwkid in self.Transfers:
+            logging( self,  'Error', "There is already an upgrade %s ( %s ) for device: %s please come back later"
+                %(self.Transfers[ target_nwkid ]['FileName'], self.Transfers[ target_nwkid ]['Status'], target_nwkid))
             return False
 
     if brand not in self.ListOfImages['Brands']:
@@ -597,30 +636,173 @@ def firmware_update( self, brand, file_name, target_nwkid, target_ep , force_upd
         return False
 
     image_type = self.ListOfImages['Brands'][brand][file_name]['ImageType']
-    manuf_code = self.ListOfImages['Brands'][brand][file_name]['intManufCode']
     image_version = self.ListOfImages['Brands'][brand][file_name]['originalVersion']
 
-    self.ListInUpdate['NwkId'] = target_nwkid
-    self.ListInUpdate['Ep'] = target_ep
-    self.ListInUpdate['AuthorizedForUpdate'].append ( target_nwkid )
-    self.ListInUpdate['Process'] = None
     # Do we have to overwrite the Image Version in order to force update
     if force_update:
         image_version = self.ListOfImages['Brands'][brand][file_name]['originalVersion'] + 0x00100000
-        logging( self,  'Status', "----> Forcing update for Image: 0x%04x from Version: 0x%08X to Version: 0x%08X" 
+        logging( self,  'Status', "----> Forcing update for Image: 0x%04x from Version: 0x%08X to Version: 0x%08X"
             %( image_type, self.ListOfImages['Brands'][brand][file_name]['originalVersion'], image_version))
-        self.ListOfImages['Brands'][brand][file_name]['intImageVersion'] = image_version
-        ota_load_image_to_zigate( self, image_type, image_version)
-    else:
-        ota_load_image_to_zigate( self, image_type)
-    ota_image_advertize(self, target_nwkid, target_ep, image_version = image_version, image_type = image_type, manufacturer_code = manuf_code)
+
+    self.Transfers[ target_nwkid ] = new_transfer( self, brand, file_name, target_nwkid, target_ep, image_version )
+    self.UpgradeQueue.append( target_nwkid )
+    logging( self,  'Status', "Firmware update of %s with %s queued ( position %s )" %(target_nwkid, file_name, len(self.UpgradeQueue)))
     return True
 
 
+def new_transfer( self, brand, file_name, NwkId, Ep, image_version, offset=0, start_time=None ):
+    available_image = self.ListOfImages['Brands'][ brand ][ file_name ]
+    return {
+        'NwkId':        NwkId,
+        'Ep':           Ep,
+        'Brand':        brand,
+        'FileName':     file_name,
+        'ImageType':    available_image['ImageType'],
+        'ImageVersion': image_version,
+        'ManufCode':    available_image['intManufCode'],
+        'intManufCode': available_image['intManufCode'],    # As requested by the device, set when the Transfer starts
+        'Size':         available_image['intSize'],
+        'Status':       'Queued',
+        'Offset':       offset,
+        'StartTime':    start_time,
+        'LastBlockSent': 0,
+        'Retry':        0,
+        'Image':        None,       # OtaImage of the file
+        'OtaImage':     None,       # Mapped payload, while the Transfer is on-going
+        'NextBlock':    None,
+        }
+
+
+def active_transfers( self ):
+    return [ x for x in self.Transfers.values() if x['Status'] != 'Queued' ]
+
+
+def same_image( transfer, other ):
+    return transfer['ImageType'] == other['ImageType'] and transfer['ImageVersion'] == other['ImageVersion']
+
+
+def schedule_transfers( self ):
+    # Start the Queued Transfers while there are free slots and ZiGate has aPDU to spare
+
+    while self.UpgradeQueue:
+        transfer = self.Transfers.get( self.UpgradeQueue[0] )
+        if transfer is None or transfer['Status'] != 'Queued':
+            self.UpgradeQueue.pop( 0 )
+            continue
+
+        active = active_transfers( self )
+        if len( active ) >= self.pluginconf.pluginConf['otaMaxConcurrentUpdates']:
+            return
+        if active and self.ZigateComm.apdu >= OTA_APDU_ADMISSION:
+            logging( self,  'Debug', "schedule_transfers - aPDU: %s, %s waits" %(self.ZigateComm.apdu, transfer['NwkId']))
+            return
+
+        # ZiGate holds one image for the Query Next Image
+        notified = [ x for x in active if x['Status'] == 'Notified' ]
+        if notified and not same_image( notified[0], transfer ):
+            return
+
+        self.UpgradeQueue.pop( 0 )
+        notify_transfer( self, transfer )
+
+
+def notify_transfer( self, transfer ):
+    # Load the image on ZiGate if needed and notify the device
+
+    if self.ImageLoaded['image_type'] != '%04X' %transfer['ImageType'] or self.ImageLoaded['ImageVersion'] != '%08X' %transfer['ImageVersion']:
+        if transfer['ImageVersion'] != self.ListOfImages['Brands'][ transfer['Brand'] ][ transfer['FileName'] ]['originalVersion']:
+            ota_load_image_to_zigate( self, transfer['ImageType'], transfer['ImageVersion'])
+        else:
+            ota_load_image_to_zigate( self, transfer['ImageType'])
+
+    logging( self,  'Log', "Firmware update of %s with %s, notifying the device" %(transfer['NwkId'], transfer['FileName']))
+    transfer['Status'] = 'Notified'
+    transfer['Retry'] = 0
+    transfer['LastBlockSent'] = 0
+    ota_image_advertize(self, transfer['NwkId'], transfer['Ep'], image_version = transfer['ImageVersion'], image_type = transfer['ImageType'], manufacturer_code = transfer['ManufCode'])
+
+
+def ota_throttled( self, transfer ):
+    # Above OTA_APDU_THROTTLE only the oldest Transfer is served, so OTA doesn't starve the other traffic
+    if self.ZigateComm.apdu < OTA_APDU_THROTTLE:
+        return False
+    running = [ x for x in self.Transfers.values() if x['Status'] == 'Transfer' ]
+    if not running:
+        return False
+    return transfer is not min( running, key=lambda x: x['StartTime'] )
+
+
+def end_transfer( self, NwkId ):
+    # The Transfer is over ( completed, failed, timed out or cancelled )
+    transfer = self.Transfers.pop( NwkId, None )
+    if transfer is None:
+        return
+    release_ota_image( transfer )
+    if NwkId in self.UpgradeQueue:
+        self.UpgradeQueue.remove( NwkId )
+    if NwkId in self.ListOfDevices and 'OTA-Transfer' in self.ListOfDevices[ NwkId ]:
+        del self.ListOfDevices[ NwkId ]['OTA-Transfer']
+    if not any( x['Status'] == 'Notified' for x in self.Transfers.values() ):
+        self.ImageLoaded['NotifiedTimeStamp'] = 0
+
+
+def save_transfers( self ):
+    # Keep the Transfers in ListOfDevices, they are saved with the DeviceList and restored at next start
+    for NwkId, transfer in self.Transfers.items():
+        if NwkId not in self.ListOfDevices:
+            continue
+        record = {
+            'Brand':        transfer['Brand'],
+            'FileName':     transfer['FileName'],
+            'Ep':           transfer['Ep'],
+            'ImageVersion': transfer['ImageVersion'],
+            'Status':       'Queued' if transfer['Status'] in ( 'Queued', 'Notified' ) else 'Transfer',
+            'Offset':       transfer['Offset'],
+            'StartTime':    int( transfer['StartTime'] ) if transfer['StartTime'] else None,
+            }
+        if self.ListOfDevices[ NwkId ].get( 'OTA-Transfer' ) != record:
+            self.ListOfDevices[ NwkId ]['OTA-Transfer'] = record
+
+
+def restore_transfers( self ):
+    # Transfers saved before the plugin restart. The ones which were on-going wait for the device to
+    # request its next block, the others are queued again
+    restored = []
+    for NwkId in list( self.ListOfDevices ):
+        record = self.ListOfDevices[ NwkId ].get( 'OTA-Transfer' )
+        if not isinstance( record, dict ):
+            continue
+        if record.get('Brand') not in self.ListOfImages['Brands'] or record.get('FileName') not in self.ListOfImages['Brands'][ record['Brand'] ]:
+            logging( self,  'Error', "Firmware update of %s cannot be resumed, %s is not available anymore" %(NwkId, record.get('FileName')))
+            del self.ListOfDevices[ NwkId ]['OTA-Transfer']
+            continue
+        transfer = new_transfer( self, record['Brand'], record['FileName'], NwkId, record['Ep'], record['ImageVersion'],
+            record.get('Offset', 0), record.get('StartTime') )
+        if record.get('Status') == 'Transfer':
+            transfer['Status'] = 'Resumed'
+            transfer['LastBlockSent'] = time()
+        self.Transfers[ NwkId ] = transfer
+        restored.append( transfer )
+
+    for transfer in sorted( restored, key=lambda x: x['StartTime'] or 0 ):
+        if transfer['Status'] == 'Queued':
+            self.UpgradeQueue.append( transfer['NwkId'] )
+        logging( self,  'Status', "Firmware update of %s with %s restored ( %s at offset %s )"
+            %(transfer['NwkId'], transfer['FileName'], transfer['Status'], transfer['Offset']))
+
+
 def logging( self, logType, message): # OK 13/10   
     self.log.logging('OTA', logType, message)
 
 
+def release_ota_image( transfer ):
+    # The transfer is over, the image is unmapped if no other transfer uses it
+    if transfer.get('Image') and transfer.get('OtaImage') is not None:
+        transfer['Image'].release()
+    transfer['OtaImage'] = None
+    transfer['NextBlock'] = None
+
+
 def retreive_image_in_a_brand( self, image_type, brand): # OK 13/10
     if brand not in self.ListOfImages['Brands']:
         return None
@@ -645,6 +827,7 @@ def ota_scan_folder( self): #OK 13/10
 
     self.ListOfImages['Brands'] = {}
     self.ListOfImages['ImageType'] = {}
+    scanned = set()
     for brand in OTA_CODES:
         if not OTA_CODES[ brand ]['Enabled']:
             continue
@@ -657,6 +840,7 @@ def ota_scan_folder( self): #OK 13/10
             if ota_image_file in ( 'README.md', 'README.txt', '.PRECIOUS', '.precious' ):
                 continue
 
+            scanned.add( join( ota_dir, ota_image_file ) )
             header_return = ota_extract_image_headers( self, OTA_CODES[ brand ]['Folder'], ota_image_file )
             if header_return is None:
                 continue
@@ -673,12 +857,14 @@ def ota_scan_folder( self): #OK 13/10
                 'Process'        : False,
                 'ImageType'      : image_type,
                 'Decoded Header' : headers,
-                'OtaImage'       : ota_image,
+                'Image'          : ota_image,
                 'intManufCode'   : headers['manufacturer_code'],
                 'originalVersion': headers['image_version'],
                 'intImageVersion': headers['image_version'],
                 'intSize'        : headers['size'],
             }
+    self.ImageCatalogue.save( scanned )
+
     # Logging if Debug
     logging( self, 'Debug', 'ota_scan_folder Following Firmware have been loaded ')
     for brand, value in self.ListOfImages['Brands'].items():
@@ -709,18 +895,14 @@ def check_image_valid_version( self, brand, image_type , ota_image_file, headers
 
 
 def ota_extract_image_headers( self, subfolder, image ): # OK 13/10
-    # Load headers from the image 
-    ota_image = _open_image_file( self.pluginconf.pluginConf['pluginOTAFirmware'] + subfolder + '/' + image )
+    # Load headers from the image, the firmware itself stays on disk
+    ota_image = self.ImageCatalogue.scan( join( self.pluginconf.pluginConf['pluginOTAFirmware'] + subfolder, image ) )
     if ota_image is None:
+        logging( self,  'Debug', "ota_extract_image_headers - %s/%s is not an OTA image" %(subfolder, image))
         return None
 
-    offset = offset_start_firmware( ota_image )
-    if offset is None:
-        return None
-
-    logging( self,  'Debug', "ota_extract_image_headers - offset:%s ..." %offset)
-    ota_image = ota_image[offset:]
-    headers = unpack_headers( ota_image)
+    logging( self,  'Debug', "ota_extract_image_headers - offset:%s ..." %ota_image.offset)
+    headers = ota_image.headers
     _logging_headers( self, headers )
 
     logging( self,  'Status', "Available Firmware - ManufCode: %4x ImageType: 0x%04x FileVersion: %8x Size: %8s Bytes Filename: %s" \
@@ -729,58 +911,15 @@ def ota_extract_image_headers( self, subfolder, image ): # OK 13/10
     return ( headers['image_type'], headers, ota_image )
 
 
-def _open_image_file( filename ): # OK 13/10
-    try:
-        with open( filename , 'rb') as file:
-            ota_image = file.read()
-    except OSError as err:
-        Domoticz.Error("ota_extract_image_headers - error when opening %s - %s" %(filename, err))
-        return None
-    if len(ota_image) < 69:
-        Domoticz.Error("ota_extract_image_headers - invalid file size read %s - %s" %(filename,len(ota_image)))
-        return None
-    return ota_image
-
-
-def offset_start_firmware( ota_image ): # OK 13/10
-    #Search for the OTA Upgrade File Identifier (  “0x0BEEF11E” )
-    offset = None
-    for i in range(len(ota_image)-4):
-        if hex(struct.unpack('<I',ota_image[0+i:4+i])[0]) == '0xbeef11e':
-            return i
-    return None
-
-
-def unpack_headers( ota_image): # OK 13/10
-    
-    try:
-        header_data = list(struct.unpack('<LHHHHHLH32BLBQHH', ota_image[:69]))
-    except struct.error:
-        Domoticz.Error("ota_extract_image_headers - Error when unpacking: %s" %ota_image[:69])
-        return None
-
-    for i in range(8, 40):
-        if header_data[i] == 0x00:
-            header_data[i] = 0x20
-
-    header_data_compact = header_data[0:8] + [header_data[8:40]] + header_data[40:]
-    header_headers = [ 'file_id', 'header_version', 'header_length', 'header_fctl', 
-            'manufacturer_code', 'image_type', 'image_version', 
-            'stack_version', 'header_str', 'size', 'security_cred_version', 'upgrade_file_dest',
-            'min_hw_version', 'max_hw_version' ]
-
-    return dict(zip(header_headers, header_data_compact))
-
-
 def initialize_block_request( # OK 13/10
     self, MsgSrcAddr, MsgEP, MsgFileOffset, intMsgImageVersion, 
     intMsgImageType, intMsgManufCode, MsgBlockRequestDelay, MsgMaxDataSize, intMsgFieldControl, MsgSQN):
 
     # Patching in order to make Legrand update with Image Page Request working
-    if intMsgManufCode == 0x00C8 and self.ListInUpdate['NwkId'] == MsgSrcAddr:
+    if intMsgManufCode == 0x00C8 and MsgSrcAddr in self.Transfers:
         # Request a Page , and Note a Block
         # For the time been , we are forcing a response with a Block
-        intMsgImageType = self.ListInUpdate['intImageType']
+        intMsgImageType = self.Transfers[ MsgSrcAddr ]['ImageType']
         intMsgManufCode = 0x1021
         MsgBlockRequestDelay = 'ffff'
         MsgMaxDataSize = '40'
@@ -802,52 +941,9 @@ def initialize_block_request( # OK 13/10
         }
 
 
-def async_request(  # OK 24/10
-    self, MsgSrcAddr, MsgEP, MsgIEEE, MsgFileOffset, image_version, 
-    image_type, intMsgManufCode, MsgBlockRequestDelay, MsgMaxDataSize, intMsgFieldControl):
-    # We are receiving an OTA request 
-    # Check if we have an available firmware
-    # If yes, then load the firmware on ZiGate
-
-    logging( self,  'Debug', "async_request: There is async request comming %s" %(MsgSrcAddr))
-        
-    if MsgSrcAddr not in self.ListInUpdate['AuthorizedForUpdate']:
-        # We need to prevent looping on serving if it is not expected!
-        logging( self,  'Error', "async_request: There is no upgrade plan for that device, drop request from %s" %(MsgSrcAddr))
-        return False
-
-    if self.ListInUpdate['NwkId']:
-        logging( self,  'Debug', "async_request: There is an upgrade in progress %s, drop request from %s" %(self.ListInUpdate['NwkId'], MsgSrcAddr))
-        return False
-
-    if image_type not in self.ListOfImages['ImageType']:
-        logging( self,  'Log', "async_request: No Firmware available to satify this request by %s" %(MsgSrcAddr))
-        return False
-
-    entry = retreive_image( self, image_type )
-    if entry is None:
-        logging( self,  'Error', "async_request: No Firmware available to satify this request by %s !!!" %(MsgSrcAddr))
-
-    brand, ota_image_file = entry
-    available_image  = self.ListOfImages['Brands'][ brand ][ ota_image_file ]
-    logging( self,  'Debug', "async_request: brand: %s ota_image_file: %s" %(brand, ota_image_file))
-
-    # Sanity Checks
-    if intMsgManufCode != available_image['intManufCode']:
-        logging( self,  'Error', "async_request: %s Available Firmware %s is not for this Manufacturer Code %s . Droping" %(MsgSrcAddr, ota_image_file, intMsgManufCode))
-        return False
-    logging( self,  'Debug', "OTA heartbeat - Image: 0x%04X from file: %s" %(image_type, ota_image_file))
-
-    # Loading Image on Zigate
-    if len(self.ImageLoaded) == 0:
-        ota_load_image_to_zigate( self, image_type )
-
-    return True
-
+def notify_upgrade_end( self, transfer, Status, MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion, ): # OK 26/10
 
-def notify_upgrade_end( self, Status, MsgSrcAddr, MsgEP, image_type, intMsgManufCode, intMsgImageVersion, ): # OK 26/10
-
-    _transferTime_hh, _transferTime_mm, _transferTime_ss = convertTime( int(time() - self.ListInUpdate['StartTime']))
+    _transferTime_hh, _transferTime_mm, _transferTime_ss = convertTime( int(time() - transfer['StartTime']))
     _ieee = self.ListOfDevices[MsgSrcAddr]['IEEE']
     _name = None
     _textmsg = ''
@@ -933,13 +1029,13 @@ def _logging_headers( self, headers ): # OK 13/10
         logging( self,  'Debug', "==> Security Credential: Reserved")
 
 
-def display_percentage_progress( self, MsgSrcAddr, MsgEP, intMsgImageType, MsgFileOffset  ):
+def display_percentage_progress( self, transfer, MsgFileOffset  ):
 
-    _size = self.ListInUpdate['intSize']
+    _size = transfer['Size']
     _completion = round( ( (int(MsgFileOffset,16) / _size ) * 100), 1 )
 
     if ( _completion % 5) == 0:
-        logging( self,  'Log', "Firmware transfert for %s/%s - Progress: %4s %%" %(MsgSrcAddr, MsgEP, _completion))
+        logging( self,  'Log', "Firmware transfert for %s/%s - Progress: %4s %%" %(transfer['NwkId'], transfer['Ep'], _completion))
         if 'Firmware Update' not in self.PluginHealth:
             self.PluginHealth['Firmware Update'] = {}
 
@@ -947,33 +1043,23 @@ def display_percentage_progress( self, MsgSrcAddr, MsgEP, intMsgImageType, MsgFi
             self.PluginHealth['Firmware Update'] = {}
 
     self.PluginHealth['Firmware Update']['Progress'] = '%s %%' %round(_completion)
-    self.PluginHealth['Firmware Update']['Device'] = MsgSrcAddr
-
-
-def start_upgrade_infos( self, MsgSrcAddr, intMsgImageType, intMsgManufCode, MsgFileOffset, MsgMaxDataSize): # OK 24/10/2020
+    self.PluginHealth['Firmware Update']['Device'] = transfer['NwkId']
+    self.PluginHealth['Firmware Update']['Transfers'] = len( active_transfers( self ) )
+    self.PluginHealth['Firmware Update']['Queued'] = len( self.UpgradeQueue )
 
-    entry = retreive_image( self, intMsgImageType )
-    if entry is None:
-        logging( self,  'Error', "start_upgrade_infos: No Firmware available to satify this request by %s !!!" %MsgSrcAddr)
-        return 
-    brand, ota_image_file = entry
 
-    available_image  = self.ListOfImages['Brands'][ brand ][ ota_image_file ]
-    self.ListInUpdate['intSize']             = available_image['intSize']
-    self.ListInUpdate['ImageVersion']        = available_image['intImageVersion']
-    self.ListInUpdate['Process']             = available_image['Process']
-    self.ListInUpdate['Decoded Header']      = available_image['Decoded Header']
-    self.ListInUpdate['OtaImage']            = available_image['OtaImage']
+def start_upgrade_infos( self, transfer, MsgEP, intMsgManufCode, MsgMaxDataSize): # OK 24/10/2020
 
-    self.ListInUpdate['ImageType']           = '%04x' % intMsgImageType
-    self.ListInUpdate['intImageType']        = intMsgImageType
-    self.ListInUpdate['NwkId']               = MsgSrcAddr
-    self.ListInUpdate['intManufCode']        = intMsgManufCode
-    self.ListInUpdate['intFileOffset']       = int(MsgFileOffset,16)
-    self.ListInUpdate['Brand']               = brand
-    self.ListInUpdate['FileName']            = ota_image_file
-    self.ListInUpdate['LastBlockSent']       = 0
-    self.ListInUpdate['StartTime']           = time()
+    MsgSrcAddr = transfer['NwkId']
+    available_image  = self.ListOfImages['Brands'][ transfer['Brand'] ][ transfer['FileName'] ]
+    release_ota_image( transfer )
+    transfer['Image']               = available_image['Image']
+    transfer['OtaImage']            = available_image['Image'].acquire()
+    transfer['intManufCode']        = intMsgManufCode
+    transfer['Ep']                  = MsgEP
+    transfer['Status']              = 'Transfer'
+    if transfer['StartTime'] is None:
+        transfer['StartTime']       = time()
 
     if 'Firmware Update' not in self.PluginHealth:
         self.PluginHealth['Firmware Update'] = {}
@@ -993,7 +1079,7 @@ def start_upgrade_infos( self, MsgSrcAddr, intMsgImageType, intMsgManufCode, Msg
             _name = self.Devices[x].Name
             break
 
-    _durhh, _durmm, _durss = convertTime( self.ListInUpdate['intSize'] // int(MsgMaxDataSize,16) )
+    _durhh, _durmm, _durss = convertTime( ( transfer['Size'] - transfer['Offset'] ) // int(MsgMaxDataSize,16) )
     _textmsg = 'Firmware update started for Device: %s with %s - Estimated Time: %s H %s min %s sec ' \
-        %(_name, self.ListInUpdate['FileName'], _durhh, _durmm, _durss)
+        %(_name, transfer['FileName'], _durhh, _durmm, _durss)
     self.adminWidgets.updateNotificationWidget( self.Devices, _textmsg)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: OtaImageCatalogue.py
+
+    Description: Catalogue of the OTA firmware files
+
+    At plugin start only the OTA headers are read: the file is memory-mapped, the OTA Upgrade File
+    Identifier ( 0x0BEEF11E ) is searched with mmap.find(), and the 69 bytes of header unpacked.
+    Headers are kept in a cache file keyed by path, mtime and size, so an unchanged firmware file is
+    not even opened at the next start.
+    The image payload is memory-mapped when a transfer starts ( OtaImage.acquire() ) and unmapped when
+    the last transfer using it is over ( OtaImage.release() ). No firmware is kept in memory.
+
+"""
+
+import os
+import json
+import mmap
+import struct
+
+OTA_FILE_IDENTIFIER = struct.pack('<I', 0x0BEEF11E)
+OTA_HEADER_FORMAT = '<LHHHHHLH32BLBQHH'
+OTA_HEADER_SIZE = struct.calcsize( OTA_HEADER_FORMAT )    # 69
+OTA_HEADER_FIELDS = ( 'file_id', 'header_version', 'header_length', 'header_fctl',
+        'manufacturer_code', 'image_type', 'image_version',
+        'stack_version', 'header_str', 'size', 'security_cred_version', 'upgrade_file_dest',
+        'min_hw_version', 'max_hw_version' )
+
+
+def unpack_headers( ota_image ):
+    # ota_image starts with the OTA Upgrade File Identifier. None if it cannot be decoded
+    try:
+        header_data = list(struct.unpack( OTA_HEADER_FORMAT, ota_image[:OTA_HEADER_SIZE]))
+    except struct.error:
+        return None
+
+    for i in range(8, 40):
+        if header_data[i] == 0x00:
+            header_data[i] = 0x20
+
+    header_data_compact = header_data[0:8] + [header_data[8:40]] + header_data[40:]
+    return dict(zip(OTA_HEADER_FIELDS, header_data_compact))
+
+
+class OtaImage(object):
+
+    def __init__(self, filename, offset, headers):
+        self.filename = filename
+        self.offset = offset        # Position of the OTA Upgrade File Identifier in the file
+        self.headers = headers
+        self.users = 0
+        self._file = None
+        self._mmap = None
+        self._view = None
+
+    def acquire(self):
+        # Payload of the image ( from the OTA Upgrade File Identifier ), memory-mapped on first use
+        if self._view is None:
+            self._file = open( self.filename, 'rb')
+            self._mmap = mmap.mmap( self._file.fileno(), 0, access=mmap.ACCESS_READ )
+            self._view = memoryview( self._mmap )[ self.offset: ]
+        self.users += 1
+        return self._view
+
+    def release(self):
+        if self.users > 0:
+            self.users -= 1
+        if self.users or self._view is None:
+            return
+        view, self._view = self._view, None
+        try:
+            view.release()
+            self._mmap.close()
+        except BufferError:
+            # A slice of the payload is still referenced, the mapping goes with it
+            pass
+        self._mmap = None
+        self._file.close()
+        self._file = None
+
+
+class OtaImageCatalogue(object):
+
+    def __init__(self, cachefile=None):
+        self.cachefile = cachefile
+        self.cache = {}             # filename -> { 'mtime', 'size', 'offset', 'headers' }
+        self.updated = False
+        if cachefile and os.path.isfile( cachefile ):
+            try:
+                with open( cachefile, 'rt') as handle:
+                    self.cache = json.load( handle )
+            except ( OSError, ValueError ):
+                self.cache = {}
+
+    def scan(self, filename):
+        # OtaImage of the firmware file, None if it is not an OTA file
+        try:
+            stat = os.stat( filename )
+        except OSError:
+            return None
+
+        entry = self.cache.get( filename )
+        if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            if entry['offset'] is None:
+                return None
+            return OtaImage( filename, entry['offset'], entry['headers'] )
+
+        offset, headers = self._read_headers( filename, stat.st_size )
+        self.cache[ filename ] = { 'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'offset': offset, 'headers': headers }
+        self.updated = True
+        if offset is None:
+            return None
+        return OtaImage( filename, offset, headers )
+
+    @staticmethod
+    def _read_headers( filename, size ):
+        if size < OTA_HEADER_SIZE:
+            return None, None
+        with open( filename, 'rb') as handle:
+            with mmap.mmap( handle.fileno(), 0, access=mmap.ACCESS_READ ) as ota_file:
+                offset = ota_file.find( OTA_FILE_IDENTIFIER )
+                if offset == -1:
+                    return None, None
+                headers = unpack_headers( ota_file[ offset: offset + OTA_HEADER_SIZE ] )
+        if headers is None:
+            return None, None
+        return offset, headers
+
+    def save(self, filenames=None):
+        # Write the cache, restricted to the files still present if filenames is given
+        if filenames is not None:
+            for filename in list( self.cache ):
+                if filename not in filenames:
+                    del self.cache[ filename ]
+                    self.updated = True
+        if not self.cachefile or not self.updated:
+            return
+        try:
+            with open( self.cachefile, 'wt') as handle:
+                json.dump( self.cache, handle )
+            self.updated = False
+        except OSError:
+            pass
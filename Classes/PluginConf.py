@@ -25,6 +25,7 @@ SETTINGS = {
         'internetAccess':         {'type': 'bool', 'default': 1, 'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'enableWebServer':        {'type': 'bool', 'default': 1, 'current': None, 'restart': True, 'hidden': False, 'Advanced': False},
         'allowOTA':               {'type': 'bool', 'default': 1, 'current': None, 'restart': True, 'hidden': True, 'Advanced': False},
+        'otaMaxConcurrentUpdates':{'type': 'int',  'default': 4, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
         'pingDevices':            {'type': 'bool', 'default': 1, 'current': None, 'restart': True, 'hidden': False, 'Advanced': False},
     }
     },
@@ -49,7 +50,8 @@ SETTINGS = {
         'enableDeflate':   {'type': 'bool', 'default': 1,       'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
         'enableChunk':     {'type': 'bool', 'default': 1,       'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
         'enableKeepalive': {'type': 'bool', 'default': 1,       'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
-        'enableCache':     {'type': 'bool', 'default': 1,       'current': None, 'restart': False, 'hidden': False, 'Advanced': True}
+        'enableCache':     {'type': 'bool', 'default': 1,       'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'webCacheSize':    {'type': 'int',  'default': 16,      'current': None, 'restart': True,  'hidden': False, 'Advanced': True}
     }
     },
 
@@ -106,7 +108,10 @@ SETTINGS = {
         'forceSwitchSelectorPushButton': {'type': 'bool', 'default': 0, 'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'allowGroupMembership':          {'type': 'bool', 'default': 1, 'current': None, 'restart': True, 'hidden': False, 'Advanced': True},
         'doUnbindBind':                  {'type': 'bool', 'default': 0, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
-        'allowReBindingClusters':        {'type': 'bool', 'default': 1, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True}
+        'allowReBindingClusters':        {'type': 'bool', 'default': 1, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'coalesceWidgetUpdates':         {'type': 'bool', 'default': 0, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'coalesceMeterDelay':            {'type': 'int',  'default': 10, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'coalesceSensorDelay':           {'type': 'int',  'default': 2, 'current': None, 'restart': False, 'hidden': False, 'Advanced': True}
     }
     },
 
@@ -166,9 +171,10 @@ SETTINGS = {
         'disableAckOnZCL': {'type': 'bool', 'default': 0,      'current': None, 'restart': False, 'hidden': False,  'Advanced': True},
         'waitForResponse': {'type': 'bool', 'default': 0,      'current': None, 'restart': False, 'hidden': True,   'Advanced': True},
         'MultiThreaded':   {'type': 'bool', 'default': 0,      'current': None, 'restart': True,  'hidden': False,   'Advanced': True},
+        'FrameQueueSize':  {'type': 'int',  'default': 500,    'current': None, 'restart': True,  'hidden': True,   'Advanced': True},
+        'FrameQueueCoalesce': {'type': 'bool', 'default': 1,   'current': None, 'restart': False, 'hidden': True,   'Advanced': True},
         'ieeeForRawAps':   {'type': 'bool', 'default': 0,      'current': None, 'restart': True,  'hidden': True,   'Advanced': True},
         'forceAckOnZCL':         {'type': 'bool', 'default': 1, 'current': None, 'restart': False, 'hidden': True, 'Advanced': True},
-        'SerialReadV2':          {'type': 'bool', 'default': 0, 'current': None, 'restart': False, 'hidden': True, 'Advanced': True},
         }
     },
 
@@ -191,6 +197,9 @@ SETTINGS = {
     'VerboseLogging': {'Order': 12, 'param': {
         'debugMatchId':         {'type': 'str',  'default': 'ffff', 'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
         'useDomoticzLog':       {'type': 'bool', 'default': 1,     'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
+        'logMaxSize':           {'type': 'int',  'default': 10,    'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'logMaxBackups':        {'type': 'int',  'default': 5,     'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
+        'logQueueSize':         {'type': 'int',  'default': 5000,  'current': None, 'restart': True,  'hidden': True,  'Advanced': True},
         'logDeviceUpdate':      {'type': 'bool', 'default': 1,     'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'trackError':            {'type': 'bool', 'default': 0, 'current': None, 'restart': False,  'hidden': False,  'Advanced': False},
         'logFORMAT':            {'type': 'bool', 'default': 0,     'current': None, 'restart': False, 'hidden': True, 'Advanced': True},
@@ -286,6 +295,7 @@ SETTINGS = {
         'profaluxOrientBSO':         {'type': 'int',  'default': 45,   'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'alarmDuration':             {'type': 'int',  'default': 1,    'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'numTopologyReports':        {'type': 'int',  'default': 4,   'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
+        'TopologyParallelRequests':  {'type': 'int',  'default': 4,   'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
         'numEnergyReports':          {'type': 'int',  'default': 4,   'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'TradfriKelvinStep':         {'type': 'int',  'default': 51,  'current': None, 'restart': False, 'hidden': False, 'Advanced': False},
         'AqaraOppleBulbMode':        {'type': 'bool', 'default': 0,   'current': None, 'restart': False, 'hidden': False, 'Advanced': True},
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: ReportStore.py
+
+    Description: Rolling store of the Network Topology and Network Energy reports
+
+    Each report is a segment file next to the report name, NetworkTopology-v3-01.json having its reports
+    in NetworkTopology-v3-01-<timestamp>.json. A segment keeps the former line format { "timestamp": report }.
+    - append() writes the new segment ( temporary file and os.replace ), then drops the oldest segments
+      beyond the keep most recent ones. Nothing else is read nor written.
+    - remove() and clear() delete segments.
+    - The index timestamp -> segment is built from the directory listing, and rebuilt when the segments
+      listed are not the ones indexed. Listing the timestamps doesn't read any report.
+    - A former single file history is split into segments the first time the store is used.
+
+    openReportStore() returns the store shared by every user of a report name ( finish_scan, WebServer ).
+
+"""
+
+import os
+import os.path
+import re
+import json
+import threading
+
+from collections import OrderedDict
+
+_stores = {}
+_storesLock = threading.Lock()
+
+
+def openReportStore( filename ):
+
+    with _storesLock:
+        if filename not in _stores:
+            _stores[ filename ] = ReportStore( filename )
+        return _stores[ filename ]
+
+
+class ReportStore(object):
+
+    def __init__(self, filename):
+        self.filename = filename    # Former single file history, name the segments are derived from
+        self.directory, basename = os.path.split( filename )
+        self.root, self.extension = os.path.splitext( basename )
+        self.pattern = re.compile( '^%s-(\\d+)%s$' %( re.escape( self.root ), re.escape( self.extension ) ) )
+        self.index = OrderedDict()  # timestamp ( str ) -> segment file name, oldest first
+        self.lock = threading.RLock()
+
+    def _segment(self, timestamp):
+        return os.path.join( self.directory, '%s-%s%s' %( self.root, timestamp, self.extension ) )
+
+    def _check(self):
+        # Rebuild the index if the segments are not the ones indexed
+        if os.path.isfile( self.filename ):
+            self._split( self.filename )
+        try:
+            names = os.listdir( self.directory or '.' )
+        except OSError:
+            names = []
+        segments = {}
+        for name in names:
+            match = self.pattern.match( name )
+            if match:
+                segments[ match.group(1) ] = os.path.join( self.directory, name )
+        if len( segments ) == len( self.index ) and all( timestamp in self.index for timestamp in segments ):
+            return
+        self.index = OrderedDict( ( timestamp, segments[ timestamp ] ) for timestamp in sorted( segments, key=int ) )
+
+    def _split(self, filename):
+        # One segment per report of a former single file history, then the file is removed
+        with open( filename, 'rb') as handle:
+            for line in handle:
+                line = line.strip()
+                if line[:1] != b'{':
+                    continue
+                try:
+                    entry = json.loads( line.decode() )
+                except ValueError:
+                    continue
+                if not isinstance( entry, dict ) or len( entry ) != 1:
+                    continue
+                timestamp = str( next( iter( entry ) ) )
+                if timestamp.isdigit():
+                    self._write( timestamp, line )
+        os.remove( filename )
+
+    def _write(self, timestamp, line):
+        segment = self._segment( timestamp )
+        with open( segment + '.tmp', 'wb') as handle:
+            handle.write( line )
+        os.replace( segment + '.tmp', segment )
+        return segment
+
+    def timestamps(self):
+        with self.lock:
+            self._check()
+            return list( self.index )
+
+    def __contains__(self, timestamp):
+        with self.lock:
+            self._check()
+            return str( timestamp ) in self.index
+
+    def report(self, timestamp):
+        # Report stored for timestamp, None if unknown
+        timestamp = str( timestamp )
+        with self.lock:
+            self._check()
+            if timestamp not in self.index:
+                return None
+            try:
+                with open( self.index[ timestamp ], 'rb') as handle:
+                    line = handle.read()
+            except OSError:
+                return None
+        return json.loads( line.decode() ).get( timestamp )
+
+    def append(self, timestamp, report, keep):
+        # Store the report of a new scan and keep the keep most recent ones
+        timestamp = str( timestamp )
+        line = json.dumps( { timestamp: report } ).encode()
+        with self.lock:
+            self._check()
+            self.index.pop( timestamp, None )
+            self.index[ timestamp ] = self._write( timestamp, line )
+            while len( self.index ) > max( keep, 1 ):
+                self._drop( next( iter( self.index ) ) )
+
+    def remove(self, timestamp):
+        timestamp = str( timestamp )
+        with self.lock:
+            self._check()
+            if timestamp not in self.index:
+                return False
+            self._drop( timestamp )
+            return True
+
+    def clear(self):
+        with self.lock:
+            self._check()
+            for timestamp in list( self.index ):
+                self._drop( timestamp )
+
+    def _drop(self, timestamp):
+        segment = self.index.pop( timestamp )
+        if os.path.isfile( segment ):
+            os.remove( segment )
@@ -5,7 +5,6 @@
 #
 
 import Domoticz
-import binascii
 import struct
 
 import time
@@ -14,20 +13,28 @@ import os
 from datetime import datetime
 
 from Classes.LoggingManagement import LoggingManagement
+from Classes.ZigateFrame import ZigateFrame
+from Classes.ZclFrame import ZclGlobalFrame
+from Classes.TransportScheduler import TransportScheduler, PRIORITY_INTERACTIVE, PRIORITY_PROTOCOL, PRIORITY_BACKGROUND
 
-from Modules.tools import is_hex, retreive_cmd_payload_from_8002, is_manufspecific_8002_payload
-from Modules.zigateConsts import ZIGATE_RESPONSES, ZIGATE_COMMANDS, ADDRESS_MODE, SIZE_DATA_TYPE
+from Modules.tools import is_hex
+from Modules.zigateConsts import ZIGATE_RESPONSES, ZIGATE_COMMANDS, ADDRESS_MODE
+from Modules.attributeRecords import decode_zcl_header, decode_zcl_read_attribute_response, decode_zcl_report_attributes, decode_zcl_attribute_status
 from Modules.sqnMgmt import sqn_init_stack, sqn_generate_new_internal_sqn, sqn_add_external_sqn, sqn_get_internal_sqn_from_aps_sqn, sqn_get_internal_sqn_from_app_sqn, TYPE_APP_ZCL, TYPE_APP_ZDP
 from Modules.errorCodes import ZCL_EXTENDED_ERROR_CODES
+from Modules.zigateCodec import encode_frame, zigate_unescape, frame_checksum, FrameReassembler
 
 import serial
 import select
 import socket
 
-from threading import Thread, Lock, Event
+from threading import Thread, Lock, RLock, Event, current_thread, local
+from contextlib import contextmanager
 import multiprocessing
 
 import queue
+import heapq
+from collections import deque
 from binascii import unhexlify, hexlify
 
 STANDALONE_MESSAGE = []
@@ -40,8 +47,34 @@ CMD_WITH_RESPONSE = {}
 RESPONSE_SQN = []
 
 NB_SEND_PER_SECONDE = 2
+TIME_OUT_LISTCMD = 15   # A command sent and still in ListOfCommands after that time is removed
+
+# Default priority class of the commands, all others are Background. Commands sent from onCommand are always Interactive
+INTERACTIVE_COMMANDS = ( 0x0080, 0x0081, 0x0082, 0x0083, 0x0084, 0x0092, 0x0093, 0x0094, 
+    0x00B0, 0x00B1, 0x00B2, 0x00B3, 0x00B4, 0x00B5, 0x00B6, 0x00B7, 0x00B8, 0x00B9, 0x00BA, 0x00BB, 0x00BC, 0x00BD, 0x00BE, 0x00BF,
+    0x00C0, 0x00C1, 0x00C2, 0x00F0, 0x00FA, 0x0111, 0x0112 )
+PROTOCOL_COMMANDS = ( 0x0400, 0x0502, 0x0504, 0x0506 )
+OTA_DEVICE_COMMANDS = ( 0x0502, 0x0504, 0x0505, 0x0506 )    # Address mode + NwkId, while 'NwkId 2nd Bytes' is False
 MAX_THROUGHPUT = 1 / NB_SEND_PER_SECONDE
 
+# Frame queue between the reading thread and the processing thread (MultiThreaded mode)
+FRAME_QUEUE_PUT_TIMEOUT = 2.0   # Max time the reading thread is blocked when the queue is full, before dropping the frame
+FRAME_QUEUE_GET_TIMEOUT = 1.0   # Processing thread wake up to check for shutdown
+# Clusters for which only the last value matters. Attribute Reports for those clusters still in the queue are replaced by the newest one.
+# Only clusters reporting a current state: Power Configuration, Illuminance, Temperature, Pressure, Humidity, Metering, Electrical
+# Measurement. Not Analog Input ( 0x000C ), which carries events ( Xiaomi cube rotation angle ) that must all be processed
+COALESCE_REPORT_CLUSTERS = ( 0x0001, 0x0400, 0x0402, 0x0403, 0x0405, 0x0702, 0x0B04 )
+
+# 0x8002 Data Indication: Status, Profile, Cluster, Src Ep, Dst Ep, Src Address Mode
+APS_DATA_INDICATION_HEADER = struct.Struct('>BHHBBB')
+# ZCL Global Commands decoded by the Transport layer: ZiGate equivalent message, records decoder
+ZCL_GLOBAL_FRAMES = {
+    0x01: ( 0x8100, decode_zcl_read_attribute_response ),
+    0x04: ( 0x8110, decode_zcl_attribute_status ),
+    0x07: ( 0x8120, lambda payload, offset: decode_zcl_attribute_status( payload, offset, direction=True ) ),
+    0x0a: ( 0x8102, decode_zcl_report_attributes ),
+}
+
 #BAUDS = 460800
 BAUDS = 115200
 class ZigateTransport(object):
@@ -65,11 +98,15 @@ class ZigateTransport(object):
 
         # Queue Management attributes 
         self.ListOfCommands = {}           # List of ( Command, Data ) to be or in process
-        self.zigateSendQueue = []          # list of normal priority commands
-        self._waitFor8000Queue = []        # list of command sent and waiting for status 0x8000
-        self._waitForCmdResponseQueue = [] # list of command sent for which status received and waiting for data
-        self._waitFor8011Queue = []          # Contains list of Command waiting for Ack/Nack
-        self._waitFor8012Queue = []         # We are wiating for aPdu free. Implemented on 31e. (wait for 0x8012 or 0x8702 )
+        self.zigateSendQueue = TransportScheduler()  # commands waiting to be sent, by priority class and destination
+        self._waitFor8000Queue = deque()        # list of command sent and waiting for status 0x8000
+        self._waitForCmdResponseQueue = deque() # list of command sent for which status received and waiting for data
+        self._waitFor8011Queue = deque()        # Contains list of Command waiting for Ack/Nack
+        self._waitFor8012Queue = deque()        # We are wiating for aPdu free. Implemented on 31e. (wait for 0x8012 or 0x8702 )
+
+        # Indexes on ListOfCommands
+        self.ListOfCommandsNotSent = {}    # ( Cmd, Datas ) -> InternalSqn for commands not yet sent, to drop duplicates
+        self.ListOfCommandsDeadlines = []  # heap of ( deadline, InternalSqn ) for commands sent, to time them out
 
         # ZigBee31c (for  firmware below 31c, when Ack --> WaitForResponse )
         # ZigBeeack ( for firmware above 31d, When Ack --> WaitForAck )
@@ -91,22 +128,29 @@ class ZigateTransport(object):
 
         # Communication/Transport link attributes
         self._connection = None  # connection handle
-        self._ReqRcv = bytearray()  # on going receive buffer
+        self.frame_reassembler = FrameReassembler()  # on going receive buffer
         self._transp = None  # Transport mode USB or Wifi
         self._serialPort = None  # serial port in case of USB
         self._wifiAddress = None  # ip address in case of Wifi
         self._wifiPort = None  # wifi port
 
         # Thread management
-        self.lock = Lock()
+        self.lock = RLock()    # Protect the Queues and ListOfCommands between the reading thread and the plugin thread
+        self.callContext = local()     # Priority class of the commands sent by the current thread ( interactive() )
         self.running = True
         self.WatchDogThread = None
 
         self.Thread_listen_and_read = None
         self.Thread_proc_zigate_frame = None
         self.Event_proc_zigate_frame = None
-        #self.frame_queue = queue.SimpleQueue( )
-        #self.start_thread_processing_messages( )
+
+        # Frames decoded by the reading thread and waiting to be processed by the plugin (MultiThreaded mode)
+        self.frame_queue = None
+        self.pending_reports = {}   # Coalescing key -> [ frame ] for Attribute Reports still in the frame_queue
+        self.pending_reports_lock = Lock()
+        self.frames_to_forward = []     # Frames forwarded by process_frame, to be queued once self.lock is released
+        if self.pluginconf.pluginConf['MultiThreaded']:
+            self.frame_queue = queue.Queue( maxsize = self.pluginconf.pluginConf['FrameQueueSize'] )
 
         self.reading_thread_timing = None
         self.watchdog_timing = None
@@ -114,9 +158,6 @@ class ZigateTransport(object):
         # Call back function to send back to plugin
         self.F_out = F_out  # Function to call to bring the decoded Frame at plugin
 
-        # Multi Threading disabled on Stable 4.11
-        self.pluginconf.pluginConf["MultiThreaded"] = 0
-
 
         initMatrix(self)
 
@@ -132,9 +173,6 @@ class ZigateTransport(object):
         else:
             Domoticz.Error("Unknown Transport Mode: %s" % transport)
             self._transp = 'None'
-    
-        if self.pluginconf.pluginConf['SerialReadV2']:
-            Domoticz.Status("Serial Line open with new Read algo...")
 
 
     # Thread handling Serial Input/Output
@@ -146,7 +184,19 @@ class ZigateTransport(object):
 
     def thread_transport_shutdown( self ):
         self.running = False
-        #self.frame_queue.put("STOP") # In order to unblock the Blocking get()
+        if self.frame_queue:
+            try:
+                self.frame_queue.put_nowait( "STOP" ) # In order to unblock the Blocking get()
+            except queue.Full:
+                # The processing thread will see self.running at the next get() timeout
+                pass
+
+    def thread_transport_join( self ):
+        # Wait for all Transport threads to complete, to be called once running is False
+        for thread in ( self.Thread_listen_and_read, self.WatchDogThread, self.Thread_proc_zigate_frame ):
+            if thread is not None and thread.is_alive() and thread.name != current_thread().name:
+                thread.join()
+        self.Thread_listen_and_read = self.WatchDogThread = self.Thread_proc_zigate_frame = None
 
 
     # Thread to manage Message/Frame processing
@@ -165,9 +215,10 @@ class ZigateTransport(object):
             frame = None
             # Sending messages ( only 1 at a time )
             try:
-                frame = self.frame_queue.get( )
-                if frame == 'STOP':
+                item = self.frame_queue.get( timeout = FRAME_QUEUE_GET_TIMEOUT )
+                if item == 'STOP':
                     break
+                frame = dequeue_frame( self, item )
                 
                 if not self.pluginconf.pluginConf['ZiGateReactTime']: 
                     self.F_out(frame, None)            
@@ -207,6 +258,11 @@ class ZigateTransport(object):
                     'Thread Name': self.Thread_listen_and_read.name,
                 }
                 self.logging_send_error( "thread_transport_watchdog", context=_context)
+                # A Thread cannot be started twice, let's create a new one
+                if self._transp == "Wifi":
+                    self.Thread_listen_and_read = Thread( name="ZiGateTCPIP",  target=ZigateTransport.tcpip_listen_and_send,  args=(self,))
+                else:
+                    self.Thread_listen_and_read = Thread( name="ZiGateSerial",  target=ZigateTransport.serial_read_from_zigate,  args=(self,))
                 self.Thread_listen_and_read.start()
 
     # Manage Serial Line
@@ -222,6 +278,7 @@ class ZigateTransport(object):
             return
 
         Domoticz.Status("Starting Listening and Sending Thread")
+        self.start_thread_processing_messages( )
         if self.Thread_listen_and_read is None:
             self.Thread_listen_and_read = Thread( name="ZiGateSerial",  target=ZigateTransport.serial_read_from_zigate,  args=(self,))
             self.Thread_listen_and_read.start()
@@ -281,9 +338,7 @@ class ZigateTransport(object):
                     self.logging_send('Log', "serial_read_from_zigate %s ms spent in on_message()" %timing)
 
 
-        self.frame_queue.put("STOP") # In order to unblock the Blocking get()
         Domoticz.Status("ZigateTransport: ZiGateSerialListen Thread stop.")
-        self.Thread_proc_zigate_frame.join()
 
     # Manage TCP connection
     def open_tcpip( self ):
@@ -294,6 +349,7 @@ class ZigateTransport(object):
             Domoticz.Error("Cannot open Zigate Wifi %s Port %s error: %s" %(self._wifiAddress, self._serialPort, e))
             return
 
+        self.start_thread_processing_messages( )
         if self.Thread_listen_and_read is None:
             self.Thread_listen_and_read = Thread( name="ZiGateTCPIP",  target=ZigateTransport.tcpip_listen_and_send,  args=(self,))
             self.Thread_listen_and_read.start()
@@ -329,17 +385,16 @@ class ZigateTransport(object):
                 if timing > 1000:
                     self.logging_send('Log', "tcpip_listen_and_send %s ms spent in on_message()" %timing)
 
-        self.frame_queue.put("STOP") # In order to unblock the Blocking get()
         Domoticz.Status("ZigateTransport: ZiGateTcpIpListen Thread stop.")
 
     # Login mecanism
-    def logging_send(self, logType, message, NwkId = None, _context=None):
+    def logging_send(self, logType, message, NwkId = None, _context=None, args=None):
         # Log all activties towards ZiGate
-        self.log.logging('TransportTx', logType, message, context = _context)
+        self.log.logging('TransportTx', logType, message, context = _context, args=args)
 
-    def logging_receive(self, logType, message, nwkid=None, _context=None):
+    def logging_receive(self, logType, message, nwkid=None, _context=None, args=None):
         # Log all activities received from ZiGate
-        self.log.logging('TransportRx', logType, message, nwkid=nwkid, context = _context)
+        self.log.logging('TransportRx', logType, message, nwkid=nwkid, context = _context, args=args)
 
     def logging_send_error( self, message, Nwkid=None, context=None):
         if context is None:
@@ -369,7 +424,7 @@ class ZigateTransport(object):
             'current_SQN': self.current_sqn,
             }
         context['inMessage'] = {
-            'ReqRcv': str(self._ReqRcv),
+            'ReqRcv': str(self.frame_reassembler.pending()),
         }
 
         message += " Error Code: %s" %context['Error code']
@@ -380,6 +435,16 @@ class ZigateTransport(object):
         # Provide the Load of the Sending Queue
         return len(self.zigateSendQueue)
 
+    @contextmanager
+    def interactive(self):
+        # Commands sent by this thread within the block are User actions ( onCommand ), whatever their command code
+        previous = getattr( self.callContext, 'priority', None )
+        self.callContext.priority = PRIORITY_INTERACTIVE
+        try:
+            yield
+        finally:
+            self.callContext.priority = previous
+
 
 
     # Transport / Opening / Closing Communication
@@ -428,13 +493,13 @@ class ZigateTransport(object):
     
         if self.pluginconf.pluginConf['MultiThreaded'] and self._connection and isinstance( self._connection, serial.serialposix.Serial):
             self._connection.cancel_read()
-            self.Thread_listen_and_read.join()
+            self.thread_transport_join()
             self._connection.close()
 
         elif self.pluginconf.pluginConf['MultiThreaded'] and self._connection and isinstance( self._connection, socket.socket):
             self._connection.shutdown( socket.SHUT_RDWR )
             self._connection.close()
-            self.Thread_listen_and_read.join()
+            self.thread_transport_join()
 
         else:
             self._connection.Disconnect()
@@ -464,7 +529,8 @@ class ZigateTransport(object):
 
 
 
-    def sendData(self, cmd, datas, ackIsDisabled=False, waitForResponseIn=False):
+    def sendData(self, cmd, datas, ackIsDisabled=False, waitForResponseIn=False, priority=None):
+        # priority: priority class of the command, if None the one of the calling context ( interactive() ), or of the command code
 
         waitForResponse = False
         if waitForResponseIn  or self.pluginconf.pluginConf['waitForResponse']:
@@ -477,7 +543,13 @@ class ZigateTransport(object):
         if datas is None:
             datas = ''
 
-        if datas != '' and not is_hex(datas):
+        binDatas = None
+        if isinstance( datas, (bytes, bytearray) ):
+            # Binary payload ( OTA blocks ), the hex form is only kept for the queues and the logs
+            binDatas = bytes( datas )
+            datas = binDatas.hex()
+
+        elif datas != '' and not is_hex(datas):
             _context = {
                 'Error code': 'TRANS-SENDDATA-01',
                 'Cmd': cmd,
@@ -488,41 +560,35 @@ class ZigateTransport(object):
             self.logging_send_error( "sendData", context=_context)
             return None
 
-        # Check if the Cmd/Data is not yet in the pipe
-        alreadyInQueue = False
-        for x in list(self.ListOfCommands.keys()):
-            if (x in self.ListOfCommands and 'Status'  in self.ListOfCommands[x] and self.ListOfCommands[x]['Status'] not in ('', 'TO-SEND', 'QUEUED')):
-                continue
-
-            if (x in self.ListOfCommands and 'Cmd' in self.ListOfCommands[x] and self.ListOfCommands[x]['Cmd'] != cmd):
-                continue
-
-            if ( x in self.ListOfCommands and 'Datas'  in self.ListOfCommands[x] and self.ListOfCommands[x]['Datas'] != datas ):
-                continue
-
-            self.logging_send( 'Debug', "Cmd: %s Data: %s already in queue. drop that command" % (cmd, datas))
-            alreadyInQueue = True
-            return None
+        with self.lock:
+            # Check if the Cmd/Data is not yet in the pipe
+            if (cmd, datas) in self.ListOfCommandsNotSent:
+                self.logging_send( 'Debug', "Cmd: %s Data: %s already in queue. drop that command", args=(cmd, datas))
+                return None
 
-        # Let's move on, create an internal Sqn for tracking
-        InternalSqn = sqn_generate_new_internal_sqn(self)
-        if InternalSqn in self.ListOfCommands:
-            # Unexpected !
-            _context = {
-                'Error code': 'TRANS-SENDDATA-02',
-                'Cmd': cmd,
-                'Datas': datas,
-                'ackIsDisabled': ackIsDisabled,
-                'waitForResponseIn': waitForResponseIn,
-                'iSQN': InternalSqn
-            }
-            self.logging_send_error( "sendData", context=_context)
-            return None
+            # Let's move on, create an internal Sqn for tracking
+            InternalSqn = sqn_generate_new_internal_sqn(self)
+            if InternalSqn in self.ListOfCommands:
+                # Unexpected !
+                _context = {
+                    'Error code': 'TRANS-SENDDATA-02',
+                    'Cmd': cmd,
+                    'Datas': datas,
+                    'ackIsDisabled': ackIsDisabled,
+                    'waitForResponseIn': waitForResponseIn,
+                    'iSQN': InternalSqn
+                }
+                self.logging_send_error( "sendData", context=_context)
+                return None
 
-        store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForResponse )
-        printListOfCommands(self, 'from sendData', InternalSqn)
-        send_data_internal(self, InternalSqn)
-        return InternalSqn
+            if priority is None:
+                priority = getattr( self.callContext, 'priority', None )
+            if priority is None:
+                priority = command_priority( int(cmd, 16) )
+            store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForResponse, binDatas, priority )
+            printListOfCommands(self, 'from sendData', InternalSqn)
+            send_data_internal(self, InternalSqn)
+            return InternalSqn
 
 
     def on_message(self, Data):
@@ -530,33 +596,39 @@ class ZigateTransport(object):
 
         #self.logging_receive( 'Log', "onMessage - %s" %(Data))
         if Data is not None:
-            self._ReqRcv += Data  # Add the incoming data
-            #Domoticz.Debug("onMessage incoming data : '" + str(binascii.hexlify(self._ReqRcv).decode('utf-8')) + "'")
+            self.frame_reassembler.feed( Data )  # Add the incoming data
 
-        while 1:  # Loop, detect frame and process, until there is no more frame.
-            if len(self._ReqRcv) == 0:
-                return
+        garbage = self.frame_reassembler.garbage
+        for raw_frame in self.frame_reassembler.frames():  # Loop, detect frame and process, until there is no more frame.
+            if self.frame_reassembler.garbage != garbage:
+                frame_resync_error( self, self.frame_reassembler.garbage - garbage, raw_frame )
+                garbage = self.frame_reassembler.garbage
 
-            BinMsg = get_frame_and_decode( self )
+            BinMsg = decode_frame( raw_frame )
             if BinMsg is None:
-                return
+                continue
 
             if not check_frame_lenght( self, BinMsg) or not check_frame_crc(self, BinMsg):
                 Domoticz.Error("on_message Frame error Crc/len %s" %(BinMsg))
                 continue           
 
-            AsciiMsg = binascii.hexlify(BinMsg).decode('utf-8')
+            frame = ZigateFrame( BinMsg )
 
             if self.pluginconf.pluginConf["debugzigateCmd"]:
-                self.logging_send('Log', "on_message AsciiMsg: %s , Remaining buffer: %s" %(AsciiMsg,  self._ReqRcv ))
+                self.logging_send('Log', "on_message Frame: %s , Remaining buffer: %s" %(frame.hex,  self.frame_reassembler.pending() ))
 
             self.statistics._received += 1
 
-            process_frame(self, AsciiMsg)
+            with self.lock:
+                process_frame(self, frame)
+            flush_forwarded_frames(self)
+
+        if self.frame_reassembler.garbage != garbage:
+            frame_resync_error( self, self.frame_reassembler.garbage - garbage, None )
 
-                    
     def check_timed_out_for_tx_queues(self):
-        check_timed_out(self)
+        with self.lock:
+            check_timed_out(self)
 
 # Thread Function
 
@@ -593,15 +665,18 @@ def handle_error_in_thread( self, e, nb_in, nb_out, data):
                     
 # Local Functions
 
-def store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForResponse ):
+def store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForResponse, binDatas=None, priority=PRIORITY_BACKGROUND ):
     self.ListOfCommands[InternalSqn] = {}
     self.ListOfCommands[InternalSqn]['Cmd'] = cmd
     self.ListOfCommands[InternalSqn]['Datas'] = datas
+    self.ListOfCommands[InternalSqn]['BinDatas'] = binDatas    # bytes of Datas, when provided by the caller
     self.ListOfCommands[InternalSqn]['ReTransmit'] = 0
     self.ListOfCommands[InternalSqn]['Status'] = ''
     self.ListOfCommands[InternalSqn]['ReceiveTimeStamp'] = str((datetime.now()).strftime("%m/%d/%Y, %H:%M:%S"))
     self.ListOfCommands[InternalSqn]['SentTimeStamp'] = None
     self.ListOfCommands[InternalSqn]['PDMCommand'] = False
+    self.ListOfCommands[InternalSqn]['Priority'] = priority      # Priority class in the send queue
+    self.ListOfCommandsNotSent[ (cmd, datas) ] = InternalSqn
 
     self.ListOfCommands[InternalSqn]['ResponseExpected'] = False    # Means that there is an Expected Response for that Command
     self.ListOfCommands[InternalSqn]['MessageResponse'] = None      # Is the expected MsgType in response for the command
@@ -634,7 +709,7 @@ def store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForRespo
         # 0110 and 0113 are always set with Ack. Overwriten by the firmware
         if hexCmd in (0x0110, 0x0113):
             self.logging_send(
-                'Debug', "-- > Patching %s to Ack due to firmware 31c" % hexCmd)
+                'Debug', "-- > Patching %s to Ack due to firmware 31c", args=(hexCmd,))
             self.ListOfCommands[InternalSqn]['MessageResponse'] = CMD_WITH_RESPONSE[hexCmd]
             self.ListOfCommands[InternalSqn]['ResponseExpected'] = True
             self.ListOfCommands[InternalSqn]['Expected8011'] = True
@@ -649,8 +724,7 @@ def store_ISQN_infos( self, InternalSqn, cmd, datas, ackIsDisabled, waitForRespo
     if self.pluginconf.pluginConf['forceFullSeqMode'] and self.ListOfCommands[InternalSqn]['ResponseExpected'] and (not ackIsDisabled or waitForResponse):
         self.ListOfCommands[InternalSqn]['WaitForResponse'] = True
 
-    self.logging_send('Debug', "sendData - %s %s ackDisabled: %s FIFO: %s ResponseExpected: %s WaitForResponse: %s MessageResponse: 0x%s" 
-        %(cmd, datas, ackIsDisabled, len(self.zigateSendQueue), 
+    self.logging_send('Debug', "sendData - %s %s ackDisabled: %s FIFO: %s ResponseExpected: %s WaitForResponse: %s MessageResponse: 0x%s", args=(cmd, datas, ackIsDisabled, len(self.zigateSendQueue), 
         self.ListOfCommands[InternalSqn]['ResponseExpected'], 
         self.ListOfCommands[InternalSqn]['WaitForResponse'],
         self.ListOfCommands[InternalSqn]['MessageResponse']))
@@ -696,12 +770,26 @@ def initMatrix(self):
 
 # Queues Managements
 
+def command_priority( cmd ):
+    # Default priority class of a command (int), when neither the caller nor the calling context give one
+    if cmd in INTERACTIVE_COMMANDS:
+        return PRIORITY_INTERACTIVE
+    if cmd in PROTOCOL_COMMANDS or cmd in CMD_PDM_ON_HOST:
+        return PRIORITY_PROTOCOL
+    return PRIORITY_BACKGROUND
+
+def command_destination( cmd, datas ):
+    # Key used to share the Tx between devices. Address mode + NwkId for most ZCL commands, first parameter otherwise
+    if cmd in CMD_NWK_2NDBytes or cmd in OTA_DEVICE_COMMANDS:
+        return datas[2:6]
+    return datas[0:4]
+
 def _add_cmd_to_send_queue(self, InternalSqn):
     # add a command to the waiting list
-    timestamp = int(time.time())
-    # Check if the Cmd+Data is not yet in the Queue. If yes forget that message
+    timestamp = time.time()
+    cmd = int(self.ListOfCommands[InternalSqn]['Cmd'], 16)
     #self.logging_send(  'Debug2', " --  > _add_cmd_to_send_queue - adding to Queue %s %s" %(InternalSqn, timestamp ))
-    self.zigateSendQueue.append((InternalSqn, timestamp))
+    self.zigateSendQueue.append((InternalSqn, timestamp), self.ListOfCommands[InternalSqn]['Priority'], command_destination( cmd, self.ListOfCommands[InternalSqn]['Datas'] ))
     # Manage Statistics
     if len(self.zigateSendQueue) > self.statistics._MaxLoad:
         self.statistics._MaxLoad = len(self.zigateSendQueue)
@@ -712,9 +800,12 @@ def _next_cmd_from_send_queue(self):
 
     # return the next Command to send (pop)
     ret = (None, None)
-    if len(self.zigateSendQueue) > 0:
-        ret = self.zigateSendQueue[0]
-        del self.zigateSendQueue[0]
+    if self.zigateSendQueue:
+        # None when the only commands left are held by the Background rate limit
+        ret = self.zigateSendQueue.popleft() or (None, None)
+        self.statistics._Load = len(self.zigateSendQueue)
+        if ret[0] in self.ListOfCommands:
+            self.statistics.add_tx_wait( self.ListOfCommands[ret[0]]['Priority'], int( ( time.time() - ret[1] ) * 1000 ) )
     #self.logging_send(  'Debug2', " --  > _nextCmdFromSendQueue - Unqueue %s " %( str(ret) ))
     return ret
 
@@ -730,9 +821,8 @@ def _add_cmd_to_wait_for8000_queue(self, InternalSqn):
 def _next_cmd_from_wait_for8000_queue(self):
     # return the entry waiting for a Status
     ret = (None, None)
-    if len(self._waitFor8000Queue) > 0:
-        ret = self._waitFor8000Queue[0]
-        del self._waitFor8000Queue[0]
+    if self._waitFor8000Queue:
+        ret = self._waitFor8000Queue.popleft()
     #self.logging_send(  'Debug2', " --  > _nextCmdFromWaitFor8000Queue - Unqueue %s " %( str(ret) ))
     return ret
 
@@ -749,9 +839,8 @@ def _next_cmd_from_wait_for8012_queue(self):
     # return the entry waiting for a Status
     
     ret = (None, None)
-    if len(self._waitFor8012Queue) > 0:
-        ret = self._waitFor8012Queue[0]
-        del self._waitFor8012Queue[0]
+    if self._waitFor8012Queue:
+        ret = self._waitFor8012Queue.popleft()
     #self.logging_send(  'Debug2', " --  > _nextCmdFromWaitFor8000Queue - Unqueue %s " %( str(ret) ))
     return ret
 
@@ -766,9 +855,8 @@ def _add_cmd_to_wait_for8011_queue(self, InternalSqn):
 def _next_cmd_to_wait_for8011_queue(self):
     # return the entry waiting for Data
     ret = (None, None)
-    if len(self._waitFor8011Queue) > 0:
-        ret = self._waitFor8011Queue[0]
-        del self._waitFor8011Queue[0]
+    if self._waitFor8011Queue:
+        ret = self._waitFor8011Queue.popleft()
     #self.logging_send(  'Debug2', " --  > _next_cmd_to_wait_for8011_queue - Unqueue %s " %( str(ret) ))
     return ret
 
@@ -784,9 +872,8 @@ def _add_cmd_to_wait_for_cmdresponse_queue(self, InternalSqn):
 def _next_cmd_from_wait_cmdresponse_queue(self):
     # return the entry waiting for Data
     ret = (None, None)
-    if len(self._waitForCmdResponseQueue) > 0:
-        ret = self._waitForCmdResponseQueue[0]
-        del self._waitForCmdResponseQueue[0]
+    if self._waitForCmdResponseQueue:
+        ret = self._waitForCmdResponseQueue.popleft()
     #self.logging_send(  'Debug', " --  > _next_cmd_from_wait_cmdresponse_queue - Unqueue %s " %( str(ret) ))
     return ret
 
@@ -804,8 +891,7 @@ def send_data_internal(self, InternalSqn):
         Domoticz.Error("send_data_internal - unexpected 1 %s not in ListOfCommands: %s" %
                        (InternalSqn, str(self.ListOfCommands.keys())))
         return
-    self.logging_send('Debug', "--- send_data_internal - %s FIFO: %s" %
-                     (InternalSqn, len(self.zigateSendQueue)))
+    self.logging_send('Debug', "--- send_data_internal - %s FIFO: %s", args=(InternalSqn, len(self.zigateSendQueue)))
 
     sendNow = True
     # PDM Management.
@@ -819,8 +905,7 @@ def send_data_internal(self, InternalSqn):
     if self._waitFor8000Queue or self._waitFor8012Queue or self._waitFor8011Queue or self._waitForCmdResponseQueue:
         sendNow = False
 
-    self.logging_send('Debug', "--- before sending - Command: %s  Q(0x8000): %s Q(8012): %s Q(Ack/Nack): %s Q(Response): %s sendNow: %s"
-        % (self.ListOfCommands[InternalSqn]['Cmd'],  len(self._waitFor8000Queue), len(self._waitFor8012Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), sendNow))
+    self.logging_send('Debug', "--- before sending - Command: %s  Q(0x8000): %s Q(8012): %s Q(Ack/Nack): %s Q(Response): %s sendNow: %s", args=(self.ListOfCommands[InternalSqn]['Cmd'],  len(self._waitFor8000Queue), len(self._waitFor8012Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), sendNow))
 
     if not sendNow:
         # Put in FIFO
@@ -869,19 +954,19 @@ def load_queues_before_sending( self, InternalSqn ):
 
 
 def printListOfCommands(self, comment, isqn):
-    self.logging_send('Debug', "=======  %s:" % comment)
-    self.logging_send('Debug', "[%s]  - Cmd:              %s" % ( isqn, self.ListOfCommands[isqn]['Cmd']))
-    self.logging_send('Debug', "[%s]  - Datas:            %s" % ( isqn, self.ListOfCommands[isqn]['Datas']))
-    self.logging_send('Debug', "[%s]  - ReTransmit:       %s" % ( isqn, self.ListOfCommands[isqn]['ReTransmit']))
-    self.logging_send('Debug', "[%s]  - Status:           %s" % ( isqn, self.ListOfCommands[isqn]['Status']))
-    self.logging_send('Debug', "[%s]  - ReceiveTimeStamp: %s" % ( isqn, self.ListOfCommands[isqn]['ReceiveTimeStamp']))
-    self.logging_send('Debug', "[%s]  - SentTimeStamp:    %s" % ( isqn, self.ListOfCommands[isqn]['SentTimeStamp']))
-    self.logging_send('Debug', "[%s]  - PDMCommand:       %s" % ( isqn, self.ListOfCommands[isqn]['PDMCommand']))
-    self.logging_send('Debug', "[%s]  - ResponseExpected: %s" % ( isqn, self.ListOfCommands[isqn]['ResponseExpected']))
-    self.logging_send('Debug', "[%s]  - MessageResponse:  %s" % ( isqn, self.ListOfCommands[isqn]['MessageResponse']))
-    self.logging_send('Debug', "[%s]  - ExpectedAck:      %s" % ( isqn, self.ListOfCommands[isqn]['Expected8011']))
-    self.logging_send('Debug', "[%s]  - Expected8012:     %s" % ( isqn, self.ListOfCommands[isqn]['Expected8012']))
-    self.logging_send('Debug', "[%s]  - WaitForResponse:  %s" % ( isqn, self.ListOfCommands[isqn]['WaitForResponse']))
+    self.logging_send('Debug', "=======  %s:", args=(comment,))
+    self.logging_send('Debug', "[%s]  - Cmd:              %s", args=( isqn, self.ListOfCommands[isqn]['Cmd']))
+    self.logging_send('Debug', "[%s]  - Datas:            %s", args=( isqn, self.ListOfCommands[isqn]['Datas']))
+    self.logging_send('Debug', "[%s]  - ReTransmit:       %s", args=( isqn, self.ListOfCommands[isqn]['ReTransmit']))
+    self.logging_send('Debug', "[%s]  - Status:           %s", args=( isqn, self.ListOfCommands[isqn]['Status']))
+    self.logging_send('Debug', "[%s]  - ReceiveTimeStamp: %s", args=( isqn, self.ListOfCommands[isqn]['ReceiveTimeStamp']))
+    self.logging_send('Debug', "[%s]  - SentTimeStamp:    %s", args=( isqn, self.ListOfCommands[isqn]['SentTimeStamp']))
+    self.logging_send('Debug', "[%s]  - PDMCommand:       %s", args=( isqn, self.ListOfCommands[isqn]['PDMCommand']))
+    self.logging_send('Debug', "[%s]  - ResponseExpected: %s", args=( isqn, self.ListOfCommands[isqn]['ResponseExpected']))
+    self.logging_send('Debug', "[%s]  - MessageResponse:  %s", args=( isqn, self.ListOfCommands[isqn]['MessageResponse']))
+    self.logging_send('Debug', "[%s]  - ExpectedAck:      %s", args=( isqn, self.ListOfCommands[isqn]['Expected8011']))
+    self.logging_send('Debug', "[%s]  - Expected8012:     %s", args=( isqn, self.ListOfCommands[isqn]['Expected8012']))
+    self.logging_send('Debug', "[%s]  - WaitForResponse:  %s", args=( isqn, self.ListOfCommands[isqn]['WaitForResponse']))
 
 def patch_cmdresponse_for_sending(self, i_sqn):
 
@@ -931,8 +1016,7 @@ def patch_cmdresponse_for_sending(self, i_sqn):
             self.ListOfCommands[i_sqn]['ResponseExpected'] = False
             self.ListOfCommands[i_sqn]['MessageResponse'] = None
             self.ListOfCommands[i_sqn]['WaitForResponse'] = False
-            self.logging_send('Debug', "--- 31c do not block 0110 even if Ack expected %s" %
-                             self.ListOfCommands[i_sqn]['Cmd'])
+            self.logging_send('Debug', "--- 31c do not block 0110 even if Ack expected %s", args=(self.ListOfCommands[i_sqn]['Cmd'],))
 
         else:
             self.logging_send('Debug', "--- Add to Queue CommandResponse Queue")
@@ -995,8 +1079,7 @@ def patch_8011_for_sending(self, i_sqn):
 
         else:
             # Wait for Ack/Nack if NwkId != '0000' and Address Mode (ZiGate)
-            self.logging_send('Debug', "--- Add to Queue Ack/Nack %s %s" %
-                             (self.ListOfCommands[i_sqn]['Cmd'], self.ListOfCommands[i_sqn]['Datas']))
+            self.logging_send('Debug', "--- Add to Queue Ack/Nack %s %s", args=(self.ListOfCommands[i_sqn]['Cmd'], self.ListOfCommands[i_sqn]['Datas']))
             _add_cmd_to_wait_for8011_queue(self, i_sqn)
 
 def ready_to_send_if_needed(self):
@@ -1005,22 +1088,21 @@ def ready_to_send_if_needed(self):
 
     if self.zmode == 'zigate31c':
         readyToSend = len(self._waitFor8000Queue) == 0 and len(self._waitForCmdResponseQueue) == 0
-        self.logging_send('Debug', "--- ready_to_send_if_needed 31c - Q(0x8000): %s Q(Ack/Nack): %s sendNow: %s"
-            % ( len(self._waitFor8000Queue), len(self._waitFor8000Queue), len(self.zigateSendQueue),))
+        self.logging_send('Debug', "--- ready_to_send_if_needed 31c - Q(0x8000): %s Q(Ack/Nack): %s sendNow: %s", args=( len(self._waitFor8000Queue), len(self._waitFor8000Queue), len(self.zigateSendQueue),))
 
     elif self.zmode == 'zigate31d':
         readyToSend = ((len(self._waitFor8000Queue) == 0) and (len(self._waitFor8011Queue) == 0) and (len(self._waitForCmdResponseQueue) == 0))
-        self.logging_send('Debug', "--- ready_to_send_if_needed 31d - Q(0x8000): %s Q(Ack/Nack): %s Q(waitForResponse): %s sendNow: %s readyToSend: %s"
-            % ( len(self._waitFor8000Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), len(self.zigateSendQueue),readyToSend ))
+        self.logging_send('Debug', "--- ready_to_send_if_needed 31d - Q(0x8000): %s Q(Ack/Nack): %s Q(waitForResponse): %s sendNow: %s readyToSend: %s", args=( len(self._waitFor8000Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), len(self.zigateSendQueue),readyToSend ))
 
     elif self.zmode == 'zigate31e':
         readyToSend = len(self._waitFor8000Queue) == 0 and len(self._waitFor8012Queue) == 0 and len(self._waitFor8011Queue) == 0 and len(self._waitForCmdResponseQueue) == 0
-        self.logging_send('Debug', "--- ready_to_send_if_needed 31e - Q(0x8000): %s Q(8012/7-8702): %s Q(Ack/Nack): %s Q(waitForResponse): %s sendNow: %s readyToSend: %s"
-            % ( len(self._waitFor8000Queue), len(self._waitFor8012Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), len(self.zigateSendQueue),readyToSend ))
+        self.logging_send('Debug', "--- ready_to_send_if_needed 31e - Q(0x8000): %s Q(8012/7-8702): %s Q(Ack/Nack): %s Q(waitForResponse): %s sendNow: %s readyToSend: %s", args=( len(self._waitFor8000Queue), len(self._waitFor8012Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), len(self.zigateSendQueue),readyToSend ))
 
     if readyToSend and len(self.zigateSendQueue) > 0:
         # Send next data
-        send_data_internal(self, _next_cmd_from_send_queue(self)[0])
+        InternalSqn = _next_cmd_from_send_queue(self)[0]
+        if InternalSqn is not None:
+            send_data_internal(self, InternalSqn)
 
 def _send_data(self, InternalSqn):
     # send data to Zigate via the communication transport
@@ -1030,6 +1112,9 @@ def _send_data(self, InternalSqn):
     self.ListOfCommands[InternalSqn]['Status'] = 'SENT'
     self.ListOfCommands[InternalSqn]['StatusTimeStamp'] = str((datetime.now()).strftime("%m/%d/%Y, %H:%M:%S"))
     self.ListOfCommands[InternalSqn]['SentTimeStamp'] = int(time.time())
+    if self.ListOfCommandsNotSent.get( (cmd, datas) ) == InternalSqn:
+        del self.ListOfCommandsNotSent[ (cmd, datas) ]
+    heapq.heappush( self.ListOfCommandsDeadlines, ( self.ListOfCommands[InternalSqn]['SentTimeStamp'] + TIME_OUT_LISTCMD, InternalSqn ) )
     
 
     if self.pluginconf.pluginConf["debugzigateCmd"]:
@@ -1039,35 +1124,17 @@ def _send_data(self, InternalSqn):
             self.ListOfCommands[InternalSqn]['ResponseExpected'], 
             self.ListOfCommands[InternalSqn]['WaitForResponse']))
 
-    if datas == "":
-        length = "0000"
-        checksumCmd = get_checksum(cmd, length, "0")
-        strchecksum = '0' + \
-            str(checksumCmd) if len(checksumCmd) == 1 else checksumCmd
-        lineinput = "01" + str(zigate_encode(cmd)) + str(zigate_encode(length)) + \
-                    str(zigate_encode(strchecksum)) + "03"
-    else:
-        #Domoticz.Log("---> datas: %s" %datas)
-        length = '%04x' % (len(datas)//2)
-
-        checksumCmd = get_checksum(cmd, length, datas)
-        strchecksum = '0' + \
-            str(checksumCmd) if len(checksumCmd) == 1 else checksumCmd
-        lineinput = "01" + str(zigate_encode(cmd)) + str(zigate_encode(length)) + \
-                    str(zigate_encode(strchecksum)) + \
-            str(zigate_encode(datas)) + "03"
-
-    # self.logging_send(  'Debug', "---  --  > _send_data - sending encoded Cmd: %s length: %s CRC: %s Data: %s" \
-    #            %(str(zigate_encode(cmd)), str(zigate_encode(length)), str(zigate_encode(strchecksum)), str(zigate_encode(datas))))
-    #self._connection.Send(bytes.fromhex(str(lineinput)), 0)
+    binDatas = self.ListOfCommands[InternalSqn]['BinDatas']
+    if binDatas is None:
+        binDatas = bytes.fromhex(datas)
+    encoded_frame = encode_frame( int(cmd, 16), binDatas )
 
-
-    #Domoticz.Log("_send_data: raw command: %s" %str(bytes.fromhex(str(lineinput))))
+    #Domoticz.Log("_send_data: raw command: %s" %str(encoded_frame))
     if self.pluginconf.pluginConf['MultiThreaded']:
         # Recommendation @badz
-        write_to_zigate( self, self._connection, bytes.fromhex(str(lineinput)) )
+        write_to_zigate( self, self._connection, encoded_frame )
     else:
-        self._connection.Send(bytes.fromhex(str(lineinput)), 0)
+        self._connection.Send(encoded_frame, 0)
     self.statistics._sent += 1
 
 
@@ -1210,35 +1277,30 @@ def timeout_cmd_response(self,isqn, ts):
     cleanup_list_of_commands(self, InternalSqn)
 
 def check_and_timeout_listofcommand(self):
-
-    TIME_OUT_LISTCMD = 15
+    # Commands are timed out in deadline order, only the expired ones are looked at
 
     if len(self.ListOfCommands) == 0:
         return
 
-    self.logging_send( 'Debug', "-- checkTimedOutForTxQueues ListOfCommands size: %s" % len(self.ListOfCommands))
-    for x in list(self.ListOfCommands.keys()):
-        if x in self.ListOfCommands and 'SentTimeStamp' not in self.ListOfCommands[x]:
-            errorCode = 'TRANS-CHKTOLSTCMD-01'
-            timeoutValue = 0
-        
-        elif x in self.ListOfCommands and self.ListOfCommands[x]['SentTimeStamp'] is None:
-            # Hum !
-            errorCode = 'TRANS-CHKTOLSTCMD-02'
-            timeoutValue = 0
-        else:    
-            errorCode =   'TRANS-CHKTOLSTCMD-03'  
-            timeoutValue = (int(time.time()) - self.ListOfCommands[x]['SentTimeStamp'])
-
-        if timeoutValue > TIME_OUT_LISTCMD:
-            _context = {
-                'Error code': errorCode,
-                'COMMAND': x,
-                'TimeOut': timeoutValue,
-            }
-            if self.pluginconf.pluginConf['trackError']:
-                self.logging_send_error(  "check_and_timeout_listofcommand", context=_context)
-            del self.ListOfCommands[x]
+    now = int(time.time())
+    self.logging_send( 'Debug', "-- checkTimedOutForTxQueues ListOfCommands size: %s", args=(len(self.ListOfCommands),))
+    while self.ListOfCommandsDeadlines and self.ListOfCommandsDeadlines[0][0] < now:
+        deadline, x = heapq.heappop( self.ListOfCommandsDeadlines )
+        if x not in self.ListOfCommands or self.ListOfCommands[x]['SentTimeStamp'] is None:
+            # Already completed
+            continue
+        if self.ListOfCommands[x]['SentTimeStamp'] + TIME_OUT_LISTCMD != deadline:
+            # Has been sent again since, a newer deadline is in the heap
+            continue
+
+        _context = {
+            'Error code': 'TRANS-CHKTOLSTCMD-03',
+            'COMMAND': x,
+            'TimeOut': now - self.ListOfCommands[x]['SentTimeStamp'],
+        }
+        if self.pluginconf.pluginConf['trackError']:
+            self.logging_send_error(  "check_and_timeout_listofcommand", context=_context)
+        cleanup_list_of_commands(self, x)
 
 def check_timed_out(self):
     
@@ -1283,111 +1345,183 @@ def check_timed_out(self):
 
 def cleanup_list_of_commands(self, i_sqn):
 
-    self.logging_send('Debug', " --  -- - > Cleanup Internal SQN: %s" % i_sqn)
+    self.logging_send('Debug', " --  -- - > Cleanup Internal SQN: %s", args=(i_sqn,))
     if i_sqn in self.ListOfCommands:
         self.logging_send('Debug', " --  -- - > Removing ListOfCommand entry")
+        key = ( self.ListOfCommands[i_sqn]['Cmd'], self.ListOfCommands[i_sqn]['Datas'] )
+        if self.ListOfCommandsNotSent.get( key ) == i_sqn:
+            del self.ListOfCommandsNotSent[ key ]
         del self.ListOfCommands[i_sqn]
+    if not self.ListOfCommands:
+        # Nothing left to time out
+        self.ListOfCommandsDeadlines = []
+
+# Frame Queue ( MultiThreaded mode )
+def forward_frame( self, frame ):
+    # Forward the frame to the plugin. In MultiThreaded mode, it will be queued for the processing thread
+    # by flush_forwarded_frames(), once self.lock is released, as the processing thread might need it to send commands
+    if self.frame_queue is None:
+        self.F_out( frame, None )
+        return
+    self.frames_to_forward.append( frame )
+
+def flush_forwarded_frames( self ):
+    while self.frames_to_forward:
+        enqueue_frame( self, self.frames_to_forward.pop( 0 ) )
+
+def coalescing_key( self, frame ):
+    # Attribute Reports on measurement clusters can be coalesced: NwkId, Ep, Cluster, Attribute
+    if ( not self.pluginconf.pluginConf['FrameQueueCoalesce'] or not isinstance( frame, ZigateFrame )
+            or frame.msgtype != 0x8102 or len( frame.payload ) < 8 ):
+        return None
+    if struct.unpack_from( '>H', frame.payload, 4 )[0] not in COALESCE_REPORT_CLUSTERS:
+        return None
+    return bytes( frame.payload[1:8] )
+
+def enqueue_frame( self, frame ):
+    key = coalescing_key( self, frame )
+    if key is not None:
+        with self.pending_reports_lock:
+            holder = self.pending_reports.get( key )
+            if holder is not None:
+                # Same Attribute already waiting in the queue, keep only the newest value
+                holder[0] = frame
+                self.statistics._frameQueueCoalesced += 1
+                return
+            holder = [ frame ]
+            self.pending_reports[ key ] = holder
+        item = ( time.time(), key, holder )
+    else:
+        item = ( time.time(), None, frame )
+
+    if self.frame_queue.full():
+        # Back pressure, the reading thread will wait
+        self.statistics._frameQueueFull += 1
+
+    try:
+        self.frame_queue.put( item, block=True, timeout=FRAME_QUEUE_PUT_TIMEOUT )
+
+    except queue.Full:
+        self.statistics._frameQueueDropped += 1
+        if key is not None:
+            with self.pending_reports_lock:
+                self.pending_reports.pop( key, None )
+        _context = {
+            'Error code': 'TRANS-FRAMEQUEUE-01',
+            'Frame': str(frame),
+            'Queue Size': self.frame_queue.qsize(),
+        }
+        self.logging_send_error( "enqueue_frame", context=_context)
+        return
+
+    self.statistics.add_frame_queue_depth( self.frame_queue.qsize() )
+
+def dequeue_frame( self, item ):
+    timestamp, key, frame = item
+    if key is not None:
+        with self.pending_reports_lock:
+            frame = frame[0]
+            self.pending_reports.pop( key, None )
+    self.statistics.add_frame_queue_wait( int( ( time.time() - timestamp ) * 1000 ) )
+    return frame
 
 # Receiving functions
 def process_frame(self, frame):
     # process the Data and check if this is a 0x8000 message
     # in case the message contains several frame, receiveData will be recall
+    # frame is a ZigateFrame, the payload is converted to hex only when a legacy handler requires it
 
-    if frame == '' or frame is None or len(frame) < 12:
+    if frame is None or len(frame) < 6:
         return
 
     i_sqn = None
-    MsgType = frame[2:6]
-    MsgLength = frame[6:10]
-    MsgCRC = frame[10:12]
+    MsgType = frame.msgtype
 
     if self.pluginconf.pluginConf["debugzigateCmd"]:
         self.logging_send('Log', "process_frame - Q(0x8000): %s Q(8012/7-8702): %s Q(Ack/Nack): %s Q(waitForResponse): %s sendNow: %s"
             % ( len(self._waitFor8000Queue), len(self._waitFor8012Queue), len(self._waitFor8011Queue), len(self._waitForCmdResponseQueue), len(self.zigateSendQueue) ))
 
-    if MsgType == '8701':
+    if MsgType == 0x8701:
         # Route Discovery
         ready_to_send_if_needed(self)
         return
 
     # We receive an async message, just forward it to plugin
-    if int(MsgType, 16) in STANDALONE_MESSAGE:
-        self.logging_receive( 'Debug', "process_frame - STANDALONE_MESSAGE MsgType: %s MsgLength: %s MsgCRC: %s" % (MsgType, MsgLength, MsgCRC))    
-        self.F_out(frame, None)  
+    if MsgType in STANDALONE_MESSAGE:
+        self.logging_receive( 'Debug', "process_frame - STANDALONE_MESSAGE MsgType: %04x MsgLength: %04x MsgCRC: %02x", args=(MsgType, frame.length, frame.crc))    
+        forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
     # Payload
-    MsgData = None
-    if len(frame) >= 18:
-        MsgData = frame[12:len(frame) - 4]
+    HasPayload = len(frame) >= 9
 
-    if MsgType == '9999':
-        handle_9999( self, MsgData )
+    if MsgType == 0x9999:
+        handle_9999( self, frame.payload_hex if HasPayload else None )
         ready_to_send_if_needed(self)
         return
 
-    if MsgData and MsgType == "8002":
+    if HasPayload and MsgType == 0x8002:
         # Data indication
-        self.logging_receive( 'Debug', "process_frame - 8002 MsgType: %s MsgLength: %s MsgCRC: %s" % (MsgType, MsgLength, MsgCRC))  
-        self.F_out( process8002( self, frame ), None )
+        self.logging_receive( 'Debug', "process_frame - 8002 MsgType: %04x MsgLength: %04x MsgCRC: %02x", args=(MsgType, frame.length, frame.crc))  
+        forward_frame( self, process8002( self, frame ) )
         ready_to_send_if_needed(self)
         return
 
 
     if len(self._waitFor8000Queue) == 0 and len(self._waitFor8012Queue) == 0 and len(self._waitFor8011Queue) == 0 and len(self._waitForCmdResponseQueue) == 0:
-        if MsgType in ( '8000', '8012', '8011'):
+        if MsgType in ( 0x8000, 0x8012, 0x8011):
             if self.pluginconf.pluginConf["debugzigateCmd"]:
-                Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %s MsgData: %s" %(MsgType, MsgData))
+                Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %04x MsgData: %s" %(MsgType, frame.payload_hex))
         else:
-            self.F_out(frame, None)  
+            forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
-    if MsgType in ( '8012', '8702') and self.zmode == 'zigate31e':
+    if MsgType in ( 0x8012, 0x8702) and self.zmode == 'zigate31e':
         # As of 31e we use the 0x8012 or 8702 to release commands instead of using 0x8000 to send the next command
-        if MsgType == '8702':
+        if MsgType == 0x8702:
             self.statistics._APSFailure += 1
-        i_sqn = handle_8012_8702( self, MsgType, MsgData, frame)
+        i_sqn = handle_8012_8702( self, frame.msgtype_hex, frame.payload_hex, frame)
         # self.F_out(frame, None)  
         ready_to_send_if_needed(self)
         return
 
     if len(self._waitFor8000Queue) == 0 and len(self._waitForCmdResponseQueue) == 0 and len(self._waitFor8011Queue) == 0:
-        if MsgType in ( '8000', '8012', '8011'):
-            Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %s MsgData: %s" %(MsgType, MsgData))
+        if MsgType in ( 0x8000, 0x8012, 0x8011):
+            Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %04x MsgData: %s" %(MsgType, frame.payload_hex))
         else:
-            self.F_out(frame, None)  
+            forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
-    if MsgData and MsgType == "8000":
-        handle_8000( self, MsgType, MsgData, frame)
-        self.F_out(frame, None)  
+    if HasPayload and MsgType == 0x8000:
+        handle_8000( self, frame.msgtype_hex, frame.payload_hex, frame)
+        forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
     if len(self._waitForCmdResponseQueue) == 0 and len(self._waitFor8011Queue) == 0:
-        if MsgType in ( '8000', '8012', '8011'):
+        if MsgType in ( 0x8000, 0x8012, 0x8011):
             if self.pluginconf.pluginConf["debugzigateCmd"]:
-                Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %s MsgData: %s" %(MsgType, MsgData))
+                Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %04x MsgData: %s" %(MsgType, frame.payload_hex))
         else:
-            self.F_out(frame, None)  
+            forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
-    if MsgType == '8011':
-        handle_8011( self, MsgType, MsgData, frame)
-        self.F_out(frame, None)  
+    if MsgType == 0x8011:
+        handle_8011( self, frame.msgtype_hex, frame.payload_hex, frame)
+        forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
     if len(self._waitForCmdResponseQueue) == 0:
         # All queues are empty
-        if MsgType in ( '8000', '8012', '8011'):
-            Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %s MsgData: %s" %(MsgType, MsgData))
+        if MsgType in ( 0x8000, 0x8012, 0x8011):
+            Domoticz.Log("process_frame - Message not processed, no active queues. Msgtype: %04x MsgData: %s" %(MsgType, frame.payload_hex))
         else:
-            self.F_out(frame, None)  
+            forward_frame(self, frame)
         ready_to_send_if_needed(self)
         return
 
@@ -1395,34 +1529,35 @@ def process_frame(self, frame):
     # But might be a 0x8102 ( as firmware 3.1c and below are reporting Read Attribute response and Report Attribute with the same MsgType)
     if self.zmode in 'zigate31c':
         # If ZigBee Command blocked until response received
-        if not self.firmware_with_aps_sqn and MsgType in ( '8100', '8110', '8102'):
-            MsgZclSqn = MsgData[0:2]
-            MsgNwkId = MsgData[2:6]
-            MsgEp = MsgData[6:8]
-            MsgClusterId = MsgData[8:12]
-
-            self.logging_send( 'Debug', "--> zigbee31c Receive MsgType: %s with ExtSqn: %s" % (MsgType, MsgZclSqn))
-            i_sqn = check_and_process_others_31c( self, MsgType, MsgZclSqn, MsgNwkId, MsgEp, MsgClusterId)
+        if not self.firmware_with_aps_sqn and MsgType in ( 0x8100, 0x8110, 0x8102) and len(frame.payload) >= 6:
+            payload = frame.payload
+            MsgZclSqn = '%02x' % payload[0]
+            MsgNwkId = '%04x' % struct.unpack_from('>H', payload, 1)[0]
+            MsgEp = '%02x' % payload[3]
+            MsgClusterId = '%04x' % struct.unpack_from('>H', payload, 4)[0]
+
+            self.logging_send( 'Debug', "--> zigbee31c Receive MsgType: %04x with ExtSqn: %s", args=(MsgType, MsgZclSqn))
+            i_sqn = check_and_process_others_31c( self, frame.msgtype_hex, MsgZclSqn, MsgNwkId, MsgEp, MsgClusterId)
         else:
-            i_sqn = check_and_process_others_31c(self, MsgType)
+            i_sqn = check_and_process_others_31c(self, frame.msgtype_hex)
 
         if i_sqn in self.ListOfCommands:
             self.ListOfCommands[i_sqn]['StatusTimeStamp'] = str((datetime.now()).strftime("%m/%d/%Y, %H:%M:%S"))
-            self.ListOfCommands[i_sqn]['Status'] = MsgType
+            self.ListOfCommands[i_sqn]['Status'] = frame.msgtype_hex
             cleanup_list_of_commands( self, _next_cmd_from_wait_cmdresponse_queue(self)[0])
 
     elif self.zmode in ( 'zigate31d', 'zigate31e'):
         # It is assumed that SQN are always on the 1st byte
-        MsgZclSqn = MsgData[0:2]
-        self.logging_send( 'Debug', "--> zigbeeack Receive MsgType: %s with ExtSqn: %s" % (MsgType, MsgZclSqn))
-        i_sqn = check_and_process_others_31d(self, MsgType, MsgZclSqn)
+        MsgZclSqn = '%02x' % frame.payload[0] if HasPayload else ''
+        self.logging_send( 'Debug', "--> zigbeeack Receive MsgType: %04x with ExtSqn: %s", args=(MsgType, MsgZclSqn))
+        i_sqn = check_and_process_others_31d(self, frame.msgtype_hex, MsgZclSqn)
         if i_sqn in self.ListOfCommands:
             self.ListOfCommands[i_sqn]['StatusTimeStamp'] = str((datetime.now()).strftime("%m/%d/%Y, %H:%M:%S"))
-            self.ListOfCommands[i_sqn]['Status'] = MsgType
+            self.ListOfCommands[i_sqn]['Status'] = frame.msgtype_hex
             cleanup_list_of_commands( self, _next_cmd_from_wait_cmdresponse_queue(self)[0])
 
     # Forward the message to plugin for further processing
-    self.F_out(frame, None)  
+    forward_frame(self, frame)
     ready_to_send_if_needed(self)
 
     # Let's take the opportunity to check TimeOut
@@ -1485,15 +1620,14 @@ def handle_8000( self, MsgType, MsgData, frame):
 
     i_sqn = check_and_process_8000(self, Status, PacketType, sqn_app, sqn_aps, type_sqn, npdu, apdu)
 
-    self.logging_send('Debug', "0x8000 - [%s] sqn_app: 0x%s/%3s, SQN_APS: 0x%s type_sqn: %s" % (
+    self.logging_send('Debug', "0x8000 - [%s] sqn_app: 0x%s/%3s, SQN_APS: 0x%s type_sqn: %s", args=(
         i_sqn, sqn_app, int(sqn_app, 16), sqn_aps, type_sqn))
 
     if i_sqn in self.ListOfCommands:
         self.ListOfCommands[i_sqn]['APP_SQN'] = sqn_app
         self.ListOfCommands[i_sqn]['APS_SQN'] = sqn_aps
         self.ListOfCommands[i_sqn]['TYP_SQN'] = type_sqn
-        self.logging_send('Debug', "--> Check cleanup Status: %s [%s] Cmd: %s Data: %s ExpectedAck: %s ResponseExpected: %s"
-                            % (Status, i_sqn, self.ListOfCommands[i_sqn]['Cmd'], self.ListOfCommands[i_sqn]['Datas'],
+        self.logging_send('Debug', "--> Check cleanup Status: %s [%s] Cmd: %s Data: %s ExpectedAck: %s ResponseExpected: %s", args=(Status, i_sqn, self.ListOfCommands[i_sqn]['Cmd'], self.ListOfCommands[i_sqn]['Datas'],
                             self.ListOfCommands[i_sqn]['Expected8011'], self.ListOfCommands[i_sqn]['ResponseExpected']))
         self.ListOfCommands[i_sqn]['StatusTimeStamp'] = str((datetime.now()).strftime("%m/%d/%Y, %H:%M:%S"))
         self.ListOfCommands[i_sqn]['Status'] = '8000'
@@ -1504,8 +1638,7 @@ def check_and_process_8000(self, Status, PacketType, sqn_app, sqn_aps, type_sqn,
     if PacketType == '':
         return None
 
-    self.logging_send('Debug', "--> check_and_process_8000 - Status: %s PacketType: %s sqn_app:%s sqn_aps: %s type_sqn: %s" 
-        % (Status, PacketType, sqn_app, sqn_aps, type_sqn))
+    self.logging_send('Debug', "--> check_and_process_8000 - Status: %s PacketType: %s sqn_app:%s sqn_aps: %s type_sqn: %s", args=(Status, PacketType, sqn_app, sqn_aps, type_sqn))
 
     if int(PacketType,16) in CMD_PDM_ON_HOST:
         # No sync on PDM commands
@@ -1569,7 +1702,7 @@ def check_and_process_8000(self, Status, PacketType, sqn_app, sqn_aps, type_sqn,
         return None
 
     InternalSqn, TimeStamp = NextCmdFromWaitFor8000
-    self.logging_send('Debug', " --  --  -- - > InternSqn: %s ExternalSqn: %s ExternalSqnZCL: %s" %(InternalSqn, sqn_app, sqn_aps))
+    self.logging_send('Debug', " --  --  -- - > InternSqn: %s ExternalSqn: %s ExternalSqnZCL: %s", args=(InternalSqn, sqn_app, sqn_aps))
 
     if InternalSqn not in self.ListOfCommands:
         _context = {
@@ -1597,7 +1730,7 @@ def check_and_process_8000(self, Status, PacketType, sqn_app, sqn_aps, type_sqn,
                 len(self.ListOfCommands)
                 ))
 
-    self.logging_send('Debug', " --  --  0x8000 > Expect: %s Receive: %s" %(self.ListOfCommands[InternalSqn]['Cmd'], PacketType))
+    self.logging_send('Debug', " --  --  0x8000 > Expect: %s Receive: %s", args=(self.ListOfCommands[InternalSqn]['Cmd'], PacketType))
 
     if self.ListOfCommands[InternalSqn]['Cmd']:
         IsCommandOk = int(self.ListOfCommands[InternalSqn]['Cmd'], 16) == int(PacketType, 16)
@@ -1670,8 +1803,7 @@ def handle_8012_8702( self, MsgType, MsgData, frame):
         return None
 
     update_xPDU( self, nPDU, aPDU)
-    self.logging_send( 'Debug', "handle_8012_8702 MsgType: %s Status: %s NwkId: %s Seq: %s self.zmode: %s FirmAckNoAck: %s" 
-        %(MsgType, MsgStatus, MsgAddr,  MsgSQN, self.zmode, self.firmware_with_aps_sqn ))
+    self.logging_send( 'Debug', "handle_8012_8702 MsgType: %s Status: %s NwkId: %s Seq: %s self.zmode: %s FirmAckNoAck: %s", args=(MsgType, MsgStatus, MsgAddr,  MsgSQN, self.zmode, self.firmware_with_aps_sqn ))
     
     if MsgData is None:
         return None
@@ -1700,8 +1832,7 @@ def check_and_process_8012_31e( self, MsgType, MsgStatus, MsgAddr, MsgSQN, nPDU,
         return None
 
     InternSqn = sqn_get_internal_sqn_from_aps_sqn(self, MsgSQN)
-    self.logging_send( 'Debug',"--> check_and_process_8012_31e i_sqn: %s e_sqn: 0x%02x/%s Status: %s Addr: %s Ep: %s npdu: %s / apdu: %s"
-        %(InternSqn, int(MsgSQN,16), int(MsgSQN,16), MsgStatus, MsgAddr,MsgSQN, nPDU, aPDU))
+    self.logging_send( 'Debug',"--> check_and_process_8012_31e i_sqn: %s e_sqn: 0x%02x/%s Status: %s Addr: %s Ep: %s npdu: %s / apdu: %s", args=(InternSqn, int(MsgSQN,16), int(MsgSQN,16), MsgStatus, MsgAddr,MsgSQN, nPDU, aPDU))
 
     if InternSqn is None:
         return None
@@ -1743,8 +1874,7 @@ def handle_8011( self, MsgType, MsgData, frame):
     if len(MsgData) > 12:
         MsgSEQ = MsgData[12:14]
     
-    self.logging_send('Debug', "MsgType: %s Status: %s NwkId: %s Ep: %s ClusterId: %s Seq: %s/%s self.zmode: %s FirmAckNoAck: %s" 
-        %(MsgType, MsgStatus, MsgSrcAddr, MsgSrcEp,MsgClusterId, int(MsgSEQ,16), int(MsgSEQ,16), self.zmode, self.firmware_with_aps_sqn ))
+    self.logging_send('Debug', "MsgType: %s Status: %s NwkId: %s Ep: %s ClusterId: %s Seq: %s/%s self.zmode: %s FirmAckNoAck: %s", args=(MsgType, MsgStatus, MsgSrcAddr, MsgSrcEp,MsgClusterId, int(MsgSEQ,16), int(MsgSEQ,16), self.zmode, self.firmware_with_aps_sqn ))
     
     if MsgData is None:
         return None
@@ -1773,8 +1903,7 @@ def handle_8011( self, MsgType, MsgData, frame):
 def check_and_process_8011_31c(self, Status, NwkId, Ep, MsgClusterId, ExternSqn):
     # Unqueue the Command in order to free for the next
     InternSqn, TimeStamps = _next_cmd_to_wait_for8011_queue(self)
-    self.logging_send('Debug', "--> check_and_process_8011_31c - Status: %s ExternalSqn: %s i_sqn: %s NwkId: %s Ep: %s ClusterId: %s" %
-        (Status, ExternSqn, InternSqn, NwkId, Ep, MsgClusterId))
+    self.logging_send('Debug', "--> check_and_process_8011_31c - Status: %s ExternalSqn: %s i_sqn: %s NwkId: %s Ep: %s ClusterId: %s", args=(Status, ExternSqn, InternSqn, NwkId, Ep, MsgClusterId))
 
     if (self.firmware_with_aps_sqn):
         InternSqn_from_ExternSqn = sqn_get_internal_sqn_from_aps_sqn(self, ExternSqn)
@@ -1790,11 +1919,11 @@ def check_and_process_8011_31c(self, Status, NwkId, Ep, MsgClusterId, ExternSqn)
 
     if Status == '00':
         if InternSqn in self.ListOfCommands:
-            self.logging_send('Debug', " - [%s] receive Ack for Cmd: %s - size of SendQueue: %s" % ( InternSqn,  self.ListOfCommands[InternSqn]['Cmd'], self.loadTransmit()))
+            self.logging_send('Debug', " - [%s] receive Ack for Cmd: %s - size of SendQueue: %s", args=( InternSqn,  self.ListOfCommands[InternSqn]['Cmd'], self.loadTransmit()))
         self.statistics._APSAck += 1
     else:
         if InternSqn in self.ListOfCommands:
-            self.logging_send('Debug', " - [%s] receive Nack for Cmd: %s - size of SendQueue: %s" % ( InternSqn,  self.ListOfCommands[InternSqn]['Cmd'], self.loadTransmit()))
+            self.logging_send('Debug', " - [%s] receive Nack for Cmd: %s - size of SendQueue: %s", args=( InternSqn,  self.ListOfCommands[InternSqn]['Cmd'], self.loadTransmit()))
         self.statistics._APSNck += 1
     return InternSqn
 
@@ -1806,8 +1935,7 @@ def check_and_process_8011_31d(self, Status, NwkId, Ep, MsgClusterId, ExternSqn)
         return None
 
     InternSqn = sqn_get_internal_sqn_from_aps_sqn(self, ExternSqn)
-    self.logging_send( 'Debug',  "--> check_and_process_8011_31d - Status: %s ExternalSqn: %s/0x%s InterSqn: %s NwkId: %s Ep: %s ClusterId: %s" %
-            (Status, int(ExternSqn,16), ExternSqn, InternSqn, NwkId, Ep, MsgClusterId))
+    self.logging_send( 'Debug',  "--> check_and_process_8011_31d - Status: %s ExternalSqn: %s/0x%s InterSqn: %s NwkId: %s Ep: %s ClusterId: %s", args=(Status, int(ExternSqn,16), ExternSqn, InternSqn, NwkId, Ep, MsgClusterId))
 
     if InternSqn is None:
         # ZiGate firmware currently can report ACk which are not link to a command sent from the plugin
@@ -1856,7 +1984,7 @@ def check_and_process_others_31c(self, MsgType, MsgSqn=None, MsgNwkId=None, MsgE
 
     # For now we assume that we do only one command at a time, so either it is an Async message,
     # or it is related to the command
-    self.logging_receive( 'Debug', "--> process_other_type_of_message - MsgType: %s" % (MsgType))
+    self.logging_receive( 'Debug', "--> process_other_type_of_message - MsgType: %s", args=(MsgType,))
 
     if len(self._waitForCmdResponseQueue) == 0:
         self.logging_receive('Debug', " --  -- - > - WaitForDataQueue empty")
@@ -1869,7 +1997,7 @@ def check_and_process_others_31c(self, MsgType, MsgSqn=None, MsgNwkId=None, MsgE
 
     expResponse = self.ListOfCommands[InternalSqn]['MessageResponse']
     expCmd = self.ListOfCommands[InternalSqn]['Cmd']
-    self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s" % (expResponse, MsgType))
+    self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s", args=(expResponse, MsgType))
     if ( expResponse ==  MsgType ) or ( expResponse == 0x8100 and MsgType in ( '8100', '8102') ):
         expNwkId = expEp = expCluster = None
         if MsgSqn and MsgNwkId and MsgEp and MsgClusterId:
@@ -1877,7 +2005,7 @@ def check_and_process_others_31c(self, MsgType, MsgSqn=None, MsgNwkId=None, MsgE
             expEp = self.ListOfCommands[InternalSqn]['Datas'][8:10]
             expCluster = self.ListOfCommands[InternalSqn]['Datas'][10:14]
 
-        self.logging_send('Debug', " --  -- - > Expecting: %s %s %s receiving %s %s %s" %(expNwkId, expEp, expCluster, MsgNwkId, MsgEp, MsgClusterId))
+        self.logging_send('Debug', " --  -- - > Expecting: %s %s %s receiving %s %s %s", args=(expNwkId, expEp, expCluster, MsgNwkId, MsgEp, MsgClusterId))
         if (expNwkId != MsgNwkId) or (expEp != MsgEp) or (expCluster != MsgClusterId):
             self.logging_send('Debug', " --  -- - > Data do not match")
             return None
@@ -1895,18 +2023,18 @@ def check_and_process_others_31c(self, MsgType, MsgSqn=None, MsgNwkId=None, MsgE
         elif ZIGATE_COMMANDS[ int(expCmd,16) ]['Layer'] == 'ZDP':
             isqn = sqn_get_internal_sqn_from_app_sqn(self, MsgSqn, TYPE_APP_ZDP)
 
-        self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s" % (InternalSqn, isqn, MsgSqn))
+        self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s", args=(InternalSqn, isqn, MsgSqn))
         if isqn and InternalSqn != isqn:
             # Async message no worry
             self.logging_send( 'Debug', " -- I_SQN do not match E_SQN, break")
-            self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s" % (expResponse, MsgType))
-            self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s" % (InternalSqn, isqn, MsgSqn))
-            self.logging_send( 'Debug', " --  -- - > Expecting: %s %s %s receiving %s %s %s" % (expNwkId, expEp, expCluster, MsgNwkId, MsgEp, MsgClusterId))
+            self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s", args=(expResponse, MsgType))
+            self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s", args=(InternalSqn, isqn, MsgSqn))
+            self.logging_send( 'Debug', " --  -- - > Expecting: %s %s %s receiving %s %s %s", args=(expNwkId, expEp, expCluster, MsgNwkId, MsgEp, MsgClusterId))
             return None
 
         return InternalSqn
 
-    self.logging_send('Debug', " --  -- - > Internal SQN: %s Received: %s and expecting %04x" % (InternalSqn, MsgType, expResponse))
+    self.logging_send('Debug', " --  -- - > Internal SQN: %s Received: %s and expecting %04x", args=(InternalSqn, MsgType, expResponse))
     if int(MsgType, 16) != expResponse:
         self.logging_receive('Debug', "         - Async incoming PacketType")
         return None
@@ -1923,7 +2051,7 @@ def check_and_process_others_31d(self, MsgType, MsgSqn):
 
     # For now we assume that we do only one command at a time, so either it is an Async message,
     # or it is related to the command
-    self.logging_receive( 'Debug', "--> check_and_process_others_31d - MsgType: %s" % (MsgType))
+    self.logging_receive( 'Debug', "--> check_and_process_others_31d - MsgType: %s", args=(MsgType,))
     if MsgSqn is None:
         self.logging_receive( 'Error', "check_and_process_others_31d - MsgType: %s cannot get i_sqn due to unknown External SQN" % (MsgType))
         return None
@@ -1965,15 +2093,15 @@ def check_and_process_others_31d(self, MsgType, MsgSqn):
     elif ZIGATE_COMMANDS[cmd]['Layer'] == 'ZDP':
         isqn = sqn_get_internal_sqn_from_app_sqn(self, MsgSqn, TYPE_APP_ZDP)
 
-    self.logging_send('Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s" %(InternalSqn, isqn, MsgSqn))
+    self.logging_send('Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s", args=(InternalSqn, isqn, MsgSqn))
     if isqn and InternalSqn != isqn:
         # Async message no worry
         self.logging_send( 'Debug', " -- I_SQN do not match E_SQN, break")
-        self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s" % (expResponse, MsgType))
-        self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s" % (InternalSqn, isqn, MsgSqn))
+        self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s", args=(expResponse, MsgType))
+        self.logging_send( 'Debug', " --  -- - > Expected IntSqn: %s Received ISqn: %s ESqn: %s", args=(InternalSqn, isqn, MsgSqn))
         return None
 
-    self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s" % (expResponse, MsgType))
+    self.logging_send( 'Debug', " --  -- - > Expecting: %04x Receiving: %s", args=(expResponse, MsgType))
 
     if int(MsgType, 16) != expResponse:
         self.logging_receive('Debug', "         - Async incoming PacketType")
@@ -1983,107 +2111,82 @@ def check_and_process_others_31d(self, MsgType, MsgSqn):
 
 
 def process8002(self, frame):
+    # frame is a ZigateFrame. When the payload is a ZCL Global Command on attributes, it is decoded here and
+    # a ZclGlobalFrame is returned, to be handed over to the attribute handlers by ZigateRead.
+    # Read Attribute request is still synthetized as an hex 0x0100 frame, otherwise the ZigateFrame is returned as is.
 
-    SrcNwkId, SrcEndPoint, ClusterId , Payload = extract_nwk_infos_from_8002( frame )
+    SrcNwkId, SrcEndPoint, ClusterId , offset = extract_nwk_infos_from_8002( frame.payload )
     self.logging_receive(
-        'Debug', "process8002 NwkId: %s Ep: %s Cluster: %s Payload: %s" %(SrcNwkId, SrcEndPoint, ClusterId , Payload))
+        'Debug', "process8002 NwkId: %s Ep: %s Cluster: %s Payload: %s", args=(SrcNwkId, SrcEndPoint, ClusterId , frame.payload_hex))
 
     if SrcNwkId is None:
         return frame
 
-    if len(Payload) < 8:
+    if len(frame.payload) - offset < 4:
+        return frame
+
+    try:
+        GlobalCommand, Sqn, ManufacturerCode, Command, offset = decode_zcl_header( frame.payload, offset )
+    except struct.error:
         return frame
-        
-    GlobalCommand, Sqn, ManufacturerCode, Command, Data = retreive_cmd_payload_from_8002( Payload )
     if not GlobalCommand:
         # This is not a Global Command (Read Attribute, Write Attribute and so on)
         return frame
 
     self.logging_receive(
-        'Debug', "process8002 Sqn: %s/%s ManufCode: %s Command: %s Data: %s " %(int(Sqn,16), Sqn , ManufacturerCode, Command, Data))
-    if Command == '00': # Read Attribute
-        return buildframe_read_attribute_request( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, ManufacturerCode, Data  )
+        'Debug', "process8002 Sqn: %s/%s ManufCode: %s Command: %02x Data: %s ", args=(int(Sqn,16), Sqn , ManufacturerCode, Command, hexlify( frame.payload[offset:] ).decode('utf-8')))
 
-    if Command == '01': # Read Attribute response
-        return buildframe_read_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data )
+    if Command == 0x00: # Read Attribute
+        return buildframe_read_attribute_request( frame.hex, Sqn, SrcNwkId, SrcEndPoint, ClusterId, ManufacturerCode, hexlify( frame.payload[offset:] ).decode('utf-8') )
 
-    if Command == '04': # Write Attribute response
-        return buildframe_write_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data )
+    if Command not in ZCL_GLOBAL_FRAMES:
+        self.logging_receive( 'Log', "process8002 Unknown Command: %02x NwkId: %s Ep: %s Cluster: %s Payload: %s" %(Command, SrcNwkId, SrcEndPoint, ClusterId , hexlify( frame.payload[offset:] ).decode('utf-8')))
+        return frame
 
-    if Command == '07':
-        return buildframe_configure_reporting_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data )
+    MsgType, decoder = ZCL_GLOBAL_FRAMES[ Command ]
+    try:
+        records = decoder( frame.payload, offset )
 
-    if Command == '0a':
-        return buildframe_report_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data )
+    except struct.error:
+        records = None
 
-    self.logging_receive( 'Log', "process8002 Unknown Command: %s NwkId: %s Ep: %s Cluster: %s Payload: %s" %(Command, SrcNwkId, SrcEndPoint, ClusterId , Data))
-        
-    return frame
+    if not records:
+        Domoticz.Error("process8002 - Unable to decode Command: %02x NwkId: %s Ep: %s Cluster: %s Frame: %s" %(Command, SrcNwkId, SrcEndPoint, ClusterId, frame.hex))
+        return frame
 
+    return ZclGlobalFrame( frame, MsgType, Command, Sqn, SrcNwkId, SrcEndPoint, ClusterId, ManufacturerCode, records )
 
-def extract_nwk_infos_from_8002( frame ):
 
-    MsgType = frame[2:6]
-    MsgLength = frame[6:10]
-    MsgCRC = frame[10:12]
+def extract_nwk_infos_from_8002( payload ):
+    # ( SrcNwkId, SrcEndPoint, ClusterId, offset of the ZCL frame ) from the binary 0x8002 payload.
+    # Only frames coming from a short address are decoded
 
-    if len(frame) < 18:
+    if len(payload) < APS_DATA_INDICATION_HEADER.size + 3:
         return ( None, None, None , None )
 
-    # Payload
-    MsgData = frame[12:len(frame) - 4]
-    LQI = frame[len(frame) - 4: len(frame) - 2]
-
-    ProfileId = MsgData[2:6]
-    ClusterId = MsgData[6:10]
-    SrcEndPoint = MsgData[10:12]
-    TargetEndPoint = MsgData[12:14]
-    SrcAddrMode = MsgData[14:16]
-
-    if ProfileId != '0104':
-        Domoticz.Log("extract_nwk_infos_from_8002 - Not an HA Profile, let's drop the packet %s" % MsgData)
+    _, ProfileId, ClusterId, SrcEndPoint, _, SrcAddrMode = APS_DATA_INDICATION_HEADER.unpack_from( payload, 0 )
+    if ProfileId != 0x0104:
+        Domoticz.Log("extract_nwk_infos_from_8002 - Not an HA Profile, let's drop the packet %s" % hexlify( payload ).decode('utf-8'))
         return ( None, None, None , None )
 
-    if int(SrcAddrMode, 16) in [ADDRESS_MODE['short'], ADDRESS_MODE['group']]:
-        SrcNwkId = MsgData[16:20]  # uint16_t
-        TargetNwkId = MsgData[20:22]
-
-        if int(TargetNwkId, 16) in [ADDRESS_MODE['short'], ADDRESS_MODE['group'], ]:
-            # Short Address
-            TargetNwkId = MsgData[22:26]  # uint16_t
-            Payload = MsgData[26:len(MsgData)]
-
-        elif int(TargetNwkId, 16) == ADDRESS_MODE['ieee']:  # uint32_t
-            # IEEE
-            TargetNwkId = MsgData[22:38]  # uint32_t
-            Payload = MsgData[38:len(MsgData)]
-
-        else:
-            Domoticz.Log("Decode8002 - Unexpected Destination ADDR_MOD: %s, drop packet %s"% (TargetNwkId, MsgData))
-            return ( None, None, None , None )
-
-    elif int(SrcAddrMode, 16) == ADDRESS_MODE['ieee']:
-        SrcNwkId = MsgData[16:32]  # uint32_t
-        TargetNwkId = MsgData[32:34]
-
-        if int(TargetNwkId, 16) in [ADDRESS_MODE['short'], ADDRESS_MODE['group'], ]:
-            TargetNwkId = MsgData[34:38]  # uint16_t
-            Payload = MsgData[38:len(MsgData)]
+    if SrcAddrMode not in ( ADDRESS_MODE['short'], ADDRESS_MODE['group'] ):
+        return ( None, None, None , None )
 
-        elif int(TargetNwkId, 16) == ADDRESS_MODE['ieee']:
-            # IEEE
-            TargetNwkId = MsgData[34:40]  # uint32_t
-            Payload = MsgData[40:len(MsgData)]
-        else:
-            Domoticz.Log("Decode8002 - Unexpected Destination ADDR_MOD: %s, drop packet %s"
-                         % (TargetNwkId, MsgData))
-            return ( None, None, None , None )
+    offset = APS_DATA_INDICATION_HEADER.size
+    SrcNwkId, TargetAddrMode = struct.unpack_from( '>HB', payload, offset )
+    offset += 3
+    if TargetAddrMode in ( ADDRESS_MODE['short'], ADDRESS_MODE['group'] ):
+        offset += 2
+    elif TargetAddrMode == ADDRESS_MODE['ieee']:
+        offset += 8
     else:
-        Domoticz.Log("Decode8002 - Unexpected Source ADDR_MOD: %s, drop packet %s"
-                     % (SrcAddrMode, MsgData))
+        Domoticz.Log("Decode8002 - Unexpected Destination ADDR_MOD: %s, drop packet %s"% (TargetAddrMode, hexlify( payload ).decode('utf-8')))
+        return ( None, None, None , None )
+
+    if offset > len(payload):
         return ( None, None, None , None )
 
-    return ( SrcNwkId, SrcEndPoint, ClusterId , Payload )
+    return ( '%04x' %SrcNwkId, '%02x' %SrcEndPoint, '%04x' %ClusterId , offset )
 
 
 def buildframe_read_attribute_request( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, ManufacturerCode, Data  ):
@@ -2122,189 +2225,12 @@ def buildframe_read_attribute_request( frame, Sqn, SrcNwkId, SrcEndPoint, Cluste
     return  newFrame
 
 
-def buildframe_write_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data):
-
-    # This is based on assumption that we only Write 1 attribute at a time
-    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId + '0000' + Data
-    newFrame = '01' # 0:2
-    newFrame += '8110' # 2:6   MsgType
-    newFrame += '%4x' %len(buildPayload) # 6:10  Length
-    newFrame += 'ff' # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4: len(frame) - 2] # LQI
-    newFrame += '03'
-
-    return  newFrame
-
-
-def decode_endian_data( data, datatype):
-    if datatype in ( '10', '18', '20', '28', '30'):
-        return data
-
-    if datatype in ('09', '19', '21', '29', '31'):
-        return '%04x' %struct.unpack('>H',struct.pack('H',int(data,16)))[0]
-
-    if datatype in ( '22', '2a'):
-        return '%06x' %struct.unpack('>I',struct.pack('I',int(data,16)))[0]
-
-    if datatype in ( '23', '2b', '39'):
-        return '%08x' %struct.unpack('>i',struct.pack('I',int(data,16)))[0]
-
-    if datatype in ( '00', '41', '42', '4c'):
-        return data
-
-    return data
-
-
-def buildframe_read_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data ):
-
-    nbAttribute = 0
-    idx = 0
-    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
-    while idx < len(Data):
-        nbAttribute += 1
-        Attribute = '%04x' %struct.unpack('H',struct.pack('>H',int(Data[idx:idx+4],16)))[0]
-        idx += 4
-        Status = Data[idx:idx+2]
-        idx += 2
-        if Status == '00':
-            DType = Data[idx:idx+2]
-            idx += 2
-            if DType in SIZE_DATA_TYPE:
-                size = SIZE_DATA_TYPE[ DType ] * 2
-            elif DType == '4c':
-                nbElement =Data[ idx+2:idx+4] +  Data[ idx:idx+2 ]
-                idx += 4
-                # Today found for attribute 0xff02 Xiaomi, just take all data
-                size = len(Data) - idx 
-                #Domoticz.Log("Data: %s" %Data)
-                #Domoticz.Log("Attribute: %s" %Attribute)
-                #Domoticz.Log("DType: %s" %DType)
-                #Domoticz.Log("size: %s" %size)
-                #Domoticz.Log("data: %s" %Data[ idx:idx + size])
-
-            elif DType in ( '41', '42'): # ZigBee_OctedString = 0x41, ZigBee_CharacterString = 0x42
-                size = int(Data[idx:idx+2],16) * 2
-                idx += 2
-            else: 
-                Domoticz.Error("buildframe_read_attribute_response - Unknown DataType size: >%s< vs. %s " %(DType, str(SIZE_DATA_TYPE)))
-                Domoticz.Error("buildframe_read_attribute_response - ClusterId: %s Attribute: %s Data: %s" %(ClusterId, Attribute, Data))
-                return frame
-
-            data = Data[idx:idx + size]
-            idx += size
-            value = decode_endian_data( data, DType)
-            lenData = '%04x' %(size // 2 )
-            buildPayload += Attribute + Status + DType + lenData + value
-        else:
-            buildPayload += Attribute + Status 
-
-    #Domoticz.Log("buildframe_read_attribute_response for 0x8100 - NwkId: %s Ep: %s ClusterId: %s nbAttribute: %s Data: %s from frame: %s" %(SrcNwkId, SrcEndPoint, ClusterId, nbAttribute, buildPayload, frame))
-    
-    newFrame = '01' # 0:2
-    newFrame += '8100' # 2:6   MsgType
-    newFrame += '%4x' %len(buildPayload) # 6:10  Length
-    newFrame += 'ff' # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4: len(frame) - 2] # LQI
-    newFrame += '03'
-
-    return  newFrame
-
-
-def buildframe_report_attribute_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data ):
-    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
-    nbAttribute = 0
-    idx = 0
-    while idx < len(Data):
-        nbAttribute += 1
-        Attribute = '%04x' %struct.unpack('H',struct.pack('>H',int(Data[idx:idx+4],16)))[0]
-        idx += 4
-        DType = Data[idx:idx+2]
-        idx += 2
-        if DType in SIZE_DATA_TYPE:
-            size = SIZE_DATA_TYPE[ DType ] * 2
-
-        elif DType == '4c':
-                # Today found for attribute 0xff02 Xiaomi, just take all data
-                nbElement =Data[ idx+2:idx+4] +  Data[ idx:idx+2 ]
-                idx += 4
-                size = len(Data) - idx 
-                #Domoticz.Log("Data: %s" %Data)
-                #Domoticz.Log("Attribute: %s" %Attribute)
-                #Domoticz.Log("DType: %s" %DType)
-                #Domoticz.Log("size: %s" %size)
-                #Domoticz.Log("data: %s" %Data[ idx:idx + size])
-
-        elif DType in ( '41', '42'): # ZigBee_OctedString = 0x41, ZigBee_CharacterString = 0x42
-            size = int(Data[idx:idx+2],16) * 2
-            idx += 2
-
-        elif DType == '00':
-            Domoticz.Error("buildframe_report_attribute_response %s/%s Cluster: %s nbAttribute: %s Attribute: %s DType: %s idx: %s frame: %s" 
-                %(SrcNwkId, SrcEndPoint, ClusterId,nbAttribute, Attribute, DType, idx, frame ))
-            return frame
-            
-        else: 
-            Domoticz.Error("buildframe_report_attribute_response - Unknown DataType size: >%s< vs. %s " %(DType, str(SIZE_DATA_TYPE)))
-            Domoticz.Error("buildframe_report_attribute_response - NwkId: %s ClusterId: %s Attribute: %s Frame: %s" %(SrcNwkId, ClusterId, Attribute, frame))
-            return frame
-
-        data = Data[idx:idx + size]
-        idx += size
-        value = decode_endian_data( data, DType)
-        lenData = '%04x' %(size // 2 )
-        buildPayload += Attribute + '00' + DType + lenData + value
-        #Domoticz.Log("buildframe_report_attribute_response - Attribute: %s DType: %s Size: %s Value: %s"
-        #    %(Attribute, DType, lenData, value))
-
-    #Domoticz.Log("buildframe_report_attribute_response - NwkId: %s Ep: %s ClusterId: %s nbAttribute: %s Data: %s" %(SrcNwkId, SrcEndPoint, ClusterId, nbAttribute, buildPayload))
-
-    newFrame = '01' # 0:2
-    newFrame += '8102' # 2:6   MsgType
-    newFrame += '%4x' %len(buildPayload) # 6:10  Length
-    newFrame += 'ff' # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4: len(frame) - 2] # LQI
-    newFrame += '03'
-    return  newFrame
-
-
-def buildframe_configure_reporting_response( frame, Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data ):
-
-    if len(Data) == 2:
-        nbAttribute = 1
-        buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId + Data 
-    else:
-        idx = 0
-        nbAttribute = 0
-        buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
-        while idx < len(Data):
-            nbAttribute += 1
-            Status = Data[idx:idx+2]
-            idx += 2
-            Direction = Data[idx:idx+2]
-            idx += 2
-            Attribute = '%04x' %struct.unpack('H',struct.pack('>H',int(Data[idx:idx+4],16)))[0]
-            idx += 4
-            buildPayload += Attribute + Status
-        return  frame
-
-    #Domoticz.Log("buildframe_configure_reporting_response - NwkId: %s Ep: %s ClusterId: %s nbAttribute: %s Data: %s" %(SrcNwkId, SrcEndPoint, ClusterId, nbAttribute, buildPayload))
-    newFrame = '01' # 0:2
-    newFrame += '8120' # 2:6   MsgType
-    newFrame += '%4x' %len(buildPayload) # 6:10  Length
-    newFrame += 'ff' # 10:12 CRC
-    newFrame += buildPayload
-    newFrame += frame[len(frame) - 4: len(frame) - 2] # LQI
-    newFrame += '03'
-    return  newFrame
-
 def update_xPDU( self, npdu, apdu):
     if npdu == '' or apdu == '':
         return
     self.npdu = int(npdu,16)
     self.apdu = int(apdu,16)
+    self.zigateSendQueue.update_pdu( self.npdu, self.apdu )
     self.statistics._MaxaPdu = max(self.statistics._MaxaPdu, int(apdu,16))
     self.statistics._MaxnPdu = max(self.statistics._MaxnPdu, int(npdu,16))
 
@@ -2360,111 +2286,28 @@ def write_to_zigate( self, serialConnection, encoded_data ):
         #Disconnect of USB->UART occured
         Domoticz.Error("serial_read_from_zigate - error while writing %s" %(e))
 
-def get_frame_and_decode(self):
-    if self.pluginconf.pluginConf['SerialReadV2']:
-        return decode_frame( get_raw_frame_from_raw_message( self ))
-    return get_frame_and_decodev1( self )
-
-# V2
-def get_raw_frame_from_raw_message( self ):
-
-    frame = bytearray()
-    # Search the 1st occurance of 0x03 (end Frame)
-    zero3_position = self._ReqRcv.find(b'\x03')
-
-    # Search the 1st position of 0x01 until the position of 0x03
-    frame_start = self._ReqRcv.rfind(b'\x01', 0, zero3_position)
-
-    if frame_start == -1 or zero3_position == -1:
-        # no start and end frame found (missing one of the two)
-        return None
-    
-    if frame_start > zero3_position:
-        Domoticz.Error("Frame error we will drop the buffer!! start: %s zero3: %s buffer: %s" %( frame_start,  zero3_position, self._ReqRcv, )   ) 
-        return None
-            
-    # Remove the frame from the buffer (new buffer start at frame +1)
-    frame = self._ReqRcv[frame_start:zero3_position + 1]
-    self._ReqRcv = self._ReqRcv[zero3_position + 1:]
-    return frame
+def frame_resync_error( self, nb_bytes, raw_frame ):
+    # Some bytes received are not part of a frame, and have been dropped
+    self.statistics._frameErrors += 1
+    _context = {
+        'Error code': 'TRANS-onMESS-01',
+        'Dropped bytes': nb_bytes,
+        'Next Frame': str(raw_frame),
+    }
+    self.logging_send_error( "on_message", context=_context)
 
 def decode_frame( frame ):
     if frame is None or frame == b'':
         return None
-    BinMsg = bytearray()
-    iterReqRcv = iter(frame)
-    for iByte in iterReqRcv:  # for each received byte
-        if iByte == 0x02:  # Coded flag ?
-            # then uncode the next value
-            iByte = next(iterReqRcv) ^ 0x10
-        BinMsg.append(iByte)  # copy
+    BinMsg = zigate_unescape( frame )
     if len(BinMsg) <= 6:
         Domoticz.Log("Error: %s/%s" %(frame,BinMsg))
         return None
     return BinMsg
 
-
-# V1
-def get_frame_and_decodev1( self ):
-
-    Zero1 = Zero3 = -1
-    idx = 0
-    for val in self._ReqRcv[0:len(self._ReqRcv)]:
-        if Zero1 == - 1 and Zero3 == -1 and val == 1:  # Do we get a 0x01
-            Zero1 = idx  # we have identify the Frame start
-
-        if Zero1 != -1 and val == 3:  # If we have already started a Frame and do we get a 0x03
-            Zero3 = idx + 1
-            break  # If we got 0x03, let process the Frame
-        idx += 1
-
-    if Zero3 == -1:  # No 0x03 in the Buffer, let's break and wait to get more data
-        return None
-
-    if Zero1 != 0:
-        _context = {
-            'Error code': 'TRANS-onMESS-01',
-            '_ReqRcv': str(self._ReqRcv),
-            'Zero1': Zero1,
-            'Zero3': Zero3,
-            'idx': idx
-        }
-        self.logging_send_error( "on_message", context=_context)
-
-    # uncode the frame
-    # DEBUG ###_uncoded = str(self._ReqRcv[Zero1:Zero3]) + ''
-    BinMsg = bytearray()
-    iterReqRcv = iter(self._ReqRcv[Zero1:Zero3])
-
-    for iByte in iterReqRcv:  # for each received byte
-        if iByte == 0x02:  # Coded flag ?
-            # then uncode the next value
-            iByte = next(iterReqRcv) ^ 0x10
-        BinMsg.append(iByte)  # copy
-
-    if len(BinMsg) <= 6:
-        _context = {
-            'Error code': 'TRANS-onMESS-02',
-            '_ReqRcv': str(self._ReqRcv),
-            'Zero1': Zero1,
-            'Zero3': Zero3,
-            'idx': idx,
-            'BinMsg': str(BinMsg),
-            'len': len(BinMsg)
-        }
-        self.logging_send_error( "on_message", context=_context)
-        return None
-
-    # What is after 0x03 has to be reworked.
-    self._ReqRcv = self._ReqRcv[Zero3:]
-    return BinMsg
-            
 def check_frame_crc(self, BinMsg):
-    ComputedChecksum = 0
     Zero1, MsgType, Length, ReceivedChecksum = struct.unpack('>BHHB', BinMsg[0:6])
-    for idx, val in enumerate(BinMsg[1:-1]):
-        if idx != 4:  # Jump the checksum itself
-            ComputedChecksum ^= val
+    ComputedChecksum = frame_checksum( BinMsg )
     if ComputedChecksum != ReceivedChecksum:
         self.statistics._crcErrors += 1
         _context = {
@@ -2502,37 +2345,3 @@ def check_frame_lenght( self, BinMsg):
         Domoticz.Log("BinMsg: %s ExpectedLen: %s ComputedLen: %s" %(BinMsg, ReceveidLength,ComputedLength ))
         return False
     return True
-
-def zigate_encode(Data):
-    # The encoding is the following:
-    # Let B any byte value of the message. If B is between 0x00 and 0x0f (included) then :
-    #    Instead of B, a 2-byte content will be written in the encoded frame
-    #    The first byte is a fixed value: 0x02
-    #    The second byte is the result of B ^ 0x10
-
-    Out = ''
-    Outtmp = ''
-    for c in Data:
-        Outtmp += c
-        if len(Outtmp) == 2:
-            if Outtmp[0] == '1' and Outtmp != '10':
-                if Outtmp[1] == '0':
-                    Outtmp = '0200'
-                Out += Outtmp
-            elif Outtmp[0] == '0':
-                Out += '021' + Outtmp[1]
-            else:
-                Out += Outtmp
-            Outtmp = ""
-    return Out
-
-def get_checksum(msgtype, length, datas):
-    temp = 0 ^ int(msgtype[0:2], 16)
-    temp ^= int(msgtype[2:4], 16)
-    temp ^= int(length[0:2], 16)
-    temp ^= int(length[2:4], 16)
-    chk = 0
-    for i in range(0, len(datas), 2):
-        temp ^= int(datas[i:i + 2], 16)
-        chk = hex(temp)
-    return chk[2:4]
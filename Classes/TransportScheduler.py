@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: TransportScheduler.py
+
+    Description: Ordering of the commands waiting to be sent to ZiGate.
+
+    Commands are split in priority classes. Within a class, each destination has its
+    own FIFO and destinations are served round robin, so a burst towards one device
+    (topology scan, configure reporting, OTA) doesn't delay the other ones.
+    Background commands are also rate limited by a token bucket, which is slowed down
+    when the firmware reports its nPDU/aPDU pools filling up.
+
+"""
+
+from collections import deque
+from time import time
+
+PRIORITY_INTERACTIVE = 0    # User actions: every command sent from onCommand ( ZigateTransport.interactive() ), and the On/Off, Level, Colour, Covering, Door Lock, Siren commands
+PRIORITY_PROTOCOL = 1       # Replies expected by a device or by the firmware: OTA blocks, IAS Enroll, PDM
+PRIORITY_BACKGROUND = 2     # Polling, Reporting configuration, Binding, Topology, ...
+
+PRIORITY_LABELS = ('Interactive', 'Protocol', 'Background')
+
+# A background command waiting for more than that (seconds) is served even if higher classes are not empty
+STARVATION_TIMEOUT = 10
+
+# Token bucket for the background class
+BACKGROUND_RATE = 5.0       # commands per second when ZiGate is idle
+BACKGROUND_BURST = 10       # max tokens
+BACKGROUND_MIN_RATE = 0.5   # commands per second when the PDU pools are full
+
+# nPDU/aPDU pools of the ZiGate firmware, as reported in 0x8000 and 0x8012 (3.1e)
+NPDU_POOL_SIZE = 80
+APDU_POOL_SIZE = 10
+
+
+class TransportScheduler(object):
+
+    def __init__(self):
+        # For each priority class: destination -> deque of ( InternalSqn, TimeStamp ), and the round robin of destinations
+        self._queues = [ {} for _ in PRIORITY_LABELS ]
+        self._ring = [ deque() for _ in PRIORITY_LABELS ]
+        self._size = [ 0 for _ in PRIORITY_LABELS ]
+
+        self.rate = BACKGROUND_RATE
+        self.tokens = float(BACKGROUND_BURST)
+        self.last_refill = time()
+        self.throttled = 0      # count of time a background command was held by the token bucket
+
+    def __len__(self):
+        return sum( self._size )
+
+    def __iter__(self):
+        # Entries in priority order, for logging purposes
+        for priority in range(len(PRIORITY_LABELS)):
+            for destination in self._ring[priority]:
+                for entry in self._queues[priority][destination]:
+                    yield entry
+
+    def size(self, priority):
+        return self._size[priority]
+
+    def append(self, entry, priority=PRIORITY_BACKGROUND, destination=None):
+        # entry is a tuple ( InternalSqn, TimeStamp )
+        queues = self._queues[priority]
+        if destination not in queues:
+            queues[destination] = deque()
+            self._ring[priority].append(destination)
+        queues[destination].append(entry)
+        self._size[priority] += 1
+
+    def popleft(self, now=None):
+        # Return the next entry to be sent, or None if the only candidates are held by the token bucket
+        if now is None:
+            now = time()
+
+        background_ready = self._size[PRIORITY_BACKGROUND] and self._take_token(now)
+        if background_ready and self._head_age(PRIORITY_BACKGROUND, now) >= STARVATION_TIMEOUT:
+            return self._pop(PRIORITY_BACKGROUND)
+
+        for priority in (PRIORITY_INTERACTIVE, PRIORITY_PROTOCOL):
+            if self._size[priority]:
+                if background_ready:
+                    # Token not used
+                    self.tokens += 1
+                return self._pop(priority)
+
+        if background_ready:
+            return self._pop(PRIORITY_BACKGROUND)
+        if self._size[PRIORITY_BACKGROUND]:
+            self.throttled += 1
+        return None
+
+    def update_pdu(self, npdu, apdu):
+        # Slow down background traffic when ZiGate is running out of buffers
+        load = max( min(npdu / NPDU_POOL_SIZE, 1.0), min(apdu / APDU_POOL_SIZE, 1.0) )
+        self.rate = max( BACKGROUND_RATE * (1.0 - load), BACKGROUND_MIN_RATE )
+
+    def _take_token(self, now):
+        self.tokens = min( BACKGROUND_BURST, self.tokens + (now - self.last_refill) * self.rate )
+        self.last_refill = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def _head_age(self, priority, now):
+        # Age of the entry to be served next in that class
+        return now - self._queues[priority][ self._ring[priority][0] ][0][1]
+
+    def _pop(self, priority):
+        ring = self._ring[priority]
+        queues = self._queues[priority]
+        destination = ring.popleft()
+        entry = queues[destination].popleft()
+        if queues[destination]:
+            ring.append(destination)
+        else:
+            del queues[destination]
+        self._size[priority] -= 1
+        return entry
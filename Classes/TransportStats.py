@@ -8,6 +8,8 @@ import Domoticz
 import json
 from time import time
 
+from Classes.TransportScheduler import PRIORITY_LABELS
+
 
 class TransportStatistics:
 
@@ -38,6 +40,17 @@ class TransportStatistics:
         self._maxTiming8012 = self._cumulTiming8012 = self._cntTiming8012 = self._averageTiming8012 = 0
         self._maxRxProcesses = self._cumulRxProcess = self._cntRxProcess = self._averageRxProcess = 0
         self._max_reading_thread_timing = self._cumul_reading_thread_timing = self._cnt_reading_thread_timing = self._average_reading_thread_timing = 0
+        self._frameQueueDepth = self._frameQueueMaxDepth = 0 # Frame queue between reading and processing threads ( MultiThreaded )
+        self._maxFrameQueueWait = self._cumulFrameQueueWait = self._cntFrameQueueWait = self._averageFrameQueueWait = 0
+        self._frameQueueFull = 0  # count of frames received while the queue was full ( back pressure )
+        self._frameQueueDropped = 0  # count of frames dropped after FRAME_QUEUE_PUT_TIMEOUT
+        self._frameQueueCoalesced = 0  # count of Attribute Reports replaced by a newer value while queued
+        self._widgetUpdates = 0  # count of Domoticz widget updates ( when coalesceWidgetUpdates is enabled )
+        self._widgetUpdatesDelayed = 0  # count of widget updates delayed by the WidgetUpdateCoalescer
+        self._widgetUpdatesSaved = 0  # count of Domoticz writes saved by the WidgetUpdateCoalescer
+        self._maxOtaBlockLatency = self._cumulOtaBlockLatency = self._cntOtaBlockLatency = self._averageOtaBlockLatency = 0 # 0x8501 to 0x0502 handed to the transport (ms)
+        self._otaBlocksPrefetched = 0  # count of OTA blocks sent from the block prepared after the previous one
+        self._maxTxWait = [ 0 for _ in PRIORITY_LABELS ]  # max time (ms) spent in the Send Queue, per priority class
         self._start = int(time())
         self.TrendStats = []
         self.pluginconf = pluginconf
@@ -55,6 +68,34 @@ class TransportStatistics:
             Domoticz.Log("Zigate Thread Serial Read Max: %s ms with an of average: %s ms" 
                 %(self._max_reading_thread_timing, self._average_reading_thread_timing ))
 
+    def add_frame_queue_depth( self, depth):
+        self._frameQueueDepth = depth
+        if depth > self._frameQueueMaxDepth:
+            self._frameQueueMaxDepth = depth
+
+    def add_frame_queue_wait( self, timing):
+        self._cumulFrameQueueWait += timing
+        self._cntFrameQueueWait += 1
+        self._averageFrameQueueWait = int( (self._cumulFrameQueueWait / self._cntFrameQueueWait))
+        if timing > self._maxFrameQueueWait:
+            self._maxFrameQueueWait = timing
+            Domoticz.Log("Zigate frame queue waiting time Max: %s ms with an of average: %s ms" 
+                %(self._maxFrameQueueWait, self._averageFrameQueueWait ))
+
+    def add_tx_wait( self, priority, timing):
+        if timing > self._maxTxWait[ priority ]:
+            self._maxTxWait[ priority ] = timing
+            Domoticz.Log("Zigate %s command waiting time in Send Queue Max: %s ms" %( PRIORITY_LABELS[ priority ], timing ))
+
+    def add_ota_block_latency( self, timing, prefetched):
+        self._cumulOtaBlockLatency += timing
+        self._cntOtaBlockLatency += 1
+        self._averageOtaBlockLatency = round( (self._cumulOtaBlockLatency / self._cntOtaBlockLatency), 2)
+        if timing > self._maxOtaBlockLatency:
+            self._maxOtaBlockLatency = timing
+        if prefetched:
+            self._otaBlocksPrefetched += 1
+
     def add_timing8000( self, timing):
 
         self._cumulTiming8000 += timing
@@ -172,6 +213,8 @@ class TransportStatistics:
         Domoticz.Status("   Max Load (Queue) : %s " % (self._MaxLoad))
         Domoticz.Status("   Max aPDU (Queue) : %s " % (self._MaxaPdu))
         Domoticz.Status("   Max nPDU (Queue) : %s " % (self._MaxnPdu))
+        for priority, label in enumerate( PRIORITY_LABELS ):
+            Domoticz.Status("   Max wait %-11s: %s ms" % (label, self._maxTxWait[ priority ]))
         Domoticz.Status("   TX failed        : %s (%s" % (self.ackKOReceived(), round((self.ackKOReceived()/self.sent())*10,2)) + '%)')
         Domoticz.Status("   TX timeout       : %s (%s" % (self.TOstatus(), round((self.TOstatus()/self.sent())*100,2)) + '%)')
         Domoticz.Status("   TX data timeout  : %s (%s" % (self.TOdata(), round((self.TOdata()/self.sent())*100,2)) + '%)')
@@ -185,6 +228,25 @@ class TransportStatistics:
         Domoticz.Status("   RX lentgh errors : %s (%s" % (self.frameErrors(), round((self.frameErrors()/self.received())*100,2)) + '%)')
         Domoticz.Status("   RX clusters      : %s" % (self.clusterOK()))
         Domoticz.Status("   RX clusters KO   : %s" % (self.clusterKO()))
+        if self._cntFrameQueueWait:
+            Domoticz.Status("Frame queue:")
+            Domoticz.Status("   Max depth        : %s" % (self._frameQueueMaxDepth))
+            Domoticz.Status("   Max wait         : %s ms" % (self._maxFrameQueueWait))
+            Domoticz.Status("   Average wait     : %s ms" % (self._averageFrameQueueWait))
+            Domoticz.Status("   Back pressure    : %s" % (self._frameQueueFull))
+            Domoticz.Status("   Coalesced        : %s" % (self._frameQueueCoalesced))
+            Domoticz.Status("   Dropped          : %s" % (self._frameQueueDropped))
+        if self._widgetUpdates:
+            Domoticz.Status("Widget updates:")
+            Domoticz.Status("   Updates          : %s" % (self._widgetUpdates))
+            Domoticz.Status("   Delayed          : %s" % (self._widgetUpdatesDelayed))
+            Domoticz.Status("   Writes saved     : %s (%s" % (self._widgetUpdatesSaved, round((self._widgetUpdatesSaved/self._widgetUpdates)*100,2)) + '%)')
+        if self._cntOtaBlockLatency:
+            Domoticz.Status("OTA blocks:")
+            Domoticz.Status("   Blocks sent      : %s" % (self._cntOtaBlockLatency))
+            Domoticz.Status("   Prefetched       : %s" % (self._otaBlocksPrefetched))
+            Domoticz.Status("   Max latency      : %s ms" % (self._maxOtaBlockLatency))
+            Domoticz.Status("   Average latency  : %s ms" % (self._averageOtaBlockLatency))
         t0 = self.starttime()
         t1 = int(time())
         _days = 0
@@ -218,6 +280,20 @@ class TransportStatistics:
         stats[timing]['clusterKO'] = self._clusterKO
         stats[timing]['reTx'] = self._reTx
         stats[timing]['MaxLoad'] = self._MaxLoad
+        for priority, label in enumerate( PRIORITY_LABELS ):
+            stats[timing]['MaxTxWait' + label] = self._maxTxWait[ priority ]
+        stats[timing]['FrameQueueMaxDepth'] = self._frameQueueMaxDepth
+        stats[timing]['FrameQueueMaxWait'] = self._maxFrameQueueWait
+        stats[timing]['FrameQueueFull'] = self._frameQueueFull
+        stats[timing]['FrameQueueCoalesced'] = self._frameQueueCoalesced
+        stats[timing]['FrameQueueDropped'] = self._frameQueueDropped
+        stats[timing]['WidgetUpdates'] = self._widgetUpdates
+        stats[timing]['WidgetUpdatesDelayed'] = self._widgetUpdatesDelayed
+        stats[timing]['WidgetUpdatesSaved'] = self._widgetUpdatesSaved
+        stats[timing]['OtaBlocks'] = self._cntOtaBlockLatency
+        stats[timing]['OtaBlocksPrefetched'] = self._otaBlocksPrefetched
+        stats[timing]['OtaBlockLatencyMax'] = self._maxOtaBlockLatency
+        stats[timing]['OtaBlockLatencyAverage'] = self._averageOtaBlockLatency
         stats[timing]['start'] = self._start
         stats[timing]['stop'] = timing
 
@@ -23,8 +23,11 @@ from Modules.tools import is_hex
 from Classes.PluginConf import PluginConf,SETTINGS
 from Classes.LoggingManagement import LoggingManagement
 from Classes.DomoticzDB import DomoticzDB_Preferences
+from Classes.ReportStore import openReportStore
+from Classes.TransportScheduler import PRIORITY_INTERACTIVE, PRIORITY_PROTOCOL, PRIORITY_BACKGROUND
 
 from Classes.WebServer.headerResponse import setupHeadersResponse, prepResponseMessage
+from Classes.WebServer.assetCache import StaticAssetCache
 
 MIMETYPES = { 
         "gif": "image/gif" ,
@@ -59,13 +62,13 @@ class WebServer(object):
     from Classes.WebServer.dispatcher import do_rest
     from Classes.WebServer.onMessage import onMessage
     from Classes.WebServer.rest_Bindings import rest_bindLSTcluster, rest_bindLSTdevice, rest_binding, rest_unbinding
-    from Classes.WebServer.rest_Energy import rest_req_nwk_full, rest_req_nwk_inter
+    from Classes.WebServer.rest_Energy import rest_req_nwk_full, rest_req_nwk_inter, rest_nwk_energy_stat
     from Classes.WebServer.rest_Groups import rest_zGroup, rest_zGroup_lst_avlble_dev, rest_rescan_group, rest_scan_devices_for_group
     from Classes.WebServer.rest_Provisioning import rest_new_hrdwr, rest_rcv_nw_hrdwr
-    from Classes.WebServer.rest_Topology import rest_netTopologie, rest_req_topologie
+    from Classes.WebServer.rest_Topology import rest_netTopologie, rest_req_topologie, rest_netTopologie_graph
     from Classes.WebServer.sendresponse import sendResponse
     from Classes.WebServer.tools import keepConnectionAlive, DumpHTTPResponseToLog    
-    from Classes.WebServer.rest_Ota import rest_ota_firmware_update, rest_ota_firmware_list, rest_ota_devices_for_manufcode
+    from Classes.WebServer.rest_Ota import rest_ota_firmware_update, rest_ota_firmware_list, rest_ota_devices_for_manufcode, rest_ota_firmware_queue
     from Classes.WebServer.rest_Casaia import rest_casa_device_list, rest_casa_device_ircode_update
 
     hearbeats = 0 
@@ -109,6 +112,7 @@ class WebServer(object):
         self.homedirectory = HomeDirectory
         self.hardwareID = hardwareID
         mimetypes.init()
+        self.assetcache = StaticAssetCache( 1024 * 1024 * self.pluginconf.pluginConf['webCacheSize'] )
 
         self.FirmwareVersion = None
         # Start the WebServer
@@ -222,19 +226,8 @@ class WebServer(object):
         _response["Headers"]["Content-Type"] = "application/json; charset=utf-8"
         _filename = self.pluginconf.pluginConf['pluginReports'] + 'NetworkEnergy-v3-' + '%02d' %self.hardwareID + '.json'
 
-        _timestamps_lst = [] # Just the list of Timestamps
-        _scan = {}
-        if os.path.isfile( _filename ):
-            self.logging( 'Debug', "Opening file: %s" %_filename)
-            with open( _filename , 'rt') as handle:
-                for line in handle:
-                    if line[0] != '{' and line[-1] != '}':
-                        continue
-
-                    entry = json.loads( line, encoding=dict )
-                    for _ts in entry:
-                        _timestamps_lst.append( _ts )
-                        _scan[_ts] = entry[ _ts ]
+        # The reports are indexed, only the requested one is read
+        _reports = openReportStore( _filename )
 
         if verb == 'DELETE':
             if len(parameters) == 0:
@@ -244,28 +237,8 @@ class WebServer(object):
 
             elif len(parameters) == 1:
                 timestamp = parameters[0]
-                if timestamp in _timestamps_lst:
-                    self.logging( 'Debug', "Removing Report: %s from %s records" %(timestamp, len(_timestamps_lst)))
-                    with open( _filename, 'r+') as handle:
-                        d = handle.readlines()
-                        handle.seek(0)
-                        for line in d:
-                            if not (line[0] == '{' or line[-1] == '}'):
-                                handle.write( line )
-                                continue
-
-                            entry = json.loads( line, encoding=dict )
-                            entry_ts = entry.keys()
-                            if len( entry_ts ) == 1:
-                                if timestamp in entry_ts:
-                                    self.logging( 'Debug', "--------> Skiping %s" %timestamp)
-                                    continue
-
-                            else:
-                                continue
-                            handle.write( line )
-                        handle.truncate()
-
+                if _reports.remove( timestamp ):
+                    self.logging( 'Debug', "Removing Report: %s" %(timestamp))
                     action = {'Name': 'Report %s removed' % timestamp}
                     _response['Data'] = json.dumps( action , sort_keys=True)
                 else:
@@ -275,12 +248,13 @@ class WebServer(object):
 
         elif verb == 'GET':
             if len(parameters) == 0:
-                _response['Data'] = json.dumps( _timestamps_lst , sort_keys=True)
+                _response['Data'] = json.dumps( _reports.timestamps() , sort_keys=True)
 
             elif len(parameters) == 1:
                 timestamp = parameters[0]
-                if timestamp in _scan:
-                    for r in _scan[timestamp]:
+                _scan = _reports.report( timestamp )
+                if _scan is not None:
+                    for r in _scan:
                         self.logging( "Debug", "report: %s" %r)
                         if r['_NwkId'] == '0000':
                             _response['Data'] = json.dumps( r['MeshRouters'], sort_keys=True )
@@ -354,6 +328,10 @@ class WebServer(object):
 
             Statistics['MaxApdu'] = self.statistics._MaxaPdu
             Statistics['MaxNpdu'] = self.statistics._MaxnPdu 
+            Statistics['MaxTxWaitInteractive'] = self.statistics._maxTxWait[ PRIORITY_INTERACTIVE ]
+            Statistics['MaxTxWaitProtocol'] = self.statistics._maxTxWait[ PRIORITY_PROTOCOL ]
+            Statistics['MaxTxWaitBackground'] = self.statistics._maxTxWait[ PRIORITY_BACKGROUND ]
+            Statistics['TxThrottled'] = self.ZigateComm.zigateSendQueue.throttled
 
             Statistics['MaxSerialInWaiting'] = self.statistics._serialInWaiting
             Statistics['MaxSerialOutWaiting'] = self.statistics._serialOutWaiting
@@ -361,6 +339,21 @@ class WebServer(object):
             Statistics['MaxReadingThreadTime'] = self.statistics._max_reading_thread_timing
             Statistics['AvgReadingThreadTime'] = self.statistics._average_reading_thread_timing
 
+            Statistics['FrameQueueDepth'] = self.statistics._frameQueueDepth
+            Statistics['FrameQueueMaxDepth'] = self.statistics._frameQueueMaxDepth
+            Statistics['FrameQueueMaxWait'] = self.statistics._maxFrameQueueWait
+            Statistics['FrameQueueAvgWait'] = self.statistics._averageFrameQueueWait
+            Statistics['FrameQueueFull'] = self.statistics._frameQueueFull
+            Statistics['FrameQueueCoalesced'] = self.statistics._frameQueueCoalesced
+            Statistics['FrameQueueDropped'] = self.statistics._frameQueueDropped
+            Statistics['WidgetUpdates'] = self.statistics._widgetUpdates
+            Statistics['WidgetUpdatesDelayed'] = self.statistics._widgetUpdatesDelayed
+            Statistics['WidgetUpdatesSaved'] = self.statistics._widgetUpdatesSaved
+            Statistics['OtaBlocks'] = self.statistics._cntOtaBlockLatency
+            Statistics['OtaBlocksPrefetched'] = self.statistics._otaBlocksPrefetched
+            Statistics['OtaBlockLatencyMax'] = self.statistics._maxOtaBlockLatency
+            Statistics['OtaBlockLatencyAverage'] = self.statistics._averageOtaBlockLatency
+
             _nbitems = len(self.statistics.TrendStats)
 
             minTS = 0
@@ -599,6 +592,7 @@ class WebServer(object):
                 if upd:
                     # We need to write done the new version of PluginConf
                     self.pluginconf.write_Settings()
+                    self.log.loggingUpdatePluginConf()
 
         return _response
 
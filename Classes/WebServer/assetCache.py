@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: assetCache.py
+
+    Description: In-memory cache of the Web User Interface files ( www/ )
+
+    Each file is kept with a strong ETag, its Last-Modified date and, once built, its deflate and gzip
+    bodies. A GET doesn't read the disk anymore, nor compress at level 9 on the plugin thread.
+    - Entries are validated against the mtime and size of the file
+    - A .gz file next to the asset, not older than it, is used as gzip body
+    - Least Recently Used entries are evicted when the memory budget ( webCacheSize, MB ) is reached.
+      With a budget of 0 nothing is kept, and each request reads and compresses the file.
+    - warmup() builds the entries of www/ in a background thread when the WebServer starts
+
+"""
+
+import os
+import os.path
+import zlib
+import gzip
+import hashlib
+import mimetypes
+import threading
+
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+
+from Classes.WebServer.tools import MAX_KB_TO_SEND
+
+
+def compress( data, encoding ):
+    # Same encodings as sendResponse()
+    if encoding == 'deflate':
+        zlib_compress = zlib.compressobj( 9, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 2)
+        return zlib_compress.compress( data ) + zlib_compress.flush()
+    if encoding == 'gzip':
+        return gzip.compress( data )
+    return data
+
+
+def accepted_encoding( AcceptEncoding, allowdeflate, allowgzip ):
+    # Encoding to be used for an Accept-Encoding header, with the sendResponse() preference
+    if not AcceptEncoding:
+        return None
+    if allowdeflate and AcceptEncoding.find('deflate') != -1:
+        return 'deflate'
+    if allowgzip and AcceptEncoding.find('gzip') != -1:
+        return 'gzip'
+    return None
+
+
+class StaticAsset(object):
+
+    __slots__ = ( 'path', 'mtime', 'size', 'body', 'digest', 'lastmodified', 'contentType', 'contentEncoding', 'variants' )
+
+    def __init__(self, path, mtime, size, body):
+        self.path = path
+        self.mtime = mtime          # st_mtime_ns
+        self.size = size
+        self.body = body
+        self.digest = hashlib.sha1( body ).hexdigest()[:20]
+        self.lastmodified = formatdate( mtime // 1000000000, usegmt=True )
+        self.contentType, self.contentEncoding = mimetypes.guess_type( path )
+        self.variants = {}          # encoding -> body
+
+    def etag(self, encoding=None):
+        # Each representation has its own strong ETag
+        if encoding:
+            return '"%s-%s"' % ( self.digest, encoding )
+        return '"%s"' % self.digest
+
+    def footprint(self):
+        return len( self.body ) + sum( len( data ) for data in self.variants.values() )
+
+    def not_modified(self, headers, encoding=None):
+        # RFC 7232: If-None-Match has the precedence over If-Modified-Since
+        if 'If-None-Match' in headers:
+            etag = self.etag( encoding )
+            for tag in headers['If-None-Match'].split(','):
+                tag = tag.strip()
+                if tag.startswith('W/'):
+                    tag = tag[2:]
+                if tag in ( '*', etag ):
+                    return True
+            return False
+
+        if 'If-Modified-Since' in headers:
+            try:
+                since = parsedate_to_datetime( headers['If-Modified-Since'] ).timestamp()
+            except ( TypeError, ValueError, IndexError ):
+                return False
+            return self.mtime // 1000000000 <= since
+
+        return False
+
+
+class StaticAssetCache(object):
+
+    def __init__(self, budget, threshold=MAX_KB_TO_SEND):
+        self.budget = budget        # bytes
+        self.threshold = threshold  # Files up to this size are never compressed
+        self.assets = OrderedDict() # path -> StaticAsset, Least Recently Used first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.running = True
+        self.warmupThread = None
+
+    def get(self, path):
+        # StaticAsset of path, None if the file doesn't exist
+        try:
+            stat = os.stat( path )
+        except OSError:
+            return None
+
+        with self.lock:
+            asset = self.assets.get( path )
+            if asset and asset.mtime == stat.st_mtime_ns and asset.size == stat.st_size:
+                self.assets.move_to_end( path )
+                self.hits += 1
+                return asset
+
+        try:
+            with open( path, mode='rb') as webFile:
+                body = webFile.read()
+        except OSError:
+            return None
+        asset = StaticAsset( path, stat.st_mtime_ns, len(body), body )
+
+        precompressed = path + '.gz'
+        if os.path.isfile( precompressed ) and os.path.getmtime( precompressed ) >= asset.mtime / 1e9:
+            with open( precompressed, mode='rb') as gzFile:
+                asset.variants['gzip'] = gzFile.read()
+
+        with self.lock:
+            self.misses += 1
+            previous = self.assets.pop( path, None )
+            if previous:
+                self.size -= previous.footprint()
+            self.assets[ path ] = asset
+            self.size += asset.footprint()
+            self._evict()
+        return asset
+
+    def encoded(self, asset, encoding):
+        # Body of the asset for the encoding, compressed once
+        if not encoding or asset.contentEncoding or asset.size <= self.threshold:
+            return asset.body
+        data = asset.variants.get( encoding )
+        if data is not None:
+            return data
+
+        data = compress( asset.body, encoding )
+        with self.lock:
+            if encoding not in asset.variants:
+                asset.variants[ encoding ] = data
+                if self.assets.get( asset.path ) is asset:
+                    self.size += len( data )
+                    self._evict()
+        return data
+
+    def _evict(self):
+        while self.size > self.budget and self.assets:
+            _, asset = self.assets.popitem( last=False )
+            self.size -= asset.footprint()
+
+    def warmup(self, directory, encoding=None):
+        # Build the assets of directory ( and their encoding ) in a background thread
+        self.warmupThread = threading.Thread( name='ZiGateWebCache', target=self._warmup, args=( directory, encoding ) )
+        self.warmupThread.daemon = True
+        self.warmupThread.start()
+
+    def _warmup(self, directory, encoding):
+        for root, _, files in os.walk( directory ):
+            for filename in sorted( files ):
+                if not self.running or self.size >= self.budget:
+                    return
+                asset = self.get( os.path.join( root, filename ) )
+                if asset:
+                    self.encoded( asset, encoding )
+
+    def stop(self):
+        self.running = False
+        if self.warmupThread and self.warmupThread.is_alive():
+            self.warmupThread.join()
@@ -14,6 +14,14 @@ def startWebServer( self ):
     self.httpServerConn.Listen()
     self.logging( 'Status', "Web backend for Web User Interface started on port: %s" %self.httpPort)
 
+    # Build the cache of the Web User Interface files, with the encoding preferred by sendResponse
+    if self.pluginconf.pluginConf['enableDeflate']:
+        self.assetcache.warmup( self.homedirectory + 'www', 'deflate' )
+    elif self.pluginconf.pluginConf['enableGzip']:
+        self.assetcache.warmup( self.homedirectory + 'www', 'gzip' )
+    else:
+        self.assetcache.warmup( self.homedirectory + 'www' )
+
     #self.httpsPort = '9443'
     #self.httpsServerConn = Domoticz.Connection(Name="Zigate Server Connection", Transport="TCP/IP", Protocol="HTTPS", Port=self.httpsPort)
     #self.httpsServerConn.Listen()
@@ -67,6 +75,7 @@ def onStop( self ):
 
     # Make sure that all remaining open connections are closed
     self.logging( 'Debug', "onStop()")
+    self.assetcache.stop()
 
     # Search for Protocol
     for connection in self.httpServerConns:
@@ -8,8 +8,8 @@ import Domoticz
 
 from Classes.WebServer.headerResponse import setupHeadersResponse, prepResponseMessage
 from Classes.WebServer.rest_Bindings import rest_bindLSTcluster, rest_bindLSTdevice, rest_binding, rest_unbinding
-from Classes.WebServer.rest_Topology import rest_netTopologie, rest_req_topologie
-from Classes.WebServer.rest_Energy import rest_req_nwk_full, rest_req_nwk_inter
+from Classes.WebServer.rest_Topology import rest_netTopologie, rest_req_topologie, rest_netTopologie_graph
+from Classes.WebServer.rest_Energy import rest_req_nwk_full, rest_req_nwk_inter, rest_nwk_energy_stat
 from Classes.WebServer.rest_Groups import rest_zGroup, rest_rescan_group, rest_zGroup_lst_avlble_dev,rest_scan_devices_for_group
 from Classes.WebServer.rest_Provisioning import rest_new_hrdwr, rest_rcv_nw_hrdwr
 
@@ -37,11 +37,13 @@ def do_rest( self, Connection, verb, data, version, command, parameters):
         'restart-needed':{'Name':'restart-needed',     'Verbs':{'GET'},          'function':self.rest_restart_needed},
         'req-nwk-inter': {'Name':'req-nwk-inter',      'Verbs':{'GET'},          'function':self.rest_req_nwk_inter},
         'req-nwk-full':  {'Name':'req-nwk-full',       'Verbs':{'GET'},          'function':self.rest_req_nwk_full},
+        'nwk-energy-stat': {'Name':'nwk-energy-stat',  'Verbs':{'GET'},          'function':self.rest_nwk_energy_stat},
         'req-topologie': {'Name':'req-topologie',      'Verbs':{'GET'},          'function':self.rest_req_topologie},
         'sw-reset-zigate':  {'Name':'sw-reset-zigate', 'Verbs':{'GET'},          'function':self.rest_reset_zigate},
         'setting':       {'Name':'setting',            'Verbs':{'GET','PUT'},    'function':self.rest_Settings_wo_debug},
         'setting-debug': {'Name':'setting',            'Verbs':{'GET','PUT'},    'function':self.rest_Settings_with_debug},
         'topologie':     {'Name':'topologie',          'Verbs':{'GET','DELETE'}, 'function':self.rest_netTopologie},
+        'topologie-graph': {'Name':'topologie-graph',  'Verbs':{'GET'},          'function':self.rest_netTopologie_graph},
         'zdevice':       {'Name':'zdevice',            'Verbs':{'GET','DELETE'}, 'function':self.rest_zDevice},
         'zdevice-name':  {'Name':'zdevice-name',       'Verbs':{'GET','PUT','DELETE'}, 'function':self.rest_zDevice_name},
         'zdevice-raw':   {'Name':'zdevice-raw',        'Verbs':{'GET','PUT'},    'function':self.rest_zDevice_raw},
@@ -58,6 +60,7 @@ def do_rest( self, Connection, verb, data, version, command, parameters):
         'ota-firmware-update': {'Name':'ota-firmware-update',   'Verbs':{'PUT'}, 'function':self.rest_ota_firmware_update},
         'ota-firmware-list': {'Name':'ota-firmware-list',       'Verbs':{'GET'}, 'function':self.rest_ota_firmware_list},
         'ota-firmware-device-list': {'Name':'ota-firmware-list','Verbs':{'GET'}, 'function':self.rest_ota_devices_for_manufcode},
+        'ota-firmware-queue': {'Name':'ota-firmware-queue',     'Verbs':{'GET','DELETE'}, 'function':self.rest_ota_firmware_queue},
 
         'casaia-list-devices':  { 'Name':'casaia-list-devices','Verbs':{'GET'}, 'function':self.rest_casa_device_list},
         'casaia-update-ircode': { 'Name':'casaia-list-devices','Verbs':{'PUT'}, 'function':self.rest_casa_device_ircode_update}
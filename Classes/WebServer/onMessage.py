@@ -6,13 +6,11 @@
 import Domoticz
 
 from urllib.parse import urlparse
-from time import gmtime, strftime
 import os
 import os.path
-import mimetypes
-from datetime import datetime
 
 from Classes.WebServer.headerResponse import setupHeadersResponse, prepResponseMessage
+from Classes.WebServer.assetCache import accepted_encoding
 from Classes.WebServer.tools import DumpHTTPResponseToLog, MAX_KB_TO_SEND
 
 def onMessage( self, Connection, Data ):
@@ -72,6 +70,12 @@ def onMessage( self, Connection, Data ):
             webFilename =  self.homedirectory + 'www' + "/index.html"
             self.logging( 'Debug', "Redirecting to /index.html")
 
+        asset = self.assetcache.get( webFilename )
+        if asset is None:
+            Domoticz.Error("Unable to read %s" %webFilename)
+            self.sendResponse( Connection, {"Status": "404 Not Found"} )
+            return
+
         # We are ready to send the response
         _response = setupHeadersResponse( cookie )
         if self.pluginconf.pluginConf['enableKeepalive']:
@@ -86,26 +90,31 @@ def onMessage( self, Connection, Data ):
         else:
             _response["Headers"]["Cache-Control"] = "private"
 
-        self.logging( 'Debug', "Opening: %s" %webFilename)
-        currentVersionOnServer = os.path.getmtime(webFilename)
-        _lastmodified = strftime("%a, %d %m %y %H:%M:%S GMT", gmtime(currentVersionOnServer))
-
         # Check Referrrer
         if 'Referer' in Data['Headers']:
             self.logging( 'Debug', "Set Referer: %s" %Data["Headers"]["Referer"])
             _response["Headers"]["Referer"] = Data['Headers']['Referer']
 
+        # Content negotiation, the encoded bodies are built once by the asset cache
+        _encoding = None
+        if not asset.contentEncoding and asset.size > MAX_KB_TO_SEND:
+            allowgzip = self.pluginconf.pluginConf['enableGzip']
+            allowdeflate = self.pluginconf.pluginConf['enableDeflate']
+            if allowgzip or allowdeflate:
+                _response["Headers"]["Vary"] = "Accept-Encoding"
+                if 'Accept-Encoding' in Data['Headers']:
+                    _encoding = accepted_encoding( Data['Headers']['Accept-Encoding'], allowdeflate, allowgzip )
+
+        _response["Headers"]["ETag"] = asset.etag( _encoding )
+        _response["Headers"]["Last-Modified"] = asset.lastmodified
+
         # Can we use Cache if exists
-        if self.pluginconf.pluginConf['enableCache']:
-            if 'If-Modified-Since' in Data['Headers']:
-                lastVersionInCache = Data['Headers']['If-Modified-Since']
-                self.logging( 'Debug', "InCache: %s versus Current: %s" %(lastVersionInCache, _lastmodified))
-                if lastVersionInCache == _lastmodified:
-                    # No need to send it back
-                    self.logging( 'Debug', "User Caching - file: %s InCache: %s versus Current: %s" %(webFilename, lastVersionInCache, _lastmodified))
-                    _response['Status'] = "304 Not Modified"
-                    self.sendResponse( Connection, _response )
-                    return _response
+        if self.pluginconf.pluginConf['enableCache'] and asset.not_modified( Data['Headers'], _encoding ):
+            # No need to send it back
+            self.logging( 'Debug', "User Caching - file: %s ETag: %s Last-Modified: %s" %(webFilename, _response["Headers"]["ETag"], asset.lastmodified))
+            _response['Status'] = "304 Not Modified"
+            self.sendResponse( Connection, _response )
+            return _response
 
         if 'Ranges' in Data['Headers']:
             self.logging( 'Debug', "Ranges processing")
@@ -125,20 +134,15 @@ def onMessage( self, Connection, Data ):
             if not self.pluginconf.pluginConf['enableKeepalive']:
                 Connection.Disconnect()
         else:
-            _response["Headers"]["Last-Modified"] = _lastmodified
-            with open(webFilename , mode ='rb') as webFile:
-                _response["Data"] = webFile.read()
-
-            _contentType, _contentEncoding = mimetypes.guess_type( Data['URL'] )
-    
-            if _contentType:
-                _response["Headers"]["Content-Type"] = _contentType +"; charset=utf-8"
-            if _contentEncoding:
-                _response["Headers"]["Content-Encoding"] = _contentEncoding 
-    
-            _response["Status"] = "200 OK"
+            _response["Data"] = self.assetcache.encoded( asset, _encoding )
 
-            if 'Accept-Encoding' in Data['Headers']:
-                self.sendResponse( Connection, _response, AcceptEncoding = Data['Headers']['Accept-Encoding']  )
-            else:
-                self.sendResponse( Connection, _response )
+            if asset.contentType:
+                _response["Headers"]["Content-Type"] = asset.contentType +"; charset=utf-8"
+            if asset.contentEncoding:
+                _response["Headers"]["Content-Encoding"] = asset.contentEncoding
+            elif _encoding:
+                _response["Headers"]["Content-Encoding"] = _encoding
+                self.logging( 'Debug', "Compression %s from %s to %s" %( _encoding, asset.size, len(_response["Data"])))
+
+            _response["Status"] = "200 OK"
+            self.sendResponse( Connection, _response )
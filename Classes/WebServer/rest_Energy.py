@@ -34,3 +34,16 @@ def rest_req_nwk_full( self, verb, data, parameters):
             self.networkenergy.start_scan( root='0000', target='0000')
 
     return _response
+
+def rest_nwk_energy_stat( self, verb, data, parameters):
+
+    _response = prepResponseMessage( self ,setupHeadersResponse(  ))
+
+    if verb == 'GET':
+        action = {'Name': 'Nwk-Energy-Stat', 'TimeStamp': int(time())}
+        if self.networkenergy:
+            action.update( self.networkenergy.channel_statistics() )
+            action['ScanInProgress'] = self.networkenergy.ScanInProgress
+        _response["Data"] = json.dumps( action, sort_keys=True )
+
+    return _response
@@ -220,3 +220,27 @@ def rest_ota_firmware_update( self, verb, data, parameter):
     action = {'Name': 'OTA requested.', 'TimeStamp': int(time())}
     _response["Data"] = json.dumps( action , sort_keys=True )
     return _response
+
+
+def rest_ota_firmware_queue( self, verb, data, parameters):
+
+    # GET: Firmware updates in progress and in queue
+    # DELETE /<NwkId>: Cancel the firmware update of that device
+    _response = prepResponseMessage( self ,setupHeadersResponse(  ))
+    _response["Data"] = None
+
+    if self.OTA is None:
+        # OTA is not enabled!
+        return _response
+
+    if verb == 'GET' and len(parameters) == 0:
+        _response["Data"] = json.dumps( self.OTA.restapi_list_of_transfers( ) , sort_keys=True )
+
+    elif verb == 'DELETE' and len(parameters) == 1:
+        if self.OTA.restapi_cancel_transfer( parameters[0] ):
+            action = {'Name': 'OTA cancelled.', 'TimeStamp': int(time())}
+        else:
+            action = {'Error': 'No firmware update for %s' %parameters[0]}
+        _response["Data"] = json.dumps( action , sort_keys=True )
+
+    return _response
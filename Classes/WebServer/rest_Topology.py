@@ -12,6 +12,7 @@ from time import time
 from datetime import datetime
 
 from Classes.WebServer.headerResponse import setupHeadersResponse, prepResponseMessage
+from Classes.ReportStore import openReportStore
 
 
 def rest_req_topologie( self, verb, data, parameters):
@@ -38,134 +39,15 @@ def rest_netTopologie( self, verb, data, parameters):
     _filename = self.pluginconf.pluginConf['pluginReports'] + 'NetworkTopology-v3-' + '%02d' %self.hardwareID + '.json'
     self.logging( 'Debug', "Filename: %s" %_filename)
 
-    if not os.path.isfile( _filename ) :
+    # The reports are indexed, only the requested one is read
+    _reports = openReportStore( _filename )
+    if not _reports.timestamps():
         _response['Data'] = json.dumps( {} , sort_keys=True ) 
         return _response
 
-    # Read the file, as we have anyway to do it
-    _topo = {}           # All Topo reports
-    _timestamps_lst = [] # Just the list of Timestamps
-    with open( _filename , 'rt') as handle:
-        for line in handle:
-            if line[0] != '{' and line[-1] != '}': 
-                continue
-            
-            entry = json.loads( line, encoding=dict )
-            for _ts in entry:
-                _timestamps_lst.append( int(_ts) )
-                _topo[_ts] = [] # List of Father -> Child relation for one TimeStamp
-                _check_duplicate = []
-                _nwkid_list = []
-                reportLQI = entry[_ts]
-
-                for item in reportLQI:
-                    self.logging( 'Debug', "Node: %s" %item)
-                    if item != '0000' and item not in self.ListOfDevices:
-                        continue
-
-                    if item not in _nwkid_list:
-                        _nwkid_list.append( item )
-                    for x in  reportLQI[item]['Neighbours']:
-                        self.logging( 'Debug', "---> %s" %x)
-                        # Report only Child relationship
-                        if x != '0000' and x not in self.ListOfDevices: 
-                            continue
-
-                        if item == x: 
-                            continue
-
-                        if 'Neighbours' not in reportLQI[item]:
-                            Domoticz.Error("Missing attribute :%s for (%s,%s)" %('Neighbours', item, x))
-                            continue
-
-                        for attribute in ( '_relationshp', '_lnkqty', '_devicetype', '_depth' ):
-                            if attribute not in reportLQI[item]['Neighbours'][x]:
-                                Domoticz.Error("Missing attribute :%s for (%s,%s)" %(attribute, item, x))
-                                continue
-
-                        if x not in _nwkid_list:
-                            _nwkid_list.append( x )
-                        
-                        # We need to reorganise in Father/Child relationship.
-                        if reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Parent':
-                            _father = item
-                            _child  = x
-
-                        elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Child':
-                            _father = x
-                            _child = item
-
-                        elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Sibling':
-                            _father = item
-                            _child  = x
-
-                        elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Former Child':
-                            # Not a Parent, not a Child, not a Sibbling
-                            #_father = item
-                            #_child  = x
-                            continue
-
-                        elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'None':
-                            # Not a Parent, not a Child, not a Sibbling
-                            #_father = item
-                            #_child  = x
-                            continue
-                    
-                        _relation = {}
-                        _relation['Father'] = _father
-                        _relation['Child'] = _child
-                        _relation["_lnkqty"] = int(reportLQI[item]['Neighbours'][x]['_lnkqty'], 16)
-                        _relation["DeviceType"] = reportLQI[item]['Neighbours'][x]['_devicetype']
-
-                        if _father != "0000":
-                            if 'ZDeviceName' in self.ListOfDevices[_father]:
-                                if self.ListOfDevices[_father]['ZDeviceName'] != "" and self.ListOfDevices[_father]['ZDeviceName'] != {}:
-                                    #_relation[master] = self.ListOfDevices[_father]['ZDeviceName']
-                                    _relation['Father'] = self.ListOfDevices[_father]['ZDeviceName']
-                        else:
-                            _relation['Father'] = "Zigate"
-
-                        if _child != "0000":
-                            if 'ZDeviceName' in self.ListOfDevices[_child]:
-                                if self.ListOfDevices[_child]['ZDeviceName'] != "" and self.ListOfDevices[_child]['ZDeviceName'] != {}:
-                                    #_relation[slave] = self.ListOfDevices[_child]['ZDeviceName']
-                                    _relation['Child'] = self.ListOfDevices[_child]['ZDeviceName']
-                        else:
-                            _relation['Child'] = "Zigate"
-
-                        # Sanity check, remove the direct loop
-                        if ( _relation['Child'], _relation['Father'] ) in _check_duplicate:
-                            self.logging( 'Debug', "Skip (%s,%s) as there is already ( %s, %s)" %(_relation['Father'], _relation['Child'], _relation['Child'], _relation['Father']))
-                            continue
-
-                        _check_duplicate.append( ( _relation['Father'], _relation['Child']))
-                        self.logging( 'Debug', "%10s Relationship - %15.15s - %15.15s %3s %2s" \
-                            %( _ts, _relation['Father'], _relation['Child'], _relation["_lnkqty"],
-                                    reportLQI[item]['Neighbours'][x]['_depth']))
-                        _topo[_ts].append( _relation )
-                    #end for x
-                #end for item
-
-                # Sanity check, to see if all devices are part of the report.
-                # for iterDev in self.ListOfDevices:
-                #     if iterDev in _nwkid_list: continue
-                #     if 'Status' not in self.ListOfDevices[iterDev]: continue
-                #     if self.ListOfDevices[iterDev]['Status'] != 'inDB': continue
-                #    self.logging( 'Debug', "Nwkid %s has not been reported by this scan" %iterDev)
-                #    _relation = {}
-                #    _relation['Father'] = _relation['Child'] = iterDev
-                #    _relation['_lnkqty'] = 0
-                #    _relation['DeviceType'] = ''
-                #    if 'ZDeviceName' in self.ListOfDevices[iterDev]:
-                #        if self.ListOfDevices[iterDev]['ZDeviceName'] != "" and self.ListOfDevices[iterDev]['ZDeviceName'] != {}:
-                #            _relation['Father'] = _relation['Child'] = self.ListOfDevices[iterDev]['ZDeviceName']
-                #    _topo[_ts].append( _relation )
-
-            #end for _st
-
     if verb == 'DELETE':
         if len(parameters) == 0:
-            os.remove( _filename )
+            _reports.clear()
             action = {}
             action['Name'] = 'File-Removed'
             action['FileName'] = _filename
@@ -173,26 +55,8 @@ def rest_netTopologie( self, verb, data, parameters):
 
         elif len(parameters) == 1:
             timestamp = parameters[0]
-            if timestamp in _topo:
-                self.logging( 'Debug', "Removing Report: %s from %s records" %(timestamp, len(_topo)))
-                with open( _filename, 'r+') as handle:
-                    d = handle.readlines()
-                    handle.seek(0)
-                    for line in d:
-                        if line[0] != '{' and line[-1] != '}':
-                            handle.write( line )
-                            continue
-                        entry = json.loads( line, encoding=dict )
-                        entry_ts = entry.keys()
-                        if len( entry_ts ) == 1:
-                            if timestamp in entry_ts:
-                                self.logging( 'Debug', "--------> Skiping %s" %timestamp)
-                                continue
-                        else:
-                            continue
-                        handle.write( line )
-                    handle.truncate()
-
+            if _reports.remove( timestamp ):
+                self.logging( 'Debug', "Removing Report: %s" %(timestamp))
                 action = {}
                 action['Name'] = 'Report %s removed' %timestamp
                 _response['Data'] = json.dumps( action , sort_keys=True)
@@ -204,14 +68,160 @@ def rest_netTopologie( self, verb, data, parameters):
     if verb == 'GET':
         if len(parameters) == 0:
             # Send list of Time Stamps
-            _response['Data'] = json.dumps( _timestamps_lst , sort_keys=True)
+            _response['Data'] = json.dumps( [ int(_ts) for _ts in _reports.timestamps() ] , sort_keys=True)
 
         elif len(parameters) == 1:
             timestamp = parameters[0]
-            if timestamp in _topo:
-                self.logging( 'Debug', "Topologie sent: %s" %_topo[timestamp])
-                _response['Data'] = json.dumps( _topo[timestamp] , sort_keys=True)
+            reportLQI = _reports.report( timestamp )
+            if reportLQI is not None:
+                _topo = topologyRelations( self, timestamp, reportLQI )
+                self.logging( 'Debug', "Topologie sent: %s" %_topo)
+                _response['Data'] = json.dumps( _topo , sort_keys=True)
             else:
                 _response['Data'] = json.dumps( [] , sort_keys=True)
 
     return _response
+
+def rest_netTopologie_graph( self, verb, data, parameters):
+
+    # Live topology from the Neighbour graph, no report file is read
+    #   topologie-graph          : Father -> Child relations, as for a report
+    #   topologie-graph/<NwkId>  : Links, Parent, weakest link and best router of a device
+
+    _response = prepResponseMessage( self ,setupHeadersResponse(  ))
+
+    if verb != 'GET' or self.networkmap is None:
+        _response['Data'] = json.dumps( {} , sort_keys=True )
+        return _response
+
+    graph = self.networkmap.graph
+    if len(parameters) == 0:
+        _response['Data'] = json.dumps( topologyRelations( self, 'live', graph.report() ) , sort_keys=True)
+
+    elif len(parameters) == 1:
+        nwkid = parameters[0]
+        _device = {}
+        _device['NwkId'] = nwkid
+        _device['Neighbours'] = [ {'NwkId': x, 'LQI': lqi, 'Age': age, 'Relationship': relationship} 
+            for x, ( lqi, age, relationship ) in graph.neighbours( nwkid ).items() ]
+        _device['Parent'] = graph.parent( nwkid )
+        _device['WeakestLink'] = graph.weakest_link( nwkid )
+        _device['RouteHint'] = graph.route_hint( nwkid )
+        if nwkid in graph.heard:
+            _device['LQI'], _stamp = graph.heard[ nwkid ]
+            _device['LastHeard'] = int( time() - _stamp )
+        _response['Data'] = json.dumps( _device , sort_keys=True)
+
+    return _response
+
+def topologyRelations( self, _ts, reportLQI ):
+
+    # List of Father -> Child relation for one TimeStamp
+    _topo = []
+    _check_duplicate = []
+    _nwkid_list = []
+
+    for item in reportLQI:
+        self.logging( 'Debug', "Node: %s" %item)
+        if item != '0000' and item not in self.ListOfDevices:
+            continue
+
+        if item not in _nwkid_list:
+            _nwkid_list.append( item )
+        for x in  reportLQI[item]['Neighbours']:
+            self.logging( 'Debug', "---> %s" %x)
+            # Report only Child relationship
+            if x != '0000' and x not in self.ListOfDevices: 
+                continue
+
+            if item == x: 
+                continue
+
+            if 'Neighbours' not in reportLQI[item]:
+                Domoticz.Error("Missing attribute :%s for (%s,%s)" %('Neighbours', item, x))
+                continue
+
+            for attribute in ( '_relationshp', '_lnkqty', '_devicetype', '_depth' ):
+                if attribute not in reportLQI[item]['Neighbours'][x]:
+                    Domoticz.Error("Missing attribute :%s for (%s,%s)" %(attribute, item, x))
+                    continue
+
+            if x not in _nwkid_list:
+                _nwkid_list.append( x )
+            
+            # We need to reorganise in Father/Child relationship.
+            if reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Parent':
+                _father = item
+                _child  = x
+
+            elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Child':
+                _father = x
+                _child = item
+
+            elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Sibling':
+                _father = item
+                _child  = x
+
+            elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'Former Child':
+                # Not a Parent, not a Child, not a Sibbling
+                #_father = item
+                #_child  = x
+                continue
+
+            elif reportLQI[item]['Neighbours'][x]['_relationshp'] == 'None':
+                # Not a Parent, not a Child, not a Sibbling
+                #_father = item
+                #_child  = x
+                continue
+        
+            _relation = {}
+            _relation['Father'] = _father
+            _relation['Child'] = _child
+            _relation["_lnkqty"] = int(reportLQI[item]['Neighbours'][x]['_lnkqty'], 16)
+            _relation["DeviceType"] = reportLQI[item]['Neighbours'][x]['_devicetype']
+
+            if _father != "0000":
+                if 'ZDeviceName' in self.ListOfDevices[_father]:
+                    if self.ListOfDevices[_father]['ZDeviceName'] != "" and self.ListOfDevices[_father]['ZDeviceName'] != {}:
+                        #_relation[master] = self.ListOfDevices[_father]['ZDeviceName']
+                        _relation['Father'] = self.ListOfDevices[_father]['ZDeviceName']
+            else:
+                _relation['Father'] = "Zigate"
+
+            if _child != "0000":
+                if 'ZDeviceName' in self.ListOfDevices[_child]:
+                    if self.ListOfDevices[_child]['ZDeviceName'] != "" and self.ListOfDevices[_child]['ZDeviceName'] != {}:
+                        #_relation[slave] = self.ListOfDevices[_child]['ZDeviceName']
+                        _relation['Child'] = self.ListOfDevices[_child]['ZDeviceName']
+            else:
+                _relation['Child'] = "Zigate"
+
+            # Sanity check, remove the direct loop
+            if ( _relation['Child'], _relation['Father'] ) in _check_duplicate:
+                self.logging( 'Debug', "Skip (%s,%s) as there is already ( %s, %s)" %(_relation['Father'], _relation['Child'], _relation['Child'], _relation['Father']))
+                continue
+
+            _check_duplicate.append( ( _relation['Father'], _relation['Child']))
+            self.logging( 'Debug', "%10s Relationship - %15.15s - %15.15s %3s %2s" \
+                %( _ts, _relation['Father'], _relation['Child'], _relation["_lnkqty"],
+                        reportLQI[item]['Neighbours'][x]['_depth']))
+            _topo.append( _relation )
+        #end for x
+    #end for item
+
+    # Sanity check, to see if all devices are part of the report.
+    # for iterDev in self.ListOfDevices:
+    #     if iterDev in _nwkid_list: continue
+    #     if 'Status' not in self.ListOfDevices[iterDev]: continue
+    #     if self.ListOfDevices[iterDev]['Status'] != 'inDB': continue
+    #    self.logging( 'Debug', "Nwkid %s has not been reported by this scan" %iterDev)
+    #    _relation = {}
+    #    _relation['Father'] = _relation['Child'] = iterDev
+    #    _relation['_lnkqty'] = 0
+    #    _relation['DeviceType'] = ''
+    #    if 'ZDeviceName' in self.ListOfDevices[iterDev]:
+    #        if self.ListOfDevices[iterDev]['ZDeviceName'] != "" and self.ListOfDevices[iterDev]['ZDeviceName'] != {}:
+    #            _relation['Father'] = _relation['Child'] = self.ListOfDevices[iterDev]['ZDeviceName']
+    #    _topo.append( _relation )
+
+    return _topo
@@ -42,7 +42,8 @@ def sendResponse( self, Connection, Response, AcceptEncoding=None ):
     allowgzip = self.pluginconf.pluginConf['enableGzip']
     allowdeflate = self.pluginconf.pluginConf['enableDeflate']
 
-    if (allowgzip or allowdeflate ) and 'Data' in Response and AcceptEncoding:
+    # Static files come already encoded from the asset cache
+    if (allowgzip or allowdeflate ) and 'Data' in Response and AcceptEncoding and 'Content-Encoding' not in Response['Headers']:
         self.logging( 'Debug', "sendResponse - Accept-Encoding: %s, Chunk: %s, Deflate: %s , Gzip: %s" %(AcceptEncoding, self.pluginconf.pluginConf['enableChunk'], allowdeflate, allowgzip))
         if len(Response["Data"]) > MAX_KB_TO_SEND:
             orig_size = len(Response["Data"])
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: WidgetResetSchedule.py
+
+    Description: Deadlines of the widgets to be reset Off ( Motion, Vibration, push buttons )
+
+    When such widget is set On, UpdateDevice_v2 registers the time at which it has to be reset.
+    ResetDevice() ( onHeartbeat ) only pops the expired deadlines, instead of parsing the LastUpdate
+    of every Domoticz Unit. A newer deadline of a Unit replaces the previous one, which is then
+    ignored when popped.
+
+"""
+
+import heapq
+import threading
+
+
+class WidgetResetSchedule(object):
+
+    def __init__(self):
+        self.heap = []              # ( deadline, Unit )
+        self.deadlines = {}         # Unit -> current deadline
+        self.seeded = False         # Devices have been scanned once for widgets already On
+        self.lock = threading.Lock()
+
+    def schedule(self, unit, deadline):
+        with self.lock:
+            self.deadlines[unit] = deadline
+            heapq.heappush(self.heap, (deadline, unit))
+
+    def cancel(self, unit):
+        with self.lock:
+            self.deadlines.pop(unit, None)
+
+    def expired(self, now):
+        # Return the Units which deadline is reached, and forget them
+        units = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                deadline, unit = heapq.heappop(self.heap)
+                if self.deadlines.get(unit) == deadline:
+                    del self.deadlines[unit]
+                    units.append(unit)
+        return units
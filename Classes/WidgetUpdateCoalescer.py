@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: WidgetUpdateCoalescer.py
+
+    Description: Coalescing of the Domoticz widget updates
+
+    Power meters, TRVs and Xiaomi sensors report several attributes back to back, each of them
+    ending into a Devices[Unit].Update() ( Domoticz core and database ). When enabled
+    ( coalesceWidgetUpdates ), the updates of meters and sensors are kept for a short delay and only
+    the latest nValue/sValue of the Unit is written to Domoticz.
+
+    - Meters ( coalesceMeterDelay ) and sensors ( coalesceSensorDelay ) are delayed
+    - Switches, IAS, buttons, selectors ... and any update with ForceUpdate are never delayed
+    - Widgets built from several attributes ( Temp+Hum+Baro ) read the pending values with
+      domoTools.RetreiveCurrentValues()
+
+    flush() is called from onHeartbeat, and with all_=True from onStop.
+    Counters are stored in the TransportStatistics object.
+
+"""
+
+import threading
+from time import time
+
+METER_WIDGETS = ( 'P1Meter', 'Power', 'Meter', 'Ampere', 'Voltage' )
+SENSOR_WIDGETS = ( 'Temp', 'Humi', 'Baro', 'Temp+Hum', 'Temp+Hum+Baro', 'Lux', 'AirQuality', 'Voc', 'CarbonDioxyde', 'CarbonMonoxyde' )
+
+
+class WidgetUpdateCoalescer(object):
+
+    def __init__(self, pluginconf, statistics):
+        self.pluginconf = pluginconf
+        self.statistics = statistics
+        self.pending = {}       # Unit -> [ due, nValue, sValue, Color, SignalLevel, BatteryLevel ]
+        self.lock = threading.Lock()
+
+    def enabled(self):
+        return self.pluginconf.pluginConf['coalesceWidgetUpdates']
+
+    def delay(self, WidgetType):
+        # Number of seconds an update of WidgetType can be delayed
+        if WidgetType in METER_WIDGETS:
+            return self.pluginconf.pluginConf['coalesceMeterDelay']
+        if WidgetType in SENSOR_WIDGETS:
+            return self.pluginconf.pluginConf['coalesceSensorDelay']
+        return 0
+
+    def is_pending(self, Unit):
+        return Unit in self.pending
+
+    def pending_values(self, Unit):
+        # ( nValue, sValue ) of the pending update of Unit, or None
+        with self.lock:
+            entry = self.pending.get( Unit )
+            if entry is None:
+                return None
+            return ( entry[1], entry[2] )
+
+    def update(self, Unit, delay, nValue, sValue, Color, SignalLevel, BatteryLevel):
+        # Keep the update for delay seconds. Updates received meanwhile replace it.
+        with self.lock:
+            self.statistics._widgetUpdates += 1
+            if Unit in self.pending:
+                self.pending[ Unit ][1:] = [ nValue, sValue, Color, SignalLevel, BatteryLevel ]
+                self.statistics._widgetUpdatesSaved += 1
+                return
+            self.pending[ Unit ] = [ time() + delay, nValue, sValue, Color, SignalLevel, BatteryLevel ]
+            self.statistics._widgetUpdatesDelayed += 1
+
+    def immediate(self, Unit):
+        # The Unit is updated right now, a pending update is outdated
+        with self.lock:
+            self.statistics._widgetUpdates += 1
+            if self.pending.pop( Unit, None ) is not None:
+                self.statistics._widgetUpdatesSaved += 1
+
+    def remove(self, Unit):
+        # The Unit has been removed from Domoticz
+        with self.lock:
+            self.pending.pop( Unit, None )
+
+    def flush(self, Devices, all_=False):
+        if not self.pending:
+            return
+        now = time()
+        with self.lock:
+            due = [ Unit for Unit, entry in self.pending.items() if all_ or entry[0] <= now ]
+            entries = [ ( Unit, self.pending.pop( Unit ) ) for Unit in due ]
+
+        saved = 0
+        for Unit, ( _, nValue, sValue, Color, SignalLevel, BatteryLevel ) in entries:
+            if Unit not in Devices:
+                continue
+            if ( Devices[Unit].nValue == int(nValue) and Devices[Unit].sValue == sValue and
+                    ( Color == '' or Devices[Unit].Color == Color ) and
+                    Devices[Unit].BatteryLevel == int(BatteryLevel) and not Devices[Unit].TimedOut ):
+                # Back to the value known by Domoticz
+                saved += 1
+                continue
+            if Color:
+                Devices[Unit].Update(nValue=int(nValue), sValue=str(sValue), Color=Color, SignalLevel=int(SignalLevel), BatteryLevel=int(BatteryLevel), TimedOut=0)
+            else:
+                Devices[Unit].Update(nValue=int(nValue), sValue=str(sValue),              SignalLevel=int(SignalLevel), BatteryLevel=int(BatteryLevel), TimedOut=0)
+
+        if saved:
+            # Counted under the lock, as update() and immediate() do
+            with self.lock:
+                self.statistics._widgetUpdatesSaved += saved
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: ZclFrame.py
+
+    Description: ZCL Global Command received as raw APS ( 0x8002 ) and decoded by the Transport layer.
+
+    The Transport layer decodes the APS and ZCL headers and the attribute records from the binary
+    frame, and forwards a ZclGlobalFrame instead of the ZigateFrame. ZigateRead hands the records
+    over to the attribute handlers without going through an hex 0x8100/0x8102 frame.
+
+    msgtype is the ZiGate message the Command is the equivalent of:
+        0x8100 Read Attributes Response ( 0x01 )    records: ( AttrID, Status, Type, Size, Data )
+        0x8102 Report Attributes ( 0x0a )           records: ( AttrID, Status, Type, Size, Data )
+        0x8110 Write Attributes Response ( 0x04 )   records: ( AttrID, Status )
+        0x8120 Configure Reporting Response ( 0x07 ) records: ( AttrID, Status )
+
+"""
+
+
+class ZclGlobalFrame(object):
+
+    __slots__ = ('msgtype', 'command', 'sqn', 'nwkid', 'ep', 'cluster', 'manufcode', 'records', 'frame')
+
+    def __init__(self, frame, msgtype, command, sqn, nwkid, ep, cluster, manufcode, records):
+        self.frame = frame          # ZigateFrame of the 0x8002
+        self.msgtype = msgtype
+        self.command = command
+        self.sqn = sqn
+        self.nwkid = nwkid
+        self.ep = ep
+        self.cluster = cluster
+        self.manufcode = manufcode
+        self.records = records
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __str__(self):
+        return self.frame.hex
+
+    @property
+    def lqi_hex(self):
+        return self.frame.lqi_hex
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: ZigateFrame.py
+
+    Description: Binary representation of a decoded (unescaped) ZiGate frame.
+
+    The frame is kept as the bytearray received from the firmware, and the header
+    is parsed once. Hexadecimal representations (used by logging and by the legacy
+    DecodeXXXX functions) are only built on demand and then cached.
+
+    Frame layout: 0x01 | MsgType (2) | Length (2) | Checksum (1) | Payload (n) | LQI (1) | 0x03
+
+"""
+
+import struct
+from binascii import hexlify
+
+
+class ZigateFrame(object):
+
+    __slots__ = ('binary', 'msgtype', 'length', 'crc', 'lqi', 'payload', '_hex', '_payload_hex')
+
+    def __init__(self, binary):
+        self.binary = binary
+        _, self.msgtype, self.length, self.crc = struct.unpack_from('>BHHB', binary, 0)
+        self._hex = None
+        self._payload_hex = None
+
+        if len(binary) > 6:
+            # Payload is followed by LQI and by the 0x03 end of frame
+            self.payload = memoryview(binary)[6:-2]
+            self.lqi = binary[-2]
+        else:
+            self.payload = memoryview(b'')
+            self.lqi = 0x00
+
+    def __len__(self):
+        return len(self.binary)
+
+    def __str__(self):
+        return self.hex
+
+    @property
+    def hex(self):
+        # Full frame in hex, as it used to be provided by the Transport layer
+        if self._hex is None:
+            self._hex = hexlify(self.binary).decode('utf-8')
+        return self._hex
+
+    @property
+    def msgtype_hex(self):
+        return '%04x' % self.msgtype
+
+    @property
+    def length_hex(self):
+        return '%04x' % self.length
+
+    @property
+    def crc_hex(self):
+        return '%02x' % self.crc
+
+    @property
+    def lqi_hex(self):
+        return '%02x' % self.lqi
+
+    @property
+    def payload_hex(self):
+        # Payload in hex, as expected by the DecodeXXXX functions
+        if self._payload_hex is None:
+            self._payload_hex = hexlify(self.payload).decode('utf-8')
+        return self._payload_hex
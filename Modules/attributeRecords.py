@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: attributeRecords.py
+
+    Description: Decoding of the Read Attribute Response ( 0x8100 ) and Attribute Report ( 0x8102 ) payloads
+
+    The payload is walked once as bytes with struct, and each attribute record is returned as the tuple
+    ( AttrID, Status, Type, Size, Data ) of hex strings the ReadCluster handlers are using.
+    All the records of a frame are decoded before being handed over, so the per-device bookkeeping is
+    done once per frame ( read_report_attributes ).
+    Functions accept bytes, bytearray or memoryview ( ZigateFrame.payload ).
+
+    The decode_zcl_xxx functions decode the ZCL Global Commands received as raw APS ( 0x8002 ). ZCL is
+    little endian, the records are returned as the ZiGate firmware provides them in 0x8100/0x8102,
+    so the same Cluster handlers are used.
+
+"""
+
+import struct
+from binascii import hexlify
+
+from Modules.zigateConsts import SIZE_DATA_TYPE
+
+# SQN, NwkId, Ep, ClusterId
+ATTRIBUTE_FRAME_HEADER = struct.Struct('>BHBH')
+# 0x8100 record: AttrID, Status then, if Status is 0x00, Type, Size and Data
+ATTRIBUTE_ID_STATUS = struct.Struct('>HB')
+ATTRIBUTE_TYPE_SIZE = struct.Struct('>BH')
+# 0x8102: AttrID, Status, Type, Size, the Data is the rest of the payload
+ATTRIBUTE_REPORT = struct.Struct('>HBBH')
+
+
+def decode_attribute_header( payload ):
+    # ( MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId ), raise struct.error if the payload is too short
+    sqn, nwkid, ep, cluster = ATTRIBUTE_FRAME_HEADER.unpack_from( payload, 0 )
+    return '%02x' %sqn, '%04x' %nwkid, '%02x' %ep, '%04x' %cluster
+
+
+def decode_attribute_records( payload, offset=ATTRIBUTE_FRAME_HEADER.size ):
+    # Records of a 0x8100 payload. Return ( records, complete ), complete is False if the payload is
+    # truncated, records are then the ones decoded before
+    records = []
+    end = len( payload )
+    try:
+        while offset < end:
+            attribute, status = ATTRIBUTE_ID_STATUS.unpack_from( payload, offset )
+            offset += ATTRIBUTE_ID_STATUS.size
+            if status == 0x00:
+                atttype, size = ATTRIBUTE_TYPE_SIZE.unpack_from( payload, offset )
+                offset += ATTRIBUTE_TYPE_SIZE.size
+                records.append( ( '%04x' %attribute, '00', '%02x' %atttype, '%04x' %size,
+                    hexlify( payload[ offset: offset + size ] ).decode('utf-8') ) )
+                offset += size
+            else:
+                # If the frame is coming from firmware we get only one attribute at a time, with some dummy datas
+                if end - offset == 3:
+                    offset += 3
+                records.append( ( '%04x' %attribute, '%02x' %status, '', '', '' ) )
+    except struct.error:
+        return records, False
+    return records, True
+
+
+def decode_attribute_report( payload, offset=ATTRIBUTE_FRAME_HEADER.size ):
+    # The single record of a 0x8102 payload, raise struct.error if the payload is too short
+    attribute, status, atttype, size = ATTRIBUTE_REPORT.unpack_from( payload, offset )
+    return ( '%04x' %attribute, '%02x' %status, '%02x' %atttype, '%04x' %size,
+        hexlify( payload[ offset + ATTRIBUTE_REPORT.size: ] ).decode('utf-8') )
+
+
+# ZCL Frame Control, ( Manufacturer Code ), Sequence Number, Command
+ZCL_FRAME_CONTROL = struct.Struct('<B')
+# The Manufacturer Code is kept in the frame byte order, as retreive_cmd_payload_from_8002() does
+ZCL_MANUF_CODE = struct.Struct('>H')
+ZCL_SQN_COMMAND = struct.Struct('<BB')
+ZCL_ATTRIBUTE_ID = struct.Struct('<H')
+ZCL_ATTRIBUTE_ID_STATUS = struct.Struct('<HB')
+ZCL_STATUS_ATTRIBUTE_ID = struct.Struct('<BH')
+ZCL_STATUS_DIRECTION_ATTRIBUTE_ID = struct.Struct('<BBH')
+
+ZCL_TYPE_SIZE = { int( x, 16 ): y for x, y in SIZE_DATA_TYPE.items() }
+# Data Types the ZiGate firmware provides in big endian
+ZCL_SWAPPED_TYPES = ( 0x09, 0x19, 0x21, 0x29, 0x31, 0x22, 0x2a, 0x23, 0x2b, 0x39 )
+ZCL_STRING_TYPES = ( 0x41, 0x42 )      # Octet String, Character String: 1 byte length
+ZCL_STRUCTURE_TYPE = 0x4c              # Structure: 2 bytes number of elements, all remaining data is taken
+
+
+def decode_zcl_header( payload, offset=0 ):
+    # ( GlobalCommand, MsgSQN, ManufacturerCode, Command, offset of the command payload )
+    # ManufacturerCode is None if not manufacturer specific, raise struct.error if the payload is too short
+    fcf, = ZCL_FRAME_CONTROL.unpack_from( payload, offset )
+    offset += ZCL_FRAME_CONTROL.size
+    manufcode = None
+    if fcf & 0b00000100:
+        manufcode, = ZCL_MANUF_CODE.unpack_from( payload, offset )
+        manufcode = '%04x' %manufcode
+        offset += ZCL_MANUF_CODE.size
+    sqn, command = ZCL_SQN_COMMAND.unpack_from( payload, offset )
+    return ( fcf & 0b00000011 ) == 0, '%02x' %sqn, manufcode, command, offset + ZCL_SQN_COMMAND.size
+
+
+def decode_zcl_attribute_value( payload, offset, atttype ):
+    # ( Size, Data, next offset ) of a ZCL attribute value, None if the Data Type is not supported
+    # raise struct.error if the payload is too short
+    end = len( payload )
+    if atttype in ZCL_TYPE_SIZE:
+        size = ZCL_TYPE_SIZE[ atttype ]
+    elif atttype in ZCL_STRING_TYPES:
+        if offset >= end:
+            raise struct.error( "missing string length" )
+        size = payload[ offset ]
+        offset += 1
+    elif atttype == ZCL_STRUCTURE_TYPE:
+        offset += 2
+        size = end - offset
+    else:
+        return None
+
+    if size < 0 or offset + size > end:
+        raise struct.error( "truncated attribute value" )
+    value = payload[ offset: offset + size ]
+    if atttype in ZCL_SWAPPED_TYPES:
+        value = bytes( value )[::-1]
+    return '%04x' %size, hexlify( value ).decode('utf-8'), offset + size
+
+
+def decode_zcl_read_attribute_response( payload, offset ):
+    # Records of a ZCL Read Attributes Response ( 0x01 ), as decode_attribute_records() does for 0x8100.
+    # None if a Data Type is not supported, raise struct.error if the payload is truncated
+    records = []
+    end = len( payload )
+    while offset < end:
+        attribute, status = ZCL_ATTRIBUTE_ID_STATUS.unpack_from( payload, offset )
+        offset += ZCL_ATTRIBUTE_ID_STATUS.size
+        if status != 0x00:
+            records.append( ( '%04x' %attribute, '%02x' %status, '', '', '' ) )
+            continue
+        atttype = payload[ offset ] if offset < end else None
+        value = decode_zcl_attribute_value( payload, offset + 1, atttype ) if atttype is not None else None
+        if value is None:
+            return None
+        size, data, offset = value
+        records.append( ( '%04x' %attribute, '00', '%02x' %atttype, size, data ) )
+    return records
+
+
+def decode_zcl_report_attributes( payload, offset ):
+    # Records of a ZCL Report Attributes ( 0x0a ). Status is always '00'
+    # None if a Data Type is not supported, raise struct.error if the payload is truncated
+    records = []
+    end = len( payload )
+    while offset < end:
+        attribute, = ZCL_ATTRIBUTE_ID.unpack_from( payload, offset )
+        offset += ZCL_ATTRIBUTE_ID.size
+        atttype = payload[ offset ] if offset < end else None
+        value = decode_zcl_attribute_value( payload, offset + 1, atttype ) if atttype not in ( None, 0x00 ) else None
+        if value is None:
+            return None
+        size, data, offset = value
+        records.append( ( '%04x' %attribute, '00', '%02x' %atttype, size, data ) )
+    return records
+
+
+def decode_zcl_attribute_status( payload, offset, direction=False ):
+    # Write Attributes Response ( 0x04 ) and Configure Reporting Response ( 0x07, direction=True ).
+    # List of ( AttrID, Status ), AttrID is None when a single Status is given for all Attributes
+    # raise struct.error if the payload is truncated
+    if len( payload ) - offset == 1:
+        return [ ( None, '%02x' %payload[ offset ] ) ]
+    records = []
+    end = len( payload )
+    while offset < end:
+        if direction:
+            status, _, attribute = ZCL_STATUS_DIRECTION_ATTRIBUTE_ID.unpack_from( payload, offset )
+            offset += ZCL_STATUS_DIRECTION_ATTRIBUTE_ID.size
+        else:
+            status, attribute = ZCL_STATUS_ATTRIBUTE_ID.unpack_from( payload, offset )
+            offset += ZCL_STATUS_ATTRIBUTE_ID.size
+        records.append( ( '%04x' %attribute, '%02x' %status ) )
+    return records
@@ -22,7 +22,7 @@ from Modules.tools import mainPoweredDevice, getListOfEpForCluster, set_request_
 from Classes.LoggingManagement import LoggingManagement
 
 
-def send_zigatecmd_zcl_ack( self, address, cmd, datas ):
+def send_zigatecmd_zcl_ack( self, address, cmd, datas, priority=None ):
     # Send a ZCL command with ack
     # address can be a shortId or an IEEE
     ackIsDisabled = False
@@ -41,13 +41,13 @@ def send_zigatecmd_zcl_ack( self, address, cmd, datas ):
             ackIsDisabled = True
         if address in self.IEEE2NWK:
             _nwkid = self.IEEE2NWK[address]
-    isqn = send_zigatecmd_raw( self, cmd, address_mode + address + datas, ackIsDisabled = ackIsDisabled )
+    isqn = send_zigatecmd_raw( self, cmd, address_mode + address + datas, ackIsDisabled = ackIsDisabled, priority=priority )
     add_Last_Cmds( self, isqn, address_mode, address, cmd, datas)
     self.log.logging( "BasicOutput", 'Debug', "send_zigatecmd_zcl_ack - [%s] %s %s %s" %(isqn, cmd, address_mode, datas),_nwkid)
     return isqn
 
 
-def send_zigatecmd_zcl_noack( self, address, cmd, datas):
+def send_zigatecmd_zcl_noack( self, address, cmd, datas, priority=None):
     # Send a ZCL command with ack
     # address can be a shortId or an IEEE
     ackIsDisabled = True
@@ -68,22 +68,23 @@ def send_zigatecmd_zcl_noack( self, address, cmd, datas):
             ackIsDisabled = False
         if address in self.IEEE2NWK:
             _nwkid = self.IEEE2NWK[address]
-    isqn = send_zigatecmd_raw( self, cmd, address_mode + address + datas, ackIsDisabled = ackIsDisabled )
+    isqn = send_zigatecmd_raw( self, cmd, address_mode + address + datas, ackIsDisabled = ackIsDisabled, priority=priority )
     add_Last_Cmds( self, isqn, address_mode, address, cmd, datas)
     self.log.logging( "BasicOutput", 'Debug', "send_zigatecmd_zcl_noack - [%s] %s %s %s" %(isqn, cmd, address_mode, datas),_nwkid)
     return isqn
 
 
-def send_zigatecmd_raw( self, cmd, datas, ackIsDisabled = False ):
+def send_zigatecmd_raw( self, cmd, datas, ackIsDisabled = False, priority=None ):
     #
     # Send the cmd directly to ZiGate
+    # priority: Transport priority class, None to let the Transport decide ( command and calling context )
 
    if self.ZigateComm is None:
        self.log.logging( "BasicOutput", 'Error', "Zigate Communication error.", None,
             {'Error code': 'BOUTPUTS-CMDRAW-01'})
        return
 
-   i_sqn = self.ZigateComm.sendData( cmd, datas , ackIsDisabled )
+   i_sqn = self.ZigateComm.sendData( cmd, datas , ackIsDisabled, priority=priority )
    if self.pluginconf.pluginConf['debugzigateCmd']:
        self.log.logging( "BasicOutput", 'Log', "send_zigatecmd_raw       - [%s] %s %s Queue Length: %s / %s" %(i_sqn, cmd, datas, self.ZigateComm.loadTransmit(), len(self.ZigateComm.ListOfCommands)))
    else:
@@ -120,12 +121,13 @@ def add_Last_Cmds( self, isqn, address_mode, nwkid, cmd, datas):
      )
 
 
-def sendZigateCmd(self, cmd, datas , ackIsDisabled = False):
+def sendZigateCmd(self, cmd, datas , ackIsDisabled = False, priority=None):
     """
     sendZigateCmd will send command to Zigate by using the SendData method
     cmd : 4 hex (str) which correspond to the Zigate command
     datas : string of hex char 
     ackIsDisabled : If True, it means that usally a Ack is expected ( ZIGATE_COMMANDS), but here it has been disabled via Address Mode
+    priority : Transport priority class ( Classes.TransportScheduler ), None to let the Transport decide
 
     """
     if int(cmd,16) not in ZIGATE_COMMANDS:
@@ -145,17 +147,17 @@ def sendZigateCmd(self, cmd, datas , ackIsDisabled = False):
             return None
         if AddrMod == '01':
             # Group With Ack
-            return send_zigatecmd_raw( self, cmd, datas ) 
+            return send_zigatecmd_raw( self, cmd, datas, priority=priority ) 
 
         if AddrMod == '02':
             # Short with Ack
-            return send_zigatecmd_zcl_ack( self,NwkId, cmd, datas[6:] )   
+            return send_zigatecmd_zcl_ack( self,NwkId, cmd, datas[6:], priority=priority )   
 
         if AddrMod == '07':
             # Short No Ack
-            return send_zigatecmd_zcl_noack( self,NwkId, cmd, datas[6:] )
+            return send_zigatecmd_zcl_noack( self,NwkId, cmd, datas[6:], priority=priority )
 
-    return send_zigatecmd_raw( self, cmd, datas, ackIsDisabled )
+    return send_zigatecmd_raw( self, cmd, datas, ackIsDisabled, priority=priority )
 
 
 def send_zigate_mode( self, mode ):
@@ -517,7 +519,7 @@ def removeZigateDevice( self, IEEE ):
     return send_zigatecmd_raw(self, "0026", ParentAddr + ChildAddr )
 
 
-def raw_APS_request( self, targetaddr, dest_ep, cluster, profileId, payload, zigate_ep=ZIGATE_EP, ackIsDisabled = False ):
+def raw_APS_request( self, targetaddr, dest_ep, cluster, profileId, payload, zigate_ep=ZIGATE_EP, ackIsDisabled = False, priority=None ):
     # This function submits a request to send data to a remote node, with no restrictions
     # on the type of transmission, destination address, destination application profile,
     # destination cluster and destination endpoint number - these destination parameters
@@ -569,12 +571,12 @@ def raw_APS_request( self, targetaddr, dest_ep, cluster, profileId, payload, zig
     if self.pluginconf.pluginConf['ieeeForRawAps']:
         ieee = self.ListOfDevices[ targetaddr]['IEEE']
         if ackIsDisabled:
-            return send_zigatecmd_raw(self, "0530", '08' + ieee + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled )
-        return send_zigatecmd_raw(self, "0530", '03' + ieee + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled )
+            return send_zigatecmd_raw(self, "0530", '08' + ieee + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled, priority=priority )
+        return send_zigatecmd_raw(self, "0530", '03' + ieee + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled, priority=priority )
 
     if ackIsDisabled:
-        return send_zigatecmd_raw(self, "0530", '07' + targetaddr + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = ackIsDisabled)
-    return send_zigatecmd_raw(self, "0530", '02' + targetaddr + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled)
+        return send_zigatecmd_raw(self, "0530", '07' + targetaddr + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = ackIsDisabled, priority=priority)
+    return send_zigatecmd_raw(self, "0530", '02' + targetaddr + zigate_ep + dest_ep + cluster + profileId + security + radius + len_payload + payload, ackIsDisabled = overwrittenackIsDisabled, priority=priority)
 
 
 def read_attribute( self, addr ,EpIn , EpOut ,Cluster ,direction , manufacturer_spec , manufacturer , lenAttr, Attr, ackIsDisabled = True):
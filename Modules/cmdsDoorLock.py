@@ -13,6 +13,7 @@
 import Domoticz
 from Modules.zigateConsts import ZIGATE_EP
 from Modules.basicOutputs import raw_APS_request, get_and_inc_SQN
+from Classes.TransportScheduler import PRIORITY_INTERACTIVE
 
 
 def cluster0101_lock_door( self, NwkId):
@@ -35,7 +36,7 @@ def cluster0101_lock_door( self, NwkId):
     cluster_frame = '11'
     
     payload = cluster_frame + sqn + cmd
-    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP)
+    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP, priority=PRIORITY_INTERACTIVE)
 
 
 def cluster0101_unlock_door( self, NwkId):
@@ -57,7 +58,7 @@ def cluster0101_unlock_door( self, NwkId):
     cluster_frame = '11'
     
     payload = cluster_frame + sqn + cmd
-    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP)
+    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP, priority=PRIORITY_INTERACTIVE)
 
 def cluster0101_toggle_door( self, NwkId):
 
@@ -77,4 +78,4 @@ def cluster0101_toggle_door( self, NwkId):
     cluster_frame = '11'
 
     payload = cluster_frame + sqn + cmd
-    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP)
\ No newline at end of file
+    raw_APS_request( self, NwkId, '01', '0101', '0104', payload, zigate_ep=ZIGATE_EP, priority=PRIORITY_INTERACTIVE)
\ No newline at end of file
@@ -19,6 +19,13 @@ import pickle
 from Classes.LoggingManagement import LoggingManagement
 
 import Modules.tools
+from Modules.deviceListParser import parse_record, iter_records, split_record
+
+# Attributes which change on each heartbeat, they don't make a record dirty on their own
+DEVICELIST_VOLATILE_ATTRIBUTES = ( 'Heartbeat', )
+
+# Records not marked dirty which are checked at each write, for the changes made without mark_devicelist_dirty()
+DEVICELIST_AUDIT_RECORDS = 10
 
 
 def _copyfile( source, dest, move=True ):
@@ -53,6 +60,87 @@ def _versionFile( source , nbversion ):
         # Last one
         _copyfile( source, source +  "-%02d" %1 , move=False)
 
+def _atomic_write( filename, lines ):
+    # Write the file aside, then replace it, so a crash never leave a truncated file
+    _tmpfilename = filename + '.tmp'
+    with open( _tmpfilename, 'wt') as file:
+        file.writelines( lines )
+        file.flush()
+        os.fsync( file.fileno() )
+    os.replace( _tmpfilename, filename )
+
+def _journal_filename( self ):
+    return self.pluginconf.pluginConf['pluginData'] + self.DeviceListName[:-3] + 'journal'
+
+def _compact_devicelist( self, filename, lines ):
+    # Replace the DeviceList by a complete one and drop the journal.
+    # The journal is renamed aside before the DeviceList is replaced, so whatever the step a crash happens at,
+    # it is never replayed over a DeviceList which already contains it ( _recover_compaction )
+    _tmpfilename = filename + '.tmp'
+    _journalFileName = _journal_filename( self )
+    with open( _tmpfilename, 'wt') as file:
+        file.writelines( lines )
+        file.flush()
+        os.fsync( file.fileno() )
+    if os.path.isfile( _journalFileName ):
+        os.replace( _journalFileName, _journalFileName + '.old' )
+    os.replace( _tmpfilename, filename )
+    if os.path.isfile( _journalFileName + '.old' ):
+        os.remove( _journalFileName + '.old' )
+
+def _recover_compaction( self, filename ):
+    # Complete or discard a compaction interrupted by a crash, before the DeviceList is read
+    _tmpfilename = filename + '.tmp'
+    _asideFileName = _journal_filename( self ) + '.old'
+    if os.path.isfile( _asideFileName ):
+        if os.path.isfile( _tmpfilename ):
+            # Stopped before the DeviceList was replaced. The new one is complete ( written before the journal was moved aside )
+            os.replace( _tmpfilename, filename )
+        # The DeviceList contains the journal records
+        os.remove( _asideFileName )
+    elif os.path.isfile( _tmpfilename ):
+        # Stopped while writting the new DeviceList
+        os.remove( _tmpfilename )
+
+def _devicelist_fingerprint( record ):
+    # Digest of the record as written, only the digest of each record is kept in memory ( self.DeviceListWritten )
+    if not isinstance( record, dict ):
+        return hash( str( record ) )
+    return hash( str( { x: record[x] for x in record if x not in DEVICELIST_VOLATILE_ATTRIBUTES } ) )
+
+def mark_devicelist_dirty( self, key ):
+    # The record of key has changed, it is checked and journaled at the next WriteDeviceList
+    # Called with the plugin context, other objects sharing ListOfDevices rely on the audit of WriteDeviceList
+    dirty = getattr( self, 'DeviceListDirty', None )
+    if dirty is not None:
+        dirty.add( key )
+
+def _audited_records( self, keys ):
+    # Next DEVICELIST_AUDIT_RECORDS keys, round robin over ListOfDevices
+    if len( keys ) <= DEVICELIST_AUDIT_RECORDS:
+        return keys
+    start = self.DeviceListAudit % len( keys )
+    self.DeviceListAudit = start + DEVICELIST_AUDIT_RECORDS
+    return ( keys + keys )[ start: start + DEVICELIST_AUDIT_RECORDS ]
+
+def _read_journal( self, entries ):
+    # Replay the journal on top of the entries loaded from the DeviceList. Last record of a NwkId wins, None means removed
+    _journalFileName = _journal_filename( self )
+    if not os.path.isfile( _journalFileName ):
+        return False
+
+    with open( _journalFileName, 'r') as journal:
+        for line in journal:
+            if not line.endswith('\n') or ':' not in line:
+                # Partial record, the plugin stopped while writting it
+                continue
+            (key, val) = split_record( line )
+            if val.strip() == 'None':
+                entries.pop( key, None )
+            else:
+                entries[ key ] = val
+    return True
+
 def LoadDeviceList( self ):
     # Load DeviceList.txt into ListOfDevices
     #
@@ -61,42 +149,47 @@ def LoadDeviceList( self ):
     def loadTxtDatabase( self , dbName ):
 
         res = "Success"
+        _recover_compaction( self, dbName )
         with open( dbName , 'r') as myfile2:
             self.log.logging( "Database", 'Debug',  "Open : " + dbName )
-            nb = 0
-            for line in myfile2:
-                if not line.strip() :
-                    #Empty line
-                    continue
-                (key, val) = line.split(":",1)
-                key = key.replace(" ","")
-                key = key.replace("'","")
+            entries = dict( iter_records( myfile2 ) )
 
-                #if key in  ( 'ffff', '0000'): continue
-                if key in  ( 'ffff'): continue
+        if _read_journal( self, entries ):
+            # Compact now, so the DeviceList is complete again and can be versioned
+            _compact_devicelist( self, dbName, [ key + " : " + entries[ key ].strip() + "\n" for key in entries ] )
 
-                try:
-                    dlVal=eval(val)
-                except (SyntaxError, NameError, TypeError, ZeroDivisionError):
-                    Domoticz.Error("LoadDeviceList failed on %s" %val)
-                    continue
+        nb = 0
+        for key, val in entries.items():
+            #if key in  ( 'ffff', '0000'): continue
+            if key in  ( 'ffff'): continue
 
+            try:
+                dlVal = parse_record( val )
+            except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+                Domoticz.Error("LoadDeviceList failed on %s" %val)
+                continue
+
+            if not isinstance( dlVal, dict ):
+                Domoticz.Error("LoadDeviceList failed on %s" %val)
+                continue
+
+            if self.pluginconf.pluginConf['debugDatabase']:
                 self.log.logging( "Database", 'Debug', "LoadDeviceList - " +str(key) + " => dlVal " +str(dlVal) , key)
 
-                if not dlVal.get('Version') :
-                    if key == '0000': # Bug fixed in later version
-                        continue
-                    Domoticz.Error("LoadDeviceList - entry " +key +" not loaded - not Version 3 - " +str(dlVal) )
-                    res = "Failed"
+            if not dlVal.get('Version') :
+                if key == '0000': # Bug fixed in later version
                     continue
+                Domoticz.Error("LoadDeviceList - entry " +key +" not loaded - not Version 3 - " +str(dlVal) )
+                res = "Failed"
+                continue
 
-                if dlVal['Version'] != '3':
-                    Domoticz.Error("LoadDeviceList - entry " +key +" not loaded - not Version 3 - " +str(dlVal) )
-                    res = "Failed"
-                    continue
-                else:
-                    nb += 1
-                    CheckDeviceList( self, key, val )
+            if dlVal['Version'] != '3':
+                Domoticz.Error("LoadDeviceList - entry " +key +" not loaded - not Version 3 - " +str(dlVal) )
+                res = "Failed"
+                continue
+            else:
+                nb += 1
+                CheckDeviceList( self, key, dlVal )
 
         return res
 
@@ -107,13 +200,13 @@ def LoadDeviceList( self ):
         with open( dbName , 'rt') as handle:
             _listOfDevices = {}
             try:
-                _listOfDevices = json.load( handle, encoding=dict)
+                _listOfDevices = json.load( handle )
             except json.decoder.JSONDecodeError as e:
                 res = "Failed"
-                Domoticz.Error("loadJsonDatabase poorly-formed %s, not JSON: %s" %(self.pluginConf['filename'],e))
+                Domoticz.Error("loadJsonDatabase poorly-formed %s, not JSON: %s" %(dbName,e))
         
         for key in _listOfDevices:
-            CheckDeviceList( self, key, str(_listOfDevices[key]))
+            CheckDeviceList( self, key, _listOfDevices[key] )
 
         return res
 
@@ -150,6 +243,9 @@ def LoadDeviceList( self ):
 
     self.log.logging( "Database", 'Debug', "LoadDeviceList - DeviceList filename : " + _DeviceListFileName )
 
+    # Done once all entries are loaded, as it goes through the all ListOfDevices
+    check_and_update_ForceAckCommands( self)
+
     _versionFile( _DeviceListFileName , self.pluginconf.pluginConf['numDeviceListVersion'])
 
     # Keep the Size of the DeviceList in order to check changes
@@ -187,33 +283,72 @@ def LoadDeviceList( self ):
 
     return res
 
-def WriteDeviceList(self, count):
+def WriteDeviceList(self, count, compact=False):
+    # Only the records which have changed since the last write are appended to the journal. They are the ones marked by
+    # mark_devicelist_dirty(), the others are audited DEVICELIST_AUDIT_RECORDS at a time, so a write doesn't serialize them all.
+    # The DeviceList is fully rewritten ( compaction ) on the first write, on request, or when the journal gets bigger than the DeviceList
 
     if self.HBcount >= count :
 
         if self.pluginconf.pluginConf['pluginData'] is None or self.DeviceListName is None:
             Domoticz.Error("WriteDeviceList - self.pluginconf.pluginConf['pluginData']: %s , self.DeviceListName: %s" \
                 %(self.pluginconf.pluginConf['pluginData'], self.DeviceListName))
+            return
+
+        _DeviceListFileName = self.pluginconf.pluginConf['pluginData'] + self.DeviceListName
+        _journalFileName = _journal_filename( self )
+
+        # Collect the dirty records. Only the records marked dirty, the new ones and a few audited ones are checked,
+        # all of them when compacting
+        touched = set( self.DeviceListDirty )
+        self.DeviceListDirty.difference_update( touched )
+        keys = list( self.ListOfDevices )
+        removed = [ key for key in self.DeviceListWritten if key not in self.ListOfDevices ]
+
+        if not compact and self.DeviceListWritten and os.path.isfile( _journalFileName ) \
+                and os.path.getsize( _journalFileName ) > self.DeviceListSize:
+            compact = True
+        compact = compact or not self.DeviceListWritten
+
+        if compact:
+            checked = keys
+        else:
+            checked = set( _audited_records( self, keys ) )
+            checked.update( key for key in touched if key in self.ListOfDevices )
+            checked.update( key for key in keys if key not in self.DeviceListWritten )
+        fingerprints = { key: _devicelist_fingerprint( self.ListOfDevices[ key ] ) for key in checked }
+        dirty = [ key for key in fingerprints if self.DeviceListWritten.get( key ) != fingerprints[ key ] ]
+
+        if not compact and not dirty and not removed:
+            self.log.logging( "Database", 'Debug', "WriteDeviceList - nothing to flush")
+            self.HBcount=0
+            return
 
-        # Write in classic format ( .txt )
         try:
-            _DeviceListFileName = self.pluginconf.pluginConf['pluginData'] + self.DeviceListName
-            self.log.logging( "Database", 'Debug', "Write " + _DeviceListFileName + " = " + str(self.ListOfDevices))
-            with open( _DeviceListFileName , 'wt') as file:
-                for key in self.ListOfDevices :
-                    try:
-                        file.write(key + " : " + str(self.ListOfDevices[key]) + "\n")
-                    except IOError:
-                        Domoticz.Error("Error while writing to plugin Database %s" %_DeviceListFileName)
+            if compact:
+                self.log.logging( "Database", 'Debug', "WriteDeviceList - compact %s entries to %s" %(len(keys), _DeviceListFileName))
+                _compact_devicelist( self, _DeviceListFileName, [ key + " : " + str(self.ListOfDevices[key]) + "\n" for key in keys ] )
+                self.DeviceListSize = os.path.getsize( _DeviceListFileName )
+                self.DeviceListWritten = fingerprints
+            else:
+                self.log.logging( "Database", 'Debug', "WriteDeviceList - journal %s updated and %s removed entries" %(len(dirty), len(removed)))
+                with open( _journalFileName , 'at') as file:
+                    file.writelines( [ key + " : " + str(self.ListOfDevices[key]) + "\n" for key in dirty ] )
+                    file.writelines( [ key + " : None\n" for key in removed ] )
+                    file.flush()
+                    os.fsync( file.fileno() )
+                self.DeviceListWritten.update( ( key, fingerprints[ key ] ) for key in dirty )
+                for key in removed:
+                    del self.DeviceListWritten[ key ]
         except IOError:
-            Domoticz.Error("Error while Opening plugin Database %s" %_DeviceListFileName)
+            Domoticz.Error("Error while writing to plugin Database %s" %_DeviceListFileName)
+            self.DeviceListDirty.update( touched )
 
         # If enabled, write in JSON
         if self.pluginconf.pluginConf['expJsonDatabase']:
             _DeviceListFileName = self.pluginconf.pluginConf['pluginData'] + self.DeviceListName[:-3] + 'json'
             self.log.logging( "Database", 'Debug', "Write " + _DeviceListFileName + " = " + str(self.ListOfDevices))
-            with open( _DeviceListFileName , 'wt') as file:
-                json.dump( self.ListOfDevices, file, sort_keys=True, indent=2)
+            _atomic_write( _DeviceListFileName, [ json.dumps( self.ListOfDevices, sort_keys=True, indent=2) ] )
 
         self.HBcount=0
         self.log.logging( "Database", 'Debug', "WriteDeviceList - flush Plugin db to %s" %_DeviceListFileName)
@@ -298,10 +433,8 @@ def checkDevices2LOD( self, Devices):
     for nwkid in self.ListOfDevices:
         self.ListOfDevices[nwkid]['ConsistencyCheck'] = ''
         if self.ListOfDevices[nwkid]['Status'] == 'inDB':
-            for dev in Devices:
-                if Devices[dev].DeviceID == self.ListOfDevices[nwkid]['IEEE']:
-                    self.ListOfDevices[nwkid]['ConsistencyCheck'] = 'ok'
-                    break
+            if self.UnitIndex.unit( Devices, self.ListOfDevices[nwkid]['IEEE'] ) is not None:
+                self.ListOfDevices[nwkid]['ConsistencyCheck'] = 'ok'
             else:
                 self.ListOfDevices[nwkid]['ConsistencyCheck'] = 'not in DZ'
 
@@ -345,15 +478,90 @@ def saveZigateNetworkData( self, nkwdata ):
         except IOError:
             Domoticz.Error("Error while writing Zigate Network Details%s" %json_filename)
 
-def CheckDeviceList(self, key, val):
+# List of Attribnutes that will be Loaded from the deviceList-xx.txt database
+ZIGATE_ATTRIBUTES = (
+        'Version',
+        'ZDeviceName',
+        'Ep',
+        'IEEE',
+        'LogicalType',
+        'PowerSource',
+        'Neighbours',
+        'GroupMemberShip',
+        )
+
+MANDATORY_ATTRIBUTES = ( 'App Version', 
+        'Attributes List', 
+        'Bind', 
+        'WebBind',
+        'Capability',
+        'ColorInfos', 
+        'ClusterType', 
+        'ConfigSource',
+        'DeviceType', 
+        'Ep', 
+        'Epv2',
+        'ForceAckCommands',
+        'HW Version', 
+        'Heartbeat', 
+        'IAS',
+        'Location', 
+        'LogicalType', 
+        'MacCapa', 
+        'Manufacturer', 
+        'Manufacturer Name', 
+        'Model', 
+        'NbEp',
+        'OTA',
+        'PowerSource', 
+        'ProfileID', 
+        'ReceiveOnIdle', 
+        'Stack Version', 
+        'RIA', 
+        'SWBUILD_1', 
+        'SWBUILD_2', 
+        'SWBUILD_3', 
+        'Stack Version', 
+        'Status', 
+        'Type',
+        'Version', 
+        'ZCL Version', 
+        'ZDeviceID', 
+        'ZDeviceName',
+        )
+
+# List of Attributes whcih are going to be loaded, ut in case of Reset (resetPluginDS) they will be re-initialized.
+BUILD_ATTRIBUTES = (
+        'Battery', 
+        'GroupMemberShip',
+        'Neighbours',
+        'ConfigureReporting',
+        'ReadAttributes',
+        'WriteAttributes', 
+        'LQI',
+        'SQN', 
+        'Stamp', 
+        'Health',
+        'OTA-Transfer',
+        )
+
+MANUFACTURER_ATTRIBUTES = (
+        'Legrand', 'Schneider', 'Lumi', 'CASA.IA' )
+
+# Attributes loaded, depending on the kind of entry
+IMPORT_ZIGATE_ATTRIBUTES = tuple(set(ZIGATE_ATTRIBUTES))
+IMPORT_RESET_ATTRIBUTES = tuple(set(MANDATORY_ATTRIBUTES))
+IMPORT_FULL_ATTRIBUTES = tuple(set(MANDATORY_ATTRIBUTES + BUILD_ATTRIBUTES + MANUFACTURER_ATTRIBUTES))
+
+def CheckDeviceList(self, key, DeviceListVal):
     '''
-        This function is call during DeviceList load
+        This function is call during DeviceList load, with the record already parsed
     '''
 
     self.log.logging( "Database", 'Debug', "CheckDeviceList - Address search : " + str(key), key)
-    self.log.logging( "Database", 'Debug', "CheckDeviceList - with value : " + str(val), key)
+    if self.pluginconf.pluginConf['debugDatabase']:
+        self.log.logging( "Database", 'Debug', "CheckDeviceList - with value : " + str(DeviceListVal), key)
 
-    DeviceListVal=eval(val)
     # Do not load Devices in State == 'unknown' or 'left' 
     if 'Status' in DeviceListVal and DeviceListVal['Status'] in (
         'UNKNOW',
@@ -374,87 +582,18 @@ def CheckDeviceList(self, key, val):
 
     self.ListOfDevices[key]['RIA']="10"
 
-    # List of Attribnutes that will be Loaded from the deviceList-xx.txt database
-    ZIGATE_ATTRIBUTES = {
-            'Version',
-            'ZDeviceName',
-            'Ep',
-            'IEEE',
-            'LogicalType',
-            'PowerSource',
-            'Neighbours',
-            'GroupMemberShip',
-            }
-
-    MANDATORY_ATTRIBUTES = ( 'App Version', 
-            'Attributes List', 
-            'Bind', 
-            'WebBind',
-            'Capability',
-            'ColorInfos', 
-            'ClusterType', 
-            'ConfigSource',
-            'DeviceType', 
-            'Ep', 
-            'Epv2',
-            'ForceAckCommands',
-            'HW Version', 
-            'Heartbeat', 
-            'IAS',
-            'Location', 
-            'LogicalType', 
-            'MacCapa', 
-            'Manufacturer', 
-            'Manufacturer Name', 
-            'Model', 
-            'NbEp',
-            'OTA',
-            'PowerSource', 
-            'ProfileID', 
-            'ReceiveOnIdle', 
-            'Stack Version', 
-            'RIA', 
-            'SWBUILD_1', 
-            'SWBUILD_2', 
-            'SWBUILD_3', 
-            'Stack Version', 
-            'Status', 
-            'Type',
-            'Version', 
-            'ZCL Version', 
-            'ZDeviceID', 
-            'ZDeviceName',
-            )
-
-    # List of Attributes whcih are going to be loaded, ut in case of Reset (resetPluginDS) they will be re-initialized.
-    BUILD_ATTRIBUTES = (
-            'Battery', 
-            'GroupMemberShip',
-            'Neighbours',
-            'ConfigureReporting',
-            'ReadAttributes',
-            'WriteAttributes', 
-            'LQI',
-            'SQN', 
-            'Stamp', 
-            'Health',
-            )
-
-    MANUFACTURER_ATTRIBUTES = (
-            'Legrand', 'Schneider', 'Lumi', 'CASA.IA' )
-
     if self.pluginconf.pluginConf['resetPluginDS']:
         self.log.logging( "Database", 'Status', "Reset Build Attributes for %s" %DeviceListVal['IEEE'])
-        IMPORT_ATTRIBUTES = list(set(MANDATORY_ATTRIBUTES))
+        IMPORT_ATTRIBUTES = IMPORT_RESET_ATTRIBUTES
 
     elif key == '0000':
         # Reduce the number of Attributes loaded for Zigate
         self.log.logging( "Database", 'Debug', "CheckDeviceList - Zigate (IEEE)  = %s Load Zigate Attributes" %DeviceListVal['IEEE'])
-        IMPORT_ATTRIBUTES = list(set(ZIGATE_ATTRIBUTES))
+        IMPORT_ATTRIBUTES = IMPORT_ZIGATE_ATTRIBUTES
         self.log.logging( "Database", 'Debug', "--> Attributes loaded: %s" %IMPORT_ATTRIBUTES)
     else:
         self.log.logging( "Database", 'Debug', "CheckDeviceList - DeviceID (IEEE)  = %s Load Full Attributes" %DeviceListVal['IEEE'])
-        IMPORT_ATTRIBUTES = list(set(MANDATORY_ATTRIBUTES + BUILD_ATTRIBUTES + MANUFACTURER_ATTRIBUTES))
+        IMPORT_ATTRIBUTES = IMPORT_FULL_ATTRIBUTES
 
     self.log.logging( "Database", 'Debug', "--> Attributes loaded: %s" %IMPORT_ATTRIBUTES)
     for attribute in IMPORT_ATTRIBUTES:
@@ -486,8 +625,6 @@ def CheckDeviceList(self, key, val):
         else :
             self.log.logging( "Database", 'Debug', "CheckDeviceList - IEEE = " + str(DeviceListVal['IEEE']) + " for NWKID = " +str(key) , key )
 
-    check_and_update_ForceAckCommands( self)
-
 
 def check_and_update_ForceAckCommands( self ):
 
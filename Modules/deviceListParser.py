@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: deviceListParser.py
+
+    Description: Parse the records of DeviceList-xx.txt without eval()
+
+    Each line of the DeviceList is "NwkId : " followed by str() of a dictionary.
+    The record is rewritten into JSON (quotes, True/False/None) and decoded with
+    json.loads, which is done in C. The rewriting only uses str methods on the
+    segments found between the string literals, and a regular expression split
+    when some strings are double quoted or escaped. Records which cannot be
+    expressed in JSON (sets, non string keys, bytes, 1-tuples) are decoded with
+    ast.literal_eval, so the result is always the same as before, and no code is
+    ever executed.
+    Tuples ( 'Last Cmds' ) are carried through JSON as a single key object, turned
+    back into tuple by the object hook.
+
+"""
+
+import ast
+import json
+import re
+
+# Python string literals, as produced by repr()
+_STRING_LITERAL = re.compile( r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""", re.DOTALL )
+
+# Key of the object carrying a tuple. A NUL character can't be found in a DeviceList key
+_TUPLE_KEY = '\x00tuple'
+_TUPLE_OPEN = '{"\\u0000tuple":['
+_TUPLE_CLOSE = ']}'
+
+
+def _syntax_to_json( syntax ):
+    # syntax is the list of the text segments found between string literals
+    joined = '\x00'.join( syntax )
+    joined = joined.replace('True', 'true').replace('False', 'false').replace('None', 'null')
+    joined = joined.replace('(', _TUPLE_OPEN).replace(')', _TUPLE_CLOSE)
+    return joined.split('\x00')
+
+
+def _string_to_json( literal ):
+    if '\\' not in literal:
+        if literal[0] == '"':
+            return literal
+        if '"' not in literal:
+            return '"' + literal[1:-1] + '"'
+    # Escaped characters, let Python decode the literal and JSON encode it again
+    return json.dumps( ast.literal_eval( literal ), ensure_ascii=False )
+
+
+def _to_json( text ):
+    if '"' not in text and '\\' not in text:
+        # Every string is '...' without escape, splitting on "'" alternates syntax and string content
+        parts = text.split("'")
+        parts[0::2] = _syntax_to_json( parts[0::2] )
+        return '"'.join( parts )
+
+    parts = _STRING_LITERAL.split( text )
+    parts[0::2] = _syntax_to_json( parts[0::2] )
+    parts[1::2] = [ _string_to_json( literal ) for literal in parts[1::2] ]
+    return ''.join( parts )
+
+
+def _tuple_hook( obj ):
+    if _TUPLE_KEY in obj and len(obj) == 1:
+        return tuple( obj[ _TUPLE_KEY ] )
+    return obj
+
+
+def parse_record( text ):
+    # Return the Python object represented by text ( str() of a dict, list, str, ... ). Raise ValueError/SyntaxError when not a literal
+    try:
+        if '\x00' in text:
+            raise ValueError('NUL character')
+        converted = _to_json( text )
+        if _TUPLE_OPEN in converted:
+            return json.loads( converted, object_hook=_tuple_hook )
+        return json.loads( converted )
+    except ValueError:
+        return ast.literal_eval( text.strip() )
+
+
+def split_record( line ):
+    # Return ( NwkId, text of the record ) of a DeviceList line, or None for an empty line
+    if not line.strip():
+        return None
+    (key, val) = line.split(":", 1)
+    return key.replace(" ", "").replace("'", ""), val
+
+
+def iter_records( handle ):
+    # Stream the ( NwkId, text of the record ) of a DeviceList file
+    for line in handle:
+        record = split_record( line )
+        if record is not None:
+            yield record
@@ -201,6 +201,8 @@ def createDomoticzWidget( self, Devices, nwkid, ieee, ep, cType,
         Domoticz.Error("Domoticz widget creation failed. Check that Domoticz can Accept New Hardware [%s]" %myDev )
     else:
         self.ListOfDevices[nwkid]['Status'] = "inDB"
+        self.UnitIndex.add( Devices, unit )
+        self.UnitIndex.invalidate_widgets( nwkid )
         if ForceClusterType:
             self.ListOfDevices[nwkid]['Ep'][ep]['ClusterType'][str(ID)] = ForceClusterType
         else:
@@ -277,6 +279,7 @@ def CreateDomoDevice(self, Devices, NWKID):
 
         if 'ClusterType' not in self.ListOfDevices[NWKID]['Ep'][Ep]:
             self.ListOfDevices[NWKID]['Ep'][Ep]['ClusterType'] = {}
+            self.UnitIndex.invalidate_widgets( NWKID )
 
         if "Humi" in Type and "Temp" in Type and "Baro" in Type:
              # Detecteur temp + Hum + Baro
@@ -546,6 +549,8 @@ def CreateDomoDevice(self, Devices, NWKID):
                     self.ListOfDevices[NWKID]['Status'] = "failDB"
                     Domoticz.Error("Domoticz widget creation failed. %s" %(str(myDev)))
                 else:
+                    self.UnitIndex.add( Devices, unit )
+                    self.UnitIndex.invalidate_widgets( NWKID )
                     self.ListOfDevices[NWKID]['Ep'][Ep]['ClusterType'][str(ID)] = t
 
                 # Create the Status (Text) Widget to report Rotation angle
@@ -557,6 +562,8 @@ def CreateDomoDevice(self, Devices, NWKID):
                 if myDev.ID == -1 :
                     Domoticz.Error("Domoticz widget creation failed. %s" %(str(myDev)))
                 else:
+                    self.UnitIndex.add( Devices, unit )
+                    self.UnitIndex.invalidate_widgets( NWKID )
                     self.ListOfDevices[NWKID]['Ep'][Ep]['ClusterType'][str(ID)] = 'Text'
 
             if t == "Strength":
@@ -17,6 +17,7 @@ from Classes.LoggingManagement import LoggingManagement
 
 from Modules.zigateConsts import THERMOSTAT_MODE_2_LEVEL
 from Modules.widgets import SWITCH_LVL_MATRIX
+from Modules.tools import mark_devicelist_dirty
 
 def RetreiveWidgetTypeList( self, Devices, NwkId, DeviceUnit = None):
     """
@@ -25,6 +26,11 @@ def RetreiveWidgetTypeList( self, Devices, NwkId, DeviceUnit = None):
 
     """
 
+    if DeviceUnit is None:
+        ClusterTypeList = self.UnitIndex.widget_list( NwkId )
+        if ClusterTypeList is not None:
+            return ClusterTypeList
+
     # Let's retreive All Widgets entries for the entire entry.
     ClusterTypeList = []
     if DeviceUnit:
@@ -58,6 +64,8 @@ def RetreiveWidgetTypeList( self, Devices, NwkId, DeviceUnit = None):
                     WidgetType = self.ListOfDevices[NwkId]['Ep'][iterEp]['ClusterType'][WidgetId]
                     ClusterTypeList.append(  ( iterEp, WidgetId, WidgetType )  )
 
+    if DeviceUnit is None:
+        self.UnitIndex.set_widget_list( NwkId, ClusterTypeList )
     return ClusterTypeList
 
 def RetreiveSignalLvlBattery( self, NwkID):
@@ -116,11 +124,49 @@ def WidgetForDeviceId( self, NwkId, DeviceId):
 
     return WidgetType
 
+def WidgetTypeOfUnit( self, Devices, Unit ):
+    """
+    Return the WidgetType of a Domoticz Unit ( '' if not a plugin widget ), cached in the UnitIndex
+    """
+
+    WidgetType = self.UnitIndex.widget_type( Devices, Unit )
+    if WidgetType is None:
+        WidgetType = ''
+        Ieee = Devices[Unit].DeviceID
+        if Ieee in self.IEEE2NWK and self.IEEE2NWK[ Ieee ] in self.ListOfDevices:
+            WidgetType = WidgetForDeviceId( self, self.IEEE2NWK[ Ieee ], Devices[Unit].ID)
+        self.UnitIndex.set_widget_type( Devices, Unit, WidgetType )
+    return WidgetType
+
+def ResetDelay( self, WidgetType ):
+    """
+    Return the number of seconds after which a WidgetType set On is reset, 0 if never
+    """
+
+    if WidgetType in ('Motion', 'Vibration'):
+        return self.pluginconf.pluginConf['resetMotiondelay']
+
+    TimedOutSwitchButton = self.pluginconf.pluginConf['resetSwitchSelectorPushButton']
+    if TimedOutSwitchButton and WidgetType in SWITCH_LVL_MATRIX:
+        if 'ForceUpdate' in SWITCH_LVL_MATRIX[ WidgetType ] and SWITCH_LVL_MATRIX[ WidgetType ]['ForceUpdate']:
+            return TimedOutSwitchButton
+    return 0
+
+def scheduleResetDevice( self, Devices, Unit, lastupdate ):
+    """
+    Unit has been set On at lastupdate, register its reset in the ResetSchedule if needed
+    """
+
+    delay = ResetDelay( self, WidgetTypeOfUnit( self, Devices, Unit ) )
+    if delay > 0:
+        self.ResetSchedule.schedule( Unit, lastupdate + delay )
+
 def ResetDevice(self, Devices, ClusterType, HbCount):
     '''
-        Reset all Devices from the ClusterType Motion after 30s
+        Reset the Motion, Vibration and push button widgets after resetMotiondelay / resetSwitchSelectorPushButton
+        Deadlines are registered in self.ResetSchedule when the widget is set On, only the expired ones are processed.
     '''
-    def resetMotion( self, Devices, NwkId, WidgetType, unit, SignalLevel, BatteryLvl, now, lastupdate, TimedOut ):
+    def resetMotion( self, Devices, NwkId, WidgetType, unit ):
         if Devices[unit].nValue == 0 and Devices[unit].sValue == "Off":
             # Nothing to Reset
             return
@@ -129,18 +175,14 @@ def ResetDevice(self, Devices, ClusterType, HbCount):
             # Let's check if we have a Device TimeOut specified by end user
             if self.domoticzdb_DeviceStatus.retreiveTimeOut_Motion( Devices[unit].ID) > 0:
                 return
-        if (now - lastupdate) >= TimedOut:
-            self.log.logging( "Widget", "Debug", "Last update of the devices %s %s was %s ago" %( unit, WidgetType, (now - lastupdate)), NwkId)
-            #UpdateDevice_v2(self, Devices, unit, 0, "Off", BatteryLvl, SignalLevel)
-            Devices[unit].Update(nValue=0, sValue='Off')
+        self.log.logging( "Widget", "Debug", "Reset of the devices %s %s", NwkId, args=( unit, WidgetType))
+        #UpdateDevice_v2(self, Devices, unit, 0, "Off", BatteryLvl, SignalLevel)
+        Devices[unit].Update(nValue=0, sValue='Off')
 
-    def resetSwitchSelectorPushButton( self, Devices, NwkId, WidgetType, unit, SignalLevel, BatteryLvl, now, lastupdate, TimedOut ):
+    def resetSwitchSelectorPushButton( self, Devices, NwkId, WidgetType, unit ):
         if Devices[unit].nValue == 0:
             return
 
-        if (now - lastupdate) < TimedOut: 
-            return
-
         #Domoticz.Log("Options: %s" %Devices[unit].Options)
         LevelOffHidden = Devices[unit].Options['LevelOffHidden']
 
@@ -149,29 +191,39 @@ def ResetDevice(self, Devices, ClusterType, HbCount):
         if LevelOffHidden == 'false':
             sValue = '00'
 
-        self.log.logging( "Widget", "Debug", "Last update of the devices %s WidgetType: %s was %s ago" %( unit, WidgetType, (now - lastupdate)), NwkId) 
+        self.log.logging( "Widget", "Debug", "Reset of the devices %s WidgetType: %s", NwkId, args=( unit, WidgetType))
         #Domoticz.Log(" Update nValue: %s sValue: %s" %(nValue, sValue))
         Devices[unit].Update(nValue=nValue, sValue=sValue)
 
 
     #Begining
     now = time.time()
-    TimedOutMotion = self.pluginconf.pluginConf['resetMotiondelay']
-    TimedOutSwitchButton = self.pluginconf.pluginConf['resetSwitchSelectorPushButton']
-    for unit in Devices:
+    if not self.ResetSchedule.seeded:
+        # Widgets already On at startup
+        self.ResetSchedule.seeded = True
+        for unit in Devices:
+            if Devices[unit].nValue == 0 or Devices[unit].DeviceID not in self.IEEE2NWK:
+                continue
+            delay = ResetDelay( self, WidgetTypeOfUnit( self, Devices, unit ) )
+            if delay <= 0:
+                continue
+            LUpdate = Devices[unit].LastUpdate
+            try:
+                LUpdate = time.mktime(time.strptime(LUpdate, "%Y-%m-%d %H:%M:%S"))
+            except:
+                Domoticz.Error("Something wrong to decode Domoticz LastUpdate %s" %LUpdate)
+                continue
+            self.ResetSchedule.schedule( unit, LUpdate + delay )
+
+    for unit in self.ResetSchedule.expired( now ):
+        if unit not in Devices:
+            continue
 
         Ieee = Devices[unit].DeviceID
         if Ieee not in self.IEEE2NWK:
             # Unknown !
             continue
 
-        LUpdate = Devices[unit].LastUpdate
-        try:
-            LUpdate = time.mktime(time.strptime(LUpdate, "%Y-%m-%d %H:%M:%S"))
-        except:
-            Domoticz.Error("Something wrong to decode Domoticz LastUpdate %s" %LUpdate)
-            break
-
         # Look for the corresponding Widget
         NWKID = self.IEEE2NWK[Ieee]
 
@@ -179,21 +231,12 @@ def ResetDevice(self, Devices, ClusterType, HbCount):
             Domoticz.Error("ResetDevice " + str(NWKID) + " not found in " + str(self.ListOfDevices))
             continue
 
-        ID = Devices[unit].ID
-        WidgetType = ''        
-        WidgetType = WidgetForDeviceId( self, NWKID, ID)
-        if WidgetType == '':
-            continue
-
-        SignalLevel, BatteryLvl = RetreiveSignalLvlBattery( self, NWKID)
-
+        WidgetType = WidgetTypeOfUnit( self, Devices, unit )
         if WidgetType in ('Motion', 'Vibration'):
-            resetMotion( self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate, TimedOutMotion)
+            resetMotion( self, Devices, NWKID, WidgetType, unit )
 
-        elif TimedOutSwitchButton and WidgetType in SWITCH_LVL_MATRIX:
-            if 'ForceUpdate' in SWITCH_LVL_MATRIX[ WidgetType ]:
-                if SWITCH_LVL_MATRIX[ WidgetType ]['ForceUpdate']:
-                    resetSwitchSelectorPushButton( self, Devices, NWKID, WidgetType, unit, SignalLevel, BatteryLvl, now, LUpdate , TimedOutSwitchButton)
+        elif ResetDelay( self, WidgetType ) > 0:
+            resetSwitchSelectorPushButton( self, Devices, NWKID, WidgetType, unit )
 
 def UpdateDevice_v2(self, Devices, Unit, nValue, sValue, BatteryLvl, SignalLvl, Color_='', ForceUpdate_=False):
 
@@ -215,7 +258,8 @@ def UpdateDevice_v2(self, Devices, Unit, nValue, sValue, BatteryLvl, SignalLvl,
         ( Color_ !='' and Devices[Unit].Color != Color_) or \
         ForceUpdate_ or \
         Devices[Unit].BatteryLevel != int(BatteryLvl) or \
-        Devices[Unit].TimedOut:
+        Devices[Unit].TimedOut or \
+        ( self.UpdateCoalescer and self.UpdateCoalescer.is_pending( Unit ) ):
 
         if ( self.pluginconf.pluginConf['forceSwitchSelectorPushButton'] and ForceUpdate_ and \
                (Devices[Unit].nValue == int(nValue)) and (Devices[Unit].sValue == sValue) ):
@@ -232,10 +276,40 @@ def UpdateDevice_v2(self, Devices, Unit, nValue, sValue, BatteryLvl, SignalLvl,
         if self.pluginconf.pluginConf['logDeviceUpdate']:
             Domoticz.Log("UpdateDevice - (%15s) %s:%s" %( Devices[Unit].Name, nValue, sValue ))
         self.log.logging( "Widget", "Debug", "--->  [Unit: %s] %s:%s:%s %s:%s %s (%15s)" %( Unit, nValue, sValue, Color_, BatteryLvl, SignalLvl, ForceUpdate_, Devices[Unit].Name), self.IEEE2NWK[Devices[Unit].DeviceID])
+        if self.UpdateCoalescer and self.UpdateCoalescer.enabled():
+            if not ForceUpdate_ and coalesceUpdate( self, Devices, Unit, nValue, sValue, Color_, SignalLvl, BatteryLvl ):
+                return
+            self.UpdateCoalescer.immediate( Unit )
         if Color_:
             Devices[Unit].Update(nValue=int(nValue), sValue=str(sValue), Color=Color_, SignalLevel=int(SignalLvl), BatteryLevel=int(BatteryLvl), TimedOut=0)
         else:
             Devices[Unit].Update(nValue=int(nValue), sValue=str(sValue),               SignalLevel=int(SignalLvl), BatteryLevel=int(BatteryLvl), TimedOut=0)
+        if self.ResetSchedule and int(nValue) != 0:
+            scheduleResetDevice( self, Devices, Unit, time.time() )
+
+def RetreiveCurrentValues( self, Devices, Unit ):
+    """
+    Return ( nValue, sValue ) of Unit, including an update still pending in the UpdateCoalescer.
+    To be used by widgets built from several attributes ( Temp+Hum, Temp+Hum+Baro ).
+    """
+
+    if self.UpdateCoalescer:
+        pending = self.UpdateCoalescer.pending_values( Unit )
+        if pending is not None:
+            return pending
+    return ( Devices[Unit].nValue, Devices[Unit].sValue )
+
+def coalesceUpdate( self, Devices, Unit, nValue, sValue, Color_, SignalLvl, BatteryLvl ):
+    """
+    Hand over the update to the UpdateCoalescer if the WidgetType of Unit can be delayed.
+    Return True if the update has been delayed.
+    """
+
+    delay = self.UpdateCoalescer.delay( WidgetTypeOfUnit( self, Devices, Unit ) )
+    if delay <= 0:
+        return False
+    self.UpdateCoalescer.update( Unit, delay, nValue, sValue, Color_, SignalLvl, BatteryLvl )
+    return True
 
 def timedOutDevice( self, Devices, Unit=None, NwkId=None, MarkTimedOut=True):
  
@@ -257,20 +331,19 @@ def timedOutDevice( self, Devices, Unit=None, NwkId=None, MarkTimedOut=True):
             return
         _IEEE = self.ListOfDevices[NwkId]['IEEE']
         self.ListOfDevices[NwkId]['Health'] = 'TimedOut' if MarkTimedOut else 'Live'
-        for x in Devices:
-            if Devices[x].DeviceID == _IEEE:
-                _nValue = Devices[x].nValue
-                _sValue = Devices[x].sValue
-                _Unit = x
-                if Devices[_Unit].TimedOut:
-                    if MarkTimedOut:
-                        continue
-                    self.log.logging( "Widget", 'Debug', 'reset timedOutDevice unit %s nwkid: %s ' % (Devices[_Unit].Name, NwkId), NwkId, )
-                    Devices[_Unit].Update(nValue=_nValue, sValue=_sValue, TimedOut=0)
-                else:
-                    if MarkTimedOut:
-                        self.log.logging( "Widget", 'Debug', 'timedOutDevice unit %s nwkid: %s ' % (Devices[_Unit].Name, NwkId), NwkId, )
-                        Devices[_Unit].Update(nValue=_nValue, sValue=_sValue, TimedOut=1)
+        for x in self.UnitIndex.units( Devices, _IEEE ):
+            _nValue = Devices[x].nValue
+            _sValue = Devices[x].sValue
+            _Unit = x
+            if Devices[_Unit].TimedOut:
+                if MarkTimedOut:
+                    continue
+                self.log.logging( "Widget", 'Debug', 'reset timedOutDevice unit %s nwkid: %s ' % (Devices[_Unit].Name, NwkId), NwkId, )
+                Devices[_Unit].Update(nValue=_nValue, sValue=_sValue, TimedOut=0)
+            else:
+                if MarkTimedOut:
+                    self.log.logging( "Widget", 'Debug', 'timedOutDevice unit %s nwkid: %s ' % (Devices[_Unit].Name, NwkId), NwkId, )
+                    Devices[_Unit].Update(nValue=_nValue, sValue=_sValue, TimedOut=1)
 
 def lastSeenUpdate( self, Devices, Unit=None, NwkId=None):
 
@@ -315,18 +388,18 @@ def lastSeenUpdate( self, Devices, Unit=None, NwkId=None):
         #self.log.logging( "Widget", "Debug", "Update LastSeen for device %s" %NwkId, NwkId)
 
         self.ListOfDevices[NwkId]['Stamp']['LastSeen'] = int(time.time())
+        mark_devicelist_dirty( self, NwkId )
 
         _IEEE = self.ListOfDevices[NwkId]['IEEE']
         if (not self.VersionNewFashion and (self.DomoticzMajor < 4 or ( self.DomoticzMajor == 4 and self.DomoticzMinor < 10547))):
             self.log.logging( "Widget", "Debug", "Not the good Domoticz level for Touch %s %s %s" %(self.VersionNewFashion, self.DomoticzMajor, self.DomoticzMinor ), NwkId)
             return
-        for x in Devices:
-            if Devices[x].DeviceID == _IEEE:
-                self.log.logging( "Widget", "Debug2",  "Touch unit %s nwkid: %s " %( Devices[x].Name, NwkId ), NwkId)
-                if Devices[x].TimedOut:
-                    timedOutDevice( self, Devices, Unit=x, MarkTimedOut=0)
-                else:
-                    Devices[x].Touch()
+        for x in self.UnitIndex.units( Devices, _IEEE ):
+            self.log.logging( "Widget", "Debug2",  "Touch unit %s nwkid: %s ", NwkId, args=( Devices[x].Name, NwkId ))
+            if Devices[x].TimedOut:
+                timedOutDevice( self, Devices, Unit=x, MarkTimedOut=0)
+            else:
+                Devices[x].Touch()
 
 def GetType(self, Addr, Ep):
     Type = ""
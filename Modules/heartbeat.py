@@ -33,7 +33,8 @@ from Modules.casaia import pollingCasaia
 from Modules.philips import pollingPhilips
 from Modules.gledopto import pollingGledopto
 from Modules.lumi import setXiaomiVibrationSensitivity, pollingLumiPower
-from Modules.tools import removeNwkInList, mainPoweredDevice, ReArrangeMacCapaBasedOnModel, is_time_to_perform_work, getListOfEpForCluster
+from Modules.tools import removeNwkInList, mainPoweredDevice, ReArrangeMacCapaBasedOnModel, is_time_to_perform_work, getListOfEpForCluster, \
+    mark_devicelist_dirty
 from Modules.domoTools import timedOutDevice
 from Modules.zigateConsts import HEARTBEAT, MAX_LOAD_ZIGATE, CLUSTERS_LIST, LEGRAND_REMOTES, LEGRAND_REMOTE_SHUTTER, LEGRAND_REMOTE_SWITCHS, ZIGATE_EP
 from Modules.pairingProcess import processNotinDBDevices
@@ -187,6 +188,7 @@ def checkHealth( self, NwkId):
                     Domoticz.Error("Device Health - Nwkid: %s,Ieee: %s , Model: %s seems to be out of the network" \
                         %(NwkId, self.ListOfDevices[NwkId]['IEEE'], self.ListOfDevices[NwkId]['Model']))
                 self.ListOfDevices[NwkId]['Health'] = 'Not seen last 24hours'
+                mark_devicelist_dirty( self, NwkId )
 
         # If device flag as Not Reachable, don't do anything
         if 'Health' in self.ListOfDevices[NwkId]:
@@ -506,13 +508,12 @@ def processListOfDevices( self , Devices ):
                     self.log.logging( "Heartbeat", 'Debug', "processListOfDevices - Device: (%s) is in Status = 'Left' for %s HB" 
                             %( NWKID, self.ListOfDevices[NWKID]['Heartbeat']), NWKID)
                 # Let's check if the device still exist in Domoticz
-                for Unit in Devices:
-                    if self.ListOfDevices[NWKID]['IEEE'] == Devices[Unit].DeviceID:
-                        self.log.logging( "Heartbeat", 'Debug', "processListOfDevices - %s  is still connected cannot remove. NwkId: %s IEEE: %s " \
-                                %(Devices[Unit].Name, NWKID, self.ListOfDevices[NWKID]['IEEE']), NWKID)
-                        fnd = True
-                        break
-                else: #We browse the all Devices and didn't find any IEEE.
+                Unit = self.UnitIndex.unit( Devices, self.ListOfDevices[NWKID]['IEEE'] )
+                if Unit is not None:
+                    self.log.logging( "Heartbeat", 'Debug', "processListOfDevices - %s  is still connected cannot remove. NwkId: %s IEEE: %s " \
+                            %(Devices[Unit].Name, NWKID, self.ListOfDevices[NWKID]['IEEE']), NWKID)
+                    fnd = True
+                else: #No Domoticz Devices with that IEEE.
                     if 'IEEE' in self.ListOfDevices[NWKID]:
                         Domoticz.Log("processListOfDevices - No corresponding device in Domoticz for %s/%s" %( NWKID, str(self.ListOfDevices[NWKID]['IEEE'])))
                     else:
@@ -526,6 +527,8 @@ def processListOfDevices( self , Devices ):
                         del self.IEEE2NWK[self.ListOfDevices[NWKID]['IEEE']]
                     Domoticz.Status("processListOfDevices - Removing the entry %s from ListOfDevice" %(NWKID))
                     removeNwkInList( self, NWKID)
+                    if self.networkmap:
+                        self.networkmap.graph.remove( NWKID )
 
         elif status != "inDB" and status != "UNKNOW":
             # Discovery process 0x004d -> 0x0042 -> 0x8042 -> 0w0045 -> 0x8045 -> 0x0043 -> 0x8043
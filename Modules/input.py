@@ -66,7 +66,8 @@ from Modules.configureReporting import processConfigureReporting
 from Modules.schneider_wiser import schneider_wiser_registration, wiser_read_attribute_request
 from Modules.legrand_netatmo import rejoin_legrand_reset
 from Modules.errorCodes import DisplayStatusCode, ZCL_EXTENDED_ERROR_CODES
-from Modules.readClusters import ReadCluster
+from Modules.readClusters import ReadClusterRecords
+from Modules.attributeRecords import decode_attribute_header, decode_attribute_records, decode_attribute_report
 from Modules.zigateConsts import (
     ADDRESS_MODE,
     ZCL_CLUSTERS_LIST,
@@ -109,132 +110,159 @@ from Classes.AdminWidgets import AdminWidgets
 # from GroupMgtv2.GroupManagement import GroupsManagement
 from Classes.OTA import OTAManagement
 from Classes.NetworkMap import NetworkMap
+from Classes.ZigateFrame import ZigateFrame
+from Classes.ZclFrame import ZclGlobalFrame
 
 
 def ZigateRead(self, Devices, Data, TransportInfos=None):
 
     DECODERS = {
-        "0100": Decode0100,
-        "004d": Decode004D,
-        "8000": Decode8000_v2,
-        #"8001": Decode8001,
-        "8002": Decode8002,
-        "8003": Decode8003,
-        "8004": Decode8004,
-        "8005": Decode8005,
-        "8006": Decode8006,
-        "8007": Decode8007,
-        "8009": Decode8009,
-        "8010": Decode8010,
+        0x0100: Decode0100,
+        0x004d: Decode004D,
+        0x8000: Decode8000_v2,
+        #0x8001: Decode8001,
+        0x8002: Decode8002,
+        0x8003: Decode8003,
+        0x8004: Decode8004,
+        0x8005: Decode8005,
+        0x8006: Decode8006,
+        0x8007: Decode8007,
+        0x8009: Decode8009,
+        0x8010: Decode8010,
         #'8011': Decode8011,
-        "8012": Decode8012,
-        "8014": Decode8014,
-        "8015": Decode8015,
-        "8017": Decode8017,
-        "8024": Decode8024,
-        "8028": Decode8028,
-        "802b": Decode802B,
-        "802c": Decode802C,
-        "8030": Decode8030,
-        "8031": Decode8031,
-        "8035": Decode8035,
-        "8034": Decode8034,
-        "8040": Decode8040,
-        "8041": Decode8041,
-        "8042": Decode8042,
-        "8043": Decode8043,
-        "8044": Decode8044,
-        "8045": Decode8045,
-        "8046": Decode8046,
-        "8047": Decode8047,
-        "8048": Decode8048,
-        "8049": Decode8049,
-        "804a": Decode804A,
-        "804b": Decode804B,
-        "804e": Decode804E,
-        "8060": Decode8060,
-        "8061": Decode8061,
-        "8062": Decode8062,
-        "8063": Decode8063,
-        "8085": Decode8085,
-        "8095": Decode8095,
-        "80a6": Decode80A6,
-        "80a7": Decode80A7,
-        "8100": Decode8100,
-        "8101": Decode8101,
-        "8102": Decode8102,
-        "8110": Decode8110,
-        "8120": Decode8120,
-        "8140": Decode8140,
-        "8401": Decode8401,
-        "8501": Decode8501,
-        "8503": Decode8503,
-        "8701": Decode8701,
-        "8702": Decode8702,
-        "8806": Decode8806,
-        "8807": Decode8807,
-        "0300": Decode0300,
-        "0301": Decode0301,
-        "0302": Decode0302,
-        "0200": Decode0200,
-        "0201": Decode0201,
-        "0202": Decode0202,
-        "0203": Decode0203,
-        "0204": Decode0204,
-        "0205": Decode0205,
-        "0206": Decode0206,
-        "0207": Decode0207,
-        "0208": Decode0208,
-        "9999": Decode9999,
+        0x8012: Decode8012,
+        0x8014: Decode8014,
+        0x8015: Decode8015,
+        0x8017: Decode8017,
+        0x8024: Decode8024,
+        0x8028: Decode8028,
+        0x802b: Decode802B,
+        0x802c: Decode802C,
+        0x8030: Decode8030,
+        0x8031: Decode8031,
+        0x8035: Decode8035,
+        0x8034: Decode8034,
+        0x8040: Decode8040,
+        0x8041: Decode8041,
+        0x8042: Decode8042,
+        0x8043: Decode8043,
+        0x8044: Decode8044,
+        0x8045: Decode8045,
+        0x8046: Decode8046,
+        0x8047: Decode8047,
+        0x8048: Decode8048,
+        0x8049: Decode8049,
+        0x804a: Decode804A,
+        0x804b: Decode804B,
+        0x804e: Decode804E,
+        0x8060: Decode8060,
+        0x8061: Decode8061,
+        0x8062: Decode8062,
+        0x8063: Decode8063,
+        0x8085: Decode8085,
+        0x8095: Decode8095,
+        0x80a6: Decode80A6,
+        0x80a7: Decode80A7,
+        0x8100: Decode8100,
+        0x8101: Decode8101,
+        0x8102: Decode8102,
+        0x8110: Decode8110,
+        0x8120: Decode8120,
+        0x8140: Decode8140,
+        0x8401: Decode8401,
+        0x8501: Decode8501,
+        0x8503: Decode8503,
+        0x8701: Decode8701,
+        0x8702: Decode8702,
+        0x8806: Decode8806,
+        0x8807: Decode8807,
+        0x0300: Decode0300,
+        0x0301: Decode0301,
+        0x0302: Decode0302,
+        0x0200: Decode0200,
+        0x0201: Decode0201,
+        0x0202: Decode0202,
+        0x0203: Decode0203,
+        0x0204: Decode0204,
+        0x0205: Decode0205,
+        0x0206: Decode0206,
+        0x0207: Decode0207,
+        0x0208: Decode0208,
+        0x9999: Decode9999,
     }
 
+    # Decoders taking the binary payload of a ZigateFrame ( hex MsgData is accepted as well )
+    BINARY_DECODERS = ( 0x8100, 0x8102 )
+
     NOT_IMPLEMENTED = ("00d1", "8029", "80a0", "80a1", "80a2", "80a3", "80a4")
 
     # self.log.logging( "Input", 'Debug', "ZigateRead - decoded data : " + Data + " lenght : " + str(len(Data)) )
 
-    FrameStart = Data[0:2]
-    FrameStop = Data[len(Data) - 2 : len(Data)]
-    if FrameStart != "01" and FrameStop != "03":
-        Domoticz.Error(
-            "ZigateRead received a non-zigate frame Data : "
-            + Data
-            + " FS/FS = "
-            + FrameStart
-            + "/"
-            + FrameStop
-        )
+    if isinstance(Data, ZclGlobalFrame):
+        # ZCL Global Command of a raw APS frame ( 0x8002 ), already decoded by Transport
+        self.Ping["Nb Ticks"] = 0  # We receive a valid packet
+        if self.pluginconf.pluginConf["debugInput"]:
+            self.log.logging( "Input", "Debug", "ZigateRead - MsgType: %04x ( 8002 Command: %02x ), NwkId: %s Ep: %s Cluster: %s Records: %s, LQI: %s", args=(Data.msgtype, Data.command, Data.nwkid, Data.ep, Data.cluster, Data.records, Data.frame.lqi),)
+        DecodeZclGlobalFrame(self, Devices, Data)
         return
 
-    self.Ping["Nb Ticks"] = 0  # We receive a valid packet
-    MsgType = Data[2:6]
-    MsgType = MsgType.lower()
-    MsgLength = Data[6:10]
-    MsgCRC = Data[10:12]
+    if isinstance(Data, ZigateFrame):
+        # Binary frame from Transport. Header is already decoded, hex payload is built only for the Decoder
+        self.Ping["Nb Ticks"] = 0  # We receive a valid packet
+        MsgType = Data.msgtype
+        if len(Data) > 6:
+            MsgData = Data.payload if MsgType in BINARY_DECODERS else Data.payload_hex
+            MsgLQI = Data.lqi_hex
+        else:
+            MsgData = ""
+            MsgLQI = "00"
+
+        if self.pluginconf.pluginConf["debugInput"]:
+            self.log.logging( "Input", "Debug", "ZigateRead - MsgType: %04x, MsgLength: %04x, MsgCRC: %02x, Data: %s, LQI: %s", args=(MsgType, Data.length, Data.crc, Data.payload_hex, Data.lqi),)
 
-    if len(Data) > 12:
-        # We have Payload : data + rssi
-        MsgData = Data[12 : len(Data) - 4]
-        MsgLQI = Data[len(Data) - 4 : len(Data) - 2]
     else:
-        MsgData = ""
-        MsgLQI = "00"
+        # Legacy hex frame ( synthetized frames )
+        FrameStart = Data[0:2]
+        FrameStop = Data[len(Data) - 2 : len(Data)]
+        if FrameStart != "01" and FrameStop != "03":
+            Domoticz.Error(
+                "ZigateRead received a non-zigate frame Data : "
+                + Data
+                + " FS/FS = "
+                + FrameStart
+                + "/"
+                + FrameStop
+            )
+            return
+
+        self.Ping["Nb Ticks"] = 0  # We receive a valid packet
+        MsgType = int(Data[2:6], 16)
+        MsgLength = Data[6:10]
+        MsgCRC = Data[10:12]
+
+        if len(Data) > 12:
+            # We have Payload : data + rssi
+            MsgData = Data[12 : len(Data) - 4]
+            MsgLQI = Data[len(Data) - 4 : len(Data) - 2]
+        else:
+            MsgData = ""
+            MsgLQI = "00"
 
-    self.log.logging( "Input", "Debug", "ZigateRead - MsgType: %s, MsgLength: %s, MsgCRC: %s, Data: %s, LQI: %s"
-        % (MsgType, MsgLength, MsgCRC, MsgData, int(MsgLQI, 16)),)
+        self.log.logging( "Input", "Debug", "ZigateRead - MsgType: %04x, MsgLength: %s, MsgCRC: %s, Data: %s, LQI: %s", args=(MsgType, MsgLength, MsgCRC, MsgData, int(MsgLQI, 16)),)
 
     if MsgType in DECODERS:
         _decoding = DECODERS[MsgType]
         _decoding(self, Devices, MsgData, MsgLQI)
         return
 
-    if MsgType == "8011":
+    if MsgType == 0x8011:
         Decode8011(self, Devices, MsgData, MsgLQI, TransportInfos)
         return
-    if MsgType == "8001": # No LQI provided for 0x8001
+    if MsgType == 0x8001: # No LQI provided for 0x8001
         Decode8001( self,Devices, MsgData + MsgLQI, '00' )
         return
 
-    Domoticz.Error("ZigateRead - Decoder not found for %s" % (MsgType))
+    Domoticz.Error("ZigateRead - Decoder not found for %04x" % (MsgType))
 
 
 def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
@@ -263,8 +291,7 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode0100 - (Livolo) Read Attribute Request %s/%s Data %s"
-            % (MsgSrcAddr, MsgSrcEp, MsgData),
+            "Decode0100 - (Livolo) Read Attribute Request %s/%s Data %s", args=(MsgSrcAddr, MsgSrcEp, MsgData),
         )
         livolo_read_attribute_request(
             self, Devices, MsgSrcAddr, MsgSrcEp, MsgData[30:32]
@@ -278,8 +305,7 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
     MsgManufCode = MsgData[18:22]
     nbAttribute = MsgData[22:24]
 
-    self.log.logging(  "Input", "Debug", "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s"
-        % (MsgSqn,MsgSrcAddr,MsgSrcEp,MsgDstEp,MsgClusterId,MsgDirection,MsgManufSpec,MsgManufCode,nbAttribute,),)
+    self.log.logging(  "Input", "Debug", "Decode0100 - Mode: %s NwkId: %s SrcEP: %s DstEp: %s ClusterId: %s Direction: %s ManufSpec: %s ManufCode: %s nbAttribute: %s", args=(MsgSqn,MsgSrcAddr,MsgSrcEp,MsgDstEp,MsgClusterId,MsgDirection,MsgManufSpec,MsgManufCode,nbAttribute,),)
 
     manuf = manuf_name = model = ''
     if 'Model' in self.ListOfDevices[MsgSrcAddr ] and self.ListOfDevices[MsgSrcAddr ]['Model'] not in ( '', {} ):
@@ -293,8 +319,7 @@ def Decode0100(self, Devices, MsgData, MsgLQI):  # Read Attribute request
         Attribute = MsgData[idx : idx + 4]
         if MsgClusterId == "000a":
             # Cluster TimeServer
-            self.log.logging(  "Input", "Debug", "Decode0100 - Received Time Server Cluster %s/%s Idx: %s  Attribute: %s" 
-                %(MsgSrcAddr, MsgSrcEp,idx, Attribute))
+            self.log.logging(  "Input", "Debug", "Decode0100 - Received Time Server Cluster %s/%s Idx: %s  Attribute: %s", args=(MsgSrcAddr, MsgSrcEp,idx, Attribute))
             timeserver_read_attribute_request( self, MsgSqn, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgManufSpec, MsgManufCode, Attribute, )
 
         elif MsgClusterId == '0201' and ( manuf == '105e' or manuf_name == 'Schneider'):
@@ -482,16 +507,7 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
     self.log.logging( 
         "Input",
         "Debug",
-        "Reception Data indication, Source Address : "
-        + MsgSourceAddress
-        + " Destination Address : "
-        + MsgDestinationAddress
-        + " ProfilID : "
-        + MsgProfilID
-        + " ClusterID : "
-        + MsgClusterID
-        + " Message Payload : "
-        + MsgPayload,)
+        "Reception Data indication, Source Address : %s Destination Address : %s ProfilID : %s ClusterID : %s Message Payload : %s", args=(MsgSourceAddress, MsgDestinationAddress, MsgProfilID, MsgClusterID, MsgPayload,),)
 
     # Let's check if this is an Schneider related APS. In that case let's process
     srcnwkid = dstnwkid = None
@@ -521,8 +537,7 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
     updLQI(self, srcnwkid, MsgLQI)
 
     if MsgProfilID != "0104":
-        self.log.logging(  "RawAPS", "Debug","Decode8002 - NwkId: %s Ep: %s Cluster: %s Payload: %s"
-            % (srcnwkid, MsgSourcePoint, MsgClusterID, MsgPayload),)
+        self.log.logging(  "RawAPS", "Debug","Decode8002 - NwkId: %s Ep: %s Cluster: %s Payload: %s", args=(srcnwkid, MsgSourcePoint, MsgClusterID, MsgPayload),)
         return
 
     ( GlobalCommand, Sqn, ManufacturerCode, Command, Data, ) = retreive_cmd_payload_from_8002(MsgPayload)
@@ -534,11 +549,9 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
     updSQN(self, srcnwkid, Sqn)
 
     if GlobalCommand and int(Command, 16) in ZIGBEE_COMMAND_IDENTIFIER:
-            self.log.logging(  "RawAPS", "Debug","Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s (%33s) Data: %s"
-                % ( srcnwkid, MsgSourcePoint, MsgClusterID, GlobalCommand, Command, ZIGBEE_COMMAND_IDENTIFIER[int(Command, 16)], Data,),)
+            self.log.logging(  "RawAPS", "Debug","Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s (%33s) Data: %s", args=( srcnwkid, MsgSourcePoint, MsgClusterID, GlobalCommand, Command, ZIGBEE_COMMAND_IDENTIFIER[int(Command, 16)], Data,),)
     else:
-        self.log.logging(  "RawAPS",  "Debug", "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s"
-                % ( srcnwkid, MsgSourcePoint, MsgClusterID, GlobalCommand, Command, Data,),)
+        self.log.logging(  "RawAPS",  "Debug", "Decode8002 - NwkId: %s Ep: %s Cluster: %s GlobalCommand: %5s Command: %s Data: %s", args=( srcnwkid, MsgSourcePoint, MsgClusterID, GlobalCommand, Command, Data,),)
 
     updLQI(self, srcnwkid, MsgLQI)
 
@@ -550,8 +563,7 @@ def Decode8002(self, Devices, MsgData, MsgLQI):  # Data indication
 
         data = Sqn + MsgSourcePoint + MsgClusterID + cmd + direction + '000000' + srcnwkid
 
-        self.log.logging(  "RawAPS",  "Debug", "Decode8002 - Sqn: %s NwkId %s Ep %s Cluster %s Cmd %s Direction %s"
-                % ( Sqn, srcnwkid, MsgClusterID, MsgClusterID, cmd, direction,),)
+        self.log.logging(  "RawAPS",  "Debug", "Decode8002 - Sqn: %s NwkId %s Ep %s Cluster %s Cmd %s Direction %s", args=( Sqn, srcnwkid, MsgClusterID, MsgClusterID, cmd, direction,),)
         Decode80A7( self, Devices, data, MsgLQI)
         return
 
@@ -658,7 +670,7 @@ def Decode8006(self, Devices, MsgData, MsgLQI):  # Non “Factory new” Restart
 
 def Decode8007(self, Devices, MsgData, MsgLQI):  # “Factory new” Restart
 
-    self.log.logging( "Input", "Debug", "Decode8007 - MsgData: %s" % (MsgData))
+    self.log.logging( "Input", "Debug", "Decode8007 - MsgData: %s", args=(MsgData,))
 
     Status = MsgData[0:2]
     if Status == "00":
@@ -683,14 +695,7 @@ def Decode8009(self, Devices, MsgData, MsgLQI):  # Network State response (Firm
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8009: Network state - Address :"
-        + addr
-        + " extaddr :"
-        + extaddr
-        + " PanID : "
-        + PanID
-        + " Channel : "
-        + str(int(Channel, 16)),
+        "Decode8009: Network state - Address :%s extaddr :%s PanID : %s Channel : %s", args=(addr, extaddr, PanID, int(Channel, 16),),
     )
 
     if self.ZigateIEEE != extaddr:
@@ -768,7 +773,7 @@ def Decode8010(self, Devices, MsgData, MsgLQI):  # Reception Version list
     MajorVersNum = MsgData[0:4]
     InstaVersNum = MsgData[4:8]
     try:
-        self.log.logging( "Input", "Debug", "Decode8010 - Reception Version list : " + MsgData)
+        self.log.logging( "Input", "Debug", "Decode8010 - Reception Version list : %s", args=(MsgData,))
         if MajorVersNum == '0003':
           self.log.logging( "Input", "Status", "ZiGate Classic")
         elif MajorVersNum == '0004':
@@ -798,7 +803,7 @@ def Decode8010(self, Devices, MsgData, MsgLQI):  # Reception Version list
 def Decode8011(self, Devices, MsgData, MsgLQI, TransportInfos=None):
 
     # APP APS ACK
-    self.log.logging( "Input", "Debug2", "Decode8011 - APS ACK: %s" % MsgData)
+    self.log.logging( "Input", "Debug2", "Decode8011 - APS ACK: %s", args=(MsgData,))
     MsgLen = len(MsgData)
     MsgStatus = MsgData[0:2]
     MsgSrcAddr = MsgData[2:6]
@@ -869,7 +874,7 @@ def Decode8014(self, Devices, MsgData, MsgLQI):  # "Permit Join" status response
     Status = MsgData[0:2]
     timestamp = int(time.time())
 
-    self.log.logging( "Input", "Debug", "Decode8014 - Permit Join status: %s" % (Status == "01"), "ffff")
+    self.log.logging( "Input", "Debug", "Decode8014 - Permit Join status: %s", "ffff", args=(Status == "01",))
 
     if "Permit" not in self.Ping:
         self.Ping["Permit"] = None
@@ -910,22 +915,22 @@ def Decode8014(self, Devices, MsgData, MsgLQI):  # "Permit Join" status response
     self.log.logging( 
         "Input",
         "Debug",
-        "---> self.permitTojoin['Starttime']: %s" % self.permitTojoin["Starttime"],
-        "ffff",
+        "---> self.permitTojoin['Starttime']: %s",
+        "ffff", args=(self.permitTojoin["Starttime"],),
     )
     self.log.logging( 
         "Input",
         "Debug",
-        "---> self.permitTojoin['Duration'] : %s" % self.permitTojoin["Duration"],
-        "ffff",
+        "---> self.permitTojoin['Duration'] : %s",
+        "ffff", args=(self.permitTojoin["Duration"],),
     )
-    self.log.logging( "Input", "Debug", "---> Current time                  : %s" % timestamp, "ffff")
-    self.log.logging( "Input", "Debug", "---> self.Ping['Permit']  (prev)   : %s" % prev, "ffff")
+    self.log.logging( "Input", "Debug", "---> Current time                  : %s", "ffff", args=(timestamp,))
+    self.log.logging( "Input", "Debug", "---> self.Ping['Permit']  (prev)   : %s", "ffff", args=(prev,))
     self.log.logging( 
         "Input",
         "Debug",
-        "---> self.Ping['Permit']  (new )   : %s" % self.Ping["Permit"],
-        "ffff",
+        "---> self.Ping['Permit']  (new )   : %s",
+        "ffff", args=(self.Ping["Permit"],),
     )
 
     self.Ping["TimeStamp"] = int(time.time())
@@ -944,8 +949,7 @@ def Decode8017(self, Devices, MsgData, MsgLQI):  # Get Time
     self.log.logging( 
         "Input",
         "Debug",
-        "UTC time is: %s, Zigate Time is: %s with deviation of :%s "
-        % (UTCTime, ZigateTime, UTCTime - ZigateTime),
+        "UTC time is: %s, Zigate Time is: %s with deviation of :%s ", args=(UTCTime, ZigateTime, UTCTime - ZigateTime),
     )
     if abs(UTCTime - ZigateTime) > 5:  # If Deviation is more than 5 sec then reset Time
         setTimeServer(self)
@@ -1000,12 +1004,7 @@ def Decode8015(
                 self.log.logging( 
                     "Input",
                     "Debug",
-                    "Decode8015 : LQI set to "
-                    + str(self.ListOfDevices[saddr]["LQI"])
-                    + "/"
-                    + str(int(rssi, 16))
-                    + " for "
-                    + str(saddr),
+                    "Decode8015 : LQI set to %s/%s for %s", args=(self.ListOfDevices[saddr]["LQI"], int(rssi, 16), saddr,),
                 )
             else:
                 self.log.logging( 
@@ -1023,7 +1022,7 @@ def Decode8015(
                     + power
                     + " not found in ListOfDevices",
                 )
-    self.log.logging( "Input", "Debug", "Decode8015 - IEEE2NWK      : " + str(self.IEEE2NWK))
+    self.log.logging( "Input", "Debug", "Decode8015 - IEEE2NWK      : %s", args=(self.IEEE2NWK,))
 
 
 def Decode8024(self, Devices, MsgData, MsgLQI):  # Network joined / formed
@@ -1068,8 +1067,7 @@ def Decode8024(self, Devices, MsgData, MsgLQI):  # Network joined / formed
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8024 - uncomplete frame, MsgData: %s, Len: %s out of 24, data received: >%s<"
-            % (MsgData, MsgLen, MsgData),
+            "Decode8024 - uncomplete frame, MsgData: %s, Len: %s out of 24, data received: >%s<", args=(MsgData, MsgLen, MsgData),
         )
         return
 
@@ -1204,7 +1202,7 @@ def Decode802C(self, Devices, MsgData, MsgLQI):  # User Descriptor Response
 def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
 
     MsgLen = len(MsgData)
-    self.log.logging( "Input", "Debug", "Decode8030 - Msgdata: %s, MsgLen: %s" % (MsgData, MsgLen))
+    self.log.logging( "Input", "Debug", "Decode8030 - Msgdata: %s, MsgLen: %s", args=(MsgData, MsgLen))
 
     MsgSequenceNumber = MsgData[0:2]
     MsgDataStatus = MsgData[2:4]
@@ -1218,12 +1216,12 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
         MsgSrcAddr = MsgData[6:10]
         nwkid = MsgSrcAddr
         self.log.logging( "Input",
-            "Debug", "Decode8030 - Bind reponse for %s" % (MsgSrcAddr), MsgSrcAddr
+            "Debug", "Decode8030 - Bind reponse for %s", MsgSrcAddr, args=(MsgSrcAddr,)
         )
 
     elif int(MsgSrcAddrMode, 16) == ADDRESS_MODE["ieee"]:
         MsgSrcAddr = MsgData[6:14]
-        self.log.logging( "Input", "Debug", "Decode8030 - Bind reponse for %s" % (MsgSrcAddr))
+        self.log.logging( "Input", "Debug", "Decode8030 - Bind reponse for %s", args=(MsgSrcAddr,))
         if MsgSrcAddr not in self.IEEE2NWK:
             Domoticz.Error("Decode8030 - Do no find %s in IEEE2NWK" % MsgSrcAddr)
             return
@@ -1246,15 +1244,14 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8030 - Bind response, Device: %s Status: %s MsgSequenceNumber: 0x%s/%3s i_sqn: %s"
-        % (
+        "Decode8030 - Bind response, Device: %s Status: %s MsgSequenceNumber: 0x%s/%3s i_sqn: %s",
+        MsgSrcAddr, args=(
             MsgSrcAddr,
             MsgDataStatus,
             MsgSequenceNumber,
             int(MsgSequenceNumber, 16),
             i_sqn,
         ),
-        MsgSrcAddr,
     )
 
     if nwkid in self.ListOfDevices:
@@ -1281,9 +1278,8 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
                         self.log.logging( 
                             "Input",
                             "Debug",
-                            "Decode8030 - Set bind request to binded : nwkid %s ep: %s cluster: %s"
-                            % (nwkid, Ep, cluster),
-                            MsgSrcAddr,
+                            "Decode8030 - Set bind request to binded : nwkid %s ep: %s cluster: %s",
+                            MsgSrcAddr, args=(nwkid, Ep, cluster),
                         )
                         self.ListOfDevices[nwkid]["Bind"][Ep][cluster]["Stamp"] = int(
                             time.time()
@@ -1343,9 +1339,8 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
                             self.log.logging( 
                                 "Input",
                                 "Debug",
-                                "Decode8030 - Set WebBind request to binded : nwkid %s ep: %s cluster: %s destNwkid: %s"
-                                % (nwkid, Ep, cluster, destNwkid),
-                                MsgSrcAddr,
+                                "Decode8030 - Set WebBind request to binded : nwkid %s ep: %s cluster: %s destNwkid: %s",
+                                MsgSrcAddr, args=(nwkid, Ep, cluster, destNwkid),
                             )
                             self.ListOfDevices[nwkid]["WebBind"][Ep][cluster][
                                 destNwkid
@@ -1361,7 +1356,7 @@ def Decode8030(self, Devices, MsgData, MsgLQI):  # Bind response
 
 def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
     MsgLen = len(MsgData)
-    self.log.logging( "Input", "Debug", "Decode8031 - Msgdata: %s" % (MsgData))
+    self.log.logging( "Input", "Debug", "Decode8031 - Msgdata: %s", args=(MsgData,))
 
     MsgSequenceNumber = MsgData[0:2]
     MsgDataStatus = MsgData[2:4]
@@ -1373,10 +1368,10 @@ def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
     if int(MsgSrcAddrMode, 16) == ADDRESS_MODE["short"]:
         MsgSrcAddr = MsgData[6:10]
         nwkid = MsgSrcAddr
-        self.log.logging( "Input", "Debug", "Decode8031 - UnBind reponse for %s" % nwkid, nwkid)
+        self.log.logging( "Input", "Debug", "Decode8031 - UnBind reponse for %s", nwkid, args=(nwkid,))
     elif int(MsgSrcAddrMode, 16) == ADDRESS_MODE["ieee"]:
         MsgSrcAddr = MsgData[6:14]
-        self.log.logging( "Input", "Debug", "Decode8031 - UnBind reponse for %s" % (MsgSrcAddr))
+        self.log.logging( "Input", "Debug", "Decode8031 - UnBind reponse for %s", args=(MsgSrcAddr,))
         if MsgSrcAddr in self.IEEE2NWK:
             nwkid = self.IEEE2NWK[MsgSrcAddr]
             Domoticz.Error("Decode8031 - Do no find %s in IEEE2NWK" % MsgSrcAddr)
@@ -1389,18 +1384,16 @@ def Decode8031(self, Devices, MsgData, MsgLQI):  # Unbind response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8031 - UnBind response, Device: %s SQN: %s Status: %s"
-        % (MsgSrcAddr, MsgSequenceNumber, MsgDataStatus),
-        MsgSrcAddr,
+        "Decode8031 - UnBind response, Device: %s SQN: %s Status: %s",
+        MsgSrcAddr, args=(MsgSrcAddr, MsgSequenceNumber, MsgDataStatus),
     )
 
     if MsgDataStatus != "00":
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8031 - Unbind response SQN: %s status [%s] - %s"
-            % (MsgSequenceNumber, MsgDataStatus, DisplayStatusCode(MsgDataStatus)),
-            MsgSrcAddr,
+            "Decode8031 - Unbind response SQN: %s status [%s] - %s",
+            MsgSrcAddr, args=(MsgSequenceNumber, MsgDataStatus, DisplayStatusCode(MsgDataStatus)),
         )
 
 
@@ -1518,19 +1511,8 @@ def Decode8042(self, Devices, MsgData, MsgLQI):  # Node Descriptor response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8042 - Reception Node Descriptor for : "
-        + addr
-        + " SEQ : "
-        + sequence
-        + " Status : "
-        + status
-        + " manufacturer :"
-        + manufacturer
-        + " mac_capability : "
-        + str(mac_capability)
-        + " bit_field : "
-        + str(bit_field),
-        addr,
+        "Decode8042 - Reception Node Descriptor for : %s SEQ : %s Status : %s manufacturer :%s mac_capability : %s bit_field : %s",
+        addr, args=(addr, sequence, status, manufacturer, mac_capability, bit_field,),
     )
 
     if addr not in self.ListOfDevices:
@@ -1593,17 +1575,17 @@ def Decode8042(self, Devices, MsgData, MsgLQI):  # Node Descriptor response
     #    PowerSource = "Battery"
 
     self.log.logging( 
-        "Input", "Debug", "Decode8042 - Alternate PAN Coordinator = " + str(AltPAN), addr
+        "Input", "Debug", "Decode8042 - Alternate PAN Coordinator = %s", addr, args=(AltPAN,)
     )  # 1 if node is capable of becoming a PAN coordinator
     self.log.logging( 
-        "Input", "Debug", "Decode8042 - Receiver on Idle = " + str(ReceiveonIdle), addr
+        "Input", "Debug", "Decode8042 - Receiver on Idle = %s", addr, args=(ReceiveonIdle,)
     )  # 1 if the device does not disable its receiver to
     # conserve power during idle periods.
     self.log.logging( 
-        "Input", "Debug", "Decode8042 - Power Source = " + str(PowerSource), addr
+        "Input", "Debug", "Decode8042 - Power Source = %s", addr, args=(PowerSource,)
     )  # 1 if the current power source is mains power.
     self.log.logging( 
-        "Input", "Debug", "Decode8042 - Device type  = " + str(DeviceType), addr
+        "Input", "Debug", "Decode8042 - Device type  = %s", addr, args=(DeviceType,)
     )  # 1 if this node is a full function device (FFD).
 
     bit_fieldL = int(bit_field[2:4], 16)
@@ -1618,10 +1600,10 @@ def Decode8042(self, Devices, MsgData, MsgLQI):  # Node Descriptor response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8042 - bit_field = " + str(bit_fieldL) + " : " + str(bit_fieldH),
-        addr,
+        "Decode8042 - bit_field = %s : %s",
+        addr, args=(bit_fieldL, bit_fieldH,),
     )
-    self.log.logging( "Input", "Debug", "Decode8042 - Logical Type = " + str(LogicalType), addr)
+    self.log.logging( "Input", "Debug", "Decode8042 - Logical Type = %s", addr, args=(LogicalType,))
 
     if self.ListOfDevices[addr]["Status"] != "inDB":
         if (
@@ -1821,8 +1803,7 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
                 self.log.logging(
                     "Pairing",
                     "Debug",
-                    "[%s]    NEW OBJECT: %s we keep DeviceConf info"
-                    % ("-", MsgDataShAddr),
+                    "[%s]    NEW OBJECT: %s we keep DeviceConf info", args=("-", MsgDataShAddr),
                 )
 
             if MsgDataCluster in ZCL_CLUSTERS_LIST:
@@ -1903,9 +1884,8 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
                     self.log.logging(
                         "Input",
                         "Debug",
-                        "[%s]    NEW OBJECT: %s we keep DeviceConf info"
-                        % ("-", MsgDataShAddr),
-                        MsgDataShAddr,
+                        "[%s]    NEW OBJECT: %s we keep DeviceConf info",
+                        MsgDataShAddr, args=("-", MsgDataShAddr),
                     )
 
             if MsgDataCluster in ZCL_CLUSTERS_LIST:
@@ -1944,10 +1924,7 @@ def Decode8043(self, Devices, MsgData, MsgLQI):  # Reception Simple descriptor r
     self.log.logging(
         "Pairing",
         "Debug",
-        "Decode8043 - Processed "
-        + MsgDataShAddr
-        + " end results is : "
-        + str(self.ListOfDevices[MsgDataShAddr]),
+        "Decode8043 - Processed %s end results is : %s", args=(MsgDataShAddr, self.ListOfDevices[MsgDataShAddr],),
     )
 
 
@@ -1967,18 +1944,7 @@ def Decode8044(self, Devices, MsgData, MsgLQI):  # Power Descriptior response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8044 - SQNum = "
-        + SQNum
-        + " Status = "
-        + Status
-        + " Power mode = "
-        + power_mode
-        + " power_source = "
-        + power_source
-        + " current_power_source = "
-        + current_power_source
-        + " current_power_level = "
-        + current_power_level,
+        "Decode8044 - SQNum = %s Status = %s Power mode = %s power_source = %s current_power_source = %s current_power_level = %s", args=(SQNum, Status, power_mode, power_source, current_power_source, current_power_level,),
     )
 
 
@@ -1995,16 +1961,7 @@ def Decode8045(self, Devices, MsgData, MsgLQI):  # Reception Active endpoint res
     self.log.logging(
         "Pairing",
         "Debug",
-        "Decode8045 - Reception Active endpoint response : SQN : "
-        + MsgDataSQN
-        + ", Status "
-        + DisplayStatusCode(MsgDataStatus)
-        + ", short Addr "
-        + MsgDataShAddr
-        + ", List "
-        + MsgDataEpCount
-        + ", Ep list "
-        + MsgDataEPlist,
+        "Decode8045 - Reception Active endpoint response : SQN : %s, Status %s, short Addr %s, List %s, Ep list %s", args=(MsgDataSQN, DisplayStatusCode(MsgDataStatus), MsgDataShAddr, MsgDataEpCount, MsgDataEPlist,),
     )
 
     if self.pluginconf.pluginConf["capturePairingInfos"]:
@@ -2093,10 +2050,7 @@ def Decode8045(self, Devices, MsgData, MsgLQI):  # Reception Active endpoint res
     self.log.logging(
         "Pairing",
         "Debug",
-        "Decode8045 - Device : "
-        + str(MsgDataShAddr)
-        + " updated ListofDevices with "
-        + str(self.ListOfDevices[MsgDataShAddr]["Ep"]),
+        "Decode8045 - Device : %s updated ListofDevices with %s", args=(MsgDataShAddr, self.ListOfDevices[MsgDataShAddr]["Ep"],),
     )
 
 
@@ -2148,10 +2102,9 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
     MsgDataStatus = MsgData[16:18]
 
     devName = ""
-    for x in Devices:
-        if Devices[x].DeviceID == MsgExtAddress:
-            devName = Devices[x].Name
-            break
+    unit = self.UnitIndex.unit( Devices, MsgExtAddress )
+    if unit is not None:
+        devName = Devices[unit].Name
     self.adminWidgets.updateNotificationWidget(
         Devices, "Leave indication from %s for %s " % (MsgExtAddress, devName)
     )
@@ -2167,8 +2120,8 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
     self.log.logging( 
         "Input",
         "Debug",
-        "Leave indication from IEEE: %s , Status: %s " % (MsgExtAddress, MsgDataStatus),
-        sAddr,
+        "Leave indication from IEEE: %s , Status: %s ",
+        sAddr, args=(MsgExtAddress, MsgDataStatus),
     )
     if sAddr == "":
         self.log.logging( 
@@ -2229,7 +2182,7 @@ def Decode8048(self, Devices, MsgData, MsgLQI):  # Leave indication
 
 def Decode8049(self, Devices, MsgData, MsgLQI):  # E_SL_MSG_PERMIT_JOINING_RESPONSE
 
-    self.log.logging( "Input", "Debug", "Decode8049 - MsgData: %s" % MsgData)
+    self.log.logging( "Input", "Debug", "Decode8049 - MsgData: %s", args=(MsgData,))
     SQN = MsgData[0:2]
     Status = MsgData[2:4]
 
@@ -2491,52 +2444,36 @@ def Decode80A6(self, Devices, MsgData, MsgLQI):  # Scene Membership response
 
 
 # Reponses Attributs
-def Decode8100( self, Devices, MsgData, MsgLQI ):  # Read Attribute Response (in case there are several Attribute call several time rad_report_attributes)
+def Decode8100( self, Devices, MsgData, MsgLQI ):  # Read Attribute Response (all the Attributes of the frame are decoded, then handed over at once)
 
-    MsgSQN = MsgData[0:2]
+    payload = bytes.fromhex( MsgData ) if isinstance( MsgData, str ) else MsgData
+    try:
+        MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId = decode_attribute_header( payload )
+    except struct.error:
+        Domoticz.Error( "Decode8100 - Too short Read Attribute Response: %s" %binascii.hexlify( payload ).decode('utf-8'))
+        return
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
 
-    MsgSrcAddr = MsgData[2:6]
     timeStamped(self, MsgSrcAddr, 0x8100)
     loggingMessages(self, "8100", MsgSrcAddr, None, MsgLQI, MsgSQN)
     updLQI(self, MsgSrcAddr, MsgLQI)
-    MsgSrcEp = MsgData[6:8]
-    MsgClusterId = MsgData[8:12]
-    idx = 12
+
+    records, complete = decode_attribute_records( payload )
+    self.log.logging( 
+        "Input",
+        "Debug",
+        "Decode8100 - Read Attribute Response: [%s:%s] ClusterID: %s MsgSQN: %s, i_sqn: %s, Attributes ( AttributeID, Status, Type, Size, ClusterData ): %s", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgSQN, i_sqn, records, ), )
 
     try:
-        while idx < len(MsgData):
-            MsgAttrID = MsgAttStatus = MsgAttType = MsgAttSize = MsgClusterData = ""
-            MsgAttrID = MsgData[idx : idx + 4]
-            idx += 4
-            MsgAttStatus = MsgData[idx : idx + 2]
-            idx += 2
-            if MsgAttStatus == "00":
-                MsgAttType = MsgData[idx : idx + 2]
-                idx += 2
-                MsgAttSize = MsgData[idx : idx + 4]
-                idx += 4
-                size = int(MsgAttSize, 16) * 2
-                MsgClusterData = MsgData[idx : idx + size]
-                idx += size
-            else:
-                # If the frame is coming from firmware we get only one attribute at a time, with some dumy datas
-                if len(MsgData[idx:]) == 6:
-                    # crap, lets finish it
-                    # Domoticz.Log("Crap Data: %s len: %s" %(MsgData[idx:], len(MsgData[idx:])))
-                    idx += 6
-            self.log.logging( 
-                "Input",
-                "Debug",
-                "Decode8100 - idx: %s Read Attribute Response: [%s:%s] ClusterID: %s MsgSQN: %s, i_sqn: %s, AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
-                % ( idx, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgSQN, i_sqn, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ), MsgSrcAddr, )
-            NewMsgData = ( MsgSQN + MsgSrcAddr + MsgSrcEp + MsgClusterId + MsgAttrID + MsgAttStatus + MsgAttType + MsgAttSize + MsgClusterData )
-            read_report_attributes( self, Devices, "8100", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, )
+        if records:
+            read_report_attributes( self, Devices, "8100", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records )
+        if not complete:
+            raise ValueError( "truncated attribute record after %s attribute(s)" %len(records) )
 
     except Exception as e:
         Domoticz.Error(
             "Decode8100 - Catch error while decoding %s/%s cluster: %s MsgData: %s Error: %s"
-            % (MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgData, e))
+            % (MsgSrcAddr, MsgSrcEp, MsgClusterId, binascii.hexlify( payload ).decode('utf-8'), e))
 
     callbackDeviceAwake(self, MsgSrcAddr, MsgSrcEp, MsgClusterId)
 
@@ -2550,8 +2487,7 @@ def Decode8101(self, Devices, MsgData, MsgLQI):  # Default Response
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8101 - Default response - SQN: %s, EP: %s, ClusterID: %s , DataCommand: %s, - Status: [%s] %s"
-        % (
+        "Decode8101 - Default response - SQN: %s, EP: %s, ClusterID: %s , DataCommand: %s, - Status: [%s] %s", args=(
             MsgDataSQN,
             MsgDataEp,
             MsgClusterId,
@@ -2564,18 +2500,15 @@ def Decode8101(self, Devices, MsgData, MsgLQI):  # Default Response
 
 def Decode8102(self, Devices, MsgData, MsgLQI):  # Attribute Reports
 
-    MsgSQN = MsgData[0:2]
-    MsgSrcAddr = MsgData[2:6]
-    MsgSrcEp = MsgData[6:8]
-    MsgClusterId = MsgData[8:12]
-    MsgAttrID = MsgData[12:16]
-    MsgAttStatus = MsgData[16:18]
-    MsgAttType = MsgData[18:20]
-    MsgAttSize = MsgData[20:24]
-    MsgClusterData = MsgData[24 : len(MsgData)]
+    payload = bytes.fromhex( MsgData ) if isinstance( MsgData, str ) else MsgData
+    try:
+        MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId = decode_attribute_header( payload )
+        MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData = decode_attribute_report( payload )
+    except struct.error:
+        Domoticz.Error( "Decode8102 - Too short Attribute Report: %s" %binascii.hexlify( payload ).decode('utf-8'))
+        return
 
-    self.log.logging(  "Input", "Debug", "Decode8102 - Attribute Reports : [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
-        % ( MsgSrcAddr, MsgSrcEp, MsgSQN, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ), MsgSrcAddr, )
+    self.log.logging(  "Input", "Debug", "Decode8102 - Attribute Reports : [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, MsgSQN, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ), )
 
     if self.PluzzyFirmware:
         self.log.logging( "Input", "Log", "Patching payload:", MsgSrcAddr)
@@ -2596,55 +2529,80 @@ def Decode8102(self, Devices, MsgData, MsgLQI):  # Attribute Reports
         MsgAttType = _type
         MsgAttSize = _newsize
         MsgClusterData = _newdata
-        MsgData = ( MsgSQN + MsgSrcAddr + MsgSrcEp + MsgClusterId + MsgAttrID + MsgAttStatus + MsgAttType + MsgAttSize + MsgClusterData )
         pluzzyDecode8102( self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, MsgLQI, )
 
 
     timeStamped(self, MsgSrcAddr, 0x8102)
     loggingMessages(self, "8102", MsgSrcAddr, None, MsgLQI, MsgSQN)
     updLQI(self, MsgSrcAddr, MsgLQI)
-    read_report_attributes( self, Devices, "8102", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, )
+    read_report_attributes( self, Devices, "8102", MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, ( ( MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData ), ) )
     callbackDeviceAwake(self, MsgSrcAddr, MsgSrcEp, MsgClusterId)
 
 
-def read_report_attributes( self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ):
+def DecodeZclGlobalFrame( self, Devices, Frame ):
+    # ZCL Global Command received as raw APS ( 0x8002 ). Records are handed over as for the equivalent ZiGate message
+
+    MsgLQI = Frame.lqi_hex
+    if Frame.msgtype in ( 0x8100, 0x8102 ):
+        MsgType = "%04x" %Frame.msgtype
+        self.log.logging( "Input", "Debug", "DecodeZclGlobalFrame - %s : [%s:%s] ClusterID: %s MsgSQN: %s Attributes ( AttributeID, Status, Type, Size, ClusterData ): %s",
+            Frame.nwkid, args=( MsgType, Frame.nwkid, Frame.ep, Frame.cluster, Frame.sqn, Frame.records ), )
+        timeStamped(self, Frame.nwkid, Frame.msgtype)
+        loggingMessages(self, MsgType, Frame.nwkid, None, MsgLQI, Frame.sqn)
+        updLQI(self, Frame.nwkid, MsgLQI)
+        read_report_attributes( self, Devices, MsgType, Frame.sqn, Frame.nwkid, Frame.ep, Frame.cluster, Frame.records )
+        callbackDeviceAwake(self, Frame.nwkid, Frame.ep, Frame.cluster)
+
+    elif Frame.msgtype == 0x8110:
+        if not self.FirmwareVersion:
+            return
+        for MsgAttrID, MsgAttrStatus in Frame.records:
+            Decode8110_raw( self, Devices, Frame.sqn, Frame.nwkid, Frame.ep, Frame.cluster, MsgAttrStatus, MsgAttrID, MsgLQI, )
+
+    elif Frame.msgtype == 0x8120:
+        Decode8120_records( self, Devices, Frame.sqn, Frame.nwkid, Frame.ep, Frame.cluster, MsgLQI, Frame.records )
+
+
+def read_report_attributes( self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records ):
+    # records: ( MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData ) of one frame
 
     if DeviceExist(self, Devices, MsgSrcAddr):
         if ( self.pluginconf.pluginConf["debugLQI"] and self.ListOfDevices[MsgSrcAddr]["LQI"] <= self.pluginconf.pluginConf["debugLQI"] ):
-            if "ZDeviceName" in self.ListOfDevices[MsgSrcAddr]:
-                if self.ListOfDevices[MsgSrcAddr]["ZDeviceName"] not in [ "", {}, ]:
-                    self.log.logging(  "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)%s"
-                        % ( self.ListOfDevices[MsgSrcAddr]["LQI"], MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]["ZDeviceName"], ), )
+            for MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData in records:
+                if "ZDeviceName" in self.ListOfDevices[MsgSrcAddr]:
+                    if self.ListOfDevices[MsgSrcAddr]["ZDeviceName"] not in [ "", {}, ]:
+                        self.log.logging(  "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)%s"
+                            % ( self.ListOfDevices[MsgSrcAddr]["LQI"], MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]["ZDeviceName"], ), )
+                    else:
+                        self.log.logging(  "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)"
+                            % ( self.ListOfDevices[MsgSrcAddr]["LQI"], MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcAddr, MsgSrcEp, ), )
                 else:
-                    self.log.logging(  "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)"
+                    self.log.logging( "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)"
                         % ( self.ListOfDevices[MsgSrcAddr]["LQI"], MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcAddr, MsgSrcEp, ), )
-            else:
-                self.log.logging( "Input", "Log", "Decode8102 - LQI: %3s Received Cluster:%s Attribute: %4s Value: %4s from (%4s/%2s)"
-                    % ( self.ListOfDevices[MsgSrcAddr]["LQI"], MsgClusterId, MsgAttrID, MsgClusterData, MsgSrcAddr, MsgSrcEp, ), )
 
-        self.log.logging(  "Input", "Debug2", "Decode8102 : Attribute Report from " + str(MsgSrcAddr) + " SQN = " + str(MsgSQN) + " ClusterID = " + str(MsgClusterId)+ " AttrID = "
-                + str(MsgAttrID)+ " Attribute Data = "+ str(MsgClusterData),MsgSrcAddr,)
+        self.log.logging(  "Input", "Debug2", "Decode8102 : Attribute Report from %s SQN = %s ClusterID = %s Attributes = %s",MsgSrcAddr, args=(MsgSrcAddr, MsgSQN, MsgClusterId, records,),)
 
         if "Health" in self.ListOfDevices[MsgSrcAddr]:
             self.ListOfDevices[MsgSrcAddr]["Health"] = "Live"
 
         updSQN(self, MsgSrcAddr, str(MsgSQN))
         lastSeenUpdate(self, Devices, NwkId=MsgSrcAddr)
-        ReadCluster( self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, Source=MsgType )
+        ReadClusterRecords( self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records, Source=MsgType )
         return
 
     # This device is unknown, and we don't have the IEEE to check if there is a device coming with a new sAddr
     # Will request in the next hearbeat to for a IEEE request
     ieee = lookupForIEEE(self, MsgSrcAddr, True)
     if ieee:
-        self.log.logging(  "Input", "Debug", "Found IEEE for short address: %s is %s" % (MsgSrcAddr, ieee) )
+        self.log.logging(  "Input", "Debug", "Found IEEE for short address: %s is %s", args=(MsgSrcAddr, ieee) )
         if MsgSrcAddr in self.UnknownDevices:
             self.UnknownDevices.remove(MsgSrcAddr)
     else:
         # If we didn't find it, let's trigger a NetworkMap scan if not one in progress
         unknown_device_nwkid(self, MsgSrcAddr)
-        self.log.logging(  "Input", "Log", "Decode8102 - Receiving a message from unknown device : [%s:%s] ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
-            % ( MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ), MsgSrcAddr, )
+        for MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData in records:
+            self.log.logging(  "Input", "Log", "Decode8102 - Receiving a message from unknown device : [%s:%s] ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
+                % ( MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData, ), MsgSrcAddr, )
 
 
 def Decode8110(self, Devices, MsgData, MsgLQI):
@@ -2676,9 +2634,8 @@ def Decode8110(self, Devices, MsgData, MsgLQI):
 def Decode8110_raw( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrStatus, MsgAttrID, MsgLQI, ):  # Write Attribute response
 
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    self.log.logging(  "Input", "Debug", "Decode8110 - WriteAttributeResponse - MsgSQN: %s,  MsgSrcAddr: %s, MsgSrcEp: %s, MsgClusterId: %s MsgAttrID: %s Status: %s"
-        % (MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus),
-        MsgSrcAddr,
+    self.log.logging(  "Input", "Debug", "Decode8110 - WriteAttributeResponse - MsgSQN: %s,  MsgSrcAddr: %s, MsgSrcEp: %s, MsgClusterId: %s MsgAttrID: %s Status: %s",
+        MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus),
     )
 
     timeStamped(self, MsgSrcAddr, 0x8110)
@@ -2699,13 +2656,13 @@ def Decode8110_raw( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, M
     # We got a global status for all attributes requested in this command
     # We need to find the Attributes related to the i_sqn
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    self.log.logging( "Input", "Debug", "------- - i_sqn: %0s e_sqn: %s" % (i_sqn, MsgSQN))
+    self.log.logging( "Input", "Debug", "------- - i_sqn: %0s e_sqn: %s", args=(i_sqn, MsgSQN))
 
     for matchAttributeId in list( get_list_isqn_attr_datastruct( self, "WriteAttributes", MsgSrcAddr, MsgSrcEp, MsgClusterId ) ):
         if ( get_isqn_datastruct( self, "WriteAttributes", MsgSrcAddr, MsgSrcEp, MsgClusterId, matchAttributeId, ) != i_sqn ):
             continue
 
-        self.log.logging(  "Input", "Debug", "------- - Sqn matches for Attribute: %s" % matchAttributeId )
+        self.log.logging(  "Input", "Debug", "------- - Sqn matches for Attribute: %s", args=(matchAttributeId,) )
         set_status_datastruct(self,"WriteAttributes",MsgSrcAddr,MsgSrcEp,MsgClusterId,matchAttributeId,MsgAttrStatus,)
         set_request_phase_datastruct( self, "WriteAttributes", MsgSrcAddr, MsgSrcEp, MsgClusterId, matchAttributeId, "fullfilled", )
         if MsgAttrStatus != "00":
@@ -2718,13 +2675,28 @@ def Decode8110_raw( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, M
 
 def Decode8120(self, Devices, MsgData, MsgLQI):  # Configure Reporting response
 
-    self.log.logging(  "Input", "Debug", "Decode8120 - Configure reporting response : %s" % MsgData )
+    self.log.logging(  "Input", "Debug", "Decode8120 - Configure reporting response : %s", args=(MsgData,) )
     if len(MsgData) < 14:
         Domoticz.Error("Decode8120 - uncomplet message %s " % MsgData)
         return
 
     MsgSQN = MsgData[0:2]
     MsgSrcAddr = MsgData[2:6]
+    MsgSrcEp = MsgData[6:8]
+    MsgClusterId = MsgData[8:12]
+
+    if len(MsgData) == 14:
+        # Global answer. Need i_sqn to get match
+        records = [ ( None, MsgData[12:14] ) ]
+    else:
+        records = [ ( MsgData[idx : idx + 4], MsgData[idx + 4 : idx + 6] ) for idx in range( 12, len(MsgData), 8 ) ]
+
+    Decode8120_records( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgLQI, records )
+
+
+def Decode8120_records( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgLQI, records ):
+    # records: ( MsgAttributeId, MsgStatus ), MsgAttributeId is None for a global Status
+
     if MsgSrcAddr not in self.ListOfDevices:
         Domoticz.Error( "Decode8120 - receiving Configure reporting response from unknow  %s" % MsgSrcAddr )
         return
@@ -2734,28 +2706,14 @@ def Decode8120(self, Devices, MsgData, MsgLQI):  # Configure Reporting response
     updLQI(self, MsgSrcAddr, MsgLQI)
     lastSeenUpdate(self, Devices, NwkId=MsgSrcAddr)
 
-    MsgSrcEp = MsgData[6:8]
-    MsgClusterId = MsgData[8:12]
-
-    if len(MsgData) == 14:
-        # Global answer. Need i_sqn to get match
-        MsgStatus = MsgData[12:14]
-        Decode8120_attribute( self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, None, MsgStatus )
-    else:
-        idx = 12
-        while idx < len(MsgData):
-            MsgAttributeId = MsgData[idx : idx + 4]
-            idx += 4
-            MsgStatus = MsgData[idx : idx + 2]
-            idx += 4
-            Decode8120_attribute( self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus, )
+    for MsgAttributeId, MsgStatus in records:
+        Decode8120_attribute( self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus, )
 
 
 def Decode8120_attribute( self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus ):
 
-    self.log.logging(  "Input", "Debug", "--> SQN: [%s], SrcAddr: %s, SrcEP: %s, ClusterID: %s, Attribute: %s Status: %s"
-        % (MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus),
-        MsgSrcAddr,
+    self.log.logging(  "Input", "Debug", "--> SQN: [%s], SrcAddr: %s, SrcEP: %s, ClusterID: %s, Attribute: %s Status: %s",
+        MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttributeId, MsgStatus),
     )
 
     if ( self.FirmwareVersion and int(self.FirmwareVersion, 16) >= int("31d", 16) and MsgAttributeId ):
@@ -2770,13 +2728,13 @@ def Decode8120_attribute( self, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     # We got a global status for all attributes requested in this command
     # We need to find the Attributes related to the i_sqn
     i_sqn = sqn_get_internal_sqn_from_app_sqn(self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    self.log.logging( "Input", "Debug", "------- - i_sqn: %0s e_sqn: %s" % (i_sqn, MsgSQN))
+    self.log.logging( "Input", "Debug", "------- - i_sqn: %0s e_sqn: %s", args=(i_sqn, MsgSQN))
 
     for matchAttributeId in list( get_list_isqn_attr_datastruct( self, "ConfigureReporting", MsgSrcAddr, MsgSrcEp, MsgClusterId ) ):
         if ( get_isqn_datastruct( self, "ConfigureReporting", MsgSrcAddr, MsgSrcEp, MsgClusterId, matchAttributeId, ) != i_sqn ):
             continue
 
-        self.log.logging(  "Input", "Debug", "------- - Sqn matches for Attribute: %s" % matchAttributeId )
+        self.log.logging(  "Input", "Debug", "------- - Sqn matches for Attribute: %s", args=(matchAttributeId,) )
         set_status_datastruct( self, "ConfigureReporting", MsgSrcAddr, MsgSrcEp, MsgClusterId, matchAttributeId, MsgStatus, )
         if MsgStatus != "00":
             self.log.logging( "Input", "Log", "Decode8120 - Configure Reporting response - ClusterID: %s/%s, MsgSrcAddr: %s, MsgSrcEp:%s , Status: %s"
@@ -2798,9 +2756,8 @@ def Decode8140(self, Devices, MsgData, MsgLQI):  # Attribute Discovery response
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8140 - Attribute Discovery Response - %s/%s - Cluster: %s - Attribute: %s - Attribute Type: %s Complete: %s"
-            % (MsgSrcAddr, MsgSrcEp, MsgClusterID, MsgAttID, MsgAttType, MsgComplete),
-            MsgSrcAddr,
+            "Decode8140 - Attribute Discovery Response - %s/%s - Cluster: %s - Attribute: %s - Attribute Type: %s Complete: %s",
+            MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterID, MsgAttID, MsgAttType, MsgComplete),
         )
 
         if MsgSrcAddr not in self.ListOfDevices:
@@ -2873,7 +2830,7 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8401 - Reception Zone status change notification : " + MsgData,
+        "Decode8401 - Reception Zone status change notification : %s", args=(MsgData,),
     )
     MsgSQN = MsgData[0:2]  # sequence number: uint8_t
     MsgEp = MsgData[2:4]  # endpoint : uint8_t
@@ -2937,8 +2894,8 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8401 - MsgSQN: %s MsgSrcAddr: %s MsgEp:%s MsgClusterId: %s MsgZoneStatus: %s MsgExtStatus: %s MsgZoneID: %s MsgDelay: %s"
-        % (
+        "Decode8401 - MsgSQN: %s MsgSrcAddr: %s MsgEp:%s MsgClusterId: %s MsgZoneStatus: %s MsgExtStatus: %s MsgZoneID: %s MsgDelay: %s",
+        MsgSrcAddr, args=(
             MsgSQN,
             MsgSrcAddr,
             MsgEp,
@@ -2948,7 +2905,6 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
             MsgZoneID,
             MsgDelay,
         ),
-        MsgSrcAddr,
     )
 
     if Model == "PST03A-v2.2.5":
@@ -2968,8 +2924,8 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8401 - PST03A-v2.2.5 door/windows status : " + value,
-                MsgSrcAddr,
+                "Decode8401 - PST03A-v2.2.5 door/windows status : %s",
+                MsgSrcAddr, args=(value,),
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEp, "0500", value)
             # Nota : tamper alarm on EP 2 are discarded
@@ -3000,8 +2956,8 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8401 - PST03A-v2.2.5, unknow EndPoint : " + MsgEp,
-                MsgSrcAddr,
+                "Decode8401 - PST03A-v2.2.5, unknow EndPoint : %s",
+                MsgSrcAddr, args=(MsgEp,),
             )
     else:  ## default
 
@@ -3039,14 +2995,13 @@ def Decode8401( self, Devices, MsgData, MsgLQI ):  # Reception Zone status chang
         self.log.logging( 
             "Input",
             "Debug",
-            "IAS Zone for device:%s  - alarm1: %s, alaram2: %s, tamper: %s, battery: %s, Support Reporting: %s, restore Reporting: %s, trouble: %s, acmain: %s, test: %s, battdef: %s"
-            % ( MsgSrcAddr, alarm1, alarm2, tamper, battery, suprrprt, restrprt, trouble, acmain, test, battdef, ), MsgSrcAddr, )
+            "IAS Zone for device:%s  - alarm1: %s, alaram2: %s, tamper: %s, battery: %s, Support Reporting: %s, restore Reporting: %s, trouble: %s, acmain: %s, test: %s, battdef: %s", MsgSrcAddr, args=( MsgSrcAddr, alarm1, alarm2, tamper, battery, suprrprt, restrprt, trouble, acmain, test, battdef, ), )
 
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8401 MsgZoneStatus: %s " % MsgZoneStatus[2:4],
-            MsgSrcAddr,
+            "Decode8401 MsgZoneStatus: %s ",
+            MsgSrcAddr, args=(MsgZoneStatus[2:4],),
         )
         value = MsgZoneStatus[2:4]
 
@@ -3109,7 +3064,7 @@ def Decode8701(
 
     MsgLen = len(MsgData)
     self.log.logging( 
-        "Input", "Debug", "Decode8701 - MsgData: %s MsgLen: %s" % (MsgData, MsgLen)
+        "Input", "Debug", "Decode8701 - MsgData: %s MsgLen: %s", args=(MsgData, MsgLen)
     )
 
     if MsgLen < 4:
@@ -3143,8 +3098,7 @@ def Decode8701(
     self.log.logging( 
         "Input",
         "Debug",
-        "Decode8701 - Route discovery has been performed for %s %s, status: %s Nwk Status: %s "
-        % (MsgSrcAddr, MsgSrcIEEE, Status, NwkStatus),
+        "Decode8701 - Route discovery has been performed for %s %s, status: %s Nwk Status: %s ", args=(MsgSrcAddr, MsgSrcIEEE, Status, NwkStatus),
     )
 
 
@@ -3188,9 +3142,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
     }
 
     # self.log.logging( "Input", 'Debug', "Decode8085 - MsgData: %s "  %MsgData, MsgSrcAddr)
-    self.log.logging(  "Input", "Debug", "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s "
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, unknown_),
-        MsgSrcAddr,
+    self.log.logging(  "Input", "Debug", "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s ",
+        MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, unknown_),
     )
 
     if MsgSrcAddr not in self.ListOfDevices:
@@ -3227,7 +3180,7 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
         if MsgClusterId == "0008" and MsgCmd in TYPE_ACTIONS:
             selector = TYPE_ACTIONS[MsgCmd]
             self.log.logging(
-                "Input", "Debug", "Decode8085 - Selector: %s" % selector, MsgSrcAddr
+                "Input", "Debug", "Decode8085 - Selector: %s", MsgSrcAddr, args=(selector,)
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, "rmt1", selector)
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = selector
@@ -3314,8 +3267,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8085 - INNR RC 110 selector: %s" % selector,
-            MsgSrcAddr,
+            "Decode8085 - INNR RC 110 selector: %s",
+            MsgSrcAddr, args=(selector,),
         )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, selector)
         self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = selector
@@ -3350,9 +3303,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging(
                 "Input",
                 "Debug",
-                "Decode8085 - =====> turning left step_size: %s transition: %s"
-                % (step_size, transition),
-                MsgSrcAddr,
+                "Decode8085 - =====> turning left step_size: %s transition: %s",
+                MsgSrcAddr, args=(step_size, transition),
             )
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = "moveup"
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, "moveup")
@@ -3367,9 +3319,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging(
                 "Input",
                 "Debug",
-                "Decode8085 - =====> turning left step_size: %s transition: %s"
-                % (step_size, transition),
-                MsgSrcAddr,
+                "Decode8085 - =====> turning left step_size: %s transition: %s",
+                MsgSrcAddr, args=(step_size, transition),
             )
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = "off"
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, "off")
@@ -3384,9 +3335,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8085 - =====> turning right step_size: %s transition: %s"
-                % (step_size, transition),
-                MsgSrcAddr,
+                "Decode8085 - =====> turning right step_size: %s transition: %s",
+                MsgSrcAddr, args=(step_size, transition),
             )
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = "on"
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, "on")
@@ -3396,9 +3346,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8085 - =====> turning Right step_size: %s transition: %s"
-                % (step_size, transition),
-                MsgSrcAddr,
+                "Decode8085 - =====> turning Right step_size: %s transition: %s",
+                MsgSrcAddr, args=(step_size, transition),
             )
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId][
                 "0000"
@@ -3410,9 +3359,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8085 - =====> Stop moving step_size: %s transition: %s"
-                % (step_size, transition),
-                MsgSrcAddr,
+                "Decode8085 - =====> Stop moving step_size: %s transition: %s",
+                MsgSrcAddr, args=(step_size, transition),
             )
         else:
             self.log.logging( 
@@ -3427,9 +3375,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
         self.log.logging( 
             "Input",
             "Debug",
-            "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s "
-            % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, unknown_),
-            MsgSrcAddr,
+            "Decode8085 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Unknown: %s ",
+            MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, unknown_),
         )
 
         TYPE_ACTIONS = {
@@ -3461,7 +3408,7 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             return
 
         self.log.logging( 
-            "Input", "Debug", "Decode8085 - Legrand selector: %s" % selector, MsgSrcAddr
+            "Input", "Debug", "Decode8085 - Legrand selector: %s", MsgSrcAddr, args=(selector,)
         )
         if selector:
             if self.pluginconf.pluginConf["EnableReleaseButton"]:
@@ -3582,8 +3529,8 @@ def Decode8085(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8085 - Profalux remote selector: %s" % selector,
-                MsgSrcAddr,
+                "Decode8085 - Profalux remote selector: %s",
+                MsgSrcAddr, args=(selector,),
             )
             if selector:
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, selector)
@@ -3615,8 +3562,7 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
 
     updLQI(self, MsgSrcAddr, MsgLQI)
 
-    self.log.logging(  "Input", "Debug", "Decode8095 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Payload: %s Unknown: %s "
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgPayload, unknown_), MsgSrcAddr, )
+    self.log.logging(  "Input", "Debug", "Decode8095 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Payload: %s Unknown: %s ", MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgPayload, unknown_), )
 
     if MsgSrcAddr not in self.ListOfDevices:
         return
@@ -3718,9 +3664,8 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8095 - Legrand: %s/%s, Cmd: %s, Unknown: %s "
-                % (MsgSrcAddr, MsgEP, MsgCmd, unknown_),
-                MsgSrcAddr,
+                "Decode8095 - Legrand: %s/%s, Cmd: %s, Unknown: %s ",
+                MsgSrcAddr, args=(MsgSrcAddr, MsgEP, MsgCmd, unknown_),
             )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd)
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId][
@@ -3733,9 +3678,8 @@ def Decode8095(self, Devices, MsgData, MsgLQI):
             self.log.logging( 
                 "Input",
                 "Debug",
-                "Decode8095 - Legrand: %s/%s, Cmd: %s, Unknown: %s "
-                % (MsgSrcAddr, MsgEP, MsgCmd, unknown_),
-                MsgSrcAddr,
+                "Decode8095 - Legrand: %s/%s, Cmd: %s, Unknown: %s ",
+                MsgSrcAddr, args=(MsgSrcAddr, MsgEP, MsgCmd, unknown_),
             )
 
     elif _ModelName == "Lightify Switch Mini":
@@ -3829,8 +3773,7 @@ def Decode80A7(self, Devices, MsgData, MsgLQI):
     TYPE_DIRECTIONS = {"00": "right", "01": "left", "02": "middle"}
     TYPE_ACTIONS = {"07": "click", "08": "hold", "09": "release"}
 
-    self.log.logging( "Input", "Debug", "Decode80A7 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Direction: %s, Unknown_ %s"
-        % (MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgDirection, unkown_),MsgSrcAddr,)
+    self.log.logging( "Input", "Debug", "Decode80A7 - SQN: %s, Addr: %s, Ep: %s, Cluster: %s, Cmd: %s, Direction: %s, Unknown_ %s",MsgSrcAddr, args=(MsgSQN, MsgSrcAddr, MsgEP, MsgClusterId, MsgCmd, MsgDirection, unkown_),)
     if MsgSrcAddr not in self.ListOfDevices:
         return
     if self.ListOfDevices[MsgSrcAddr]["Status"] != "inDB":
@@ -3864,7 +3807,7 @@ def Decode80A7(self, Devices, MsgData, MsgLQI):
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgEP, "rmt1", selector)
             self.ListOfDevices[MsgSrcAddr]["Ep"][MsgEP][MsgClusterId]["0000"] = selector
             self.log.logging( 
-                "Input", "Debug", "Decode80A7 - selector: %s" % selector, MsgSrcAddr
+                "Input", "Debug", "Decode80A7 - selector: %s", MsgSrcAddr, args=(selector,)
             )
 
             if self.groupmgt:
@@ -3909,7 +3852,7 @@ def Decode8806(self, Devices, MsgData, MsgLQI):
         "JN516x M05": {0: 9.5, 52: -3, 40: -15, 31: -26},
     }
 
-    self.log.logging( "Input", "Debug", "Decode8806 - MsgData: %s" % MsgData)
+    self.log.logging( "Input", "Debug", "Decode8806 - MsgData: %s", args=(MsgData,))
 
     TxPower = MsgData[0:2]
     self.zigatedata["Tx-Power"] = TxPower
@@ -3979,8 +3922,7 @@ def Decode8035(self, Devices, MsgData, MsgLQI):
         self.log.logging(
             "PDM",
             "Debug",
-            "eventCode: %s (%s) eventNumber: %s"
-            % (eventCode, PDU_EVENT[eventCode], u32eventNumber),
+            "eventCode: %s (%s) eventNumber: %s", args=(eventCode, PDU_EVENT[eventCode], u32eventNumber),
         )
         if eventCode == "00":  # E_PDM_SYSTEM_EVENT_WEAR_COUNT_TRIGGER_VALUE_REACHED=0,
             pass
@@ -4031,15 +3973,13 @@ def Decode8035(self, Devices, MsgData, MsgLQI):
             self.log.logging(
                 "PDM",
                 "Debug",
-                "Decode8035 - PDM event : eventCode: %s (%s) eventNumber"
-                % (eventCode, PDU_EVENT[eventCode], u32eventNumber),
+                "Decode8035 - PDM event : eventCode: %s (%s) eventNumber: %s", args=(eventCode, PDU_EVENT[eventCode], u32eventNumber),
             )
     else:
         self.log.logging(
             "PDM",
             "Debug",
-            "Decode8035 - PDM event : eventCode: %s eventNumber"
-            % (eventCode, u32eventNumber),
+            "Decode8035 - PDM event : eventCode: %s eventNumber: %s", args=(eventCode, u32eventNumber),
         )
 
 
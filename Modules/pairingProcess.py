@@ -243,13 +243,12 @@ def processNotinDBDevices( self, Devices, NWKID , status , RIA ):
         self.log.logging( "Pairing", 'Debug', "[%s] NEW OBJECT: %s Trying to create Domoticz device(s)" %(RIA, NWKID))
         IsCreated=False
         # Let's check if the IEEE is not known in Domoticz
-        for x in Devices:
-            if self.ListOfDevices[NWKID].get('IEEE'):
-                if Devices[x].DeviceID == str(self.ListOfDevices[NWKID]['IEEE']):
-                    IsCreated = True
-                    Domoticz.Error("processNotinDBDevices - Devices already exist. "  + Devices[x].Name + " with " + str(self.ListOfDevices[NWKID]) )
-                    Domoticz.Error("processNotinDBDevices - Please cross check the consistency of the Domoticz and Plugin database.")
-                    break
+        if self.ListOfDevices[NWKID].get('IEEE'):
+            x = self.UnitIndex.unit( Devices, str(self.ListOfDevices[NWKID]['IEEE']) )
+            if x is not None:
+                IsCreated = True
+                Domoticz.Error("processNotinDBDevices - Devices already exist. "  + Devices[x].Name + " with " + str(self.ListOfDevices[NWKID]) )
+                Domoticz.Error("processNotinDBDevices - Please cross check the consistency of the Domoticz and Plugin database.")
 
         if not IsCreated:
             self.log.logging( "Pairing", 'Debug', "processNotinDBDevices - ready for creation: %s , Model: %s " %(self.ListOfDevices[NWKID], self.ListOfDevices[NWKID]['Model']))
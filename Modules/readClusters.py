@@ -24,8 +24,7 @@ from Modules.zigateConsts import LEGRAND_REMOTE_SHUTTER, LEGRAND_REMOTE_SWITCHS,
 from Modules.domoMaj import MajDomoDevice
 from Modules.domoTools import timedOutDevice
 from Modules.tools import DeviceExist, getEPforClusterType, is_hex, voltage2batteryP, checkAttribute, checkAndStoreAttributeValue, \
-                        set_status_datastruct, set_timestamp_datastruct, get_isqn_datastruct, instrument_timing
-from Modules.sqnMgmt import sqn_get_internal_sqn_from_app_sqn, TYPE_APP_ZCL
+                        set_status_datastruct, set_timestamp_datastruct, instrument_timing
 
 from Modules.lumi import AqaraOppleDecoding0012, readXiaomiCluster, xiaomi_leave, cube_decode, decode_vibr, decode_vibrAngle, readLumiLock
 
@@ -97,7 +96,7 @@ def decodeAttribute(self, AttType, Attribute, handleErrors=False):
                 decode = binascii.unhexlify(Attribute).decode('utf-8', errors = 'ignore')
                 decode = decode.replace('\x00', '')
                 decode = decode.strip()
-                self.log.logging( "Cluster", 'Debug', "decodeAttribute - seems errors, returning with errors ignore From: %s to >%s<" %( str(Attribute), str(decode)))
+                self.log.logging( "Cluster", 'Debug', "decodeAttribute - seems errors, returning with errors ignore From: %s to >%s<", args=( Attribute, decode))
 
         # Cleaning
         decode = decode.strip('\x00')
@@ -107,33 +106,40 @@ def decodeAttribute(self, AttType, Attribute, handleErrors=False):
     #self.log.logging( "Cluster", 'Debug', "decodeAttribut(%s, %s) unknown, returning %s unchanged" %(AttType, Attribute, Attribute) )
     return Attribute
 
-def storeReadAttributeStatus( self, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus ):
-
-    i_sqnFromMessage = sqn_get_internal_sqn_from_app_sqn (self.ZigateComm, MsgSQN, TYPE_APP_ZCL)
-    i_sqn_expected = get_isqn_datastruct(self, 'ReadAttributes', MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID )
+def storeReadAttributeStatus( self, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records ):
 
     # if MsgType == '8100' and i_sqn_expected and i_sqnFromMessage and i_sqn_expected != i_sqnFromMessage:
     #     Domoticz.Log("+++ SQN Missmatch in ReadCluster %s/%s %s %s i_sqn: %s e_sqn: %s i_esqn: %s " 
     #         %( MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, i_sqn_expected, MsgSQN, i_sqnFromMessage ))
 
-    set_status_datastruct(self, 'ReadAttributes', MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus )
+    for MsgAttrID, MsgAttrStatus, _, _, _ in records:
+        set_status_datastruct(self, 'ReadAttributes', MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus )
     set_timestamp_datastruct(self, 'ReadAttributes', MsgSrcAddr, MsgSrcEp, MsgClusterId, int(time()) )
 
 
 def ReadCluster(self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus, MsgAttType, MsgAttSize, MsgClusterData, Source=None):
 
-    self.statistics._clusterOK += 1
+    ReadClusterRecords( self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, 
+        ( ( MsgAttrID, MsgAttrStatus, MsgAttType, MsgAttSize, MsgClusterData ), ), Source )
+
+
+def ReadClusterRecords(self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records, Source=None):
+    # records: ( MsgAttrID, MsgAttrStatus, MsgAttType, MsgAttSize, MsgClusterData ) of one frame.
+    # Device and Endpoint checks are done once, then each Attribute goes to the Cluster decoder
+
+    self.statistics._clusterOK += len(records)
 
     if MsgSrcAddr not in self.ListOfDevices:
-        _context = {
-            'MsgClusterId' : str(MsgClusterId),
-            'MsgSrcEp' : str(MsgSrcEp),
-            'MsgAttrID' : str(MsgAttrID),
-            'MsgAttType' : str(MsgAttType),
-            'MsgAttSize' : str(MsgAttSize),
-            'MsgClusterData' : str(MsgClusterData)
-        }
-        self.log.logging(  "Cluster", 'Error',"ReadCluster - unknown device: %s" %(MsgSrcAddr),MsgSrcAddr,_context)
+        for MsgAttrID, MsgAttrStatus, MsgAttType, MsgAttSize, MsgClusterData in records:
+            _context = {
+                'MsgClusterId' : str(MsgClusterId),
+                'MsgSrcEp' : str(MsgSrcEp),
+                'MsgAttrID' : str(MsgAttrID),
+                'MsgAttType' : str(MsgAttType),
+                'MsgAttSize' : str(MsgAttSize),
+                'MsgClusterData' : str(MsgClusterData)
+            }
+            self.log.logging(  "Cluster", 'Error',"ReadCluster - unknown device: %s" %(MsgSrcAddr),MsgSrcAddr,_context)
         return
 
     if not DeviceExist(self, Devices, MsgSrcAddr):
@@ -152,55 +158,21 @@ def ReadCluster(self, Devices, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgCluster
     if MsgClusterId not in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]:
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId] = {}
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgAttrStatus, MsgClusterData),MsgSrcAddr)
+    storeReadAttributeStatus( self, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, records )
 
-    storeReadAttributeStatus( self, MsgType, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttrStatus )
+    _func = DECODE_CLUSTER.get( MsgClusterId )
+    for MsgAttrID, MsgAttrStatus, MsgAttType, MsgAttSize, MsgClusterData in records:
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s",MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgAttrStatus, MsgClusterData))
 
-    if MsgAttrStatus != "00" and MsgClusterId != '0500':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Status %s for addr: %s/%s on cluster/attribute %s/%s" %(MsgAttrStatus, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID) , nwkid=MsgSrcAddr)
-        self.statistics._clusterKO += 1
-        return
+        if MsgAttrStatus != "00" and MsgClusterId != '0500':
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - Status %s for addr: %s/%s on cluster/attribute %s/%s" , nwkid=MsgSrcAddr, args=(MsgAttrStatus, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID))
+            self.statistics._clusterKO += 1
+            continue
 
-    DECODE_CLUSTER = {
-            "0000": Cluster0000, 
-            "0001": Cluster0001, 
-            "0003": Cluster0003, 
-            "0005": Cluster0005, 
-            "0006": Cluster0006,
-            "0008": Cluster0008,
-            "0009": Cluster0009,
-            "0012": Cluster0012, 
-            "000c": Cluster000c,
-            "0100": Cluster0100,
-            "0101": Cluster0101, 
-            "0102": Cluster0102,
-            "0201": Cluster0201, 
-            "0202": Cluster0202, 
-            "0204": Cluster0204,
-            "0300": Cluster0300,
-            "0400": Cluster0400, 
-            "0402": Cluster0402, 
-            "0403": Cluster0403, 
-            "0405": Cluster0405, 
-            "0406": Cluster0406,
-            "0500": Cluster0500, 
-            "0502": Cluster0502,
-            "0702": Cluster0702,
-            "0b04": Cluster0b04, 
-            "fc00": Clusterfc00,
-            "000f": Cluster000f,
-            "fc01": Clusterfc01,
-            "fc21": Clusterfc21,
-            "fcc0": Clusterfcc0,
-            "fc40": Clusterfc40
-            }
-
-    if MsgClusterId in DECODE_CLUSTER:
-        _func = DECODE_CLUSTER[ MsgClusterId ]
-        _func(  self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, \
-            MsgAttType, MsgAttSize, MsgClusterData, Source )
-    else:
+        if _func:
+            _func(  self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, \
+                MsgAttType, MsgAttSize, MsgClusterData, Source )
+            continue
 
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
         _context = {
@@ -221,28 +193,28 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
 
     if MsgAttrID == "0000": # ZCL Version
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - ZCL Version: " +str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - ZCL Version: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['ZCL Version'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ZCL_Version']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0001": # Application Version
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Application version: " +str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Application version: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['App Version'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['App_Version']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0002": # Stack Version
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Stack version: " +str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Stack version: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['Stack Version'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['Stack_Version']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0003": # Hardware version
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Hardware version: " +str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Hardware version: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['HW Version'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
@@ -257,7 +229,7 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             idx += 2
 
         _manufcode = str(decodeAttribute( self, MsgAttType, MsgClusterData[0:idx],  handleErrors=True))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Manufacturer: " + str(_manufcode), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Manufacturer: %s", MsgSrcAddr, args=(_manufcode,))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData, handleErrors=True) )
         if is_hex(_manufcode):
             self.ListOfDevices[MsgSrcAddr]['Manufacturer'] = _manufcode
@@ -315,7 +287,7 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.ListOfDevices[MsgSrcAddr]['Model'] = {}
 
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = AttrModelName # We store the original one
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - Recepion Model: >%s<" %(MsgClusterId, MsgAttrID, modelName), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - Recepion Model: >%s<", MsgSrcAddr, args=(MsgClusterId, MsgAttrID, modelName))
         if modelName == '':
             return
 
@@ -323,18 +295,17 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         if 'Ep' in self.ListOfDevices[MsgSrcAddr]:
             for iterEp in self.ListOfDevices[MsgSrcAddr]['Ep']:
                 if 'ClusterType' in self.ListOfDevices[MsgSrcAddr]['Ep'][iterEp]:
-                    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - %s %s is already provisioned in Domoticz" \
-                            %(MsgClusterId, MsgAttrID, MsgSrcAddr, modelName), MsgSrcAddr)
+                    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - %s %s is already provisioned in Domoticz", MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgSrcAddr, modelName))
 
                     # However if Model is not correctly set, let's take the opportunity to correct
                     if self.ListOfDevices[MsgSrcAddr]['Model'] == '' or self.ListOfDevices[MsgSrcAddr]['Model'] == {}:
-                        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - Update Model Name %s" %(MsgClusterId, MsgAttrID,modelName ), MsgSrcAddr)
+                        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - Update Model Name %s", MsgSrcAddr, args=(MsgClusterId, MsgAttrID,modelName ))
                         self.ListOfDevices[MsgSrcAddr]['Model'] = modelName
                     return
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] == modelName and self.ListOfDevices[MsgSrcAddr]['Model'] in self.DeviceConf:
             # This looks like a Duplicate, just drop
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - no action" %(MsgClusterId, MsgAttrID), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s / %s - no action", MsgSrcAddr, args=(MsgClusterId, MsgAttrID))
             return
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] == '' or self.ListOfDevices[MsgSrcAddr]['Model'] == {}:
@@ -351,7 +322,7 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         # Let's see if this model is known in DeviceConf. If so then we will retreive already the Eps
         if self.ListOfDevices[MsgSrcAddr]['Model'] in self.DeviceConf:                 # If the model exist in DeviceConf.txt
             modelName = self.ListOfDevices[MsgSrcAddr]['Model']
-            self.log.logging( "Cluster", 'Debug', "Extract all info from Model : %s" %self.DeviceConf[modelName], MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "Extract all info from Model : %s", MsgSrcAddr, args=(self.DeviceConf[modelName],))
 
             if 'ConfigSource' in self.ListOfDevices[MsgSrcAddr]:
                 if self.ListOfDevices[MsgSrcAddr]['ConfigSource'] == 'DeviceConf':
@@ -369,16 +340,16 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                     _BackupEp = dict(self.ListOfDevices[MsgSrcAddr]['Ep'])
                     del self.ListOfDevices[MsgSrcAddr]['Ep']                           # It has been prepopulated by some 0x8043 message, let's remove them.
                     self.ListOfDevices[MsgSrcAddr]['Ep'] = {}                          # It has been prepopulated by some 0x8043 message, let's remove them.
-                    self.log.logging( "Cluster", 'Debug',"-- Record removed 'Ep' %s" %(self.ListOfDevices[MsgSrcAddr]), MsgSrcAddr)
+                    self.log.logging( "Cluster", 'Debug',"-- Record removed 'Ep' %s", MsgSrcAddr, args=(self.ListOfDevices[MsgSrcAddr],))
 
             for Ep in self.DeviceConf[modelName]['Ep']:                                # For each Ep in DeviceConf.txt
                 if Ep not in self.ListOfDevices[MsgSrcAddr]['Ep']:                     # If this EP doesn't exist in database
                     self.ListOfDevices[MsgSrcAddr]['Ep'][Ep]={}                        # create it.
-                    self.log.logging( "Cluster", 'Debug', "-- Create Endpoint %s in record %s" %(Ep, self.ListOfDevices[MsgSrcAddr]['Ep']), MsgSrcAddr)
+                    self.log.logging( "Cluster", 'Debug', "-- Create Endpoint %s in record %s", MsgSrcAddr, args=(Ep, self.ListOfDevices[MsgSrcAddr]['Ep']))
 
                 for cluster in self.DeviceConf[modelName]['Ep'][Ep]:                   # For each cluster discribe in DeviceConf.txt
                     if cluster not in self.ListOfDevices[MsgSrcAddr]['Ep'][Ep]:        # If this cluster doesn't exist in database
-                        self.log.logging( "Cluster", 'Debug', "----> Cluster: %s" %cluster, MsgSrcAddr)
+                        self.log.logging( "Cluster", 'Debug', "----> Cluster: %s", MsgSrcAddr, args=(cluster,))
                         self.ListOfDevices[MsgSrcAddr]['Ep'][Ep][cluster]={}           # create it.
                         if _BackupEp and Ep in _BackupEp:                              # In case we had data, let's retreive it
                             if cluster in _BackupEp[Ep]:
@@ -389,7 +360,7 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                                     else:
                                         self.ListOfDevices[MsgSrcAddr]['Ep'][Ep][cluster][attr] = _BackupEp[Ep][cluster][attr]
 
-                                    self.log.logging( "Cluster", 'Debug', "------> Cluster %s set with Attribute %s" %(cluster, attr), MsgSrcAddr)
+                                    self.log.logging( "Cluster", 'Debug', "------> Cluster %s set with Attribute %s", MsgSrcAddr, args=(cluster, attr))
 
                 if 'Type' in self.DeviceConf[modelName]['Ep'][Ep]:                     # If type exist at EP level : copy it
                     self.ListOfDevices[MsgSrcAddr]['Ep'][Ep]['Type']=self.DeviceConf[modelName]['Ep'][Ep]['Type']
@@ -399,7 +370,7 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                     if 'ColorMode' in  self.DeviceConf[modelName]['Ep'][Ep]:
                         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['ColorMode'] = int(self.DeviceConf[modelName]['Ep'][Ep]['ColorMode'])
 
-            self.log.logging( "Cluster", 'Debug', "Result based on DeviceConf is: %s" %str(self.ListOfDevices[MsgSrcAddr]), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "Result based on DeviceConf is: %s", MsgSrcAddr, args=(self.ListOfDevices[MsgSrcAddr],))
 
         if self.pluginconf.pluginConf['capturePairingInfos']:
             if MsgSrcAddr not in self.DiscoveryDevices:
@@ -412,30 +383,30 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0007": # Power Source
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Power Source: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Power Source: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         # 0x03 stand for Battery
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['PowerSource'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '0008': # 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0008: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0008: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '0009': # 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0009: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0009: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '000a': # Product Code
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Product Code: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Product Code: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '000b': # 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0x000b: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Attribute 0x000b: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '0010': # LOCATION_DESCRIPTION
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Location: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Location: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['Location'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
@@ -453,12 +424,12 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '0015': # SW_BUILD_ID
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 0015: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 0015: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['SWBUILD_2'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0016": # Battery
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 0016 : %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 0016 : %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         if self.pluginconf.pluginConf['capturePairingInfos'] and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['Battery'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
@@ -466,25 +437,25 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.ListOfDevices[MsgSrcAddr]['BatteryUpdateTime'] = int(time())
 
     elif MsgAttrID == "4000": # SW Build
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 4000: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 4000: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['SWBUILD_3'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "8000": 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 8000: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut 8000: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         self.ListOfDevices[MsgSrcAddr]['SWBUILD_3'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "e000": # Schneider Thermostat
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e000: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e000: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "e001": # Schneider Thermostat
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e001: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e001: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "e002": # Schneider Thermostat
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e002: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut e002: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "f000": 
@@ -503,20 +474,20 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             ss =  op_time 
 
             self.ListOfDevices[MsgSrcAddr]['Operating Time'] = '%sd %sh %sm %ss' %(dd,hh,mm,ss)
-            self.log.logging( "Cluster", 'Debug', "%s/%s ReadCluster - 0x0000 - Operating Time: %sdays %shours %smin %ssec" %(MsgSrcAddr, MsgSrcEp, dd, hh,mm,ss), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "%s/%s ReadCluster - 0x0000 - Operating Time: %sdays %shours %smin %ssec", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, dd, hh,mm,ss))
         else:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut f000: %s" %str(decodeAttribute( self, MsgAttType, MsgClusterData) ), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - Attribut f000: %s", MsgSrcAddr, args=(decodeAttribute( self, MsgAttType, MsgClusterData),))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID in ( 'ff0d', 'ff22', 'ff23'): # Xiaomi Code
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - %s/%s Attribut %s %s %s %s" %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0x0000 - %s/%s Attribut %s %s %s %s" , MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == 'ff30': # Xiaomi Locking status
         # 1107xx -> Wrong Key or bad insert
         # 1207xx -> Unlock everything to neutral state
         # 1211xx -> Key in the lock
         # xx is the key number
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s %s Saddr: %s ClusterData: %s" %(MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s %s Saddr: %s ClusterData: %s", MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData))
         readLumiLock( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData )
 
     elif MsgAttrID in ( 'ff01', 'ff02', 'fff0'):
@@ -524,19 +495,18 @@ def Cluster0000( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             #Domoticz.Error("ReadCluster - %s - %s/%s Attribut %s received while device not inDB" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID))
             return
 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s %s Saddr: %s ClusterData: %s" %(MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s %s Saddr: %s ClusterData: %s", MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgSrcAddr, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = MsgClusterData
         readXiaomiCluster( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData )
 
     elif MsgAttrID in ( 'ffe0', 'ffe1', 'ffe2'):
         # Tuya, Zemismart
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0000 %s/%s attribute Tuya/Zemismat - %s: 0x%s %s" 
-                %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData, decodeAttribute( self, MsgAttType, MsgClusterData)), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0000 %s/%s attribute Tuya/Zemismat - %s: 0x%s %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData, decodeAttribute( self, MsgAttType, MsgClusterData)))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
 
     elif MsgAttrID == "fffd": #
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0000/fffd Addr: %s Cluster Revision:%s" %(MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0000/fffd Addr: %s Cluster Revision:%s", MsgSrcAddr, args=(MsgSrcAddr, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
         #self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]['Cluster Revision'] = str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
@@ -559,21 +529,21 @@ def Cluster0001( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         value = round(int(value)/10, 1)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(value))
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s General Voltage: %s V " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s General Voltage: %s V " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == "0001": # MAINS FREQUENCY
                               # 0x00 indicates a DC supply, or Freq too low
                               # 0xFE indicates AC Freq is too high
                               # 0xFF indicates AC Freq cannot be measured
         if int(value) == 0x00:
-            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq is DC or too  low" %MsgSrcAddr, MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq is DC or too  low", MsgSrcAddr, args=(MsgSrcAddr,))
         elif int(value) == 0xFE:
-            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq is too high" %MsgSrcAddr, MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq is too high", MsgSrcAddr, args=(MsgSrcAddr,))
         elif int(value) == 0xFF:
-            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq cannot be measured" %MsgSrcAddr, MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq cannot be measured", MsgSrcAddr, args=(MsgSrcAddr,))
         else:
             value = round(int(value)/2)  # 
-            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq %s Hz" %(MsgSrcAddr, value), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Freq %s Hz", MsgSrcAddr, args=(MsgSrcAddr, value))
 
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
@@ -581,8 +551,7 @@ def Cluster0001( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         _undervoltage = (int(value)) & 1
         _overvoltage = (int(value) >> 1 ) & 1
         _mainpowerlost = (int(value) >> 2 ) & 1
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Alarm Mask: UnderVoltage: %s OverVoltage: %s MainPowerLost: %s" \
-                %(MsgSrcAddr, _undervoltage, _overvoltage, _mainpowerlost), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 %s Alarm Mask: UnderVoltage: %s OverVoltage: %s MainPowerLost: %s", MsgSrcAddr, args=(MsgSrcAddr, _undervoltage, _overvoltage, _mainpowerlost))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == '0007': # Power Source
@@ -599,12 +568,12 @@ def Cluster0001( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == "0010": # Voltage
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Voltage: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Voltage: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(value))
 
     elif MsgAttrID == "0020": # Battery Voltage
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery: %s V" %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery: %s V" , MsgSrcAddr, args=(MsgSrcAddr, value))
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] == 'EH-ZB-BMS' ):
             value = round( value/10, 1)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(value))
@@ -618,28 +587,28 @@ def Cluster0001( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             value = 0
 
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Percentage: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Percentage: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == "0031": # Battery Size
         # 0x03 stand for AA
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery size: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery size: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == "0033": # Battery Quantity
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Quantity: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Battery Quantity: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == "0035": # Battery Alarm Mask 
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Attribut 0035: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Attribut 0035: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == "0036": # Minimum Threshold
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Minimum Threshold: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Minimum Threshold: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     elif MsgAttrID == 'fffd': # Cluster Version
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Cluster Version: %s " %(MsgSrcAddr, value) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster 0001 - %s Cluster Version: %s " , MsgSrcAddr, args=(MsgSrcAddr, value))
 
     else:
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
@@ -690,7 +659,7 @@ def UpdateBatteryAttribute( self, MsgSrcAddr, MsgSrcEp ):
         battRemainPer = float(self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]['0001']['0021'])
 
 
-    self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s mainVolt:%s , battVolt:%s, battRemainingVolt: %s, battRemainPer:%s " %(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], mainVolt, battVolt, battRemainingVolt, battRemainPer) , MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s mainVolt:%s , battVolt:%s, battRemainingVolt: %s, battRemainPer:%s " , MsgSrcAddr, args=(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], mainVolt, battVolt, battRemainingVolt, battRemainPer))
 
     value = None
     # Based on % ( 0x0021 )
@@ -735,47 +704,45 @@ def UpdateBatteryAttribute( self, MsgSrcAddr, MsgSrcEp ):
     #    battRemainingVolt, type(battRemainingVolt) ))
 
     if value:
-       self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s Updating battery %s to %s" 
-            %(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], self.ListOfDevices[MsgSrcAddr]['Battery'], value) , MsgSrcAddr)
+       self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s Updating battery %s to %s" , MsgSrcAddr, args=(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], self.ListOfDevices[MsgSrcAddr]['Battery'], value))
        if value != self.ListOfDevices[MsgSrcAddr]['Battery']:
            self.ListOfDevices[MsgSrcAddr]['Battery'] = value
            self.ListOfDevices[MsgSrcAddr]['BatteryUpdateTime'] = int(time())
-           self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s Updating battery to %s" %(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], value) , MsgSrcAddr)
+           self.log.logging( "Cluster", 'Debug', "readCluster 0001 - Device: %s Model: %s Updating battery to %s" , MsgSrcAddr, args=(MsgSrcAddr, self.ListOfDevices[MsgSrcAddr]['Model'], value))
 
 def Cluster0003( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ) )
 
     if MsgAttrID == '0000': # IdentifyTime Attribute
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Remaining time to identify itself %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, int(MsgClusterData, 16)))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Remaining time to identify itself %s", args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, int(MsgClusterData, 16)))
 
 def Cluster0005( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ) )
 
     if MsgAttrID == '0000': # SceneCount
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Count: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Count: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == '0001': # CurrentScene
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Cuurent Scene: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Cuurent Scene: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == '0002': # CurrentGroup
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/% Scene Current Group: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/% Scene Current Group: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == '0003': # SceneVal id
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Valid : %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Valid : %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == '0004': # NameSupport
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene NameSupport: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene NameSupport: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     elif MsgAttrID == '0005': # LastConfiguredBy
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Last Configured By : %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Scene Last Configured By : %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     else:
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
 def Cluster0006( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
     # Cluster On/Off
@@ -795,8 +762,7 @@ def Cluster0006( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
             # endpoint 02 is for controlling the L1 output
             # Blacklist all EPs other than '02'
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=%s - Unexpected EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s" \
-                    %(MsgClusterId, MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=%s - Unexpected EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
             return
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] == 'lumi.ctrl_neutral2' and MsgSrcEp != '02' and MsgSrcEp != '03':
@@ -805,8 +771,7 @@ def Cluster0006( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             # EP 04 EVENT LEFT
             # EP 05 EVENT RIGHT
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=%s - not processed EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s" \
-                %(MsgClusterId, MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=%s - not processed EP, %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, Value: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
             return
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] == '3AFE170100510001': 
@@ -823,50 +788,49 @@ def Cluster0006( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             else:
                 #Domoticz.Log("Konke Multi Purpose Switch - Unknown Value: %s" %MsgClusterData)
                 return
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Konke Multi Purpose Switch reception General: On/Off: %s" %value , MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Konke Multi Purpose Switch reception General: On/Off: %s" , MsgSrcAddr, args=(value,))
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value)
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
             return
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] == 'TI0001':
             # Livolo / Might get something else than On/Off
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" \
-                        %(MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - reception General: On/Off: %s" %str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - reception General: On/Off: %s" , MsgSrcAddr, args=(MsgClusterData,))
 
     elif MsgAttrID == '4000': # Global Scene Control
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Global Scene Control Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Global Scene Control Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == '4001': # On Time
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - On Time Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - On Time Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == '4002': # Off Wait Time
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Off Wait Time Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Off Wait Time Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == '4003': # Power On On Off
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == "8001":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == "8002":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s" %(MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - Power On OnOff Attr: %s Value: %s", MsgSrcAddr, args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     elif MsgAttrID == "f000" and MsgAttType == "23" and MsgAttSize == "0004":
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - Feedback from device %s/%s Attribute 0xf000 value: %s-%s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - Feedback from device %s/%s Attribute 0xf000 value: %s-%s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterData, value))
         _Xiaomi_code = MsgClusterData[0:2]
         _Xiaomi_sAddr = MsgClusterData[2:6]
         _Xiaomi_Value = MsgClusterData[6:8]
@@ -886,16 +850,16 @@ def Cluster0006( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
         if _Xiaomi_code in XIAOMI_CODE:
             if 'ZDeviceName' in self.ListOfDevices[MsgSrcAddr]:
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - %s %s/%s %s: %s" %(self.ListOfDevices[MsgSrcAddr]['ZDeviceName'],MsgSrcAddr, MsgSrcEp, XIAOMI_CODE[ _Xiaomi_code ], int(_Xiaomi_Value,16)), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - %s %s/%s %s: %s", MsgSrcAddr, args=(self.ListOfDevices[MsgSrcAddr]['ZDeviceName'],MsgSrcAddr, MsgSrcEp, XIAOMI_CODE[ _Xiaomi_code ], int(_Xiaomi_Value,16)))
             else:
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - %s/%s %s: %s" %(MsgSrcAddr, MsgSrcEp, XIAOMI_CODE[ _Xiaomi_code ], int(_Xiaomi_Value,16)), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - %s/%s %s: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, XIAOMI_CODE[ _Xiaomi_code ], int(_Xiaomi_Value,16)))
 
         else:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - - %s/%s Unknown Xiaomi Code %s raw data: %s (please report to @pipiche)" %(MsgSrcAddr, MsgSrcEp, _Xiaomi_code, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - Xiaomi 0006/f000 - - %s/%s Unknown Xiaomi Code %s raw data: %s (please report to @pipiche)", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, _Xiaomi_code, MsgClusterData))
 
 
     elif MsgAttrID == 'fffd':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - unknown Attr: %s Value: %s" %(MsgAttrID, MsgClusterData))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0006 - unknown Attr: %s Value: %s", args=(MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ))
 
     else:
@@ -907,39 +871,37 @@ def Cluster0008( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,MsgClusterData)
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterID: %s Addr: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s"
-            %(MsgClusterId, MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterID: %s Addr: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if MsgAttrID == '0000': # Current Level
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] == 'TI0001' and MsgSrcEp == '06' ): # Livolo switch
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" \
-                %(MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
             # Do nothing as the Livolo state is given by 0x0100
             return
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Level Control: %s" %(MsgSrcAddr,MsgSrcEp,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Level Control: %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgClusterData))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
 
     elif MsgAttrID == '0001': # Remaining Time
         # The RemainingTime attribute represents the time remaining until the current
         # command is complete - it is specified in 1/10ths of a second.
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Remaining Time: %s" %(MsgSrcAddr,MsgSrcEp,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Remaining Time: %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgClusterData))
 
     elif MsgAttrID == '0010': # OnOffTransitionTime
         # The OnOffTransitionTime attribute represents the time taken to move to or from the target level 
         # when On of Off commands are received by an On/Off cluster on the same endpoint. It is specified in 1/10ths of a second.
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s OnOff Transition Time: %s" %(MsgSrcAddr,MsgSrcEp,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s OnOff Transition Time: %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgClusterData))
 
     elif MsgAttrID == '0011': # OnLevel 
         # The OnLevel attribute determines the value that the CurrentLevel attribute is 
         # set to when the OnOff attribute of an On/Off cluster on the same endpoint is set to On. 
         # If the OnLevel attribute is not implemented, or is set to 0xff, it has no effect. 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s On Level : %s" %(MsgSrcAddr,MsgSrcEp,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s On Level : %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgClusterData))
 
     elif MsgAttrID == '4000': # 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" %(MsgSrcAddr,MsgSrcEp,MsgAttrID,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgAttrID,MsgClusterData))
 
     elif MsgAttrID == 'f000':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" %(MsgSrcAddr,MsgSrcEp,MsgAttrID,MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0008 - %s/%s Attr: %s Value: %s" , MsgSrcAddr, args=(MsgSrcAddr,MsgSrcEp,MsgAttrID,MsgClusterData))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
@@ -954,12 +916,12 @@ def Cluster0009( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 def Cluster000c( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
     # Magic Cube Xiaomi rotation and Power Meter
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterID=000C - MsgSrcEp: %s MsgAttrID: %s MsgAttType: %s MsgClusterData: %s " %(MsgSrcEp, MsgAttrID, MsgAttType, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterID=000C - MsgSrcEp: %s MsgAttrID: %s MsgAttType: %s MsgClusterData: %s ", MsgSrcAddr, args=(MsgSrcEp, MsgAttrID, MsgAttType, MsgClusterData))
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData) ) )
 
     if MsgAttrID == '0051': #
-        self.log.logging( "Cluster", 'Debug', "%s/%s Out of service: %s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "%s/%s Out of service: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = MsgClusterData
 
     elif MsgAttrID=="0055":
@@ -967,11 +929,11 @@ def Cluster000c( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         EPforPower = getEPforClusterType( self, MsgSrcAddr, "Power" ) 
         EPforMeter = getEPforClusterType( self, MsgSrcAddr, "Meter" ) 
         EPforPowerMeter = getEPforClusterType( self, MsgSrcAddr, "PowerMeter" ) 
-        self.log.logging( "Cluster", 'Debug', "EPforPower: %s, EPforMeter: %s, EPforPowerMeter: %s" %(EPforPower, EPforMeter, EPforPowerMeter), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "EPforPower: %s, EPforMeter: %s, EPforPowerMeter: %s", MsgSrcAddr, args=(EPforPower, EPforMeter, EPforPowerMeter))
        
         if len(EPforPower) == len(EPforMeter) == len(EPforPowerMeter) == 0:
             rotation_angle = struct.unpack('f',struct.pack('I',int(MsgClusterData,16)))[0]
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - Magic Cube angle: %s" %rotation_angle, MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - Magic Cube angle: %s", MsgSrcAddr, args=(rotation_angle,))
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(int(rotation_angle)), Attribute_ = '0055' )
             if rotation_angle < 0:
                 #anti-clokc
@@ -984,12 +946,12 @@ def Cluster000c( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
         elif len(EPforPower) > 0 or len(EPforMeter) > 0 or len(EPforPowerMeter) > 0 : # We have several EPs in Power/Meter
             value = round(float(decodeAttribute( self, MsgAttType, MsgClusterData )),3)
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - MsgAttrID=0055 - on Ep " +str(MsgSrcEp) + " reception Conso Prise Xiaomi: " + str(value), MsgSrcAddr)
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - List of Power/Meter EPs" +str( EPforPower ) + str(EPforMeter) +str(EPforPowerMeter) , MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - MsgAttrID=0055 - on Ep %s reception Conso Prise Xiaomi: %s", MsgSrcAddr, args=(MsgSrcEp, value,))
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - List of Power/Meter EPs%s%s%s" , MsgSrcAddr, args=(EPforPower, EPforMeter, EPforPowerMeter,))
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(value)
             for ep in EPforPower + EPforMeter:
                 if ep == MsgSrcEp:
-                    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - MsgAttrID=0055 - reception Conso Prise Xiaomi: " + str(value) , MsgSrcAddr)
+                    self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - MsgAttrID=0055 - reception Conso Prise Xiaomi: %s" , MsgSrcAddr, args=(value,))
                     if '0702' not in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]:
                         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]['0702'] = {}
                     if not isinstance( self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp]['0702'], dict):
@@ -1004,11 +966,11 @@ def Cluster000c( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
 
     elif MsgAttrID=="006f": # Status flag
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=000c - Status flag: %s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=000c - Status flag: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterData))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = MsgClusterData
 
     elif MsgAttrID=="ff05": # Rotation - horinzontal
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - Magic Cube Rotation: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=000c - Magic Cube Rotation: %s" , MsgSrcAddr, args=(MsgClusterData,))
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = MsgClusterData
 
     else:
@@ -1022,7 +984,7 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     if MsgAttrID == '0051':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Out of Service: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Out of Service: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         if MsgClusterData == '00':
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['Out of Service'] = False
         elif MsgClusterData == '01':
@@ -1030,7 +992,7 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['Out of Service'] = True
 
     elif MsgAttrID == '0055':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Present Value: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Present Value: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
         if MsgClusterData == '00': 
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['Active State'] = False
@@ -1041,10 +1003,10 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.log.logging( "Cluster", 'Log', "Legrand unknown Model %s Value: %s" %(self.ListOfDevices[MsgSrcAddr]['Model'], MsgClusterData), MsgSrcAddr)
             return
             
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Model: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]['Model']), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Model: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]['Model']))
         if self.ListOfDevices[MsgSrcAddr]['Model'] != {}:
             if self.ListOfDevices[MsgSrcAddr]['Model'] in LEGRAND_REMOTE_SWITCHS:
-                self.log.logging( "Cluster", 'Debug', "Legrand remote Switch Present Value: %s" %MsgClusterData, MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "Legrand remote Switch Present Value: %s", MsgSrcAddr, args=(MsgClusterData,))
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0006', MsgClusterData)
 
             elif self.ListOfDevices[MsgSrcAddr]['Model'] in LEGRAND_REMOTE_SHUTTER:
@@ -1058,7 +1020,7 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 # The Shutter should have the Led on its right
                 # Present Value: 0x01 -> Open
                 # Present Value: 0x00 -> Closed
-                self.log.logging( "Cluster", 'Debug', "---->Legrand Shutter switch with neutral Present Value: %s" %MsgClusterData, MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "---->Legrand Shutter switch with neutral Present Value: %s", MsgSrcAddr, args=(MsgClusterData,))
                 if MsgClusterData == '01':
                     value = '%02x' %100
                 else:
@@ -1067,8 +1029,7 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 if 'SWBUILD_3' in self.ListOfDevices[MsgSrcAddr]:
                     if int(self.ListOfDevices[MsgSrcAddr]['SWBUILD_3'],16) >= 0x01a:
                         # Do not use Present Value anymore
-                        self.log.logging( "Cluster",  'Debug', "ReadCluster - %s - %s/%s - SWBUILD_3: %0X do not report present value %s"
-                            %(MsgAttrID, MsgSrcAddr, MsgSrcEp, int(self.ListOfDevices[MsgSrcAddr]['SWBUILD_3'],16), value), MsgSrcAddr)
+                        self.log.logging( "Cluster",  'Debug', "ReadCluster - %s - %s/%s - SWBUILD_3: %0X do not report present value %s", MsgSrcAddr, args=(MsgAttrID, MsgSrcAddr, MsgSrcEp, int(self.ListOfDevices[MsgSrcAddr]['SWBUILD_3'],16), value))
                         return
 
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0102', value)
@@ -1098,20 +1059,19 @@ def Cluster000f( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 '02': 'Overridden',
                 '03': 'Out Of service'
                 }
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Status Flag: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Status Flag: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         if MsgClusterData in STATUS_FLAGS:
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['Status'] = STATUS_FLAGS[MsgClusterData]
             if MsgClusterData != '00':
                 Domoticz.Status("Device %s/%s Status flag: %s %s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData, STATUS_FLAGS[MsgClusterData]))
             else:
-                self.log.logging( "Cluster", 'Debug', "Device %s/%s Status flag: %s %s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData, STATUS_FLAGS[MsgClusterData]))
+                self.log.logging( "Cluster", 'Debug', "Device %s/%s Status flag: %s %s", args=(MsgSrcAddr, MsgSrcEp, MsgClusterData, STATUS_FLAGS[MsgClusterData]))
 
         else:
             Domoticz.Status("Device %s/%s Status flag: %s" %(MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
     elif MsgAttrID == 'fffd':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     else:
         self.log.logging( "Cluster", 'Log', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
@@ -1123,8 +1083,7 @@ def Cluster0012( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         return
     _modelName = self.ListOfDevices[MsgSrcAddr]['Model']
 
-    self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s - MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s Model: %s"
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, _modelName), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s - MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s Model: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, _modelName))
 
     # Hanlding Message from the Aqara Opple Switch 2,4,6 buttons
     if _modelName in ('lumi.remote.b686opcn01', 'lumi.remote.b486opcn01', 'lumi.remote.b286opcn01'):    
@@ -1137,7 +1096,7 @@ def Cluster0012( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         # 2 -> Double press
         # 255 -> Long Release
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-        self.log.logging( "Cluster", 'Debug',"ReadCluster - ClusterId=0012 - Switch Aqara: EP: %s Value: %s " %(MsgSrcEp,value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug',"ReadCluster - ClusterId=0012 - Switch Aqara: EP: %s Value: %s ", MsgSrcAddr, args=(MsgSrcEp,value))
         if value == 0: 
             value = 3
 
@@ -1148,7 +1107,7 @@ def Cluster0012( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif _modelName in ( 'lumi.sensor_switch.aq3', 'lumi.sensor_switch.aq3'):
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - Switch Aqara (AQ2): EP: %s Value: %s " %(MsgSrcEp,value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - Switch Aqara (AQ2): EP: %s Value: %s ", MsgSrcAddr, args=(MsgSrcEp,value))
  
          # Store the value in Cluster 0x0006 (as well)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, "0006",str(value))
@@ -1157,14 +1116,14 @@ def Cluster0012( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
  
     elif _modelName in ( 'lumi.ctrl_ln2.aq1', ):
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - Switch Aqara lumi.ctrl_ln2.aq1: EP: %s Attr: %s Value: %s " %(MsgSrcEp,MsgAttrID, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - Switch Aqara lumi.ctrl_ln2.aq1: EP: %s Attr: %s Value: %s ", MsgSrcAddr, args=(MsgSrcEp,MsgAttrID, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif _modelName in ( 'lumi.sensor_cube.aqgl01', 'lumi.sensor_cube'):
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, cube_decode(self, MsgClusterData, MsgSrcAddr) )
 
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  cube_decode(self, MsgClusterData, MsgSrcAddr) )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - reception Xiaomi Magic Cube Value: " + str(cube_decode(self, MsgClusterData, MsgSrcAddr)) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0012 - reception Xiaomi Magic Cube Value: %s" , MsgSrcAddr, args=(cube_decode(self, MsgClusterData, MsgSrcAddr),))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s Model: %s" 
@@ -1177,24 +1136,22 @@ def Cluster0100( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,MsgClusterData)
     
     if MsgAttrID == "0000":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: PhysicalClosedLimit: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: PhysicalClosedLimit: %s", MsgSrcAddr, args=(MsgClusterData,))
     elif MsgAttrID == "0001":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: MotorStepSize: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: MotorStepSize: %s", MsgSrcAddr, args=(MsgClusterData,))
     elif MsgAttrID == "0002":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: Status: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: Status: %s", MsgSrcAddr, args=(MsgClusterData,))
     elif MsgAttrID == "0010":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: ClosedLimit: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: ClosedLimit: %s", MsgSrcAddr, args=(MsgClusterData,))
     elif MsgAttrID == "0011":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: Mode: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0100 - Shade Config: Mode: %s", MsgSrcAddr, args=(MsgClusterData,))
     else:
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
 def Cluster0101( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
     
     # Door Lock Cluster
-    self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: %s, EP:%s AttrID: %s, AttrType: %s, AttrSize: %s Attribute: %s Len: %s" \
-            %( MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, len(MsgClusterData)), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: %s, EP:%s AttrID: %s, AttrType: %s, AttrSize: %s Attribute: %s Len: %s", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, len(MsgClusterData)))
 
     if MsgAttrID == "0000":          # Lockstate
         LOCKSTATE = {
@@ -1238,22 +1195,22 @@ def Cluster0101( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         
 
     elif MsgAttrID == "0001":         # Locktype
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: Lock type "  + str(MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: Lock type %s", MsgSrcAddr, args=(MsgClusterData,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,MsgClusterData)
 
     elif MsgAttrID == "0002":         # Enabled
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: Enabled "  + str(MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0101 - Dev: Enabled %s", MsgSrcAddr, args=(MsgClusterData,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,MsgClusterData)
 
     # Aqara related
     elif MsgAttrID ==  "0055":   # Aqara Vibration: Vibration, Tilt, Drop
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s - Aqara Vibration - Event: %s" %(MsgClusterId, MsgAttrID, MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s - Aqara Vibration - Event: %s" , MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgClusterData))
         state = decode_vibr( MsgClusterData )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, state )
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,state)
 
     elif MsgAttrID == "0503":   # Bed activties: Tilt angle
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s -  Vibration Angle: %s" %(MsgClusterId, MsgAttrID, MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s -  Vibration Angle: %s" , MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData)
 
         if MsgClusterData == "0054": # Following Tilt
@@ -1266,7 +1223,7 @@ def Cluster0101( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         # with which I get a graph where I can see the value of "Strenght" as a function of time
         value = int(MsgClusterData, 16)
         strenght = ( value >> 16 ) & 0xffff
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s -  Vibration Strenght: %s %s %s" %(MsgClusterId, MsgAttrID, MsgClusterData, value, strenght) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s -  Vibration Strenght: %s %s %s" , MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgClusterData, value, strenght))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, 'Strenght', str(strenght), Attribute_=MsgAttrID)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,strenght)
 
@@ -1278,8 +1235,7 @@ def Cluster0101( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
         angleX, angleY, angleZ = decode_vibrAngle( MsgClusterData)
 
-        self.log.logging( "Cluster", 'Debug', " ReadCluster %s/%s - AttrType: %s AttrLenght: %s AttrData: %s Vibration ==> angleX: %s angleY: %s angleZ: %s" \
-                %(MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, angleX, angleY, angleZ), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', " ReadCluster %s/%s - AttrType: %s AttrLenght: %s AttrData: %s Vibration ==> angleX: %s angleY: %s angleZ: %s", MsgSrcAddr, args=(MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, angleX, angleY, angleZ))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, 'Orientation', 'angleX: %s, angleY: %s, angleZ: %s' %(angleX, angleY, angleZ) , Attribute_=MsgAttrID)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,'angleX: %s, angleY: %s, angleZ: %s' %(angleX, angleY, angleZ) )
         
@@ -1295,10 +1251,10 @@ def Cluster0102( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     value = decodeAttribute(self, MsgAttType, MsgClusterData)
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value)
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Attribute: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Attribute: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     if MsgAttrID == "0000":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Window Covering Type: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Window Covering Type: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
         WINDOW_COVERING = { '00': 'Rollershade',
                             '01': 'Rollershade - 2 Motor',
                             '02': 'Rollershade – Exterior',
@@ -1312,22 +1268,22 @@ def Cluster0102( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                             }
 
     elif  MsgAttrID == "0001":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Physical close limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Physical close limit lift cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif  MsgAttrID == "0002":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Physical close limit Tilt cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Physical close limit Tilt cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0003":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Lift in cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Lift in cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0004":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Tilt in cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Tilt in cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0005":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Number of Actuations – Lift: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Number of Actuations – Lift: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0006":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Number of Actuations – Tilt: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Number of Actuations – Tilt: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0007":
         # 00000001 - 0-Not Operational, 1-Operational
@@ -1341,14 +1297,12 @@ def Cluster0102( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.log.logging( "Cluster", self, 'Debug', "ReadCluster - %s - %s/%s - Config Status: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
 
     elif MsgAttrID == "0008":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0x%s - %s - %s/%s - Current position lift in %%: %s, Type: %s, Size: %s Data: %s-%s" 
-            %(Source, MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0x%s - %s - %s/%s - Current position lift in %%: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(Source, MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
 
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] != {} ):
 
-            self.log.logging( "Cluster",  'Debug', "ReadCluster - %s - %s/%s - Model: %s" 
-                %(MsgAttrID, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]['Model']), MsgSrcAddr)
+            self.log.logging( "Cluster",  'Debug', "ReadCluster - %s - %s/%s - Model: %s", MsgSrcAddr, args=(MsgAttrID, MsgSrcAddr, MsgSrcEp, self.ListOfDevices[MsgSrcAddr]['Model']))
 
             if self.ListOfDevices[MsgSrcAddr]['Model'] == 'TS0302' and value == 50:
                 # Zemismart Blind shutter switch send 50 went the swicth is on wait mode
@@ -1367,29 +1321,28 @@ def Cluster0102( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                     Domoticz.Log("==>INVERSE===")
                     value = 100 - value
 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Shutter switch with neutral After correction value: %s" 
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Shutter switch with neutral After correction value: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
 
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, "%02x" %value )
 
     elif MsgAttrID == "0009":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Tilte in %%: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Curent position Tilte in %%: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0010":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Open limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Open limit lift cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0011":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Closed limit lift cm: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Closed limit lift cm: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "0014":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Velocity lift: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Velocity lift: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
         self.log.logging( "Cluster", 'Debug', "Velocity", MsgSrcAddr)
 
     elif MsgAttrID == "0017":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Windows Covering mode: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Windows Covering mode: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     elif MsgAttrID == "fffd":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - AttributeID: %s, Type: %s, Size: %s Data: %s-%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - AttributeID: %s, Type: %s, Size: %s Data: %s-%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
@@ -1397,8 +1350,7 @@ def Cluster0102( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
     # Thermostat cluster
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s"
-            %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     value = decodeAttribute( self, MsgAttType, MsgClusterData)
 
@@ -1409,52 +1361,52 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0402',ValueTemp)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  ValueTemp )
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,'0402', '0000',  ValueTemp )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Local Temp: %s" %ValueTemp, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Local Temp: %s", MsgSrcAddr, args=(ValueTemp,))
 
     elif MsgAttrID == '0001': # Outdoor Temperature
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Outdoor Temp: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Outdoor Temp: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0002': # Occupancy
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Occupancy: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Occupancy: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0003': # Min Heat Setpoint Limit
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Min Heat Setpoint Limit: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Min Heat Setpoint Limit: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0004': # Max Heat Setpoint Limit
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Max Heat Setpoint Limit: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Max Heat Setpoint Limit: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0005': # Min Cool Setpoint Limit
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Min Cool Setpoint Limit: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Min Cool Setpoint Limit: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0006': # Max Cool Setpoint Limit
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Max Cool Setpoint Limit: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Max Cool Setpoint Limit: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0007':   #  Pi Cooling Demand  (valve position %)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Pi Cooling Demand: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Pi Cooling Demand: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0008':   #  Pi Heating Demand  (valve position %)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Pi Heating Demand: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Pi Heating Demand: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0009':   #  HVAC System Type Config
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s HVAC System Type Config: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s HVAC System Type Config: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '0010':   # Calibration / Adjustement
         value = value / 10 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Calibration: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Calibration: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0011':   # Cooling Setpoint (Zinte16)
         ValueTemp=round(int(value)/100,1)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Cooling Setpoint: %s" %ValueTemp, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Cooling Setpoint: %s", MsgSrcAddr, args=(ValueTemp,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  ValueTemp )
 
         if self.ListOfDevices[MsgSrcAddr]['Model'] in  ('AC211', 'AC221'):
@@ -1467,7 +1419,7 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == '0012':   # Heat Setpoint (Zinte16)
         ValueTemp = round(int(value)/100,2)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Heating Setpoint: %s ==> %s" %(value, ValueTemp), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Heating Setpoint: %s ==> %s", MsgSrcAddr, args=(value, ValueTemp))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  int(value) )
 
         if 'Model' in self.ListOfDevices[MsgSrcAddr]:
@@ -1483,7 +1435,7 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
             elif self.ListOfDevices[MsgSrcAddr]['Model'] == 'EH-ZB-VACT':
                 # In case of Schneider Wiser Valve, we have to 
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - ValueTemp: %s" %int( ((ValueTemp * 100) * 2) / 2 ), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - ValueTemp: %s", MsgSrcAddr, args=(int( ((ValueTemp * 100) * 2) / 2 ),))
                 if 'Schneider' in self.ListOfDevices[MsgSrcAddr]:
                     if 'Target SetPoint' in self.ListOfDevices[MsgSrcAddr]['Schneider']:
                         if self.ListOfDevices[MsgSrcAddr]['Schneider']['Target SetPoint'] == int( ((ValueTemp * 100) * 2) / 2 ):
@@ -1510,41 +1462,41 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             elif self.ListOfDevices[MsgSrcAddr]['Model'] != 'SPZB0001':
                 # In case it is not a Eurotronic, let's Update heatPoint
                 # As Eurotronics will rely on 0x4003 attributes
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Request update on Domoticz %s not a Schneider, not a Eurotronics" %MsgSrcAddr, MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Request update on Domoticz %s not a Schneider, not a Eurotronics", MsgSrcAddr, args=(MsgSrcAddr,))
                 MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,ValueTemp,Attribute_=MsgAttrID)
                                 
 
     elif MsgAttrID == '0014':   # Unoccupied Heating
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Unoccupied Heating:  %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Unoccupied Heating:  %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0015':   # MIN_HEAT_SETPOINT_LIMIT
         ValueTemp=round(int(value)/100,1)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Min SetPoint: %s" %ValueTemp, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Min SetPoint: %s", MsgSrcAddr, args=(ValueTemp,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  ValueTemp )
 
     elif MsgAttrID == '0016':   # MAX_HEAT_SETPOINT_LIMIT
         ValueTemp=round(int(value)/100,1)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Max SetPoint: %s" %ValueTemp, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Max SetPoint: %s", MsgSrcAddr, args=(ValueTemp,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  ValueTemp )
 
     elif MsgAttrID == '001a': # Remote Sensing
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Remote Sensing: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Remote Sensing: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
     elif MsgAttrID == '0025':   # Scheduler state
         # Bit #0 => disable/enable Scheduler
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Scheduler state:  %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Scheduler state:  %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0029':   # Heating operation state
         # bit #0 heat On/Off state
         # bit #1 cool on/off state
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Heating operation state:  %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Heating operation state:  %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0045': # ACLouverPosition
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - ACLouverPosition:  %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - ACLouverPosition:  %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '001b': # Control Sequence Operation
@@ -1557,11 +1509,11 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 '04': 'Cooling and heating',
                 '05': 'Cooling and heating with reheat'
                 }
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Control Sequence Operation: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Control Sequence Operation: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == '001c':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - System Mode: %s" %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - System Mode: %s", MsgSrcAddr, args=(value,))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value, Attribute_=MsgAttrID )
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
@@ -1574,29 +1526,29 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == '001d':
 
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Alarm Mask: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Alarm Mask: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0403':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 403: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 403: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0405':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 405 ( thermostat mode ?=regulator mode For Elko) : %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 405 ( thermostat mode ?=regulator mode For Elko) : %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0406':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 406 : %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 406 : %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0408':
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 408 ( Elko power consumption in last 10 minutes): %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 408 ( Elko power consumption in last 10 minutes): %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID == '0409':
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 409: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute 409: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     elif MsgAttrID in ( '4000', '4001', '4002', '4003', '4008' ):
@@ -1610,22 +1562,22 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         if eurotronics:
             # Eurotronic SPZB Specifics
             if MsgAttrID == '4000': # TRV Mode for EUROTRONICS
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s TRV Mode: %s" %(MsgSrcAddr, MsgSrcEp,value), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s TRV Mode: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,value))
                 checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
             elif MsgAttrID == '4001': # Valve position for EUROTRONICS
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Valve position: %s" %(MsgSrcAddr, MsgSrcEp,value), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Valve position: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,value))
                 checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
             elif MsgAttrID == '4002': # Erreors for EUROTRONICS
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Status: %s" %(MsgSrcAddr, MsgSrcEp,value), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Status: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,value))
                 checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
             elif MsgAttrID == '4003': # Current Temperature Set point for EUROTRONICS
                 setPoint = ValueTemp = round(int(value)/100,2)
                 if '0012' in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]:
                     setPoint = self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['0012']
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Current Temp Set point: %s versus %s " %(MsgSrcAddr, MsgSrcEp,ValueTemp, setPoint), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Current Temp Set point: %s versus %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,ValueTemp, setPoint))
                 if ValueTemp != float(setPoint):
                     # Seems that there is a local setpoint
                     MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0201',ValueTemp, Attribute_=MsgAttrID)
@@ -1646,7 +1598,7 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                         0x000020:'enable off mode',
                         0x000080:'child lock'
                         }
-                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Host Flags: %s" %(MsgSrcAddr, MsgSrcEp,value), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - %s/%s Host Flags: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp,value))
                 checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
                 if ( int(value,16) & 0x000010 ) == 0x00000010:
@@ -1665,83 +1617,81 @@ def Cluster0201( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 '06': 'Holiday Frost Protection', }
 
             if MsgClusterData in THERMOSTAT_MODE:
-                self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Thermostat Mode %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, THERMOSTAT_MODE[MsgClusterData]), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Thermostat Mode %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, THERMOSTAT_MODE[MsgClusterData]))
             else:
-                self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Thermostat Mode 0xe010 %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+                self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Thermostat Mode 0xe010 %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0201',MsgClusterData, Attribute_=MsgAttrID)
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
         elif MsgAttrID == 'e011':  # hact mode : fip or conventional and heating mode : fip or setpoint 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_HACT_CONFIG  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_HACT_CONFIG  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0201',MsgClusterData, Attribute_=MsgAttrID)
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
         elif MsgAttrID == 'e012':  # 57362, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_STATUS  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0500',MsgClusterData )
 
         elif MsgAttrID == 'e013': # 57363, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_THRESHOLD  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
         elif MsgAttrID == 'e014': # 57364, ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider ATTRIBUTE_THERMOSTAT_OPEN_WINDOW_DETECTION_INTERVAL  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
         elif MsgAttrID == 'e020': # fip mode
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider FIP mode  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider FIP mode  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0201',MsgClusterData, Attribute_=MsgAttrID)
 
         elif MsgAttrID == 'e030': 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Valve Position  %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Valve Position  %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
         elif MsgAttrID == 'e031':
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Valve Calibration Status %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Valve Calibration Status %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     elif MsgAttrID == 'fd00':
         # Casia.IA / Wing On/off
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute fd00 (Wing): %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0201 - Attribute fd00 (Wing): %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value, Attribute_=MsgAttrID)
 
     else:
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
         
 def Cluster0202( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source ):
     
     # Thermostat cluster
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - 0202 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s"
-            %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - 0202 - %s/%s AttrId: %s AttrType: %s AttSize: %s Data: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     value = decodeAttribute( self, MsgAttType, MsgClusterData)
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  value )
 
     if MsgAttrID =='0000':  # Fan Mode
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0202 - Fan Mode: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0202 - Fan Mode: %s", MsgSrcAddr, args=(value,))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, '%02x' %value)
 
     elif MsgAttrID == '0001': # Fan Mode Sequence
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Fan Mode Sequenec: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s Fan Mode Sequenec: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
 
 def Cluster0204( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster 0204 - Addr: %s Ep: %s AttrId: %s AttrType: %s AttSize: %s Data: %s"
-            %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster 0204 - Addr: %s Ep: %s AttrId: %s AttrType: %s AttSize: %s Data: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     if MsgAttrID == '0000':
         # TemperatureDisplayMode
         if MsgClusterData == '00':
-            self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s 0204 - Temperature Display Mode : %s --> °C" %( MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s 0204 - Temperature Display Mode : %s --> °C", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, MsgClusterData))
         elif MsgClusterData == '01':
-            self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s 0204 - Temperature Display Mode : %s -->  °F" %( MsgSrcAddr, MsgSrcEp, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster %s/%s 0204 - Temperature Display Mode : %s -->  °F", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, MsgClusterData))
 
     elif MsgAttrID == '0001':
         # Keypad Lock Mode
@@ -1749,9 +1699,9 @@ def Cluster0204( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             '00': 'no lockout'
         }
         value = decodeAttribute( self, MsgAttType, MsgClusterData)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster 0204 - Lock Mode: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster 0204 - Lock Mode: %s", MsgSrcAddr, args=(value,))
     else:
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
 
 def Cluster0300( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
@@ -1765,34 +1715,34 @@ def Cluster0300( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     value = decodeAttribute( self, MsgAttType, MsgClusterData)
     if MsgAttrID == "0000":     # CurrentHue
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['Hue'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentHue: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentHue: %s", MsgSrcAddr, args=(value,))
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-Hue']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0001":   # CurrentSaturation
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['Saturation'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentSaturation: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentSaturation: %s", MsgSrcAddr, args=(value,))
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-Saturation']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0002":   
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - %s/%s RemainingTime: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - %s/%s RemainingTime: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
 
     elif MsgAttrID == "0003":     # CurrentX
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['X'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentX: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentX: %s", MsgSrcAddr, args=(value,))
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-X']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0004":   # CurrentY
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['Y'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentY: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - CurrentY: %s", MsgSrcAddr, args=(value,))
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-Y']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == "0007":   # ColorTemperatureMireds
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['ColorTemperatureMireds'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - ColorTemperatureMireds: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - ColorTemperatureMireds: %s", MsgSrcAddr, args=(value,))
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-ColorTemperatureMireds']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
@@ -1801,47 +1751,47 @@ def Cluster0300( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 '01': 'Current x and current y',
                 '02': 'Color temperature' }
 
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Color Mode: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Color Mode: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
         self.ListOfDevices[MsgSrcAddr]['ColorInfos']['ColorMode'] = value
         if self.pluginconf.pluginConf['capturePairingInfos'] == 1 and MsgSrcAddr in self.DiscoveryDevices:
             self.DiscoveryDevices[MsgSrcAddr]['ColorInfos-ColorMode']=str(decodeAttribute( self, MsgAttType, MsgClusterData) )
 
     elif MsgAttrID == '000f':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
 
     elif MsgAttrID == "f000":
         # 070000df
         # 00800900
         #self.ListOfDevices[MsgSrcAddr]['ColorInfos']['ColorMode'] = value
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - Color Mode: %s" %value, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0300 - Color Mode: %s", MsgSrcAddr, args=(value,))
 
     # Seems to be Hue related
     elif MsgAttrID == '0010':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '001a':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '0032':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '0033':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '0034':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '0036':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '0037':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '4001':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '400a':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '400b':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '400c':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '400d':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
     elif MsgAttrID == '4010':
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr) 
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData)) 
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
@@ -1858,7 +1808,7 @@ def Cluster0400( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             lux = value
         else:
             lux = int(pow( 10, ((value -1) / 10000.00)))
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - LUX Sensor: %s/%s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData, lux), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - LUX Sensor: %s/%s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData, lux))
 
     MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(lux))
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, lux)
@@ -1882,15 +1832,15 @@ def Cluster0402( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         
         if value > 0x7FFF and  value < 0x954D:
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Invalid Temperature Measurement: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Invalid Temperature Measurement: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         else:
             value = round(value/100,1)
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Temperature Measurement: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Temperature Measurement: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value )
             
     elif MsgAttrID == '0001':
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData))
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0001: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0001: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] == 'VOC_Sensor' ):
             # Humidity
@@ -1899,7 +1849,7 @@ def Cluster0402( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == '0002':
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData))
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0002: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0002: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] == 'VOC_Sensor' ):
             # ECO2
@@ -1908,7 +1858,7 @@ def Cluster0402( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == '0003':
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData))
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0003: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Attribute 0x0003: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         if ( 'Model' in self.ListOfDevices[MsgSrcAddr] and self.ListOfDevices[MsgSrcAddr]['Model'] == 'VOC_Sensor' ):
             # VOC
@@ -1917,7 +1867,7 @@ def Cluster0402( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     else:
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
-        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
 def Cluster0403( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
     # (Measurement: Pression atmospherique)
@@ -1927,23 +1877,23 @@ def Cluster0403( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         return
 
     value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-    self.log.logging( "Cluster", 'Debug', "Cluster0403 - decoded value: from:%s to %s" %( MsgClusterData, value) , MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "Cluster0403 - decoded value: from:%s to %s" , MsgSrcAddr, args=( MsgClusterData, value))
 
     if MsgAttrID == "0000": # Atmo in mb
         #value = round((value/100),1)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,value)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0403 - 0000 reception atm: " + str(value ) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0403 - 0000 reception atm: %s" , MsgSrcAddr, args=(value,))
 
     elif MsgAttrID == "0010": # Atmo in 10xmb
         value = round((value/10),1)
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,value)
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=%s - Scaled value %s: %s " %(MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=%s - Scaled value %s: %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData))
 
     elif MsgAttrID == "0014": # Scale
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=%s - Scale %s: %s " %(MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s/%s ClusterId=%s - Scale %s: %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgClusterData))
 
     else:
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
@@ -1966,7 +1916,7 @@ def Cluster0405( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.log.logging( "Cluster", 'Log', "ReadCluster - ClusterId=0405 - Invalid hum: %s - %s" %(int(MsgClusterData,16),value) , MsgSrcAddr)
         else:
             value = round(value/100,1)
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0405 - reception hum: %s - %s" %(int(MsgClusterData,16),value) , MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0405 - reception hum: %s - %s" , MsgSrcAddr, args=(int(MsgClusterData,16),value))
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, value )
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = value
     else:
@@ -1979,26 +1929,23 @@ def Cluster0406( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
 
     if MsgAttrID == '0000':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - reception Occupancy Sensor: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - reception Occupancy Sensor: %s" , MsgSrcAddr, args=(MsgClusterData,))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,MsgClusterData)
 
     elif MsgAttrID == '0001':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),MsgSrcAddr)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Sensor Type: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Sensor Type: %s" , MsgSrcAddr, args=(MsgClusterData,))
 
     elif MsgAttrID == '0010':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),MsgSrcAddr)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Occupied to UnOccupied delay: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Occupied to UnOccupied delay: %s" , MsgSrcAddr, args=(MsgClusterData,))
 
     elif MsgAttrID == '0011':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),MsgSrcAddr)
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - UnOccupied to Occupied delay: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - NwkId: %s Ep: %s AttrId: %s AttyType: %s Attsize: %s AttrValue: %s",MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - UnOccupied to Occupied delay: %s" , MsgSrcAddr, args=(MsgClusterData,))
 
     elif MsgAttrID == '0030':
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Attribut 0030: " + str(MsgClusterData) , MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - ClusterId=0406 - Attribut 0030: %s" , MsgSrcAddr, args=(MsgClusterData,))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " 
@@ -2013,8 +1960,7 @@ def Cluster0500( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     if MsgClusterData == '':
         return
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s" \
-            %( MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData ), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s", MsgSrcAddr, args=( MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData ))
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, MsgClusterData )
 
@@ -2033,21 +1979,21 @@ def Cluster0500( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     if MsgAttrID == "0000": # ZoneState ( 0x00 Not Enrolled / 0x01 Enrolled )
         if int(MsgClusterData,16) == 0x00:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s NOT ENROLLED (0x%02d)" %(MsgSrcAddr,  int(MsgClusterData,16)), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s NOT ENROLLED (0x%02d)", MsgSrcAddr, args=(MsgSrcAddr,  int(MsgClusterData,16)))
             self.ListOfDevices[MsgSrcAddr]['IAS'][MsgSrcEp]['EnrolledStatus'] = int(MsgClusterData,16)
         elif  int(MsgClusterData,16) == 0x01:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s ENROLLED (0x%02d)" %(MsgSrcAddr,  int(MsgClusterData,16)), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s ENROLLED (0x%02d)", MsgSrcAddr, args=(MsgSrcAddr,  int(MsgClusterData,16)))
             self.ListOfDevices[MsgSrcAddr]['IAS'][MsgSrcEp]['EnrolledStatus'] = int(MsgClusterData,16)
         self.iaszonemgt.receiveIASmessages( MsgSrcAddr, MsgSrcEp, 5, MsgClusterData)
 
     elif MsgAttrID == "0001": # ZoneType
         if int(MsgClusterData,16) in ZONE_TYPE:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s - ZoneType: %s" %(MsgSrcAddr, ZONE_TYPE[int(MsgClusterData,16)]), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s - ZoneType: %s", MsgSrcAddr, args=(MsgSrcAddr, ZONE_TYPE[int(MsgClusterData,16)]))
             self.ListOfDevices[MsgSrcAddr]['IAS'][MsgSrcEp]['ZoneType'] = int(MsgClusterData,16)
             self.ListOfDevices[MsgSrcAddr]['IAS'][MsgSrcEp]['ZoneTypeName'] = ZONE_TYPE[int(MsgClusterData,16)]
         else: 
 
-            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s - Unknown ZoneType: %s" %(MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s - Unknown ZoneType: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgClusterData))
         self.iaszonemgt.receiveIASmessages( MsgSrcAddr, MsgSrcEp, 5, MsgClusterData)
 
     elif MsgAttrID == "0002": # Zone Status
@@ -2067,8 +2013,7 @@ def Cluster0500( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = \
                     'alarm1: %s, alarm2: %s, tamper: %s, batter: %s, srepor: %s, rrepor: %s, troubl: %s, acmain: %s, test: %s, batdef: %s' \
                     %(alarm1, alarm2, tamper, batter, srepor, rrepor, troubl, acmain, test, batdef)
-            self.log.logging( "Cluster", 'Debug', "ReadCluster 0500/0002 - IAS Zone - Device:%s status alarm1: %s, alarm2: %s, tamper: %s, batter: %s, srepor: %s, rrepor: %s, troubl: %s, acmain: %s, test: %s, batdef: %s" \
-                    %( MsgSrcAddr, alarm1, alarm2, tamper, batter, srepor, rrepor, troubl, acmain, test, batdef), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster 0500/0002 - IAS Zone - Device:%s status alarm1: %s, alarm2: %s, tamper: %s, batter: %s, srepor: %s, rrepor: %s, troubl: %s, acmain: %s, test: %s, batdef: %s", MsgSrcAddr, args=( MsgSrcAddr, alarm1, alarm2, tamper, batter, srepor, rrepor, troubl, acmain, test, batdef))
 
             if ( 'IAS' in self.ListOfDevices[MsgSrcAddr] and 
                     MsgSrcEp in self.ListOfDevices[MsgSrcAddr]['IAS'] and 
@@ -2090,36 +2035,34 @@ def Cluster0500( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, '%02d' %( alarm1 or alarm2) )
             
         else:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s empty data: %s" %(MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s empty data: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgClusterData))
 
     elif MsgAttrID == "0010": # IAS CIE Address
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - IAS CIE Address: %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - IAS CIE Address: %s", MsgSrcAddr, args=(MsgClusterData,))
         self.iaszonemgt.receiveIASmessages( MsgSrcAddr, MsgSrcEp, 7, MsgClusterData)
 
     elif MsgAttrID == "0011": # Zone ID
-        self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - ZoneID : %s" %MsgClusterData, MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - ZoneID : %s", MsgSrcAddr, args=(MsgClusterData,))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s Data: %s" %(MsgSrcAddr, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster0500 - Device: %s Data: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgClusterData))
 
 def Cluster0502( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster0502 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s" \
-            %( MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData ), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster0502 - Security & Safety IAZ Zone - Device: %s MsgAttrID: %s MsgAttType: %s MsgAttSize: %s MsgClusterData: %s", MsgSrcAddr, args=( MsgSrcAddr, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData ))
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(decodeAttribute( self, MsgAttType, MsgClusterData)) )
 
     if MsgAttrID == "0000": # Max Duration
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0502 - %s/%s Max Duration: %s" \
-                %( MsgSrcAddr, MsgSrcEp, str(decodeAttribute( self, MsgAttType, MsgClusterData) )), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0502 - %s/%s Max Duration: %s", MsgSrcAddr, args=( MsgSrcAddr, MsgSrcEp, decodeAttribute( self, MsgAttType, MsgClusterData)))
         if 'IAS WD' not in self.ListOfDevices[MsgSrcAddr]:
             self.ListOfDevices[MsgSrcAddr]['IAS WD'] = {}
         self.ListOfDevices[MsgSrcAddr]['IAS WD']['MaxDuration'] = decodeAttribute( self, MsgAttType, MsgClusterData)
 
     elif MsgAttrID == "fffd":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0502 - %s/%s unknown attribute: %s %s %s %s" %(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - 0502 - %s/%s unknown attribute: %s %s %s %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
@@ -2132,13 +2075,13 @@ def compute_conso( self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, raw_valu
        and '0302' in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]):
         diviser = self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['0302']
         value = round( conso / ( diviser / 1000 ),3)
-        self.log.logging( "Cluster", 'Debug', "compute_conso - %s Power %s, div: %s --> %s Watts" %( MsgAttrID, conso, diviser, value))
+        self.log.logging( "Cluster", 'Debug', "compute_conso - %s Power %s, div: %s --> %s Watts", args=( MsgAttrID, conso, diviser, value))
     elif ( MsgSrcEp in self.ListOfDevices[MsgSrcAddr]['Ep']
            and MsgClusterId in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp] 
            and '0301' in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]):
         multiplier = self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['0301']
         value = round( conso * multiplier, 3)
-        self.log.logging( "Cluster", 'Debug', "compute_conso - %s Power %s, multiply: %s --> %s Watts" %( MsgAttrID, conso, multiplier, value))
+        self.log.logging( "Cluster", 'Debug', "compute_conso - %s Power %s, multiply: %s --> %s Watts", args=( MsgAttrID, conso, multiplier, value))
     else:
         # Old fashion
         value = round(conso/10, 3)
@@ -2182,28 +2125,28 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 %(MsgSrcAddr, MsgSrcEp, value, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData),MsgSrcAddr,_context)
         value = 0
 
-    self.log.logging( "Cluster", 'Debug', "Cluster0702 - MsgAttrID: %s MsgAttType: %s DataLen: %s Data: %s decodedValue: %s" %(MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "Cluster0702 - MsgAttrID: %s MsgAttType: %s DataLen: %s Data: %s decodedValue: %s", MsgSrcAddr, args=(MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))
 
     if MsgAttrID == "0000": # CurrentSummationDelivered
         conso = compute_conso( self,  MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID,value)
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - 0x0000 CURRENT_SUMMATION_DELIVERED Value: %s Conso: %s " %(value, conso), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - 0x0000 CURRENT_SUMMATION_DELIVERED Value: %s Conso: %s ", MsgSrcAddr, args=(value, conso))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, conso )
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(conso), Attribute_='0000' )
 
     elif MsgAttrID == "0001": #CURRENT_SUMMATION_RECEIVED
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - CURRENT_SUMMATION_RECEIVED %s " %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - CURRENT_SUMMATION_RECEIVED %s ", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0002": #Current Max Demand Delivered
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Max Demand Delivered %s " %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Max Demand Delivered %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "000a": #ATTR_DEFAULT_UPDATE_PERIOD
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - ATTR_DEFAULT_UPDATE_PERIOD %s " %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - ATTR_DEFAULT_UPDATE_PERIOD %s ", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "000b": #FAST_POLL_UPDATE_PERIOD
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - FAST_POLL_UPDATE_PERIOD %s " %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - FAST_POLL_UPDATE_PERIOD %s ", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0017": # Inlet Temperature
@@ -2223,7 +2166,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         if value in METERING_STATUS:
             value = METERING_STATUS[value]
 
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - Status: %s" %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - Status: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0300":   # Unit of Measure
@@ -2236,23 +2179,23 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         if value in MEASURE_UNITS:
             value = MEASURE_UNITS[value]
 
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Unit of Measure: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Unit of Measure: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0301":   # Multiplier
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Multiplier: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Multiplier: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0302":   # Divisor
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Divisor: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Divisor: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0303":   # "Summation Formatting
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Summation Formatting: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Summation Formatting: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0304":   # TotalActivePower
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s TotalActivePower: %s" %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s TotalActivePower: %s", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0306":   # Device Type
@@ -2267,7 +2210,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         if value in MEASURE_DEVICE_TYPE:
             value = MEASURE_DEVICE_TYPE[value]
 
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - Divisor: %s" %(value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - Divisor: %s", MsgSrcAddr, args=(value,))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID == "0400": 
@@ -2276,7 +2219,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             return
         conso = compute_conso( self, MsgSrcAddr,MsgSrcEp, MsgClusterId, MsgAttrID, value )
 
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - 0x0400 Instant demand raw_value: %s Conso: %s" %(value, conso), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - 0x0400 Instant demand raw_value: %s Conso: %s", MsgSrcAddr, args=(value, conso))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId,str(conso))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, str(conso) )
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(conso)
@@ -2287,7 +2230,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = str(value)
 
     elif MsgAttrID == '0801':
-        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Electricty Alarm Mask: %s " %(MsgSrcAddr, MsgSrcEp, value), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Electricty Alarm Mask: %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, value))
         checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
 
     elif MsgAttrID in ( '5000', '5001', '5101', '5121', '5500', '5501', '5601', '5622', '5a20', '5a22' ):
@@ -2300,10 +2243,10 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 }
 
         if MsgAttrID in ELECTRICAL_MEASURES:
-            self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Schneider %s : %s " %(MsgSrcAddr, MsgSrcEp, ELECTRICAL_MEASURES[MsgAttrID], value), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "Cluster0702 - %s/%s Schneider %s : %s ", MsgSrcAddr, args=(MsgSrcAddr, MsgSrcEp, ELECTRICAL_MEASURES[MsgAttrID], value))
             checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID, value )
         else:
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Attribute: %s  Raw Data: %s Decoded Data: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData, value), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s Schneider Attribute: %s  Raw Data: %s Decoded Data: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgClusterData, value))
 
     elif MsgAttrID in ( '2000', '2001', '2002', 
                         '2100', '2101', '2102', '2103' ,
@@ -2325,7 +2268,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             checkAndStoreAttributeValue( self, MsgSrcAddr, fake_ep, MsgClusterId, MsgAttrID, str(conso) )
             self.ListOfDevices[MsgSrcAddr]['Ep'][fake_ep][MsgClusterId]['0400'] = str(conso)
 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Power %s" %( MsgClusterId, MsgSrcAddr, fake_ep, line, conso))
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Power %s", args=( MsgClusterId, MsgSrcAddr, fake_ep, line, conso))
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, MsgClusterId, str(conso) )
 
         elif  MsgAttrID in ( '2100', '2101', '2102'): # Reactive Power
@@ -2344,7 +2287,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 self.ListOfDevices[ MsgSrcAddr ]['Ep'][ fake_ep ]['0001'] = {}
             self.ListOfDevices[MsgSrcAddr]['Ep'][fake_ep]['0001']['0000'] = str(value)
 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Voltage %s" %( MsgClusterId, MsgSrcAddr, fake_ep, line, value))
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Voltage %s", args=( MsgClusterId, MsgSrcAddr, fake_ep, line, value))
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, '0001', str(value) )
 
         elif MsgAttrID in ( '3100', '3101', '3102'): # Lx Current/Ampere
@@ -2357,7 +2300,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 self.ListOfDevices[ MsgSrcAddr ]['Ep'][ fake_ep ]['0b04'] = {}
             self.ListOfDevices[MsgSrcAddr]['Ep'][fake_ep]['0b04']['0508'] = str(value)
 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Current %s" %( MsgClusterId, MsgSrcAddr, fake_ep, line, value))
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Current %s", args=( MsgClusterId, MsgSrcAddr, fake_ep, line, value))
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, '0b04', str(value), Attribute_='0508')
 
         elif MsgAttrID in ( '4000', '4001', '4002'): # Lx Energy Consuption (Meter)
@@ -2368,7 +2311,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             checkAndStoreAttributeValue( self, MsgSrcAddr, fake_ep,MsgClusterId, MsgAttrID, str(value) )
             self.ListOfDevices[MsgSrcAddr]['Ep'][fake_ep][MsgClusterId]['0000'] = str(conso)
 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Summation Power %s" %( MsgClusterId, MsgSrcAddr, fake_ep, line, conso))
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Line: %s Summation Power %s", args=( MsgClusterId, MsgSrcAddr, fake_ep, line, conso))
             MajDomoDevice(self, Devices, MsgSrcAddr, fake_ep, '0702', str(conso), Attribute_='0000')
 
         elif  MsgAttrID in ( '4100', '4101', '4102'): # Reactive energy summation
@@ -2379,7 +2322,7 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
         else:
 
-            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Clamp: %s %s %s %s (value: %s)" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value), MsgSrcAddr)    
+            self.log.logging( "Cluster", 'Debug', "readCluster - %s - %s/%s CASAIA PC321 phase Power Clamp: %s %s %s %s (value: %s)", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, value))    
 
 
     else:
@@ -2389,14 +2332,12 @@ def Cluster0702( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 def Cluster0b04( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
     
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if MsgAttrID == "050b": # Active Power
         if -32768 <= int(MsgClusterData[0:4],16) <= 32767:
             value = int(decodeAttribute( self, MsgAttType, MsgClusterData[0:4] ))
-            self.log.logging( "Cluster",  'Debug', "ReadCluster %s - %s/%s Power %s" \
-                %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
+            self.log.logging( "Cluster",  'Debug', "ReadCluster %s - %s/%s Power %s", args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
             if 'Model' in self.ListOfDevices[ MsgSrcAddr ] and self.ListOfDevices[ MsgSrcAddr ]['Model'] == 'outletv4':
                 value /= 10
             MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value))
@@ -2406,8 +2347,7 @@ def Cluster0b04( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == "0505": # RMS Voltage
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Voltage %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Voltage %s", args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         if value == 0xffff:
             return
         if 'Model' in self.ListOfDevices[ MsgSrcAddr ] and self.ListOfDevices[ MsgSrcAddr ]['Model'] == 'outletv4':
@@ -2416,8 +2356,7 @@ def Cluster0b04( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     elif MsgAttrID == "0508": #RMSCurrent
         value = int(decodeAttribute( self, MsgAttType, MsgClusterData ))
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Current %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Current %s", args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, value))
         value /= 100
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, str(value), Attribute_=MsgAttrID)
 
@@ -2431,8 +2370,7 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     DIMMER_STEP = 1
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s MsgAttrID: %s, MsgAttType: %s, MsgAttSize: %s, : %s", MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if MsgAttrID not in ( '0001', '0002', '0003', '0004'):
         _context = {
@@ -2446,8 +2384,7 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
         self.log.logging( "Cluster", 'Error', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr,_context)
         return
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s - reading self.ListOfDevices[%s]['Ep'][%s][%s][%s] = %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgSrcAddr, MsgSrcEp, MsgClusterId , MsgAttrID,  self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s - reading self.ListOfDevices[%s]['Ep'][%s][%s][%s] = %s", MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgSrcAddr, MsgSrcEp, MsgClusterId , MsgAttrID,  self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]))
 
     if '0000' in self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]:
         prev_Value = str(self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]['0000']).split(";")
@@ -2469,23 +2406,23 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     prev_lvlValue = lvlValue = int(prev_Value[1],16)
     prev_duration = duration = int(prev_Value[2],16)
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - past OnOff: %s, Lvl: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, onoffValue, lvlValue), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - past OnOff: %s, Lvl: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, onoffValue, lvlValue))
     if MsgAttrID == '0001': #On button
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - ON Button detected" %(MsgClusterId, MsgSrcAddr, MsgSrcEp), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - ON Button detected", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp))
         onoffValue = 1
 
     elif MsgAttrID == '0004': # Off  Button
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - OFF Button detected" %(MsgClusterId, MsgSrcAddr, MsgSrcEp), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - OFF Button detected", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp))
         onoffValue = 0
 
     elif MsgAttrID in  ( '0002', '0003' ): # Dim+ / 0002 is +, 0003 is -
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Button detected" %(MsgClusterId, MsgSrcAddr, MsgSrcEp), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Button detected", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp))
         action = MsgClusterData[2:4]
         duration = MsgClusterData[6:10]
         duration = struct.unpack('H',struct.pack('>H',int(duration,16)))[0]
 
         if action in ('00'): #Short press
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Action: %s" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, action), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Action: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, action))
             onoffValue = 1
             # Short press/Release - Make one step   , we just report the press
             if MsgAttrID == '0002': 
@@ -2502,10 +2439,10 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
                 lvlValue -= round( delta * DIMMER_STEP)
 
         elif action in ('03') : # Release after Long Press
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Release after %s seconds" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, round(duration/10)), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Release after %s seconds", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, round(duration/10)))
 
         else:
-            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Action: %s not processed" %(MsgClusterId, MsgSrcAddr, MsgSrcEp, action), MsgSrcAddr)
+            self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - DIM Action: %s not processed", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, action))
             return   # No need to update
 
         # Check if we reach the limits Min and Max
@@ -2513,7 +2450,7 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
             lvlValue = 255
         if lvlValue <= 0: 
             lvlValue = 0
-        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Level: %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, lvlValue), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s - Level: %s ", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, lvlValue))
     else:
         self.log.logging( "Cluster", 'Log', "readCluster - %s - %s/%s unknown attribute: %s %s %s %s " %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
 
@@ -2523,8 +2460,7 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
     sduration = '%02x' %duration
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, '0000',  '%s;%s;%s' %(sonoffValue, slvlValue, sduration) )
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s - updating self.ListOfDevices[%s]['Ep'][%s][%s] = %s" \
-            %( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgSrcAddr, MsgSrcEp, MsgClusterId , self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s - updating self.ListOfDevices[%s]['Ep'][%s][%s] = %s", MsgSrcAddr, args=( MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgSrcAddr, MsgSrcEp, MsgClusterId , self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId]))
 
     if prev_onoffvalue != onoffValue:
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, '0006', sonoffValue)
@@ -2533,12 +2469,10 @@ def Clusterfc00( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
 def Clusterfc01( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-        %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)   
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))   
         
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if 'Model' not in self.ListOfDevices[MsgSrcAddr]:
         return
@@ -2581,12 +2515,10 @@ def Clusterfc01( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
 def Clusterfc40( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData, Source ):
     
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-        %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)   
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))   
         
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID,  MsgClusterData )
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if 'Model' not in self.ListOfDevices[MsgSrcAddr]:
         return
@@ -2611,19 +2543,52 @@ def Clusterfc21( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgA
 
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
 
     if MsgAttrID == "0001":
-        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Orientation BSO: %s - %s °" \
-            %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData, int(MsgClusterData,16)), MsgSrcAddr)
+        self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Orientation BSO: %s - %s °", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgClusterData, int(MsgClusterData,16)))
         MajDomoDevice(self, Devices, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgClusterData)
 
 def Clusterfcc0(self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData , Source):
 
-    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s" 
-        %(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData), MsgSrcAddr)
+    self.log.logging( "Cluster", 'Debug', "ReadCluster %s - %s/%s Attribute: %s Type: %s Size: %s Data: %s", MsgSrcAddr, args=(MsgClusterId, MsgSrcAddr, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData))
     checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID,  MsgClusterData )
 
     if MsgAttrID == '00f7':
         readXiaomiCluster( self, Devices, MsgSQN, MsgSrcAddr, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData )
+
+
+# Cluster decoders used by ReadClusterRecords
+DECODE_CLUSTER = {
+        "0000": Cluster0000, 
+        "0001": Cluster0001, 
+        "0003": Cluster0003, 
+        "0005": Cluster0005, 
+        "0006": Cluster0006,
+        "0008": Cluster0008,
+        "0009": Cluster0009,
+        "0012": Cluster0012, 
+        "000c": Cluster000c,
+        "0100": Cluster0100,
+        "0101": Cluster0101, 
+        "0102": Cluster0102,
+        "0201": Cluster0201, 
+        "0202": Cluster0202, 
+        "0204": Cluster0204,
+        "0300": Cluster0300,
+        "0400": Cluster0400, 
+        "0402": Cluster0402, 
+        "0403": Cluster0403, 
+        "0405": Cluster0405, 
+        "0406": Cluster0406,
+        "0500": Cluster0500, 
+        "0502": Cluster0502,
+        "0702": Cluster0702,
+        "0b04": Cluster0b04, 
+        "fc00": Clusterfc00,
+        "000f": Cluster000f,
+        "fc01": Clusterfc01,
+        "fc21": Clusterfc21,
+        "fcc0": Clusterfcc0,
+        "fc40": Clusterfc40
+        }
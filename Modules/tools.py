@@ -18,7 +18,7 @@ import json
 import Domoticz
 
 from Classes.AdminWidgets import AdminWidgets
-from Modules.database import WriteDeviceList
+from Modules.database import WriteDeviceList, mark_devicelist_dirty
 
 def is_hex(s):
 
@@ -227,10 +227,9 @@ def DeviceExist(self, Devices, lookupNwkId , lookupIEEE = ''):
 
         # Let's send a Notfification
         devName = ''
-        for x in Devices:
-            if Devices[x].DeviceID == lookupIEEE:
-                devName = Devices[x].Name
-                break
+        unit = self.UnitIndex.unit( Devices, lookupIEEE )
+        if unit is not None:
+            devName = Devices[unit].Name
         self.adminWidgets.updateNotificationWidget( Devices, 'Reconnect %s with %s/%s' %( devName, lookupNwkId, lookupIEEE ))
  
     return found
@@ -245,6 +244,9 @@ def reconnectNWkDevice( self, newNWKID, IEEE, oldNWKID):
 
     self.ListOfDevices[newNWKID] = dict(self.ListOfDevices[oldNWKID])
     self.IEEE2NWK[IEEE] = newNWKID
+    mark_devicelist_dirty( self, newNWKID )
+    self.UnitIndex.invalidate_widgets( oldNWKID )
+    self.UnitIndex.invalidate_widgets( newNWKID )
 
     Domoticz.Status("NetworkID : " +str(newNWKID) + " is replacing " +str(oldNWKID) + " and is attached to IEEE : " +str(IEEE) )
 
@@ -291,6 +293,7 @@ def removeDeviceInList( self, Devices, IEEE, Unit ):
 
     key = self.IEEE2NWK[IEEE]
     ID = Devices[Unit].ID
+    self.UnitIndex.invalidate_widgets( key )
 
     Domoticz.Log("removeDeviceInList - request to remove Device: %s with IEEE: %s " %(key, IEEE) )
 
@@ -304,6 +307,7 @@ def removeDeviceInList( self, Devices, IEEE, Unit ):
             if ( 'ClusterType' in self.ListOfDevices[key]['Ep'][tmpEp] and str(ID) in self.ListOfDevices[key]['Ep'][tmpEp]['ClusterType'] ):
                 Domoticz.Log("removeDeviceInList - removing : %s with Ep: %s in - %s" %(ID, tmpEp,str(self.ListOfDevices[key]['Ep'][tmpEp]['ClusterType']) ))
                 del self.ListOfDevices[key]['Ep'][tmpEp]['ClusterType'][str(ID)]
+    mark_devicelist_dirty( self, key )
 
     # Finaly let's see if there is any Devices left in this .
     emptyCT = True
@@ -365,6 +369,7 @@ def initDeviceInList(self, Nwkid):
         'ZCL Version': '',
         'Health': '',
     }
+    mark_devicelist_dirty( self, Nwkid )
 
 
 def timeStamped( self, key, Type ):
@@ -374,6 +379,7 @@ def timeStamped( self, key, Type ):
         self.ListOfDevices[key]['Stamp'] = {'Time': {}, 'MsgType': {}}
     self.ListOfDevices[key]['Stamp']['Time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
     self.ListOfDevices[key]['Stamp']['MsgType'] = "%4x" %(Type)
+    mark_devicelist_dirty( self, key )
 
 
 def get_and_inc_SQN( self, key ):
@@ -401,6 +407,7 @@ def updSQN( self, key, newSQN) :
 
     #Domoticz.Log("-->SQN updated %s from %s to %s" %(key, self.ListOfDevices[key]['SQN'], newSQN))
     self.ListOfDevices[key]['SQN'] = newSQN
+    mark_devicelist_dirty( self, key )
     return
 
 
@@ -425,6 +432,10 @@ def updLQI( self, key, LQI):
         if len(self.ListOfDevices[key]['RollingLQI']) > 10:
             del self.ListOfDevices[key]['RollingLQI'][0]
         self.ListOfDevices[ key ]['RollingLQI'].append( int(LQI, 16))
+        mark_devicelist_dirty( self, key )
+
+        if self.networkmap:
+            self.networkmap.graph.frame_received( key, int( LQI, 16) )
 
     return
 
@@ -750,6 +761,21 @@ def lookupForIEEE( self, nwkid , reconnect=False):
     # """
 
     # Domoticz.Log("lookupForIEEE - looking for %s in Neighbourgs table" %nwkid)
+    if self.networkmap:
+        # The Neighbour graph has the last scan of every router, and is indexed by neighbour
+        ieee = self.networkmap.graph.ieee( nwkid )
+        if ieee is None or ieee not in self.IEEE2NWK:
+            return None
+        oldNWKID = self.IEEE2NWK[ ieee ]
+        if oldNWKID not in self.ListOfDevices:
+            Domoticz.Log("lookupForIEEE found an inconsitency %s nt existing but pointed by %s" %( oldNWKID, ieee ))
+            del self.IEEE2NWK[ ieee ]
+            return None
+        if reconnect:
+            reconnectNWkDevice( self, nwkid, ieee, oldNWKID)
+        Domoticz.Log("lookupForIEEE found IEEE %s for %s known as %s in Neighbour graph" %(ieee, nwkid, oldNWKID))
+        return ieee
+
     for key in self.ListOfDevices:
         if 'Neighbours' not in self.ListOfDevices[key]:
             continue
@@ -802,11 +828,17 @@ def lookupForParentDevice( self, nwkid= None, ieee=None):
     if ieee and nwkid is None:
         if ieee not in self.IEEE2NWK:
             return
-        nwkid = self.IEEE2NWK[ nwkid ]
+        nwkid = self.IEEE2NWK[ ieee ]
 
     if mainPoweredDevice( self, nwkid):
         return ieee
 
+    if self.networkmap:
+        # Parent as known by the Neighbour graph
+        parent = self.networkmap.graph.parent( nwkid )
+        if parent and parent in self.ListOfDevices and 'IEEE' in self.ListOfDevices[ parent ]:
+            return self.ListOfDevices[ parent ]['IEEE']
+
     for PotentialRouter in self.ListOfDevices:
         if 'Neighbours' not in self.ListOfDevices[PotentialRouter]:
             continue
@@ -846,6 +878,7 @@ def checkAndStoreAttributeValue( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAtt
     checkAttribute( self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID )    
 
     self.ListOfDevices[MsgSrcAddr]['Ep'][MsgSrcEp][MsgClusterId][MsgAttrID] = Value
+    mark_devicelist_dirty( self, MsgSrcAddr )
 
 
 def getAttributeValue (self, MsgSrcAddr, MsgSrcEp,MsgClusterId, MsgAttrID):
@@ -939,6 +972,7 @@ def set_timestamp_datastruct(self, DeviceAttribute, key, endpoint, clusterId, no
     if check_datastruct( self, DeviceAttribute, key, endpoint, clusterId ) is None:
         return
     self.ListOfDevices[key][DeviceAttribute]['Ep'][endpoint][clusterId]['TimeStamp'] = now
+    mark_devicelist_dirty( self, key )
 
 
 def get_list_isqn_attr_datastruct(self, DeviceAttribute, key, endpoint, clusterId):
@@ -1034,6 +1068,7 @@ def set_status_datastruct(self, DeviceAttribute, key, endpoint, clusterId, Attri
         return 
     self.ListOfDevices[key][DeviceAttribute]['Ep'][endpoint][clusterId]['Attributes'][ AttributeId ] = status
     clean_old_datastruct(self,DeviceAttribute, key , endpoint, clusterId, AttributeId )
+    mark_devicelist_dirty( self, key )
 
 
 def get_status_datastruct(self, DeviceAttribute, key, endpoint, clusterId, AttributeId ):
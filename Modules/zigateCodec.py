@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Module: zigateCodec.py
+
+    Description: byte level encoding/decoding of ZiGate serial frames
+
+    A frame on the serial line is: 0x01 | escaped( MsgType(2) Length(2) Checksum(1) Data(n) ) | 0x03
+    Escaping: any byte B between 0x00 and 0x0f is replaced by 0x02, B ^ 0x10
+
+    All functions work on bytes/bytearray. Escaping, unescaping and checksum are done
+    with bytes.replace, translation tables and integer operations, so the cost per
+    byte is paid in C. Small frames use a plain loop as the set-up cost dominates.
+
+"""
+
+from binascii import hexlify, unhexlify
+import struct
+
+ESCAPE_CHAR = 0x02
+FRAME_START = 0x01
+FRAME_STOP = 0x03
+
+# Below that size, a plain loop is cheaper than the table driven functions
+SMALL_FRAME_SIZE = 48
+
+# Translation tables used to locate escaping sequences: 0x02 -> 0x10 (mask for the next byte), 0x02 -> 0xff (escape char)
+_FOLLOWER_MASK_TABLE = bytes( 0x10 if i == ESCAPE_CHAR else 0x00 for i in range(256) )
+_ESCAPE_MARK_TABLE = bytes( 0xff if i == ESCAPE_CHAR else 0x00 for i in range(256) )
+
+# Bytes which need to be escaped. 0x02 must be escaped first, as the escaping sequence starts with 0x02
+_ESCAPED_BYTES = bytes( [ESCAPE_CHAR] + [ x for x in range(0x10) if x != ESCAPE_CHAR ] )
+_ESCAPE_SEQUENCES = tuple( ( bytes([x]), bytes([ESCAPE_CHAR, x ^ 0x10]) ) for x in _ESCAPED_BYTES )
+
+
+def zigate_escape( data ):
+    # Return the escaped version of data (bytes)
+    if len( data.translate( None, _ESCAPED_BYTES ) ) == len( data ):
+        # Nothing to escape
+        return bytes( data )
+
+    data = bytes( data )
+    for raw, escaped in _ESCAPE_SEQUENCES:
+        data = data.replace( raw, escaped )
+    return data
+
+
+def zigate_unescape( data ):
+    # Return the unescaped version of data (bytearray)
+    if ESCAPE_CHAR not in data:
+        return bytearray( data )
+
+    if len( data ) < SMALL_FRAME_SIZE:
+        BinMsg = bytearray()
+        iterData = iter( data )
+        for iByte in iterData:
+            if iByte == ESCAPE_CHAR:
+                iByte = next( iterData, 0x10 ) ^ 0x10
+            BinMsg.append( iByte )
+        return BinMsg
+
+    # In the escaped stream, 0x02 is always an escape char, and is never the escaped byte (0x10 to 0x1f).
+    # Build a XOR mask (0x10 on each escaped byte) aligned with the stream once the 0x02 are removed
+    data = bytes( data )
+    size = len( data )
+    follower_mask = int.from_bytes( data.translate( _FOLLOWER_MASK_TABLE ), 'big' ) >> 8
+    escape_mark = int.from_bytes( data.translate( _ESCAPE_MARK_TABLE ), 'big' )
+    mask = ( follower_mask | escape_mark ).to_bytes( size, 'big' ).translate( None, b'\xff' )
+    compact = data.translate( None, b'\x02' )
+    return bytearray( ( int.from_bytes( compact, 'big' ) ^ int.from_bytes( mask, 'big' ) ).to_bytes( len(compact), 'big' ) )
+
+
+def xor_checksum( data, checksum=0 ):
+    # XOR of all bytes of data. checksum is the value computed on the previous chunk, if any (incremental computation)
+    length = len( data )
+    if length == 0:
+        return checksum
+    if length < SMALL_FRAME_SIZE:
+        for x in data:
+            checksum ^= x
+        return checksum
+
+    # Fold the buffer on itself, XOR of both halves keeps the same XOR over all bytes
+    value = int.from_bytes( data, 'big' )
+    while length > 1:
+        half = length // 2
+        high = length - half
+        value = ( value >> ( 8 * half ) ) ^ ( value & ( ( 1 << ( 8 * half ) ) - 1 ) )
+        length = high
+    return checksum ^ value
+
+
+def encode_frame( msgtype, data=b'' ):
+    # Build the frame ready to be sent on the serial line, msgtype is an int and data bytes
+    header = struct.pack( '>HH', msgtype, len(data) )
+    checksum = xor_checksum( data, xor_checksum( header ) )
+    return b'\x01' + zigate_escape( header + bytes( [ checksum ] ) + bytes( data ) ) + b'\x03'
+
+
+def frame_checksum( binmsg ):
+    # Compute the checksum of a decoded frame (0x01 .. 0x03), checksum byte itself excluded
+    return xor_checksum( memoryview( binmsg )[6:-1], xor_checksum( memoryview( binmsg )[1:5] ) )
+
+
+def frame_checksum_ok( binmsg ):
+    # XOR over MsgType, Length, Checksum, Data and LQI is 0 when the checksum is right
+    return xor_checksum( memoryview( binmsg )[1:-1] ) == 0
+
+
+# Drop-in replacements of the hex based functions
+
+def zigate_encode( Data ):
+    # hex string in, escaped hex string out
+    return hexlify( zigate_escape( unhexlify( Data ) ) ).decode('utf-8')
+
+
+def get_checksum( msgtype, length, datas ):
+    # hex strings in, checksum as hex string (not padded) out
+    checksum = xor_checksum( unhexlify( msgtype + length ) )
+    if datas not in ( '', '0'):
+        checksum = xor_checksum( unhexlify( datas ), checksum )
+    return '%x' % checksum
+
+
+def decode_frame( frame ):
+    # Unescape a raw frame (0x01 .. 0x03), return None if the frame is too short
+    if frame is None or frame == b'':
+        return None
+    BinMsg = zigate_unescape( frame )
+    if len(BinMsg) <= 6:
+        return None
+    return BinMsg
+
+
+def check_frame_crc( BinMsg ):
+    return frame_checksum_ok( BinMsg )
+
+
+class FrameReassembler(object):
+    # Extract complete frames from the byte stream received from ZiGate.
+    #
+    # Incoming data are appended to a single buffer, and a read cursor moves forward on each
+    # frame found, so a burst of frames received in one read is processed in one pass and the
+    # buffer is compacted only once per read. As 0x01 and 0x03 are always escaped inside a frame,
+    # the last 0x01 before a 0x03 is the start of the frame, anything else is garbage and is skipped.
+
+    # A pending frame cannot be larger than that (max payload is 0xFFFF, but ZiGate never goes above a few hundreds)
+    MAX_PENDING_SIZE = 4096
+
+    def __init__( self ):
+        self.buffer = bytearray()
+        self.cursor = 0
+        self.garbage = 0    # Number of bytes dropped while resynchronizing
+
+    def __len__( self ):
+        return len( self.buffer ) - self.cursor
+
+    def pending( self ):
+        # Bytes received and not yet part of a complete frame
+        return bytes( self.buffer[ self.cursor: ] )
+
+    def feed( self, data ):
+        if self.cursor:
+            # Compact what has been consumed during the previous read
+            del self.buffer[ :self.cursor ]
+            self.cursor = 0
+        self.buffer += data
+
+    def frames( self ):
+        # Generator of raw frames (0x01 .. 0x03, still escaped)
+        buffer = self.buffer
+        while True:
+            pos = self.cursor
+            end = buffer.find( b'\x03', pos )
+            if end == -1:
+                break
+
+            start = buffer.rfind( b'\x01', pos, end )
+            if start == -1:
+                # 0x03 without start of frame
+                self.garbage += end + 1 - pos
+                self.cursor = end + 1
+                continue
+
+            if start != pos:
+                self.garbage += start - pos
+
+            self.cursor = end + 1
+            yield bytes( buffer[ start:end + 1 ] )
+
+        self._drop_garbage_in_pending()
+
+    def _drop_garbage_in_pending( self ):
+        # Partial frame, keep from the last 0x01. If no start of frame, the data is useless
+        pos = self.cursor
+        start = self.buffer.rfind( b'\x01', pos )
+        if start == -1:
+            start = len( self.buffer )
+        elif len( self.buffer ) - start > self.MAX_PENDING_SIZE:
+            start = len( self.buffer )
+        if start != pos:
+            self.garbage += start - pos
+            self.cursor = start
+
+    def reset( self ):
+        self.buffer = bytearray()
+        self.cursor = 0
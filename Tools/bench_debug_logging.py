@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Benchmark of the Debug logging calls done while decoding frames, when the debug
+    flags are off: messages formated by the caller ( former LoggingManagement.logging )
+    against format string + args rendered only when needed.
+
+    Usage: python3 Tools/bench_debug_logging.py
+
+    A recorded stream of frames ( Attribute reports, Data indications, Status, APS Ack )
+    is replayed, issuing for each frame the Debug calls of the Transport, ZigateRead,
+    Decode8102, ReadCluster and MajDomoDevice paths.
+    Out of Domoticz, the Domoticz module is replaced by a silent one.
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from benchtools import silent_domoticz
+silent_domoticz()
+
+from Classes.LoggingManagement import LoggingManagement
+
+# ( MsgType, Payload ) as received from a ZiGate 3.1d with ~40 devices
+FRAMES = [
+    ( 0x8102, '4f5b0f010402000000290002085c' ),
+    ( 0x8102, '505b0f01040500000021000217a2' ),
+    ( 0x8102, '51a2c80100060000000010000101' ),
+    ( 0x8102, '52a2c8010b0405050000210002008e' ),
+    ( 0x8002, '00010400060101027b3002000000a2c80101' ),
+    ( 0x8000, '00e10102c6000a' ),
+    ( 0x8011, '00a2c8010006e1' ),
+    ( 0x8102, '539e2d0100010021000020000230' ),
+]
+NB_FRAMES = 20000
+
+
+class PluginConf(object):
+    def __init__(self, debug, matchid):
+        self.pluginConf = { 'useDomoticzLog': 1, 'debugMatchId': matchid }
+        for module in ('TransportRx', 'Input', 'Cluster', 'Widget', 'RawAPS'):
+            self.pluginConf[ 'debug' + module ] = debug
+
+
+def legacy_logging( log, module, logType, message, nwkid=None, context=None):
+    # LoggingManagement.logging() and _logginfilter() before the lazy formatting
+    if logType == 'Debug':
+        pluginConfModule = "debug"+str(module)
+        if pluginConfModule in log.pluginconf.pluginConf:
+            if log.pluginconf.pluginConf[pluginConfModule]:
+                if nwkid is None:
+                    log._loggingDebug( message )
+                elif nwkid:
+                    nwkid = nwkid.lower()
+                    _debugMatchId =  log.pluginconf.pluginConf['debugMatchId'].lower().split(',')
+                    if ('ffff' in _debugMatchId) or (nwkid in _debugMatchId) or (nwkid == 'ffff'):
+                        log._loggingDebug(  message )
+        else:
+            log._loggingDebug(message)
+
+
+def replay_legacy( log ):
+    for idx in range( NB_FRAMES ):
+        MsgType, MsgData = FRAMES[ idx % len(FRAMES) ]
+        MsgLQI = 'a2'
+        nwkid = MsgData[2:6]
+        legacy_logging( log, 'TransportRx', 'Debug', "process_frame - STANDALONE_MESSAGE MsgType: %04x MsgLength: %04x MsgCRC: %02x" %(MsgType, len(MsgData) // 2, 0x5a))
+        legacy_logging( log, 'Input', "Debug", "ZigateRead - MsgType: %04x, MsgLength: %04x, MsgCRC: %02x, Data: %s, LQI: %s" % (MsgType, len(MsgData) // 2, 0x5a, MsgData, int(MsgLQI, 16)))
+        if MsgType != 0x8102:
+            legacy_logging( log, 'TransportRx', 'Debug', "--> process_other_type_of_message - MsgType: %s" %MsgType )
+            continue
+        MsgSQN, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData = MsgData[0:2], MsgData[6:8], MsgData[8:12], MsgData[12:16], MsgData[18:20], MsgData[20:24], MsgData[24:]
+        legacy_logging( log, "Input", "Debug", "Decode8102 - Attribute Reports : [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<"
+            % ( nwkid, MsgSrcEp, MsgSQN, MsgClusterId, MsgAttrID, '00', MsgAttType, MsgAttSize, MsgClusterData, ), nwkid, )
+        legacy_logging( log, "Cluster", 'Debug', "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s"
+            %( MsgClusterId, nwkid, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, '00', MsgClusterData), nwkid)
+        legacy_logging( log, "Widget", "Debug", "MajDomoDevice NwkId: %s Ep: %s ClusterId: %s Value: %s ValueType: %s Attribute: %s Color: %s"
+            % ( nwkid, MsgSrcEp, MsgClusterId, MsgClusterData, type(MsgClusterData), MsgAttrID, '' ), nwkid )
+        legacy_logging( log, "Widget", "Debug", "------> ClusterType = " + str( { '123': 'Temp' } ), nwkid)
+
+
+def replay_lazy( log ):
+    for idx in range( NB_FRAMES ):
+        MsgType, MsgData = FRAMES[ idx % len(FRAMES) ]
+        MsgLQI = 'a2'
+        nwkid = MsgData[2:6]
+        log.logging( 'TransportRx', 'Debug', "process_frame - STANDALONE_MESSAGE MsgType: %04x MsgLength: %04x MsgCRC: %02x", args=(MsgType, len(MsgData) // 2, 0x5a))
+        log.logging( 'Input', "Debug", "ZigateRead - MsgType: %04x, MsgLength: %04x, MsgCRC: %02x, Data: %s, LQI: %s", args=(MsgType, len(MsgData) // 2, 0x5a, MsgData, int(MsgLQI, 16)))
+        if MsgType != 0x8102:
+            log.logging( 'TransportRx', 'Debug', "--> process_other_type_of_message - MsgType: %s", args=(MsgType,) )
+            continue
+        MsgSQN, MsgSrcEp, MsgClusterId, MsgAttrID, MsgAttType, MsgAttSize, MsgClusterData = MsgData[0:2], MsgData[6:8], MsgData[8:12], MsgData[12:16], MsgData[18:20], MsgData[20:24], MsgData[24:]
+        log.logging( "Input", "Debug", "Decode8102 - Attribute Reports : [%s:%s] MsgSQN: %s ClusterID: %s AttributeID: %s Status: %s Type: %s Size: %s ClusterData: >%s<", nwkid,
+            args=( nwkid, MsgSrcEp, MsgSQN, MsgClusterId, MsgAttrID, '00', MsgAttType, MsgAttSize, MsgClusterData, ) )
+        log.logging( "Cluster", 'Debug', "ReadCluster - %s - %s/%s AttrId: %s AttrType: %s Attsize: %s Status: %s AttrValue: %s", nwkid,
+            args=( MsgClusterId, nwkid, MsgSrcEp, MsgAttrID, MsgAttType, MsgAttSize, '00', MsgClusterData) )
+        log.logging( "Widget", "Debug", "MajDomoDevice NwkId: %s Ep: %s ClusterId: %s Value: %s ValueType: %s Attribute: %s Color: %s", nwkid,
+            args=( nwkid, MsgSrcEp, MsgClusterId, MsgClusterData, type(MsgClusterData), MsgAttrID, '' ) )
+        log.logging( "Widget", "Debug", "------> ClusterType = %s", nwkid, args=( { '123': 'Temp' }, ) )
+
+
+def bench( label, debug, matchid ):
+    log = LoggingManagement( PluginConf( debug, matchid ), {}, 1, {}, {} )
+    log._loggingDebug = lambda message: None
+
+    start = time.perf_counter()
+    replay_legacy( log )
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    replay_lazy( log )
+    t_lazy = time.perf_counter() - start
+
+    print("%-34s legacy: %6.2f µs/frame  lazy: %6.2f µs/frame  speedup: x%.1f"
+          %( label, 1e6 * t_legacy / NB_FRAMES, 1e6 * t_lazy / NB_FRAMES, t_legacy / t_lazy ))
+
+
+def main():
+    print("%s frames replayed" %NB_FRAMES)
+    bench( "debug off", 0, 'ffff' )
+    bench( "debug on, other debugMatchId", 1, '0001,0002' )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Startup benchmark of the DeviceList parsing: former double eval() against
+    Modules/deviceListParser.py
+
+    Usage: python3 Tools/bench_devicelist_load.py [ DeviceList-xx.txt ]
+
+    Without file, a synthetic DeviceList of 500 devices is generated, with the
+    ReadAttributes, ConfigureReporting and Stamp sub-dictionaries a paired device
+    usually gets.
+
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from Modules.deviceListParser import parse_record, iter_records
+
+NB_DEVICES = 500
+CLUSTERS = ( '0000', '0001', '0003', '0006', '0008', '0300', '0402', '0405', '0702', '0b04' )
+
+
+def synthetic_device( nwkid ):
+    clusters = random.sample( CLUSTERS, 6 )
+    ep = { '01': { c: {} for c in clusters } }
+    ep['01']['ClusterType'] = { '%d' % random.randint(1, 999): 'Switch' }
+    return {
+        'Version': '3', 'Status': 'inDB', 'Heartbeat': '%d' % random.randint(0, 3600),
+        'IEEE': '00158d%010x' % random.getrandbits(40), 'Model': 'lumi.plug.maeu01', 'Manufacturer': '115f',
+        'Manufacturer Name': 'LUMI', 'ZDeviceName': "Prise l'entrée %s" % nwkid, 'PowerSource': 'Main', 'MacCapa': '8e',
+        'Ep': ep, 'Epv2': {}, 'Type': '', 'ProfileID': '0104', 'ZDeviceID': '0051', 'App Version': '', 'Stack Version': '',
+        'Bind': { '01': { c: { 'Stamp': 1600000000, 'Phase': 'binded', 'Status': '00' } for c in clusters[:3] } },
+        'ReadAttributes': { 'Ep': { '01': { c: { 'TimeStamp': 1600000000 + random.randint(0, 10000),
+                                                 'Status': { '%04x' % a: '00' for a in range(8) } } for c in clusters } } },
+        'ConfigureReporting': { 'Ep': { '01': { c: { 'TimeStamp': 1600000000, 'Status': '00' } for c in clusters[:4] } } },
+        'Stamp': { 'Time': '2020-11-05 10:00:00', 'MsgType': '8102', 'LastSeen': 1604566800, 'LastPing': 0 },
+        'RollingLQI': [ random.randint(30, 255) for _ in range(10) ], 'LQI': 120, 'Battery': None, 'Health': 'Live',
+        'Neighbours': [ { 'Time': 1604566800, 'Devices': [ { '%04x' % random.getrandbits(16): { '_relationshp': 'Sibling', '_lnkqty': '7f' } } ] } ],
+        'OTA': {}, 'IAS': {}, 'ForceAckCommands': [], 'Capability': [ 'Main Powered' ], 'Location': '', 'RIA': '10',
+        'SQN': '5a', 'ConfigSource': 'DeviceConf', 'Last Cmds': [ ( 12, '02', nwkid, '0092', '0101' ) ],
+    }
+
+
+def build_file( filename ):
+    random.seed( 0 )
+    with open( filename, 'wt') as handle:
+        for nwkid in random.sample( range( 0x0001, 0xfff8 ), NB_DEVICES ):
+            nwkid = '%04x' % nwkid
+            handle.write( nwkid + " : " + str( synthetic_device( nwkid ) ) + "\n" )
+
+
+def legacy_load( filename ):
+    # LoadDeviceList + CheckDeviceList before the parser: split, eval once to check the Version, eval again in CheckDeviceList
+    loaded = {}
+    with open( filename, 'r') as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            (key, val) = line.split(":", 1)
+            key = key.replace(" ", "").replace("'", "")
+            dlVal = eval( val )
+            if dlVal.get('Version') != '3':
+                continue
+            loaded[ key ] = eval( val )
+    return loaded
+
+
+def parser_load( filename ):
+    loaded = {}
+    with open( filename, 'r') as handle:
+        for key, val in iter_records( handle ):
+            dlVal = parse_record( val )
+            if dlVal.get('Version') != '3':
+                continue
+            loaded[ key ] = dlVal
+    return loaded
+
+
+def timed( function, filename, number ):
+    best = None
+    for _ in range( number ):
+        start = time.perf_counter()
+        result = function( filename )
+        duration = time.perf_counter() - start
+        best = duration if best is None else min( best, duration )
+    return best, result
+
+
+def main():
+    if len(sys.argv) > 1:
+        filename = sys.argv[1]
+    else:
+        filename = '/tmp/bench-DeviceList-%s.txt' % os.getpid()
+        build_file( filename )
+
+    print("DeviceList: %s ( %s KB )" % ( filename, os.path.getsize( filename ) // 1024 ))
+    t_legacy, legacy = timed( legacy_load, filename, 5 )
+    t_parser, parsed = timed( parser_load, filename, 5 )
+    assert legacy == parsed
+    print("%s entries" % len( parsed ))
+    print("legacy ( double eval ): %8.1f ms" % ( 1000 * t_legacy ))
+    print("parser                : %8.1f ms  speedup: x%.1f" % ( 1000 * t_parser, t_legacy / t_parser ))
+
+    if len(sys.argv) == 1:
+        os.remove( filename )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Benchmark of the OTA block path ( 0x8501 Block Request -> 0x0502 frame written to ZiGate ): former
+    hex payload built byte per byte then bytes.fromhex() in _send_data, against the bytes payload sliced
+    from the mapped image and prepared after the previous block.
+
+    Usage: python3 Tools/bench_ota_blocks.py [ image size in KB ]
+
+    The transfer of a whole image with 64 bytes blocks ( IKEA ) is replayed. Both paths end with
+    zigateCodec.encode_frame() and must produce the same frames.
+    Out of Domoticz, the Domoticz module is replaced by a silent one.
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from benchtools import silent_domoticz
+silent_domoticz()
+
+from Modules.zigateConsts import ZIGATE_EP
+from Modules.zigateCodec import encode_frame
+from Classes.OTA import ota_block_payload, OTA_BLOCK_SQN_INDEX
+
+BLOCK_SIZE = 0x40
+IMAGE_VERSION = 0x23014631
+IMAGE_TYPE = 0x2101
+MANUF_CODE = 0x117c
+
+
+def former_block( image, dest_addr, dest_ep, sequence, _offset, _lenght ):
+    # ota_send_block before the bytes payload, then bytes.fromhex() of _send_data
+    _raw_ota_data = image[_offset:_offset+_lenght]
+    datas = '07' + dest_addr + ZIGATE_EP + dest_ep
+    datas += "%02x" %sequence + "%02x" %0x00
+    datas += "%08x" %_offset
+    datas += '%08x' %IMAGE_VERSION + '%04x' %IMAGE_TYPE + '%04x' %MANUF_CODE
+    datas += "%02x" %_lenght
+    for i in _raw_ota_data:
+        datas += "%02x" %i
+    return encode_frame( 0x0502, bytes.fromhex( datas ) )
+
+
+def replay_former( image ):
+    frames = []
+    for sequence, offset in enumerate( range( 0, len(image), BLOCK_SIZE ) ):
+        frames.append( former_block( image, '1a2b', '01', sequence & 0xff, offset, BLOCK_SIZE ) )
+    return frames
+
+
+def replay_prefetch( image ):
+    # The block is ready when requested, the next one is prepared after the frame is handed over
+    transfer = { 'OtaImage': memoryview( image ) }
+    frames = []
+    key = ( '1a2b', '01', 0, BLOCK_SIZE, IMAGE_VERSION, IMAGE_TYPE, MANUF_CODE )
+    nextblock = ota_block_payload( transfer, key )
+    latency = 0
+    for sequence, offset in enumerate( range( 0, len(image), BLOCK_SIZE ) ):
+        start = time.perf_counter()
+        datas = nextblock
+        datas[ OTA_BLOCK_SQN_INDEX ] = sequence & 0xff
+        frames.append( encode_frame( 0x0502, bytes( datas ) ) )
+        latency += time.perf_counter() - start
+        if offset + BLOCK_SIZE < len(image):
+            nextblock = ota_block_payload( transfer, ( '1a2b', '01', offset + BLOCK_SIZE ) + key[3:] )
+    return frames, latency
+
+
+def main():
+    size = 1024 * ( int( sys.argv[1] ) if len(sys.argv) > 1 else 512 )
+    image = os.urandom( size )
+    nb_blocks = ( size + BLOCK_SIZE - 1 ) // BLOCK_SIZE
+    print("Image: %s KB, %s blocks of %s bytes" % ( size // 1024, nb_blocks, BLOCK_SIZE ))
+
+    start = time.perf_counter()
+    former = replay_former( image )
+    t_former = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frames, latency = replay_prefetch( image )
+    t_bytes = time.perf_counter() - start
+    assert frames == former
+
+    print("former  : %6.1f µs/block" % ( 1e6 * t_former / nb_blocks ))
+    print("bytes   : %6.1f µs/block ( %6.1f µs between request and frame with prefetch )  speedup: x%.1f"
+        % ( 1e6 * t_bytes / nb_blocks, 1e6 * latency / nb_blocks, t_former / t_bytes ))
+
+
+if __name__ == '__main__':
+    main()
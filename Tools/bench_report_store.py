@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Benchmark of the topology reports: former single NetworkTopology-v3-xx.json file against the
+    segmented ReportStore.
+
+    Usage: python3 Tools/bench_report_store.py [ number of reports ]
+
+    A history of LQI reports of 150 devices ( 6 neighbours each ) is written in a temporary directory,
+    then the timestamp list and the latest report are requested 20 times ( REST API ), and 20 new
+    reports are added with the history kept at its size ( finish_scan ).
+
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from Classes.ReportStore import openReportStore
+
+NB_DEVICES = 150
+NB_NEIGHBOURS = 6
+NB_REQUESTS = 20
+
+
+def lqi_report():
+    nodes = [ '%04x' % random.randint( 1, 0xfff0 ) for _ in range( NB_DEVICES ) ]
+    report = {}
+    for nwkid in nodes:
+        report[ nwkid ] = { 'Status': 'Completed', 'TableMaxSize': NB_NEIGHBOURS, 'TableCurSize': NB_NEIGHBOURS, 'Neighbours': {} }
+        for neighbour in random.sample( nodes, NB_NEIGHBOURS ):
+            report[ nwkid ]['Neighbours'][ neighbour ] = { '_relationshp': 'Sibling', '_devicetype': 'Router', '_depth': '01',
+                                                           '_lnkqty': '%02x' % random.randint( 0, 255 ), '_rxonwhenidl': 'Rx-On',
+                                                           '_ieee': '00158d0000000000', '_permitjnt': 'Off' }
+    return report
+
+
+def former_read( filename ):
+    # As rest_netTopologie did: every line read and decoded
+    reports = {}
+    with open( filename, 'rt') as handle:
+        for line in handle:
+            if line[0] != '{' and line[-1] != '}':
+                continue
+            entry = json.loads( line )
+            for _ts in entry:
+                reports[ _ts ] = entry[ _ts ]
+    return reports
+
+
+def former_append( filename, stamp, report, keep ):
+    # As finish_scan did: whole history read, retained lines and the new one written back
+    with open( filename, 'rt') as handle:
+        lines = handle.read().splitlines()
+    with open( filename, 'wt') as handle:
+        for line in lines[ -( keep - 1 ): ]:
+            handle.write( line + '\n' )
+        handle.write( json.dumps( { stamp: report } ) + '\n' )
+
+
+def main():
+    nb_reports = int( sys.argv[1] ) if len(sys.argv) > 1 else 50
+    directory = tempfile.mkdtemp()
+    former = os.path.join( directory, 'Former-v3-01.json' )
+    filename = os.path.join( directory, 'NetworkTopology-v3-01.json' )
+    store = openReportStore( filename )
+    with open( former, 'wt') as handle:
+        for stamp in range( nb_reports ):
+            report = lqi_report()
+            handle.write( json.dumps( { str( 1600000000 + stamp ): report } ) + '\n' )
+            store.append( 1600000000 + stamp, report, nb_reports )
+    print("%s reports, %.1f MB" % ( nb_reports, os.path.getsize( former ) / 1e6 ))
+    last = str( 1600000000 + nb_reports - 1 )
+
+    start = time.perf_counter()
+    for _ in range( NB_REQUESTS ):
+        timestamps = list( former_read( former ) )
+        report = former_read( former )[ last ]
+    t_former = ( time.perf_counter() - start ) / NB_REQUESTS
+
+    start = time.perf_counter()
+    for _ in range( NB_REQUESTS ):
+        assert openReportStore( filename ).timestamps() == timestamps
+        assert openReportStore( filename ).report( last ) == report
+    t_store = ( time.perf_counter() - start ) / NB_REQUESTS
+
+    print("read   former: %8.2f ms ( list + one report )" % ( 1e3 * t_former ))
+    print("read   store : %8.2f ms ( list + one report )  speedup: x%.0f" % ( 1e3 * t_store, t_former / t_store ))
+
+    new_report = lqi_report()
+    start = time.perf_counter()
+    for stamp in range( NB_REQUESTS ):
+        former_append( former, str( 1700000000 + stamp ), new_report, nb_reports )
+    t_former = ( time.perf_counter() - start ) / NB_REQUESTS
+
+    start = time.perf_counter()
+    for stamp in range( NB_REQUESTS ):
+        openReportStore( filename ).append( 1700000000 + stamp, new_report, nb_reports )
+    t_store = ( time.perf_counter() - start ) / NB_REQUESTS
+    assert len( openReportStore( filename ).timestamps() ) == nb_reports
+
+    print("append former: %8.2f ms ( new report, history trimmed )" % ( 1e3 * t_former ))
+    print("append store : %8.2f ms ( new report, history trimmed )  speedup: x%.0f" % ( 1e3 * t_store, t_former / t_store ))
+
+    openReportStore( filename ).clear()
+    os.remove( former )
+    os.rmdir( directory )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Benchmark of the static files of the Web User Interface: former onMessage/sendResponse ( file read
+    and deflate at level 9 on each GET ) against the asset cache.
+
+    Usage: python3 Tools/bench_web_assets.py [ www directory ]
+
+    Each file of www/ is requested 5 times with 'Accept-Encoding: gzip, deflate, br', then revalidated
+    with If-None-Match as a browser does when enableCache is on.
+    Out of Domoticz, the Domoticz module is replaced by a silent one.
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from benchtools import silent_domoticz
+silent_domoticz()
+
+from Classes.WebServer.tools import MAX_KB_TO_SEND
+from Classes.WebServer.assetCache import StaticAssetCache, compress, accepted_encoding
+
+NB_ROUNDS = 5
+ACCEPT_ENCODING = 'gzip, deflate, br'
+
+
+def former_get( path ):
+    with open( path, mode='rb') as webFile:
+        data = webFile.read()
+    if len(data) > MAX_KB_TO_SEND:
+        data = compress( data, 'deflate' )
+    return data
+
+
+def cached_get( cache, path, headers ):
+    asset = cache.get( path )
+    encoding = None
+    if asset.size > MAX_KB_TO_SEND:
+        encoding = accepted_encoding( headers['Accept-Encoding'], True, True )
+    if asset.not_modified( headers, encoding ):
+        return b''
+    return cache.encoded( asset, encoding )
+
+
+def main():
+    www = sys.argv[1] if len(sys.argv) > 1 else os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..', 'www' )
+    files = sorted( os.path.join( root, name ) for root, _, names in os.walk( www ) for name in names )
+    total = sum( os.path.getsize( path ) for path in files )
+    print("%s files, %.1f MB, %s rounds" % ( len(files), total / 1e6, NB_ROUNDS ))
+
+    start = time.perf_counter()
+    for _ in range( NB_ROUNDS ):
+        former = [ former_get( path ) for path in files ]
+    t_former = ( time.perf_counter() - start ) / NB_ROUNDS
+
+    cache = StaticAssetCache( 64 * 1024 * 1024 )
+    headers = { 'Accept-Encoding': ACCEPT_ENCODING }
+    start = time.perf_counter()
+    first = [ cached_get( cache, path, headers ) for path in files ]
+    t_first = time.perf_counter() - start
+    assert first == former
+
+    start = time.perf_counter()
+    for _ in range( NB_ROUNDS ):
+        cached = [ cached_get( cache, path, headers ) for path in files ]
+    t_cached = ( time.perf_counter() - start ) / NB_ROUNDS
+    assert cached == former
+
+    start = time.perf_counter()
+    for _ in range( NB_ROUNDS ):
+        for path in files:
+            asset = cache.get( path )
+            encoding = 'deflate' if asset.size > MAX_KB_TO_SEND else None
+            assert cached_get( cache, path, dict( headers, **{ 'If-None-Match': asset.etag( encoding ) } ) ) == b''
+    t_revalidate = ( time.perf_counter() - start ) / NB_ROUNDS
+
+    print("former     : %8.2f ms per round" % ( 1e3 * t_former ))
+    print("cache build: %8.2f ms ( once )  cache size: %.1f MB" % ( 1e3 * t_first, cache.size / 1e6 ))
+    print("cache      : %8.2f ms per round  speedup: x%.0f" % ( 1e3 * t_cached, t_former / t_cached ))
+    print("304        : %8.2f ms per round" % ( 1e3 * t_revalidate ))
+
+
+if __name__ == '__main__':
+    main()
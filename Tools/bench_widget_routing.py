@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Benchmark of MajDomoDevice: former dispatch ( TypeFromCluster, then every widget of the device
+    through the whole ClusterType/WidgetType chain ) against the compiled widget routes.
+
+    Usage: python3 Tools/bench_widget_routing.py [ domoMaj.py ]
+
+    Without argument, the former dispatch is emulated by calling the whole chain of handlers for each
+    widget, which adds the cost of the function calls to the former inline if-chain. To compare with
+    the former module itself:
+        git show <revision>:Modules/domoMaj.py > /tmp/domoMaj_before.py
+        python3 Tools/bench_widget_routing.py /tmp/domoMaj_before.py
+
+    A mix of 0x8102 Attribute reports ( Temperature, Humidity, Battery Voltage, On/Off, Level,
+    Power, Lux ) is replayed on 60 devices, as ReadCluster would call MajDomoDevice.
+    Out of Domoticz, the Domoticz module is replaced by a silent one and Devices by plain objects.
+
+"""
+
+import os
+import sys
+import time
+import importlib.util
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from benchtools import silent_domoticz
+silent_domoticz()
+
+from Classes.LoggingManagement import LoggingManagement
+from Classes.DomoticzUnitIndex import DomoticzUnitIndex
+
+import Modules.domoMaj as domoMaj
+from Modules.domoTools import TypeFromCluster, RetreiveWidgetTypeList, RetreiveSignalLvlBattery
+
+NB_UPDATES = 50000
+
+# Model -> ( Ep -> [ WidgetType ] ), ( ClusterId, value, Attribute ) reported
+MODELS = {
+    'lumi.weather': (
+        { '01': [ 'Temp', 'Humi', 'Baro', 'Temp+Hum+Baro', 'Voltage' ] },
+        [ ( '0402', 21.5, '' ), ( '0405', 48, '0000' ), ( '0001', '3.02', '' ) ] ),
+    'lumi.plug.maeu01': (
+        { '01': [ 'Switch', 'Power', 'Meter', 'Voltage' ] },
+        [ ( '0006', '01', '' ), ( '0702', '35.2', '' ), ( '0006', '00', '' ) ] ),
+    'TRADFRI bulb E27 WS opal 980lm': (
+        { '01': [ 'ColorControlWW' ] },
+        [ ( '0008', 'fe', '0000' ), ( '0006', '01', '' ) ] ),
+    'SML001': (
+        { '02': [ 'Motion', 'Lux', 'Temp' ] },
+        [ ( '0400', '120', '' ), ( '0406', '01', '' ), ( '0402', 19.0, '' ) ] ),
+}
+NB_DEVICES = 60
+
+
+class DomoticzDevice(object):
+    def __init__(self, ID, DeviceID, Name):
+        self.ID = ID
+        self.DeviceID = DeviceID
+        self.Name = Name
+        self.nValue = 0
+        self.sValue = ''
+        self.SwitchType = 0
+        self.SubType = 0
+        self.Options = {}
+        self.Color = ''
+        self.BatteryLevel = 255
+        self.TimedOut = 0
+
+    def Update(self, nValue=0, sValue='', Color='', SignalLevel=12, BatteryLevel=255, TimedOut=0, Options=None):
+        self.nValue = nValue
+        self.sValue = sValue
+        self.BatteryLevel = BatteryLevel
+        self.TimedOut = TimedOut
+
+
+class PluginConf(object):
+    def __init__(self):
+        self.pluginConf = { 'useDomoticzLog': 1, 'debugMatchId': 'ffff', 'debugWidget': 0,
+                            'forceSwitchSelectorPushButton': 0, 'logDeviceUpdate': 0 }
+
+
+class Plugin(object):
+    def __init__(self):
+        self.pluginconf = PluginConf()
+        self.log = LoggingManagement( self.pluginconf, {}, 1, {}, {} )
+        self.ListOfDevices = {}
+        self.IEEE2NWK = {}
+        self.UnitIndex = DomoticzUnitIndex()
+        self.UpdateCoalescer = None
+        self.ResetSchedule = None
+        self.domoticzdb_DeviceStatus = None
+        self.groupmgt = None
+
+
+def build_network():
+    plugin = Plugin()
+    Devices = {}
+    reports = []
+    models = sorted( MODELS )
+    for idx in range( NB_DEVICES ):
+        nwkid = '%04x' % ( 0x1000 + idx )
+        ieee = '00158d00%08x' % idx
+        model = models[ idx % len(models) ]
+        endpoints, attributes = MODELS[ model ]
+        plugin.IEEE2NWK[ ieee ] = nwkid
+        plugin.ListOfDevices[ nwkid ] = { 'IEEE': ieee, 'Model': model, 'LQI': 120, 'Battery': 90, 'Ep': {} }
+        for ep, widgets in endpoints.items():
+            plugin.ListOfDevices[ nwkid ]['Ep'][ ep ] = { 'ClusterType': {} }
+            for widget in widgets:
+                unit = len(Devices) + 1
+                Devices[ unit ] = DomoticzDevice( 1000 + unit, ieee, '%s %s' % ( widget, nwkid ) )
+                plugin.ListOfDevices[ nwkid ]['Ep'][ ep ]['ClusterType'][ str( 1000 + unit ) ] = widget
+            for cluster, value, attribute in attributes:
+                reports.append( ( nwkid, ep, cluster, value, attribute ) )
+    return plugin, Devices, reports
+
+
+# MajDomoDevice chain, in the former order
+CHAIN = ( domoMaj._majAmpere, domoMaj._majPower, domoMaj._majMeter, domoMaj._majVoltage, domoMaj._majThermoSetpoint,
+          domoMaj._majThermoMode, domoMaj._majAirQuality, domoMaj._majVoc, domoMaj._majTemp, domoMaj._majHumi, domoMaj._majBaro,
+          domoMaj._majBSOOrientation, domoMaj._majGeneric, domoMaj._majWindowCovering, domoMaj._majLvlControl,
+          domoMaj._majColorControl, domoMaj._majXCube, domoMaj._majOrientation, domoMaj._majStrenght, domoMaj._majLux )
+
+
+def legacy_MajDomoDevice( self, Devices, NWKID, Ep, clusterID, value, Attribute_='', Color_=''):
+    # MajDomoDevice before the routes: each widget of the device goes through the whole chain
+    if NWKID not in self.ListOfDevices:
+        return
+    if 'IEEE' not in self.ListOfDevices[NWKID]:
+        return
+    self.log.logging( "Widget", "Debug", "MajDomoDevice NwkId: %s Ep: %s ClusterId: %s Value: %s ValueType: %s Attribute: %s Color: %s", NWKID, args=( NWKID, Ep, clusterID, value, type(value),Attribute_, Color_ ) )
+    ClusterType = TypeFromCluster(self, clusterID)
+    ClusterTypeList = RetreiveWidgetTypeList( self, Devices, NWKID )
+    if len(ClusterTypeList) == 0:
+        return
+    for WidgetEp , WidgetId, WidgetType in ClusterTypeList:
+        if WidgetEp == '00':
+            WidgetEp = '01'
+        if (WidgetType not in domoMaj.WIDGET_BYPASS_EP_MATCH):
+            if WidgetEp != Ep:
+                continue
+        DeviceUnit = self.UnitIndex.unit_for_id( Devices, WidgetId )
+        if DeviceUnit is None:
+            return
+        Switchtype = Devices[ DeviceUnit ].SwitchType
+        Subtype = Devices[ DeviceUnit ].SubType
+        SignalLevel,BatteryLevel = RetreiveSignalLvlBattery( self, NWKID)
+        for handler in CHAIN:
+            status = handler( self, Devices, NWKID, Ep, clusterID, value, Attribute_, Color_, ClusterType, WidgetEp, WidgetType, DeviceUnit, BatteryLevel, SignalLevel )
+            if status == domoMaj.MAJ_ABORT:
+                return
+            if status == domoMaj.MAJ_NEXT:
+                break
+        domoMaj.CheckUpdateGroup( self, NWKID, Ep,  clusterID )
+
+
+def replay( function, plugin, Devices, reports, number=5 ):
+    # Best of number replays
+    nb_reports = len(reports)
+    best = None
+    for _ in range( number ):
+        start = time.perf_counter()
+        for idx in range( NB_UPDATES ):
+            nwkid, ep, cluster, value, attribute = reports[ idx % nb_reports ]
+            function( plugin, Devices, nwkid, ep, cluster, value, Attribute_=attribute )
+        duration = time.perf_counter() - start
+        best = duration if best is None else min( best, duration )
+    return best
+
+
+def former_MajDomoDevice( filename ):
+    spec = importlib.util.spec_from_file_location( 'former_domoMaj', filename )
+    module = importlib.util.module_from_spec( spec )
+    spec.loader.exec_module( module )
+    return module.MajDomoDevice
+
+
+def main():
+    if len(sys.argv) > 1:
+        legacy = former_MajDomoDevice( sys.argv[1] )
+        label = "former"
+    else:
+        legacy = legacy_MajDomoDevice
+        label = "chain "
+
+    plugin, Devices, reports = build_network()
+    print("%s devices, %s widgets, %s updates replayed" % ( len(plugin.ListOfDevices), len(Devices), NB_UPDATES ))
+    t_legacy = replay( legacy, plugin, Devices, reports )
+    legacy_states = [ ( d.nValue, d.sValue ) for d in Devices.values() ]
+
+    plugin, Devices, reports = build_network()
+    t_routes = replay( domoMaj.MajDomoDevice, plugin, Devices, reports )
+    assert legacy_states == [ ( d.nValue, d.sValue ) for d in Devices.values() ]
+
+    print("%s: %6.2f µs/update" % ( label, 1e6 * t_legacy / NB_UPDATES ))
+    print("routes: %6.2f µs/update  speedup: x%.1f" % ( 1e6 * t_routes / NB_UPDATES, t_legacy / t_routes ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Micro benchmark of Modules/zigateCodec.py against the former hex based functions
+    of Classes/Transport.py ( zigate_encode, get_checksum, decode_frame, check_frame_crc ).
+
+    Usage: python3 Tools/bench_zigate_codec.py [ recorded_frames.txt ]
+
+    recorded_frames.txt contains one decoded frame in hex per line, as logged by
+    "on_message Frame:" when debugzigateCmd is enabled. Without file, a built-in
+    set of typical frames (status, ack, reports, raw APS, OTA request) is used.
+    Before the timings, legacy and codec results are compared on those frames and on
+    random payloads, and the script fails on the first difference.
+
+"""
+
+import os
+import sys
+import random
+import struct
+import timeit
+from binascii import hexlify
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from Modules.zigateCodec import zigate_escape, zigate_unescape, encode_frame, frame_checksum_ok, get_checksum, zigate_encode
+
+RECORDED_FRAMES = (
+    '0180000005720051004d0003',                                                     # 0x8000 Status
+    '018011000a6a0096a80104020702',                                                 # 0x8011 Ack
+    '018102000e1201abcd01000600002001ff03',                                         # 0x8102 On/Off
+    '01810200155b9a28fb0104020000002902070802d803',                                 # 0x8102 Temperature
+    '018102001d3e3f3a5e010b04050b00002900e5050800002100ea0508000029000fff03',       # 0x8102 Electrical measurement
+    '018100004f1823f2a1010000000400004200104c554d492e6d6f746f7201000500004200104c554d492e73656e736f725f6d6f74696f6e0000070000300300004000002001008003',
+    '0180020026df000104000601010208ba02000001180a0000001001ff020d1001020e3d03',     # 0x8002 Raw APS
+    '018501002d5a02ab12010113000010000000117c10e5d02117c016400000000a0d3c4d0000000000020000001cff03',
+)
+
+
+# Former implementations ( Classes/Transport.py before the codec module ), kept here as reference
+
+def legacy_zigate_encode(Data):
+    Out = ''
+    Outtmp = ''
+    for c in Data:
+        Outtmp += c
+        if len(Outtmp) == 2:
+            if Outtmp[0] == '1' and Outtmp != '10':
+                if Outtmp[1] == '0':
+                    Outtmp = '0200'
+                Out += Outtmp
+            elif Outtmp[0] == '0':
+                Out += '021' + Outtmp[1]
+            else:
+                Out += Outtmp
+            Outtmp = ""
+    return Out
+
+
+def legacy_get_checksum(msgtype, length, datas):
+    temp = 0 ^ int(msgtype[0:2], 16)
+    temp ^= int(msgtype[2:4], 16)
+    temp ^= int(length[0:2], 16)
+    temp ^= int(length[2:4], 16)
+    chk = 0
+    for i in range(0, len(datas), 2):
+        temp ^= int(datas[i:i + 2], 16)
+        chk = hex(temp)
+    return chk[2:4]
+
+
+def legacy_decode_frame( frame ):
+    BinMsg = bytearray()
+    iterReqRcv = iter(frame)
+    for iByte in iterReqRcv:
+        if iByte == 0x02:
+            iByte = next(iterReqRcv) ^ 0x10
+        BinMsg.append(iByte)
+    if len(BinMsg) <= 6:
+        return None
+    return BinMsg
+
+
+def legacy_check_frame_crc( BinMsg ):
+    ComputedChecksum = 0
+    Zero1, MsgType, Length, ReceivedChecksum = struct.unpack('>BHHB', BinMsg[0:6])
+    for idx, val in enumerate(BinMsg[1:-1]):
+        if idx != 4:
+            ComputedChecksum ^= val
+    return ComputedChecksum == ReceivedChecksum
+
+
+def legacy_send_frame( cmd, datas ):
+    length = '%04x' % (len(datas)//2)
+    checksumCmd = legacy_get_checksum(cmd, length, datas)
+    strchecksum = '0' + str(checksumCmd) if len(checksumCmd) == 1 else checksumCmd
+    lineinput = "01" + str(legacy_zigate_encode(cmd)) + str(legacy_zigate_encode(length)) + \
+                str(legacy_zigate_encode(strchecksum)) + str(legacy_zigate_encode(datas)) + "03"
+    return bytes.fromhex(lineinput)
+
+
+def load_frames( filename ):
+    frames = []
+    with open( filename, 'r') as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                frames.append( bytearray.fromhex( line ) )
+    return frames
+
+
+def fix_header( binmsg ):
+    # Built-in frames are edited by hand, make sure the length and the checksum are right
+    struct.pack_into( '>H', binmsg, 3, len(binmsg) - 7 )
+    checksum = 0
+    for x in binmsg[1:5] + binmsg[6:-1]:
+        checksum ^= x
+    binmsg[5] = checksum
+    return binmsg
+
+
+def check_random_frames( count ):
+    # Legacy and codec must give the same result on any payload: every byte value, escaped ones ( < 0x10 ) over represented.
+    # Not empty, legacy_get_checksum() fails on an empty payload
+    rng = random.Random( 0 )
+    for _ in range( count ):
+        cmd = '%04x' % rng.choice( ( rng.randint( 0, 0xffff ), rng.randint( 0, 0x10 ) ) )
+        datas = bytes( rng.choice( ( rng.randint( 0, 0xff ), rng.randint( 0, 0x11 ) ) ) for _ in range( rng.randint( 1, 300 ) ) )
+        frame = legacy_send_frame( cmd, datas.hex() )
+        assert frame == encode_frame( int(cmd, 16), datas )
+        assert legacy_zigate_encode( datas.hex() ) == zigate_encode( datas.hex() )
+        binmsg = legacy_decode_frame( frame )
+        assert binmsg == zigate_unescape( frame )
+        if binmsg is None:
+            continue
+        # Received frames have the LQI before the end of frame
+        binmsg = bytearray( binmsg[:-1] + bytes( ( rng.randint( 0, 0xff ), ) ) + binmsg[-1:] )
+        assert legacy_check_frame_crc( binmsg ) == frame_checksum_ok( binmsg )
+        binmsg[5] ^= rng.randint( 1, 0xff )
+        assert legacy_check_frame_crc( binmsg ) == frame_checksum_ok( binmsg )
+
+
+def bench( label, legacy, codec, number, nb_frames ):
+    t_legacy = timeit.timeit( legacy, number=number )
+    t_codec = timeit.timeit( codec, number=number )
+    print("%-28s legacy: %8.2f us/frame  codec: %8.2f us/frame  speedup: x%.1f"
+        %( label, 1e6 * t_legacy / ( number * nb_frames ), 1e6 * t_codec / ( number * nb_frames ), t_legacy / t_codec ))
+
+
+def main():
+    if len(sys.argv) > 1:
+        frames = load_frames( sys.argv[1] )
+    else:
+        frames = [ fix_header( bytearray.fromhex( x ) ) for x in RECORDED_FRAMES ]
+
+    raw_frames = [ b'\x01' + zigate_escape( bytes( x[1:-1] ) ) + b'\x03' for x in frames ]
+    commands = [ ( '%04x' % struct.unpack('>H', x[1:3])[0], hexlify( x[6:-2] ).decode('utf-8') ) for x in frames ]
+
+    # Check that both implementations provide the same result
+    for binmsg, raw, ( cmd, datas ) in zip( frames, raw_frames, commands ):
+        assert legacy_decode_frame( raw ) == zigate_unescape( raw )
+        assert legacy_check_frame_crc( binmsg ) == frame_checksum_ok( binmsg )
+        assert legacy_send_frame( cmd, datas ) == encode_frame( int(cmd, 16), bytes.fromhex( datas ) )
+        assert legacy_zigate_encode( datas ) == zigate_encode( datas )
+        length = '%04x' % (len(datas)//2)
+        assert int( legacy_get_checksum( cmd, length, datas ), 16) == int( get_checksum( cmd, length, datas ), 16)
+    check_random_frames( 2000 )
+    print("legacy and codec results are identical")
+
+    number = 2000
+    print("%s frames, %s iterations" %( len(frames), number))
+
+    bench( "unescape (decode_frame)",
+        lambda: [ legacy_decode_frame( x ) for x in raw_frames ],
+        lambda: [ zigate_unescape( x ) for x in raw_frames ], number, len(frames) )
+
+    bench( "checksum (check_frame_crc)",
+        lambda: [ legacy_check_frame_crc( x ) for x in frames ],
+        lambda: [ frame_checksum_ok( x ) for x in frames ], number, len(frames) )
+
+    bench( "encode (send path)",
+        lambda: [ legacy_send_frame( cmd, datas ) for cmd, datas in commands ],
+        lambda: [ encode_frame( int(cmd, 16), bytes.fromhex( datas ) ) for cmd, datas in commands ], number, len(frames) )
+
+    # OTA block size payload, the worst case for the send path
+    ota_datas = hexlify( bytes( range(256) )[:0x40] ).decode('utf-8')
+    bench( "encode 64 bytes OTA block",
+        lambda: legacy_send_frame( '0502', ota_datas ),
+        lambda: encode_frame( 0x0502, bytes.fromhex( ota_datas ) ), number, 1 )
+
+    # PDM records restored after a ZiGate reboot are the largest frames received
+    pdm_frame = fix_header( bytearray( b'\x01\x83\x00\x01\x06\x00' + bytes( range(256) ) + b'\xff\x03' ) )
+    pdm_raw = b'\x01' + zigate_escape( bytes( pdm_frame[1:-1] ) ) + b'\x03'
+    assert legacy_decode_frame( pdm_raw ) == zigate_unescape( pdm_raw )
+    assert legacy_check_frame_crc( pdm_frame ) == frame_checksum_ok( pdm_frame )
+    bench( "unescape 256 bytes PDM",
+        lambda: legacy_decode_frame( pdm_raw ),
+        lambda: zigate_unescape( pdm_raw ), number, 1 )
+    bench( "checksum 256 bytes PDM",
+        lambda: legacy_check_frame_crc( pdm_frame ),
+        lambda: frame_checksum_ok( pdm_frame ), number, 1 )
+
+
+if __name__ == '__main__':
+    main()
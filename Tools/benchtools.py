@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Helpers shared by the Tools/bench_xxx.py and Tools/check_xxx.py scripts, which are run out of Domoticz
+    ( python3 Tools/<script>.py ).
+
+"""
+
+import sys
+import types
+
+
+def silent_domoticz():
+    # Out of Domoticz, the Domoticz module is replaced by a silent one, before any plugin module is imported
+    try:
+        import Domoticz
+    except ImportError:
+        Domoticz = types.ModuleType('Domoticz')
+        Domoticz.Log = Domoticz.Status = Domoticz.Error = Domoticz.Debug = lambda message: None
+        sys.modules['Domoticz'] = Domoticz
+    return Domoticz
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# coding: utf-8 -*-
+#
+# Author: zaraki673 & pipiche38
+#
+"""
+    Check of Modules/attributeRecords.py against the former hex decoding of the Read Attribute Response
+    ( Decode8100 ) and Attribute Report ( Decode8102 ) payloads, and of the ZCL Read Attributes Response
+    and Report Attributes received as raw APS ( 0x8002 ), formerly rebuilt as hex 0x8100/0x8102 frames.
+
+    Usage: python3 Tools/check_attribute_records.py [ number of random payloads ]
+
+    Recorded payloads and random ones ( every Data Type of SIZE_DATA_TYPE, strings, failed status,
+    firmware dummy data ) are decoded both ways. The script fails on the first difference.
+    The former 0x8002 path swapped the 24 bits types ( 0x22, 0x2a ) and the 32 bits types with the high
+    bit set ( 0x23, 0x2b, 0x39 ) wrongly, for those the binary decoding is checked to be the byte swap. It
+    also lost the last attribute status of a Read Attributes Response when the one before was a status too.
+
+"""
+
+import os
+import sys
+import random
+import struct
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' ) )
+
+from benchtools import silent_domoticz
+silent_domoticz()
+
+from Modules.zigateConsts import SIZE_DATA_TYPE
+from Modules.attributeRecords import decode_attribute_header, decode_attribute_records, decode_attribute_report, \
+    decode_zcl_header, decode_zcl_read_attribute_response, decode_zcl_report_attributes
+
+NB_RANDOM = 5000
+
+# Typical 0x8100 / 0x8102 payloads: Model and Power Source read, failed read with and without firmware dummy data, reports
+RECORDED_8100 = (
+    '23f2a10100000005004200126c756d692e73656e736f725f6d6f74696f6e00070030000103',
+    '4f5b0f0104020000000029000208ac',
+    '50a2c8010006000086',
+    '51a2c8010006000086000000',
+)
+RECORDED_8102 = (
+    '4f5b0f010402000000290002085c',
+    '505b0f01040500000021000217a2',
+    '51a2c80100060000000010000101',
+    '52a2c8010b0405050000210002008e',
+)
+
+
+# Former decoding ( Modules/input.py before attributeRecords.py ), kept here as reference
+
+def former_decode8100( MsgData ):
+    records = []
+    idx = 12
+    while idx < len(MsgData):
+        MsgAttrID = MsgAttStatus = MsgAttType = MsgAttSize = MsgClusterData = ""
+        MsgAttrID = MsgData[idx : idx + 4]
+        idx += 4
+        MsgAttStatus = MsgData[idx : idx + 2]
+        idx += 2
+        if MsgAttStatus == "00":
+            MsgAttType = MsgData[idx : idx + 2]
+            idx += 2
+            MsgAttSize = MsgData[idx : idx + 4]
+            idx += 4
+            size = int(MsgAttSize, 16) * 2
+            MsgClusterData = MsgData[idx : idx + size]
+            idx += size
+        else:
+            # If the frame is coming from firmware we get only one attribute at a time, with some dumy datas
+            if len(MsgData[idx:]) == 6:
+                idx += 6
+        records.append( ( MsgAttrID, MsgAttStatus, MsgAttType, MsgAttSize, MsgClusterData ) )
+    return records
+
+
+def former_decode8102( MsgData ):
+    return ( MsgData[12:16], MsgData[16:18], MsgData[18:20], MsgData[20:24], MsgData[24 : len(MsgData)] )
+
+
+# Former 0x8002 decoding ( retreive_cmd_payload_from_8002 and Classes/Transport.py before the ZclGlobalFrame ),
+# the payload of the rebuilt 0x8100/0x8102 frame is returned
+
+def former_retreive_cmd_payload_from_8002( Payload ):
+    ManufacturerCode = None
+    fcf = Payload[0:2]
+    GlobalCommand = ( int(fcf, 16) & 0b00000011) == 0
+    if (( int(fcf, 16) & 0b00000100) >> 2) == 1:
+        ManufacturerCode = Payload[2:6]
+        Sqn = Payload[6:8]
+        Command = Payload[8:10]
+        Data = Payload[10:]
+    else:
+        Sqn = Payload[2:4]
+        Command = Payload[4:6]
+        Data = Payload[6:]
+    return ( GlobalCommand, Sqn, ManufacturerCode, Command, Data)
+
+
+def former_decode_endian_data( data, datatype):
+    if datatype in ( '10', '18', '20', '28', '30'):
+        return data
+    if datatype in ('09', '19', '21', '29', '31'):
+        return '%04x' %struct.unpack('>H',struct.pack('H',int(data,16)))[0]
+    if datatype in ( '22', '2a'):
+        return '%06x' %struct.unpack('>I',struct.pack('I',int(data,16)))[0]
+    if datatype in ( '23', '2b', '39'):
+        return '%08x' %struct.unpack('>i',struct.pack('I',int(data,16)))[0]
+    return data
+
+
+def former_read_attribute_response( Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data ):
+    idx = 0
+    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
+    while idx < len(Data):
+        Attribute = '%04x' %struct.unpack('H',struct.pack('>H',int(Data[idx:idx+4],16)))[0]
+        idx += 4
+        Status = Data[idx:idx+2]
+        idx += 2
+        if Status == '00':
+            DType = Data[idx:idx+2]
+            idx += 2
+            if DType in SIZE_DATA_TYPE:
+                size = SIZE_DATA_TYPE[ DType ] * 2
+            elif DType == '4c':
+                idx += 4
+                size = len(Data) - idx
+            elif DType in ( '41', '42'):
+                size = int(Data[idx:idx+2],16) * 2
+                idx += 2
+            else:
+                return None
+            data = Data[idx:idx + size]
+            idx += size
+            value = former_decode_endian_data( data, DType)
+            lenData = '%04x' %(size // 2 )
+            buildPayload += Attribute + Status + DType + lenData + value
+        else:
+            buildPayload += Attribute + Status
+    return buildPayload
+
+
+def former_report_attribute_response( Sqn, SrcNwkId, SrcEndPoint, ClusterId, Data ):
+    buildPayload = Sqn + SrcNwkId + SrcEndPoint + ClusterId
+    idx = 0
+    while idx < len(Data):
+        Attribute = '%04x' %struct.unpack('H',struct.pack('>H',int(Data[idx:idx+4],16)))[0]
+        idx += 4
+        DType = Data[idx:idx+2]
+        idx += 2
+        if DType in SIZE_DATA_TYPE:
+            size = SIZE_DATA_TYPE[ DType ] * 2
+        elif DType == '4c':
+            idx += 4
+            size = len(Data) - idx
+        elif DType in ( '41', '42'):
+            size = int(Data[idx:idx+2],16) * 2
+            idx += 2
+        else:
+            return None
+        data = Data[idx:idx + size]
+        idx += size
+        value = former_decode_endian_data( data, DType)
+        lenData = '%04x' %(size // 2 )
+        buildPayload += Attribute + '00' + DType + lenData + value
+    return buildPayload
+
+
+def random_value( rng ):
+    # ( Type, Size, Data ) of an attribute value
+    atttype = rng.choice( list( SIZE_DATA_TYPE ) + [ '41', '42' ] )
+    size = SIZE_DATA_TYPE.get( atttype, rng.randint( 0, 40 ) )
+    return atttype, size, bytes( rng.randint( 0, 0xff ) for _ in range( size ) )
+
+
+def random_8100( rng ):
+    payload = struct.pack( '>BHBH', rng.randint( 0, 0xff ), rng.randint( 0, 0xffff ), rng.randint( 1, 0xf2 ), rng.randint( 0, 0xffff ) )
+    if rng.random() < 0.1:
+        # Failed read as sent by the firmware: one attribute, status and dummy data
+        return payload + struct.pack( '>HB', rng.randint( 0, 0xffff ), rng.choice( ( 0x86, 0x8f ) ) ) + bytes( 3 )
+    for _ in range( rng.randint( 1, 6 ) ):
+        if rng.random() < 0.2:
+            payload += struct.pack( '>HB', rng.randint( 0, 0xffff ), rng.choice( ( 0x86, 0x8f ) ) )
+            continue
+        atttype, size, data = random_value( rng )
+        payload += struct.pack( '>HBBH', rng.randint( 0, 0xffff ), 0x00, int( atttype, 16 ), size ) + data
+    return payload
+
+
+def random_8102( rng ):
+    atttype, size, data = random_value( rng )
+    return struct.pack( '>BHBHHBBH', rng.randint( 0, 0xff ), rng.randint( 0, 0xffff ), rng.randint( 1, 0xf2 ), rng.randint( 0, 0xffff ),
+        rng.randint( 0, 0xffff ), 0x00, int( atttype, 16 ), size ) + data
+
+
+def check_8100( payload ):
+    MsgData = payload.hex()
+    assert decode_attribute_header( payload ) == ( MsgData[0:2], MsgData[2:6], MsgData[6:8], MsgData[8:12] ), MsgData
+    records, complete = decode_attribute_records( payload )
+    assert complete, MsgData
+    assert records == former_decode8100( MsgData ), MsgData
+
+
+def check_8102( payload ):
+    MsgData = payload.hex()
+    assert decode_attribute_header( payload ) == ( MsgData[0:2], MsgData[2:6], MsgData[6:8], MsgData[8:12] ), MsgData
+    assert decode_attribute_report( payload ) == former_decode8102( MsgData ), MsgData
+
+
+def random_zcl_value( rng ):
+    # ZCL ( little endian ) encoding of an attribute value: ( Type, value bytes )
+    atttype, size, data = random_value( rng )
+    if atttype in ( '41', '42' ):
+        return atttype, bytes( ( size, ) ) + data
+    return atttype, data
+
+
+def random_zcl( rng, command ):
+    # ZCL frame of a Read Attributes Response ( 0x01 ) or Report Attributes ( 0x0a ), manufacturer specific or not
+    manufcode = rng.random() < 0.3
+    frame = bytes( ( 0x18 | ( 0x04 if manufcode else 0x00 ), ) )
+    if manufcode:
+        frame += struct.pack( '<H', rng.randint( 0, 0xffff ) )
+    frame += bytes( ( rng.randint( 0, 0xff ), command ) )
+    for _ in range( rng.randint( 1, 4 ) ):
+        frame += struct.pack( '<H', rng.randint( 0, 0xffff ) )
+        if command == 0x01 and rng.random() < 0.2:
+            frame += bytes( ( 0x86, ) )
+            continue
+        if command == 0x01:
+            frame += bytes( ( 0x00, ) )
+        atttype, value = random_zcl_value( rng )
+        frame += bytes( ( int( atttype, 16 ), ) ) + value
+    return frame
+
+
+def former_wrong_swap( record ):
+    # Record the former 0x8002 path decoded wrongly
+    return record[2] in ( '22', '2a' ) or ( record[2] in ( '23', '2b', '39' ) and int( record[4][:2], 16 ) & 0x80 )
+
+
+def check_8002( zcl ):
+    # zcl is the ZCL frame of the 0x8002 payload, for a device 0x1234 endpoint 0x01 cluster 0x0402
+    Payload = zcl.hex()
+    GlobalCommand, Sqn, ManufacturerCode, Command, Data = former_retreive_cmd_payload_from_8002( Payload )
+    global_command, sqn, manufcode, command, offset = decode_zcl_header( zcl )
+    assert ( global_command, sqn, manufcode, '%02x' %command ) == ( GlobalCommand, Sqn, ManufacturerCode, Command ), Payload
+
+    if Command == '01':
+        records = decode_zcl_read_attribute_response( zcl, offset )
+        MsgData = former_read_attribute_response( Sqn, '1234', '01', '0402', Data )
+    else:
+        records = decode_zcl_report_attributes( zcl, offset )
+        MsgData = former_report_attribute_response( Sqn, '1234', '01', '0402', Data )
+    # The former rebuilt frame had the 0x8100 record layout, the records are decoded as Decode8100 did
+    wrong = [ idx for idx, record in enumerate( records ) if record[1] == '00' and former_wrong_swap( record ) ]
+    if wrong:
+        # The former value is wrong, and may be shorter, shifting ( or looping on ) the next records: the
+        # former frame is decoded up to that record, the binary value must be the byte swap of the frame data
+        records = records[ :wrong[0] + 1 ]
+        MsgData = MsgData[ :12 + sum( 12 + len( record[4] ) if record[1] == '00' else 6 for record in records ) ]
+        former = former_decode8100( MsgData )
+        assert records[:-1] == former[:-1] and records[-1][:4] == former[-1][:4], Payload
+        assert bytes.fromhex( records[-1][4] )[::-1] in zcl[ offset: ], Payload
+        return
+
+    former = former_decode8100( MsgData )
+    if len( records ) > 1 and records[-2][1] != '00' and records[-1][1] != '00':
+        # The last status was taken as the firmware dummy data of the previous one and lost
+        records = records[:-1]
+    assert records == former, Payload
+    if Command == '0a' and len( records ) == 1:
+        # Single attribute report, as Decode8102 did
+        assert records[0] == former_decode8102( MsgData ), Payload
+
+
+def main():
+    count = int( sys.argv[1] ) if len( sys.argv ) > 1 else NB_RANDOM
+    for MsgData in RECORDED_8100:
+        check_8100( bytes.fromhex( MsgData ) )
+    for MsgData in RECORDED_8102:
+        check_8102( bytes.fromhex( MsgData ) )
+
+    rng = random.Random( 0 )
+    for _ in range( count ):
+        check_8100( random_8100( rng ) )
+        check_8102( random_8102( rng ) )
+    print("0x8100/0x8102: %s recorded and %s random payloads, former and binary decoding are identical"
+        %( len( RECORDED_8100 ) + len( RECORDED_8102 ), 2 * count ))
+
+    for _ in range( count ):
+        check_8002( random_zcl( rng, 0x01 ) )
+        check_8002( random_zcl( rng, 0x0a ) )
+    print("0x8002: %s random Read Attributes Response and Report Attributes, former and binary decoding are identical" %( 2 * count ))
+
+
+if __name__ == '__main__':
+    main()
@@ -95,6 +95,9 @@ from Classes.PluginConf import PluginConf
 from Classes.Transport import ZigateTransport
 from Classes.TransportStats import TransportStatistics
 from Classes.LoggingManagement import LoggingManagement
+from Classes.DomoticzUnitIndex import DomoticzUnitIndex
+from Classes.WidgetUpdateCoalescer import WidgetUpdateCoalescer
+from Classes.WidgetResetSchedule import WidgetResetSchedule
 
 from Classes.GroupMgtv2.GroupManagement import GroupsManagement
 from Classes.AdminWidgets import AdminWidgets
@@ -126,6 +129,8 @@ class BasePlugin:
         self.DevicesInPairingMode = []
         self.DiscoveryDevices = {} # Used to collect pairing information
         self.IEEE2NWK = {}
+        self.UnitIndex = DomoticzUnitIndex()   # DeviceID -> Units, Domoticz ID -> Unit, NwkId -> Widgets
+        self.ResetSchedule = WidgetResetSchedule()  # Deadlines of Motion and push button widgets to be reset
         self.zigatedata = {}
         self.DeviceConf = {} # Store DeviceConf.txt, all known devices configuration
 
@@ -141,6 +146,7 @@ class BasePlugin:
         self.pluginconf = None     # PlugConf object / all configuration parameters
         self.OTA = None
         self.statistics = None
+        self.UpdateCoalescer = None     # Delay and coalesce the updates of meter and sensor widgets
         self.iaszonemgt = None      # Object to manage IAS Zone
         self.webserver = None
         self.transport = None         # USB or Wifi
@@ -161,6 +167,9 @@ class BasePlugin:
         self.DomoticzVersion = None
         self.StartupFolder = None
         self.DeviceListName = None
+        self.DeviceListWritten = {}    # NwkId -> digest of the record last written in DeviceList ( incremental persistence )
+        self.DeviceListDirty = set()   # NwkId of the records changed since the last WriteDeviceList
+        self.DeviceListAudit = 0       # Position of the next records checked for changes made without marking them dirty
         self.pluginParameters = None
 
         self.PluginHealth = {}
@@ -346,6 +355,7 @@ class BasePlugin:
 
         # Create Statistics object
         self.statistics = TransportStatistics(self.pluginconf)
+        self.UpdateCoalescer = WidgetUpdateCoalescer( self.pluginconf, self.statistics )
 
         # Connect to Zigate only when all initialisation are properly done.
         self.log.logging( 'Plugin', 'Status', "Transport mode: %s" %self.transport)
@@ -401,11 +411,14 @@ class BasePlugin:
 
         if ( self.DomoticzMajor > 4 or self.DomoticzMajor == 4 and self.DomoticzMinor >= 10355 or self.VersionNewFashion ):
             for thread in threading.enumerate():
-                if (thread.name != threading.current_thread().name):
+                # The ZiGateLogging thread is stopped last, by closeLogFile()
+                if (thread.name != threading.current_thread().name) and thread is not self.log.logging_thread:
                     Domoticz.Log("'"+thread.name+"' is running, it must be shutdown otherwise Domoticz will abort on plugin exit.")
 
         #self.ZigateComm.close_conn()
-        WriteDeviceList(self, 0)
+        if self.UpdateCoalescer:
+            self.UpdateCoalescer.flush( Devices, all_=True )
+        WriteDeviceList(self, 0, compact=True)
 
         self.statistics.printSummary()
         self.statistics.writeReport()
@@ -419,6 +432,10 @@ class BasePlugin:
 
 
         self.log.logging( 'Plugin', 'Debug', "onDeviceRemoved called" )
+        self.UnitIndex.remove( Devices, Unit )
+        if self.UpdateCoalescer:
+            self.UpdateCoalescer.remove( Unit )
+        self.ResetSchedule.cancel( Unit )
 
         # Let's check if this is End Node, or Group related.
         if Devices[Unit].DeviceID in self.IEEE2NWK:
@@ -525,6 +542,16 @@ class BasePlugin:
     def onCommand(self, Unit, Command, Level, Color):
         self.log.logging( 'Plugin', 'Debug', "onCommand - unit: %s, command: %s, level: %s, color: %s" %(Unit, Command, Level, Color))
 
+        if self.ZigateComm is None:
+            self.processCommand( Unit, Command, Level, Color )
+            return
+
+        # User action: all commands sent are Interactive, whatever their command code ( raw APS, write attribute ... )
+        with self.ZigateComm.interactive():
+            self.processCommand( Unit, Command, Level, Color )
+
+    def processCommand(self, Unit, Command, Level, Color):
+
         # Let's check if this is End Node, or Group related.
         if Devices[Unit].DeviceID in self.IEEE2NWK:
             # Command belongs to a end node
@@ -570,6 +597,9 @@ class BasePlugin:
         if self.ZigateComm:
             self.ZigateComm.check_timed_out_for_tx_queues()
 
+        if self.UpdateCoalescer:
+            self.UpdateCoalescer.flush( Devices )
+
         self.internalHB += 1
         if self.PDMready and (self.internalHB % HEARTBEAT) != 0:
             return
@@ -855,7 +885,7 @@ def zigateInit_Phase3( self ):
         if self.groupmgt is None and self.pluginconf.pluginConf['enablegroupmanagement']:
             self.log.logging( 'Plugin', 'Status', "Start Group Management")
             self.groupmgt = GroupsManagement( self.pluginconf, self.ZigateComm, self.adminWidgets, Parameters["HomeFolder"],
-                    self.HardwareID, Devices, self.ListOfDevices, self.IEEE2NWK, self.log )
+                    self.HardwareID, Devices, self.ListOfDevices, self.IEEE2NWK, self.log, self.UnitIndex )
             if self.groupmgt and self.ZigateIEEE:
                 self.groupmgt.updateZigateIEEE( self.ZigateIEEE) 
 
@@ -874,7 +904,7 @@ def zigateInit_Phase3( self ):
     # In case we have Transport = None , let's check if we have to active Group management or not. (For Test and Web UI Dev purposes
     if self.transport == 'None' and self.groupmgt is None and self.pluginconf.pluginConf['enablegroupmanagement']:
            self.groupmgt = GroupsManagement( self.pluginconf, self.ZigateComm, self.adminWidgets, Parameters["HomeFolder"],
-                   self.HardwareID, Devices, self.ListOfDevices, self.IEEE2NWK, self.log )
+                   self.HardwareID, Devices, self.ListOfDevices, self.IEEE2NWK, self.log, self.UnitIndex )
            if self.groupmgt and self.ZigateIEEE:
                self.groupmgt.updateZigateIEEE( self.ZigateIEEE) 
 